@@ -5,3 +5,16 @@ import os
 LOGGER_NAME = "API_CONNECTOR_LOGGER"
 LOG_LEVEL = os.getenv("EXTERNAL_APIS_LOG_LEVEL", "WARNING")
 LOG_FILE = os.getenv("EXTERNAL_APIS_LOG_FILE", "logs/umlars-external-apis.log")
+
+
+# HTTP CLIENT
+# Connections kept open by the connector's session - in total and to a single host
+API_CONNECTOR_POOL_LIMIT = int(os.getenv("API_CONNECTOR_POOL_LIMIT", 100))
+API_CONNECTOR_POOL_LIMIT_PER_HOST = int(os.getenv("API_CONNECTOR_POOL_LIMIT_PER_HOST", 20))
+API_CONNECTOR_KEEPALIVE_TIMEOUT = float(os.getenv("API_CONNECTOR_KEEPALIVE_TIMEOUT", 30))
+API_CONNECTOR_DNS_CACHE_TTL = int(os.getenv("API_CONNECTOR_DNS_CACHE_TTL", 300))
+API_CONNECTOR_REQUEST_TIMEOUT = float(os.getenv("API_CONNECTOR_REQUEST_TIMEOUT", 60))
+# Requests sent at once, when many resources are fetched concurrently
+API_CONNECTOR_MAX_CONCURRENT_REQUESTS = int(os.getenv("API_CONNECTOR_MAX_CONCURRENT_REQUESTS", 10))
+# Size of the chunks of the response bodies read as a stream
+API_CONNECTOR_STREAM_CHUNK_SIZE = int(os.getenv("API_CONNECTOR_STREAM_CHUNK_SIZE", 64 * 1024))
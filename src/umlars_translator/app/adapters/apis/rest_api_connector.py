@@ -1,12 +1,68 @@
-from typing import Optional
+from typing import Any, AsyncIterator, Iterable, List, Optional
+from contextlib import asynccontextmanager
+import asyncio
+import logging
+
 import aiohttp
 
 from umlars_translator.app.adapters.apis.api_connector import ApiConnector, ServiceConnectionData
+from umlars_translator.app.adapters.apis import config
 from umlars_translator.app.utils.functions import retry_async
 from umlars_translator.app.exceptions import ServiceConnectionError, NotYetAvailableError, ExternalServiceOperationError, ServiceUnexpectedBehaviorError
 
 
 class RestApiConnector(ApiConnector):
+    """
+    Sends the requests through one long-lived session, so the connections to the service are kept alive and reused
+    and the resolved addresses are cached. Compressed (gzip, deflate) responses are accepted and decoded transparently.
+    """
+    def __init__(
+        self,
+        service_url: str,
+        service_data: Optional[ServiceConnectionData] = None,
+        api_connector_logger: Optional[logging.Logger] = None,
+        max_concurrent_requests: Optional[int] = None,
+    ) -> None:
+        # Logger is injected into the base class initializer, unless given
+        logger_kwargs = {"api_connector_logger": api_connector_logger} if api_connector_logger is not None else {}
+        super().__init__(service_url, service_data, **logger_kwargs)
+        self._max_concurrent_requests = max(max_concurrent_requests or config.API_CONNECTOR_MAX_CONCURRENT_REQUESTS, 1)
+        self._session = None
+        self._session_loop = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        Session of the running event loop - created on the first request and again, if it was closed.
+        """
+        running_loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not running_loop:
+            self._session = self._create_session()
+            self._session_loop = running_loop
+        return self._session
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        self._logger.info(f"Creating HTTP session for the service {self._service_url}")
+        connector = aiohttp.TCPConnector(
+            limit=config.API_CONNECTOR_POOL_LIMIT,
+            limit_per_host=config.API_CONNECTOR_POOL_LIMIT_PER_HOST,
+            keepalive_timeout=config.API_CONNECTOR_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=config.API_CONNECTOR_DNS_CACHE_TTL,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=config.API_CONNECTOR_REQUEST_TIMEOUT),
+            headers={"Accept-Encoding": "gzip, deflate"},
+            auto_decompress=True,
+        )
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            self._logger.info(f"Closing HTTP session for the service {self._service_url}")
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
     @retry_async(exception_class_raised_when_all_attempts_failed=ServiceConnectionError)
     async def authenticate(self, user: dict, create_token_endpoint: Optional[str] = None, create_token_url: Optional[str] = None) -> dict:
         create_token_url = create_token_url if create_token_url is not None else f"{self._service_url}/{create_token_endpoint}"
@@ -26,36 +82,51 @@ class RestApiConnector(ApiConnector):
             raise NotYetAvailableError(error_message) from ex
 
     async def get_data(self, url: str, add_auth_headers: bool = True, add_tech_request_params: bool = True) -> dict:
-        headers = dict()
-        query_params = dict()
-        if add_auth_headers:
-            jwt_token = self.service_data.jwt
-            headers.update({"Authorization": f"Bearer {jwt_token}"})
+        # In case of any problems with JWT - BasicAuth code works as well:
+        # session.get(url, auth=aiohttp.BasicAuth(app_config.REPOSITORY_SERVICE_USER, app_config.REPOSITORY_SERVICE_PASSWORD))
+        return await self._request("GET", url, add_auth_headers=add_auth_headers, add_tech_request_params=add_tech_request_params)
 
-        if add_tech_request_params:
-            query_params.update({"format": "json"})
-            query_params_str = "&".join([f"{key}={value}" for key, value in query_params.items()])
-            url = f"{url}?{query_params_str}"
-
-        async with aiohttp.ClientSession() as session:
-            # In case of any problems with JWT - BasicAuth code works as well
-            # async with aiohttp_client.get(models_repository_api_url, auth=aiohttp.BasicAuth(app_config.REPOSITORY_SERVICE_USER, app_config.REPOSITORY_SERVICE_PASSWORD)) as response:
-            async with session.get(url, headers=headers) as response:
-                if response.status != 200:
-                    response_text = await response.read()
-                    error_message = f"Failed to get data - unexpected response status: {response.status}."
-                    self._logger.error(error_message + f" Response: {response_text}")
-                    raise ExternalServiceOperationError(error_message)
-                else:
-                    try:
-                        return await response.json()
-                    except aiohttp.client_exceptions.ContentTypeError as ex:
-                        response_text = await response.read()
-                        error_message = f"Failed to get data - unexpected response content type: {response.content_type}. Error: {ex}"
-                        self._logger.error(error_message + f" Response: {response_text}")
-                        raise ServiceUnexpectedBehaviorError(error_message) from ex
+    async def get_many_data(
+        self, urls: Iterable[str], max_concurrent_requests: Optional[int] = None, return_exceptions: bool = False, **get_data_kwargs
+    ) -> List[dict | BaseException]:
+        """
+        Fetches the data from all the urls concurrently - at most max_concurrent_requests at once - through the connections of the session.
+        Results are returned in the order of the urls. With return_exceptions, the errors are returned in place of the failed results,
+        otherwise the first error is raised.
+        """
+        requests_slots = asyncio.Semaphore(max_concurrent_requests or self._max_concurrent_requests)
+
+        async def get_data_in_slot(url: str) -> dict:
+            async with requests_slots:
+                return await self.get_data(url, **get_data_kwargs)
+
+        return await asyncio.gather(*(get_data_in_slot(url) for url in urls), return_exceptions=return_exceptions)
 
     async def post_data(self, url: str, data: dict, add_auth_headers: bool = True, add_tech_request_params: bool = True) -> dict:
+        return await self._request("POST", url, data=data, add_auth_headers=add_auth_headers, add_tech_request_params=add_tech_request_params)
+
+    async def iter_data_chunks(self, url: str, chunk_size: Optional[int] = None, add_auth_headers: bool = True, add_tech_request_params: bool = True) -> AsyncIterator[bytes]:
+        """
+        Yields the body of the response in chunks, as it is received (decompressed), so it doesn't have to be kept in memory as a whole.
+        """
+        async with self._open_request("GET", url, add_auth_headers=add_auth_headers, add_tech_request_params=add_tech_request_params) as response:
+            async for chunk in response.content.iter_chunked(chunk_size or config.API_CONNECTOR_STREAM_CHUNK_SIZE):
+                yield chunk
+
+    async def _request(self, method: str, url: str, data: Optional[Any] = None, add_auth_headers: bool = True, add_tech_request_params: bool = True) -> dict:
+        async with self._open_request(method, url, data, add_auth_headers, add_tech_request_params) as response:
+            try:
+                return await response.json()
+            except aiohttp.client_exceptions.ContentTypeError as ex:
+                response_text = await response.read()
+                error_message = f"Failed to get data - unexpected response content type: {response.content_type}. Error: {ex}"
+                self._logger.error(error_message + f" Response: {response_text}")
+                raise ServiceUnexpectedBehaviorError(error_message) from ex
+
+    @asynccontextmanager
+    async def _open_request(
+        self, method: str, url: str, data: Optional[Any] = None, add_auth_headers: bool = True, add_tech_request_params: bool = True
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
         headers = dict()
         query_params = dict()
         if add_auth_headers:
@@ -64,21 +135,11 @@ class RestApiConnector(ApiConnector):
 
         if add_tech_request_params:
             query_params.update({"format": "json"})
-            query_params_str = "&".join([f"{key}={value}" for key, value in query_params.items()])
-            url = f"{url}?{query_params_str}"
-
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, data=data, headers=headers) as response:
-                if response.status != 200:
-                    response_text = await response.read()
-                    error_message = f"Failed to get data - unexpected response status: {response.status}."
-                    self._logger.error(error_message + f" Response: {response_text}")
-                    raise ExternalServiceOperationError(error_message)
-                else:
-                    try:
-                        return await response.json()
-                    except aiohttp.client_exceptions.ContentTypeError as ex:
-                        response_text = await response.read()
-                        error_message = f"Failed to get data - unexpected response content type: {response.content_type}. Error: {ex}"
-                        self._logger.error(error_message + f" Response: {response_text}")
-                        raise ServiceUnexpectedBehaviorError(error_message) from ex
+
+        async with self.session.request(method, url, data=data, headers=headers, params=query_params) as response:
+            if response.status != 200:
+                response_text = await response.read()
+                error_message = f"Failed to get data - unexpected response status: {response.status}."
+                self._logger.error(error_message + f" Response: {response_text}")
+                raise ExternalServiceOperationError(error_message)
+            yield response
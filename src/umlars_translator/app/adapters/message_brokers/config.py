@@ -16,3 +16,16 @@ MESSAGE_BROKER_PASSWORD = os.getenv("RABBITMQ_DEFAULT_PASS", "admin")
 MESSAGE_BROKER_QUEUE_UPLOADED_FILES_NAME = os.environ.get("RABBITMQ_QUEUE_NAME_UPLOADED_FILES", "uploaded_files")
 MESSAGE_BROKER_QUEUE_TRANSLATED_MODELS_NAME = os.environ.get("RABBITMQ_QUEUE_NAME_TRANLATED_MODELS", "translated_models")
 MESSAGE_BROKER_PREFETCH_COUNT = 100
+# Number of messages processed concurrently by the consumer - their translation runs in the translation executor
+# (use TRANSLATION_EXECUTOR_TYPE=process for the translations to scale with the number of cores)
+MESSAGE_BROKER_CONSUMER_PROCESSING_SLOTS = int(os.getenv("RABBITMQ_CONSUMER_PROCESSING_SLOTS", os.cpu_count() or 1))
+# Messages delivered ahead for each processing slot - the broker stops delivering, when all of them are unacknowledged
+MESSAGE_BROKER_CONSUMER_PREFETCH_PER_SLOT = int(os.getenv("RABBITMQ_CONSUMER_PREFETCH_PER_SLOT", 2))
+# Channels of the producer's connection used concurrently for publishing - each of them has the publisher confirms enabled
+MESSAGE_BROKER_PRODUCER_CHANNEL_POOL_SIZE = int(os.getenv("RABBITMQ_PRODUCER_CHANNEL_POOL_SIZE", 4))
+# Translation statuses of the files are collected and sent in batches: as TranslatedFilesMessage carrying up to MAX_SIZE files states,
+# or - with batching disabled - as the TranslatedFileMessage per file, understood by the existing consumers of the queue
+MESSAGE_BROKER_BATCH_STATUS_MESSAGES = os.getenv("RABBITMQ_BATCH_STATUS_MESSAGES", "false").lower() in ("1", "true", "yes")
+MESSAGE_BROKER_STATUS_BATCH_MAX_SIZE = int(os.getenv("RABBITMQ_STATUS_BATCH_MAX_SIZE", 100))
+# Seconds the collected statuses wait for the others, before they are sent
+MESSAGE_BROKER_STATUS_BATCH_MAX_DELAY = float(os.getenv("RABBITMQ_STATUS_BATCH_MAX_DELAY", 0.5))
@@ -0,0 +1,62 @@
+from typing import Dict, Optional
+import asyncio
+import logging
+
+from umlars_translator.app.adapters.message_brokers import config
+from umlars_translator.app.dtos.messages import ModelToTranslateMessage
+
+
+class ModelTranslationTurn:
+    """Translation of the model in progress, along with the latest message of the model waiting for it."""
+    def __init__(self) -> None:
+        self.waiting_message: Optional[ModelToTranslateMessage] = None
+        self.waiting_future: Optional[asyncio.Future] = None
+
+
+class ModelTranslationsCoordinator:
+    """
+    Lets only one message of each model be translated at a time. Messages of the model being translated wait for it -
+    the newer one replaces the waiting one, joined with it (see ModelToTranslateMessage.coalesce). The replaced message doesn't have
+    to be translated, because the model is fetched again for the newer one, so only the latest state of the model is translated.
+    """
+    def __init__(self, messaging_logger: Optional[logging.Logger] = None) -> None:
+        self._logger = (messaging_logger or logging.getLogger(config.APP_LOGGER_NAME)).getChild(self.__class__.__name__)
+        self._turns: Dict[str, ModelTranslationTurn] = {}
+
+    def is_translated(self, model_id: str | int) -> bool:
+        return str(model_id) in self._turns
+
+    async def wait_for_turn(self, model_to_translate_message: ModelToTranslateMessage) -> Optional[ModelToTranslateMessage]:
+        """
+        Returns the message to translate, when the previous translation of the model is finished - finish_turn has to be called afterwards.
+        Returns None, if the message was replaced by the newer one, so it shouldn't be translated.
+        """
+        model_id = str(model_to_translate_message.id)
+        turn = self._turns.get(model_id)
+        if turn is None:
+            self._turns[model_id] = ModelTranslationTurn()
+            return model_to_translate_message
+
+        if turn.waiting_future is not None:
+            self._logger.info(f"Waiting message of model {model_id} is replaced by the newer one")
+            model_to_translate_message = turn.waiting_message.coalesce(model_to_translate_message)
+            if not turn.waiting_future.done():
+                turn.waiting_future.set_result(None)
+
+        turn.waiting_message = model_to_translate_message
+        turn.waiting_future = asyncio.get_running_loop().create_future()
+        return await turn.waiting_future
+
+    def finish_turn(self, model_id: str | int) -> None:
+        """
+        Passes the turn to the message of the model waiting for it.
+        """
+        model_id = str(model_id)
+        turn = self._turns[model_id]
+        waiting_message, waiting_future = turn.waiting_message, turn.waiting_future
+        turn.waiting_message = turn.waiting_future = None
+        if waiting_future is None or waiting_future.done():
+            # Nothing waits - the waiting message could be cancelled only along with the consumer
+            del self._turns[model_id]
+            return
+        waiting_future.set_result(waiting_message)
@@ -1,6 +1,7 @@
-from typing import Optional
+from typing import Any, List, NamedTuple, Optional
 import logging
 import asyncio
+import threading
 import json
 import uuid
 
@@ -8,36 +9,135 @@ from pydantic import ValidationError
 import aio_pika
 from kink import inject
 
-from umlars_translator.core.deserialization.exceptions import UnsupportedSourceDataTypeError
+from umlars_translator.core.deserialization.exceptions import TranslationBudgetExceededError, TranslationCancelledError
 from umlars_translator.app.exceptions import QueueUnavailableError, NotYetAvailableError, InputDataError
 from umlars_translator.app.adapters.message_brokers.message_consumer import MessageConsumer
 from umlars_translator.app.adapters.message_brokers import config as messaging_config
 from umlars_translator.app.dtos.messages import ModelToTranslateMessage
-from umlars_translator.app.dtos.input import UmlModelDTO
+from umlars_translator.app.dtos.input import UmlModelDTO, UmlFileDTO
+from umlars_translator.app.dtos.uml_model import UmlModel
+from umlars_translator.app.dtos.model_sources import UmlModelSourcesDTO
 from umlars_translator.app import config as app_config
 from umlars_translator.app.adapters.apis.rest_api_connector import RestApiConnector
 from umlars_translator.app.utils.functions import retry_async
+from umlars_translator.app.utils.json_stream import JsonStreamError
+from umlars_translator.app.utils.incremental_translation import get_files_to_translate, merge_translated_files
 from umlars_translator.app.adapters.repositories.uml_model_repository import UmlModelRepository
-from umlars_translator.app.adapters.message_brokers.rabbitmq_message_producer import RabbitMQProducer, create_failed_translation_message, create_successfull_translation_message, create_running_translation_message, send_translated_models_messages, send_translated_model_message
-from umlars_translator.core.translator import ModelTranslator
-from umlars_translator.core.deserialization.deserializer import ModelDeserializer
+from umlars_translator.app.adapters.message_brokers.rabbitmq_message_producer import RabbitMQProducer, get_shared_producer, create_failed_translation_message, create_successfull_translation_message, create_running_translation_message
+from umlars_translator.app.adapters.message_brokers.translation_status_aggregator import TranslationStatusAggregator
+from umlars_translator.app.adapters.message_brokers.model_translations_coordinator import ModelTranslationsCoordinator
+from umlars_translator.core.translator import ModelTranslator, get_worker_translator
+from umlars_translator.core.translation_executor import TranslationExecutor
+from umlars_translator.core.deserialization.translation_progress import TranslationProgress
+from umlars_translator.core.deserialization.translation_budget import create_translation_budget
+
+
+def get_file_translation_error_message(uml_file: UmlFileDTO, exception: Exception) -> str:
+    if isinstance(exception, TranslationBudgetExceededError):
+        return f"Translation of file {uml_file.filename} was aborted: {exception.reason}"
+    return f"Failed to deserialize file {uml_file.filename}: {exception}"
+
+
+class ModelTranslationResult(NamedTuple):
+    model: Any
+    files_errors_messages: dict[str | int, str]
+    sources: UmlModelSourcesDTO
+
+
+def translate_model_in_worker(
+    uml_model: UmlModelDTO,
+    time_limit: Optional[float] = None,
+    memory_limit: Optional[int] = None,
+    translation_progress: Optional[TranslationProgress] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> ModelTranslationResult:
+    """
+    Entry point of the translation worker processes. Translates all the files of the model into one model,
+    skipping the files which failed. Returns the serialized model, the error messages of the failed files and the elements added by each file.
+    The translation_progress and cancel_event can be used only if the function runs in a thread of this process -
+    the translation stops at its next checkpoint after the cancel_event is set.
+    """
+    model_translator = get_worker_translator()
+    translation_context = model_translator.create_context()
+    translation_context.translation_progress = translation_progress
+    files_errors_messages = {}
+    try:
+        for uml_file in uml_model.source_files:
+            if translation_progress is not None:
+                translation_progress.start_file(uml_file.filename)
+            try:
+                # Limits are set for each file separately
+                translation_context.translation_budget = create_translation_budget(time_limit, memory_limit, cancel_event)
+                with translation_context.record_source(str(uml_file.id)):
+                    model_translator.deserialize(data_sources=[uml_file.to_data_source()], model_id=uml_model.id, context=translation_context)
+            except TranslationCancelledError:
+                raise
+            except Exception as ex:
+                files_errors_messages[uml_file.id] = get_file_translation_error_message(uml_file, ex)
+            finally:
+                if translation_progress is not None:
+                    translation_progress.finish_file()
+        model_sources = UmlModelSourcesDTO.from_contributions(translation_context.sources_contributions, files_errors_messages)
+        return ModelTranslationResult(model_translator.serialize(to_string=False, context=translation_context), files_errors_messages, model_sources)
+    finally:
+        model_translator.clear(translation_context)
+
+
+def get_translation_memory_limit(translation_executor: TranslationExecutor) -> Optional[int]:
+    """
+    Memory of the translation is measured as the growth of its process' memory, so the limit is applied only to the translations
+    run in the worker processes, which translate one model at a time. Translations run in threads share the process -
+    each of them would be charged for the allocations of the others.
+    """
+    return app_config.TRANSLATION_FILE_MEMORY_LIMIT if translation_executor.uses_processes else None
 
 
 @inject
 class RabbitMQConsumer(MessageConsumer):
-    def __init__(self, queue_name: str, rabbitmq_host: str, repository_api_connector: RestApiConnector, uml_model_repository: UmlModelRepository, messaging_logger: Optional[logging.Logger] = None, model_translator: Optional[ModelTranslator] = None, message_producer: Optional[RabbitMQProducer] = None) -> None:
+    """
+    Consumes the models to translate. Up to processing_slots messages are processed concurrently: the I/O runs on the event loop,
+    while the translation is sent to the translation executor - with the process pool configured, the whole model is translated in a worker process.
+    Messages are acknowledged in the order their processing completes. Prefetch is bounded by the number of slots,
+    so the broker keeps the messages which can't be processed soon. Messages of the model being translated wait for it -
+    only the latest of them is translated, the ones it replaced are acknowledged without the translation.
+    """
+    def __init__(
+        self,
+        queue_name: str,
+        rabbitmq_host: str,
+        repository_api_connector: RestApiConnector,
+        uml_model_repository: UmlModelRepository,
+        messaging_logger: Optional[logging.Logger] = None,
+        model_translator: Optional[ModelTranslator] = None,
+        message_producer: Optional[RabbitMQProducer] = None,
+        translation_executor: Optional[TranslationExecutor] = None,
+        processing_slots: Optional[int] = None,
+    ) -> None:
         self._logger = messaging_logger.getChild(self.__class__.__name__)
         self._logger.info(f"Initializing RabbitMQConsumer with queue '{queue_name}' and host '{rabbitmq_host}'")
         self._repository_api_connector = repository_api_connector
         self._model_translator = model_translator or ModelTranslator()
+        self._translation_executor = translation_executor or TranslationExecutor()
+        self._memory_limit = get_translation_memory_limit(self._translation_executor)
+        if app_config.TRANSLATION_FILE_MEMORY_LIMIT is not None and self._memory_limit is None:
+            self._logger.warning("TRANSLATION_FILE_MEMORY_LIMIT is ignored - it applies only to the translations run in the process pool")
+        self._processing_slots_count = max(processing_slots or messaging_config.MESSAGE_BROKER_CONSUMER_PROCESSING_SLOTS, 1)
+        self._processing_slots = asyncio.Semaphore(self._processing_slots_count)
+        self._translations_coordinator = ModelTranslationsCoordinator(messaging_logger)
         self._uml_model_repository = uml_model_repository
-        self._message_producer = message_producer or RabbitMQProducer(queue_name=messaging_config.MESSAGE_BROKER_TRANSLATED_MODELS_QUEUE_NAME, rabbitmq_host=messaging_config.MESSAGE_BROKER_HOST)
+        self._message_producer = message_producer or get_shared_producer()
         self._queue_name = queue_name
         self._rabbitmq_host = rabbitmq_host
         self._connection = None
         self._channel = None
         self._queue = None
 
+    @property
+    def prefetch_count(self) -> int:
+        return min(
+            self._processing_slots_count * messaging_config.MESSAGE_BROKER_CONSUMER_PREFETCH_PER_SLOT, messaging_config.MESSAGE_BROKER_PREFETCH_COUNT
+        )
+
     @retry_async(exception_class_raised_when_all_attempts_failed=QueueUnavailableError)
     async def connect_channel(self, rabbitmq_host: Optional[str] = None, queue_name: Optional[str] = None, is_queue_durable: bool = True) -> None:
         self._logger.info(f"Attempting to connect to RabbitMQ at host '{rabbitmq_host or self._rabbitmq_host}' and queue '{queue_name or self._queue_name}'")
@@ -60,7 +160,7 @@ class RabbitMQConsumer(MessageConsumer):
             self._channel = await self._connection.channel()
             self._logger.info("Channel opened")
 
-            await self._channel.set_qos(prefetch_count=messaging_config.MESSAGE_BROKER_PREFETCH_COUNT)
+            await self._channel.set_qos(prefetch_count=self.prefetch_count)
             self._queue = await self._channel.declare_queue(queue_name, durable=is_queue_durable)
             self._logger.info(f"Declared queue '{queue_name}' with durability set to '{is_queue_durable}'")
         except aio_pika.exceptions.AMQPConnectionError as ex:
@@ -76,6 +176,9 @@ class RabbitMQConsumer(MessageConsumer):
             raise QueueUnavailableError("Unexpected error while connecting to RabbitMQ") from ex
 
     async def _callback(self, message: aio_pika.IncomingMessage) -> None:
+        await self._process_delivery(message)
+
+    async def _process_delivery(self, message: aio_pika.IncomingMessage) -> None:
         process_id = str(uuid.uuid4())
         self._logger.info("Callback execution started for message delivery tag %s. Process_id: %s", message.delivery_tag, process_id)
 
@@ -83,28 +186,51 @@ class RabbitMQConsumer(MessageConsumer):
             try:
                 model_to_translate_message = self._deserialize_message(message)
                 self._logger.debug(f"Deserialized message to {model_to_translate_message}")
-                files_ids = model_to_translate_message.ids_of_source_files
-                self._logger.info(f"Message contains {len(files_ids)} source file IDs")
             except Exception as ex:
                 self._logger.error(f"Failed to deserialize message: {ex}")
                 await message.reject(requeue=False)
                 return
 
-            running_translation_messages = map(lambda file_id: create_running_translation_message(file_id=file_id, process_id=process_id), files_ids)
-            send_running_messages_coroutines = send_translated_models_messages(running_translation_messages)
+            # Messages of the model being translated wait for it without taking the processing slot
+            model_to_translate_message = await self._translations_coordinator.wait_for_turn(model_to_translate_message)
+            if model_to_translate_message is None:
+                # States of the files are sent along the translation of the newer message
+                self._logger.info("Message with delivery tag %s was replaced by the newer message of the model", message.delivery_tag)
+                await message.ack()
+                return
 
             try:
-                uml_model = await self.get_data_from_repository(model_to_translate_message.id)
-                await send_running_messages_coroutines
-                await self.process_message(uml_model, process_id=process_id)
-                await message.ack()
-                self._logger.info("Message with delivery tag %s acknowledged", message.delivery_tag)
-            except Exception as ex:
-                self._logger.error(f"Failed to process message: {ex}")
-                failed_translation_messages = map(lambda file_id: create_failed_translation_message(file_id=file_id, process_id=process_id, error_message=f"Failed to process model. Error: {ex}"), files_ids)
-                await send_running_messages_coroutines
-                await send_translated_models_messages(failed_translation_messages)
-                await message.reject(requeue=False)
+                # Prefetched messages wait here for the free slot
+                async with self._processing_slots:
+                    await self._translate_delivered_model(message, model_to_translate_message, process_id)
+            finally:
+                self._translations_coordinator.finish_turn(model_to_translate_message.id)
+
+    async def _translate_delivered_model(self, message: aio_pika.IncomingMessage, model_to_translate_message: ModelToTranslateMessage, process_id: str) -> None:
+        files_ids = model_to_translate_message.ids_of_source_files
+        self._logger.info(f"Message contains {len(files_ids)} source file IDs")
+
+        # RUNNING states not sent yet are coalesced with the final ones
+        status_aggregator = self.create_status_aggregator(process_id)
+        await status_aggregator.add_all(create_running_translation_message(file_id=file_id, process_id=process_id) for file_id in files_ids)
+
+        try:
+            uml_model = await self.get_data_from_repository(model_to_translate_message.id)
+            await self.process_message(
+                uml_model, process_id=process_id, status_aggregator=status_aggregator, model_to_translate_message=model_to_translate_message
+            )
+            await message.ack()
+            self._logger.info("Message with delivery tag %s acknowledged", message.delivery_tag)
+        except Exception as ex:
+            self._logger.error(f"Failed to process message: {ex}")
+            await status_aggregator.add_all(
+                create_failed_translation_message(file_id=file_id, process_id=process_id, error_message=f"Failed to process model. Error: {ex}") for file_id in files_ids
+            )
+            await status_aggregator.close()
+            await message.reject(requeue=False)
+
+    def create_status_aggregator(self, process_id: str) -> TranslationStatusAggregator:
+        return TranslationStatusAggregator(process_id, self._message_producer, self._logger)
 
     def _deserialize_message(self, message: aio_pika.IncomingMessage) -> ModelToTranslateMessage:
         self._logger.debug(f"Deserializing message body: {message.body}")
@@ -125,55 +251,159 @@ class RabbitMQConsumer(MessageConsumer):
         models_repository_api_url = f"{app_config.REPOSITORY_API_URL}/{app_config.REPOSITORY_SERVICE_MODELS_ENDPOINT}/{model_to_translate_id}"
 
         self._logger.debug(f"Fetching data from repository API at {models_repository_api_url}")
-        response_body = await self._repository_api_connector.get_data(models_repository_api_url)
-        self._logger.debug(f"Received response from repository API")
         try:
-            uml_model = UmlModelDTO(**response_body)
+            # Response is parsed as it arrives - the big source files are spooled to the temporary files instead of being kept in memory
+            uml_model = await UmlModelDTO.from_json_stream(self._repository_api_connector.iter_data_chunks(models_repository_api_url))
             self._logger.info(f"Deserialized UML model with ID: {uml_model.id}")
-        except ValidationError as ex:
+        except (ValidationError, JsonStreamError) as ex:
             error_message = f"Failed to deserialize response from the repository service: {ex}. Invalid structure."
             self._logger.error(error_message)
             raise InputDataError(error_message) from ex
         
         return uml_model
 
-    async def process_message(self, uml_model: UmlModelDTO, process_id: str) -> None:
-        # To avoid data races, we need to create a new instance of ModelTranslator for each message
-        model_translator = ModelTranslator(model_deseializer=ModelDeserializer())
-        scheduled_sending_coroutines = []
+    async def process_message(
+        self,
+        uml_model: UmlModelDTO,
+        process_id: str,
+        status_aggregator: Optional[TranslationStatusAggregator] = None,
+        model_to_translate_message: Optional[ModelToTranslateMessage] = None,
+    ) -> None:
+        """
+        Translates the model and saves it. States of its files are sent through the aggregator, after the model is saved.
+        When the message describes the changes of the saved model, only its edited and new files are translated.
+        """
+        status_aggregator = status_aggregator or self.create_status_aggregator(process_id)
         try:
+            stored_model = await self._get_stored_model(uml_model, model_to_translate_message)
+            if stored_model is None:
+                translated_model, files_errors_messages, model_sources = await self._translate(uml_model)
+            else:
+                translated_model, files_errors_messages, model_sources = await self._translate_incrementally(uml_model, *stored_model)
+
+            translation_messages = []
             for uml_file in uml_model.source_files:
-                self._logger.info(f"Processing file: {uml_file.filename}")
-                try:
-                    model_translator.deserialize(data_sources=[uml_file.to_data_source()], clear_builder_afterwards=False, model_id=uml_model.id)
-                    sending_success_message_coroutine = send_translated_model_message(create_successfull_translation_message(file_id=uml_file.id, process_id=process_id))
-                    scheduled_sending_coroutines.append(sending_success_message_coroutine)
-                    self._logger.info(f"File {uml_file.filename} was successfully deserialized")
-                except Exception as ex:
-                    error_message = f"Failed to deserialize file {uml_file.filename}: {ex}"
-                    self._logger.error(error_message)
-                    sending_fail_message_coroutine = send_translated_model_message(create_failed_translation_message(file_id=uml_file.id, process_id=process_id, error_message=error_message))
-                    scheduled_sending_coroutines.append(sending_fail_message_coroutine)
-
-        except UnsupportedSourceDataTypeError as ex:
-            error_message = f"Failed to deserialize model: {ex}"
-            self._logger.error(error_message)
-            await asyncio.gather(*scheduled_sending_coroutines)
-            raise InputDataError(error_message) from ex
+                if uml_file.id in files_errors_messages:
+                    translation_message = create_failed_translation_message(file_id=uml_file.id, process_id=process_id, error_message=files_errors_messages[uml_file.id])
+                else:
+                    translation_message = create_successfull_translation_message(file_id=uml_file.id, process_id=process_id)
+                translation_messages.append(translation_message)
+
+            await self._uml_model_repository.save(translated_model, model_sources)
+            self._logger.info(f"Model {uml_model.id} saved")
+            await status_aggregator.add_all(translation_messages)
+            self._logger.info(f"Successfully translated model: {translated_model.id}")
+        finally:
+            uml_model.release()
+            await status_aggregator.close()
+
+    async def _get_stored_model(
+        self, uml_model: UmlModelDTO, model_to_translate_message: Optional[ModelToTranslateMessage]
+    ) -> Optional[tuple[dict, UmlModelSourcesDTO, List[str]]]:
+        """
+        Returns the saved model, its sources and IDs of the files to translate again - None, if the whole model has to be translated.
+        """
+        if not app_config.TRANSLATION_INCREMENTAL_ENABLED or model_to_translate_message is None:
+            return None
+        changes_lists = (
+            model_to_translate_message.ids_of_edited_files, model_to_translate_message.ids_of_new_submitted_files, model_to_translate_message.ids_of_deleted_files
+        )
+        if all(changes_list is None for changes_list in changes_lists):
+            # Message doesn't describe an update of the model
+            return None
+
+        model_data, model_sources = await self._uml_model_repository.get_raw_with_sources(str(uml_model.id)) or (None, None)
+        files_to_translate_ids = get_files_to_translate(
+            [uml_file.id for uml_file in uml_model.source_files], model_data, model_sources,
+            model_to_translate_message.ids_of_edited_files, model_to_translate_message.ids_of_new_submitted_files,
+        )
+        if files_to_translate_ids is None:
+            self._logger.info(f"Model {uml_model.id} is translated as a whole")
+            return None
+        return model_data, model_sources, files_to_translate_ids
+
+    async def _translate_incrementally(
+        self,
+        uml_model: UmlModelDTO,
+        model_data: dict,
+        model_sources: UmlModelSourcesDTO,
+        files_to_translate_ids: List[str],
+    ) -> ModelTranslationResult:
+        """
+        Translates the changed files only and merges their elements with the elements of the other files, taken from the saved model.
+        """
+        self._logger.info(f"Translating {len(files_to_translate_ids)} of {len(uml_model.source_files)} files of model {uml_model.id}")
+        files_to_translate_ids = set(files_to_translate_ids)
+        for uml_file in uml_model.source_files:
+            if str(uml_file.id) not in files_to_translate_ids:
+                uml_file.release()
+
+        if files_to_translate_ids:
+            changed_files_model = UmlModelDTO(
+                id=uml_model.id, source_files=[uml_file for uml_file in uml_model.source_files if str(uml_file.id) in files_to_translate_ids]
+            )
+            translated_model, files_errors_messages, translated_model_sources = await self._translate(changed_files_model)
+            translated_model_data = translated_model.model_dump()
+        else:
+            files_errors_messages, translated_model_data, translated_model_sources = {}, {}, UmlModelSourcesDTO()
+
+        merged_model_data, merged_model_sources = merge_translated_files(
+            [uml_file.id for uml_file in uml_model.source_files], model_data, model_sources, translated_model_data, translated_model_sources
+        )
+        return ModelTranslationResult(UmlModel(**merged_model_data), files_errors_messages, merged_model_sources)
+
+    async def _translate(self, uml_model: UmlModelDTO) -> ModelTranslationResult:
+        """
+        Translates the files of the model. Errors of the files are returned with the model of the others, to be reported with their states.
+        """
+        if self._translation_executor.uses_processes:
+            return await self._translate_in_worker(uml_model)
+        return await self._translate_in_thread(uml_model)
+
+    async def _translate_in_worker(self, uml_model: UmlModelDTO) -> ModelTranslationResult:
+        try:
+            translation_result = await self._translation_executor.run(
+                translate_model_in_worker, uml_model, app_config.TRANSLATION_FILE_TIME_LIMIT, self._memory_limit
+            )
         except Exception as ex:
             error_message = f"Failed to translate model: {ex}"
             self._logger.error(error_message)
-            await asyncio.gather(*scheduled_sending_coroutines)
             raise InputDataError(error_message) from ex
 
-        self._logger.info("Serializing translated model")
-        translated_model = model_translator.serialize(to_string=False)
-        await self._uml_model_repository.save(translated_model)
-        model_translator.clear()
-        self._logger.info(f"Model {uml_model.id} saved and translator state cleared")
-        await asyncio.gather(*scheduled_sending_coroutines)
+        for error_message in translation_result.files_errors_messages.values():
+            self._logger.error(error_message)
+        return translation_result
 
-        self._logger.info(f"Successfully translated model: {translated_model.id}")
+    async def _translate_in_thread(self, uml_model: UmlModelDTO) -> ModelTranslationResult:
+        # The translator is shared by the messages - each of them is translated in its own context, to avoid data races
+        model_translator = self._model_translator
+        translation_context = model_translator.create_context()
+        files_errors_messages = {}
+        for uml_file in uml_model.source_files:
+            self._logger.info(f"Processing file: {uml_file.filename}")
+            try:
+                # Run outside of the event loop, so heartbeats and other messages are handled during the translation
+                with translation_context.record_source(str(uml_file.id)):
+                    await model_translator.adeserialize(
+                        data_sources=[uml_file.to_data_source()], clear_builder_afterwards=False, model_id=uml_model.id, context=translation_context,
+                        time_limit=app_config.TRANSLATION_FILE_TIME_LIMIT, memory_limit=self._memory_limit,
+                    )
+                self._logger.info(f"File {uml_file.filename} was successfully deserialized")
+            except Exception as ex:
+                error_message = get_file_translation_error_message(uml_file, ex)
+                self._logger.error(error_message)
+                files_errors_messages[uml_file.id] = error_message
+            finally:
+                uml_file.release()
+
+        self._logger.info("Serializing translated model")
+        try:
+            translated_model = await model_translator.aserialize(to_string=False, context=translation_context)
+            model_sources = UmlModelSourcesDTO.from_contributions(translation_context.sources_contributions, files_errors_messages)
+        finally:
+            model_translator.clear(translation_context)
+        self._logger.info("Translation context cleared")
+        return ModelTranslationResult(translated_model, files_errors_messages, model_sources)
 
     async def start_consuming(self) -> None:
         self._logger.info("Starting to consume messages")
@@ -1,10 +1,11 @@
 import json
-from typing import Optional, Iterable, Coroutine, List
+from typing import Optional, Iterable, Coroutine, List, Dict, AsyncIterator
 import logging
 import asyncio
 
-from kink import inject
+from kink import inject, di
 import aio_pika
+from aio_pika.pool import Pool
 from contextlib import asynccontextmanager
 
 from umlars_translator.app.adapters.message_brokers.message_producer import MessageProducer
@@ -15,82 +16,166 @@ from umlars_translator.app.dtos.messages import ProcessStatusEnum, TranslatedFil
 
 @inject(alias=MessageProducer)
 class RabbitMQProducer(MessageProducer):
-    def __init__(self, queue_name: str = config.MESSAGE_BROKER_QUEUE_TRANSLATED_MODELS_NAME, rabbitmq_host: str = config.MESSAGE_BROKER_HOST, messaging_logger: Optional[logging.Logger] = None) -> None:
+    """
+    Publishes the messages through one long-lived connection, shared by all the senders.
+    Channels are taken from the pool and the queues are declared once per connection.
+    Messages sent together are published at once and their publisher confirms are awaited in a batch.
+    """
+    def __init__(self, queue_name: str = config.MESSAGE_BROKER_QUEUE_TRANSLATED_MODELS_NAME, rabbitmq_host: str = config.MESSAGE_BROKER_HOST, messaging_logger: Optional[logging.Logger] = None, channel_pool_size: Optional[int] = None) -> None:
         self._logger = messaging_logger.getChild(self.__class__.__name__)
         self._queue_name = queue_name
         self._rabbitmq_host = rabbitmq_host
+        self._channel_pool_size = channel_pool_size or config.MESSAGE_BROKER_PRODUCER_CHANNEL_POOL_SIZE
         self._connection = None
-        self._channel = None
-        self._queue = None
+        self._channel_pool = None
+        self._declared_queues_names = set()
+        self._connection_lock = None
         self._logger.info(f"RabbitMQProducer initialized with queue '{queue_name}' and host '{rabbitmq_host}'")
 
+    async def connect(self, rabbitmq_host: Optional[str] = None, reset_connection: bool = False) -> aio_pika.abc.AbstractRobustConnection:
+        """
+        Returns the producer's connection, establishing it on the first use. Robust connection restores itself
+        (and its channels) after the network failures, so it is established again only when it was closed or reset.
+        """
+        if self._connection_lock is None:
+            self._connection_lock = asyncio.Lock()
+
+        async with self._connection_lock:
+            if self._connection is not None and not reset_connection and not self._connection.is_closed:
+                return self._connection
+
+            await self._close_connection()
+            rabbitmq_host = rabbitmq_host or self._rabbitmq_host
+            self._logger.info(f"Connecting to RabbitMQ at host '{rabbitmq_host}'")
+            self._connection = await aio_pika.connect_robust(
+                host=rabbitmq_host,
+                port=config.MESSAGE_BROKER_PORT,
+                login=config.MESSAGE_BROKER_USER,
+                password=config.MESSAGE_BROKER_PASSWORD,
+            )
+            self._channel_pool = Pool(self._open_channel, max_size=self._channel_pool_size)
+            self._logger.info("RabbitMQ connection established")
+            return self._connection
+
+    async def _open_channel(self) -> aio_pika.abc.AbstractRobustChannel:
+        self._logger.debug("Opening new channel of the pool")
+        return await self._connection.channel(publisher_confirms=True)
+
     @asynccontextmanager
-    async def connect_channel(self, rabbitmq_host: Optional[str] = None, queue_name: Optional[str] = None, is_queue_durable: bool = True, reset_connection: bool = False) -> None:
+    async def connect_channel(self, rabbitmq_host: Optional[str] = None, queue_name: Optional[str] = None, is_queue_durable: bool = True, reset_connection: bool = False) -> AsyncIterator[aio_pika.abc.AbstractChannel]:
+        """
+        Lends the channel from the pool, with the queue declared. The channel is returned to the pool afterwards - the connection stays open.
+        """
+        queue_name = queue_name or self._queue_name
         try:
-            if not self._connection or reset_connection or self._connection.is_closed:
-                rabbitmq_host = rabbitmq_host or self._rabbitmq_host
-                queue_name = queue_name or self._queue_name
-                self._logger.info(f"Connecting to RabbitMQ at host '{rabbitmq_host}' with queue '{queue_name}'")
-
-                self._connection = await aio_pika.connect_robust(
-                    host=rabbitmq_host,
-                    port=config.MESSAGE_BROKER_PORT,
-                    login=config.MESSAGE_BROKER_USER,
-                    password=config.MESSAGE_BROKER_PASSWORD,
-                )
-                self._logger.info("RabbitMQ connection established")
-            else:
-                self._logger.info("Using existing RabbitMQ connection")
-
-            self._channel = await self._connection.channel()
-            self._queue = await self._channel.declare_queue(queue_name, durable=is_queue_durable)
-            self._logger.info(f"Connected to RabbitMQ channel and declared queue '{queue_name}' with durability '{is_queue_durable}'")
-            yield self._channel
+            await self.connect(rabbitmq_host, reset_connection)
+            channel_pool = self._channel_pool
+            async with channel_pool.acquire() as channel:
+                if queue_name not in self._declared_queues_names:
+                    await channel.declare_queue(queue_name, durable=is_queue_durable)
+                    self._declared_queues_names.add(queue_name)
+                    self._logger.info(f"Declared queue '{queue_name}' with durability '{is_queue_durable}'")
+                yield channel
         except aio_pika.exceptions.AMQPConnectionError as ex:
             self._logger.error(f"Failed to connect to the RabbitMQ channel: {ex}")
             raise QueueUnavailableError("Failed to connect to the RabbitMQ channel") from ex
+        except QueueUnavailableError:
+            raise
         except Exception as ex:
             self._logger.error(f"Unexpected error while connecting to RabbitMQ: {ex}")
             raise QueueUnavailableError("Unexpected error while connecting to RabbitMQ") from ex
-        finally:
-            if self._connection and not self._connection.is_closed:
-                self._logger.info("Closing RabbitMQ connection")
-                await self._connection.close()
-                self._logger.info("RabbitMQ connection closed")
 
     async def send_message(self, message_data: dict) -> None:
-        self._logger.info(f"Preparing to send message: {message_data}")
+        await self.send_messages([message_data])
+
+    async def send_messages(self, messages_data: Iterable[dict]) -> None:
+        """
+        Publishes all the messages through one channel, without waiting for the confirm of each one before sending the next.
+        Returns after the broker confirmed all of them.
+        """
+        messages = [self._create_message(message_data) for message_data in messages_data]
+        if not messages:
+            return
+
+        self._logger.info(f"Preparing to send {len(messages)} messages")
         async with self.connect_channel() as channel:
             try:
-                message_body = json.dumps(message_data).encode()
-                self._logger.debug(f"Encoded message body: {message_body}")
-
-                await channel.default_exchange.publish(
-                    aio_pika.Message(
-                        body=message_body,
-                        delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
-                    ),
-                    routing_key=self._queue_name,
-                )
-                self._logger.info(f"Message sent to queue '{self._queue_name}'")
+                await asyncio.gather(*(channel.default_exchange.publish(message, routing_key=self._queue_name) for message in messages))
+                self._logger.info(f"{len(messages)} messages sent to queue '{self._queue_name}'")
             except Exception as ex:
                 self._logger.error(f"Error while sending message to RabbitMQ: {ex}")
                 raise ValueError(f"Error while sending message to RabbitMQ: {ex}") from ex
 
+    def _create_message(self, message_data: dict) -> aio_pika.Message:
+        message_body = json.dumps(message_data).encode()
+        self._logger.debug(f"Encoded message body: {message_body}")
+        return aio_pika.Message(body=message_body, delivery_mode=aio_pika.DeliveryMode.PERSISTENT)
+
+    async def close(self) -> None:
+        if self._connection_lock is None:
+            return await self._close_connection()
+        async with self._connection_lock:
+            await self._close_connection()
+
+    async def _close_connection(self) -> None:
+        if self._channel_pool is not None and not self._channel_pool.is_closed:
+            await self._channel_pool.close()
+        self._channel_pool = None
+        self._declared_queues_names.clear()
+
+        if self._connection is not None and not self._connection.is_closed:
+            self._logger.info("Closing RabbitMQ connection")
+            await self._connection.close()
+            self._logger.info("RabbitMQ connection closed")
+        self._connection = None
+
+
+_shared_producers: Dict[str, RabbitMQProducer] = {}
+
+
+def get_shared_producer(queue_name: str = config.MESSAGE_BROKER_QUEUE_TRANSLATED_MODELS_NAME) -> RabbitMQProducer:
+    """
+    Returns the producer shared by all the senders of the messages to the given queue, so they reuse its connection.
+    """
+    if queue_name == config.MESSAGE_BROKER_QUEUE_TRANSLATED_MODELS_NAME:
+        return di[RabbitMQProducer]
+    if queue_name not in _shared_producers:
+        _shared_producers[queue_name] = RabbitMQProducer(queue_name=queue_name, rabbitmq_host=config.MESSAGE_BROKER_HOST)
+    return _shared_producers[queue_name]
+
+
+async def close_shared_producers() -> None:
+    for producer in [di[RabbitMQProducer], *_shared_producers.values()]:
+        await producer.close()
+    _shared_producers.clear()
+
 
 async def send_translated_model_message(message_data: dict, producer: Optional[MessageProducer] = None, queue_name: str = config.MESSAGE_BROKER_QUEUE_TRANSLATED_MODELS_NAME) -> Coroutine:
     try:
         if producer is None:
-            producer = RabbitMQProducer(queue_name=queue_name, rabbitmq_host=config.MESSAGE_BROKER_HOST)
+            producer = get_shared_producer(queue_name)
         return await producer.send_message(message_data)
     except Exception as ex:
         logging.error(f"Failed to send translated model message: {ex}")
         raise ValueError(f"Error while sending message: {ex}") from ex
 
 
-async def send_translated_models_messages(messages_data: Iterable[dict], producer: Optional[MessageProducer] = None, queue_name: str = config.MESSAGE_BROKER_QUEUE_TRANSLATED_MODELS_NAME) -> Coroutine:
+async def _send_translated_models_messages(messages_data: List[dict], producer: Optional[MessageProducer], queue_name: str) -> None:
+    try:
+        if producer is None:
+            producer = get_shared_producer(queue_name)
+        return await producer.send_messages(messages_data)
+    except Exception as ex:
+        logging.error(f"Failed to send translated model messages: {ex}")
+        raise ValueError(f"Error while sending messages: {ex}") from ex
+
+
+def send_translated_models_messages(messages_data: Iterable[dict], producer: Optional[MessageProducer] = None, queue_name: str = config.MESSAGE_BROKER_QUEUE_TRANSLATED_MODELS_NAME) -> asyncio.Task:
+    """
+    Schedules sending of the messages in one batch. Returned task can be awaited more than once.
+    """
     logging.info(f"Sending translated model messages to queue '{queue_name}'")
-    return asyncio.gather(*[send_translated_model_message(message_data, producer, queue_name) for message_data in messages_data])
+    return asyncio.ensure_future(_send_translated_models_messages(list(messages_data), producer, queue_name))
 
 
 def create_successfull_translation_message(file_id: str, process_id: str) -> dict:
@@ -0,0 +1,104 @@
+from typing import Dict, Iterable, List, Optional
+import asyncio
+import logging
+
+from umlars_translator.app.adapters.message_brokers.message_producer import MessageProducer
+from umlars_translator.app.adapters.message_brokers import config
+from umlars_translator.app.dtos.messages import TranslatedFileMessage, TranslatedFilesMessage
+
+
+class TranslationStatusAggregator:
+    """
+    Collects the states of the files translated in one process and sends them together.
+    Only the latest state of each file waits for sending - e.g. RUNNING state replaced by FINISHED before the flush isn't sent at all.
+    Collected states are flushed, when there are batch_max_size of them or batch_max_delay seconds after the first one was added.
+    With batching disabled, each state is sent as a separate TranslatedFileMessage (all of them published at once),
+    otherwise TranslatedFilesMessage carries up to batch_max_size states.
+    """
+    def __init__(
+        self,
+        process_id: str,
+        message_producer: MessageProducer,
+        messaging_logger: Optional[logging.Logger] = None,
+        batch_messages: Optional[bool] = None,
+        batch_max_size: Optional[int] = None,
+        batch_max_delay: Optional[float] = None,
+    ) -> None:
+        self._logger = (messaging_logger or logging.getLogger(config.APP_LOGGER_NAME)).getChild(self.__class__.__name__)
+        self._process_id = process_id
+        self._message_producer = message_producer
+        self._batch_messages = config.MESSAGE_BROKER_BATCH_STATUS_MESSAGES if batch_messages is None else batch_messages
+        self._batch_max_size = max(batch_max_size or config.MESSAGE_BROKER_STATUS_BATCH_MAX_SIZE, 1)
+        self._batch_max_delay = config.MESSAGE_BROKER_STATUS_BATCH_MAX_DELAY if batch_max_delay is None else batch_max_delay
+        self._pending_files_states: Dict[str | int, TranslatedFileMessage] = {}
+        self._delayed_flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+    @property
+    def process_id(self) -> str:
+        return self._process_id
+
+    @property
+    def pending_files_states(self) -> List[TranslatedFileMessage]:
+        return list(self._pending_files_states.values())
+
+    async def add(self, message_data: dict) -> None:
+        """
+        Adds the state of the file, given as the TranslatedFileMessage data, replacing its state waiting for sending.
+        """
+        file_state = TranslatedFileMessage(**message_data)
+        # Moved to the end, so the states are sent in the order of their last change
+        self._pending_files_states.pop(file_state.id, None)
+        self._pending_files_states[file_state.id] = file_state
+
+        if len(self._pending_files_states) >= self._batch_max_size:
+            await self.flush()
+        elif self._delayed_flush_task is None:
+            self._delayed_flush_task = asyncio.create_task(self._flush_after_delay())
+
+    async def add_all(self, messages_data: Iterable[dict]) -> None:
+        for message_data in messages_data:
+            await self.add(message_data)
+
+    async def flush(self) -> None:
+        self._cancel_delayed_flush()
+        async with self._flush_lock:
+            files_states = self.pending_files_states
+            self._pending_files_states.clear()
+            if not files_states:
+                return
+
+            self._logger.info(f"Sending {len(files_states)} files states of the process {self._process_id}")
+            await self._message_producer.send_messages(self._create_messages(files_states))
+
+    async def close(self) -> None:
+        await self.flush()
+
+    def _create_messages(self, files_states: List[TranslatedFileMessage]) -> List[dict]:
+        if not self._batch_messages:
+            return [file_state.model_dump() for file_state in files_states]
+
+        return [
+            TranslatedFilesMessage(process_id=self._process_id, files_states=files_states[batch_start:batch_start + self._batch_max_size]).model_dump()
+            for batch_start in range(0, len(files_states), self._batch_max_size)
+        ]
+
+    async def _flush_after_delay(self) -> None:
+        await asyncio.sleep(self._batch_max_delay)
+        # Flushing task can't cancel itself
+        self._delayed_flush_task = None
+        try:
+            await self.flush()
+        except Exception as ex:
+            self._logger.error(f"Failed to send files states of the process {self._process_id}: {ex}")
+
+    def _cancel_delayed_flush(self) -> None:
+        if self._delayed_flush_task is not None and self._delayed_flush_task is not asyncio.current_task():
+            self._delayed_flush_task.cancel()
+        self._delayed_flush_task = None
+
+    async def __aenter__(self) -> "TranslationStatusAggregator":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
@@ -0,0 +1,174 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+from collections import OrderedDict
+import threading
+import time
+
+from umlars_translator.app.dtos.uml_model import UmlModel
+from umlars_translator.app.dtos.model_sources import UmlModelSourcesDTO
+from umlars_translator.app.adapters.repositories.uml_model_repository import UmlModelRepository, SerializedUmlModel
+from umlars_translator.app import config
+from umlars_translator.core.serialization.compression import CompressionMethod
+
+
+CacheKey = Tuple[str, Optional[int]]
+
+
+class UmlModelCache:
+    """
+    LRU cache of the serialized models, limited by both the number of entries and their total size.
+    Entries are keyed by the model's ID and revision - only the latest cached revision of the model is returned.
+    Invalidations are counted with the ticks: model read before its invalidation isn't put in the cache,
+    so the version read concurrently with the save can't replace the saved one.
+    """
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None, ttl: Optional[float] = None) -> None:
+        self._max_entries = max_entries if max_entries is not None else config.UML_MODEL_CACHE_MAX_ENTRIES
+        self._max_bytes = max_bytes if max_bytes is not None else config.UML_MODEL_CACHE_MAX_BYTES
+        self._ttl = ttl if ttl is not None else config.UML_MODEL_CACHE_TTL
+        self._entries: OrderedDict[CacheKey, Tuple[SerializedUmlModel, float]] = OrderedDict()
+        self._latest_keys: Dict[str, CacheKey] = {}
+        self._size = 0
+        self._tick = 0
+        # Ticks of the latest invalidations of the models - older ones are forgotten, the latest forgotten tick applies to them
+        self._invalidations_ticks: OrderedDict[str, int] = OrderedDict()
+        self._forgotten_invalidation_tick = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, model_id: str, content_encoding: Optional[CompressionMethod] = None) -> Optional[SerializedUmlModel]:
+        """
+        Returns the cached model, with its body compressed with the given method - compressed once and cached along.
+        """
+        with self._lock:
+            key = self._latest_keys.get(model_id)
+            if key is None:
+                return None
+
+            serialized_model, cached_at = self._entries[key]
+            if self._ttl and time.monotonic() - cached_at > self._ttl:
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+            if content_encoding is not None and content_encoding not in serialized_model.encoded_bodies:
+                size_before_encoding = serialized_model.size
+                serialized_model.get_body(content_encoding)
+                self._size += serialized_model.size - size_before_encoding
+                self._evict()
+            return serialized_model
+
+    def start_read(self) -> int:
+        """
+        Returns the tick, which has to be passed to put the model read after this call.
+        """
+        with self._lock:
+            return self._tick
+
+    def put(self, serialized_model: SerializedUmlModel, read_tick: int) -> bool:
+        model_id = serialized_model.model_id
+        with self._lock:
+            if self._invalidations_ticks.get(model_id, self._forgotten_invalidation_tick) > read_tick:
+                # Model was saved since it was read
+                return False
+            if serialized_model.size > self._max_bytes:
+                return False
+
+            if (previous_key := self._latest_keys.get(model_id)) is not None:
+                self._remove(previous_key)
+            key = (model_id, serialized_model.revision)
+            self._entries[key] = (serialized_model, time.monotonic())
+            self._latest_keys[model_id] = key
+            self._size += serialized_model.size
+            self._evict()
+            return True
+
+    def invalidate(self, model_id: str) -> None:
+        with self._lock:
+            self._tick += 1
+            self._invalidations_ticks[model_id] = self._tick
+            self._invalidations_ticks.move_to_end(model_id)
+            while len(self._invalidations_ticks) > self._max_entries:
+                _, self._forgotten_invalidation_tick = self._invalidations_ticks.popitem(last=False)
+
+            if (key := self._latest_keys.get(model_id)) is not None:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tick += 1
+            self._forgotten_invalidation_tick = self._tick
+            self._invalidations_ticks.clear()
+            self._entries.clear()
+            self._latest_keys.clear()
+            self._size = 0
+
+    def _remove(self, key: CacheKey) -> None:
+        serialized_model, _ = self._entries.pop(key)
+        self._size -= serialized_model.size
+        if self._latest_keys.get(key[0]) == key:
+            del self._latest_keys[key[0]]
+
+    def _evict(self) -> None:
+        while self._entries and (len(self._entries) > self._max_entries or self._size > self._max_bytes):
+            self._remove(next(iter(self._entries)))
+
+
+class CachedUmlModelRepository(UmlModelRepository):
+    """
+    Read-through cache of the serialized models in front of another repository.
+    Cached model is dropped when it is saved through this repository - models saved by the other processes
+    are read again after the cache's TTL.
+    """
+    def __init__(self, repository: UmlModelRepository, cache: Optional[UmlModelCache] = None) -> None:
+        self._repository = repository
+        self._cache = cache if cache is not None else UmlModelCache()
+
+    @property
+    def cache(self) -> UmlModelCache:
+        return self._cache
+
+    async def get(self, model_id: str) -> Optional[UmlModel]:
+        return await self._repository.get(model_id)
+
+    async def get_with_revision(self, model_id: str) -> Optional[Tuple[UmlModel, Optional[int]]]:
+        return await self._repository.get_with_revision(model_id)
+
+    async def get_raw(self, model_id: str, fields: Optional[List[str]] = None) -> Optional[dict]:
+        return await self._repository.get_raw(model_id, fields)
+
+    async def get_diagram_raw(self, model_id: str, diagram_id: str) -> Optional[dict]:
+        return await self._repository.get_diagram_raw(model_id, diagram_id)
+
+    async def get_raw_with_sources(self, model_id: str) -> Optional[Tuple[dict, Optional[UmlModelSourcesDTO]]]:
+        return await self._repository.get_raw_with_sources(model_id)
+
+    async def get_serialized(self, model_id: str, content_encoding: Optional[CompressionMethod] = None) -> Optional[SerializedUmlModel]:
+        model_id = str(model_id)
+        serialized_model = self._cache.get(model_id, content_encoding)
+        if serialized_model is not None:
+            return serialized_model
+
+        read_tick = self._cache.start_read()
+        serialized_model = await super().get_serialized(model_id, content_encoding)
+        if serialized_model is not None:
+            self._cache.put(serialized_model, read_tick)
+        return serialized_model
+
+    async def save(self, uml_model: UmlModel, model_sources: Optional[UmlModelSourcesDTO] = None):
+        try:
+            return await self._repository.save(uml_model, model_sources)
+        finally:
+            self._cache.invalidate(str(uml_model.id))
+
+    async def save_many(self, uml_models: Iterable[UmlModel]):
+        uml_models = list(uml_models)
+        try:
+            return await self._repository.save_many(uml_models)
+        finally:
+            for uml_model in uml_models:
+                self._cache.invalidate(str(uml_model.id))
@@ -0,0 +1,107 @@
+from typing import Any, Dict, List, Optional
+import hashlib
+import json
+
+
+HASHES_FIELD_NAME = "_hashes"
+REVISION_FIELD_NAME = "_revision"
+# Fields split into the elements - changes of their elements are saved separately
+ELEMENTS_SECTIONS_NAMES = ("elements", "diagrams")
+# Separator of the keys of the hashes - dots can't be used in the names of the fields
+HASHES_KEY_SEPARATOR = "/"
+
+
+def hash_value(value: Any) -> str:
+    serialized_value = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(serialized_value.encode(), digest_size=12).hexdigest()
+
+
+def is_elements_list(value: Any) -> bool:
+    return isinstance(value, list) and all(isinstance(item, dict) and "id" in item for item in value)
+
+
+def compute_document_hashes(document: Dict[str, Any]) -> Dict[str, str | List[List[str]]]:
+    """
+    Returns hashes of the parts of the document - saved along it, so the next version can be compared with it without reading it.
+    Fields of the elements sections are hashed separately, lists of the elements - element by element, as [id, hash] pairs.
+    Other fields are hashed as a whole.
+    """
+    document_hashes = {}
+    for field_name, value in document.items():
+        if field_name in ELEMENTS_SECTIONS_NAMES and isinstance(value, dict):
+            for section_field_name, section_value in value.items():
+                key = f"{field_name}{HASHES_KEY_SEPARATOR}{section_field_name}"
+                if is_elements_list(section_value):
+                    document_hashes[key] = [[str(element["id"]), hash_value(element)] for element in section_value]
+                else:
+                    document_hashes[key] = hash_value(section_value)
+        else:
+            document_hashes[field_name] = hash_value(value)
+    return document_hashes
+
+
+def get_value_at_hashes_key(document: Dict[str, Any], key: str) -> Any:
+    value = document
+    for field_name in key.split(HASHES_KEY_SEPARATOR):
+        value = value[field_name]
+    return value
+
+
+def create_elements_list_update(
+    path: str, hashes_path: str, elements: List[dict], hashes: List[List[str]], stored_hashes: List[List[str]]
+) -> Dict[str, Any]:
+    """
+    Returns fields to set (with their hashes), updating the stored list of the elements. When the elements stayed in place,
+    only the changed ones are set - new elements appended at the end are set at their indexes. Otherwise, the whole list is set.
+    """
+    stored_ids = [element_id for element_id, _ in stored_hashes]
+    ids = [element_id for element_id, _ in hashes]
+    if ids[:len(stored_ids)] != stored_ids:
+        return {path: elements, hashes_path: hashes}
+
+    fields_to_set = {}
+    for index, (element, element_id_and_hash) in enumerate(zip(elements, hashes)):
+        if index >= len(stored_hashes) or stored_hashes[index] != element_id_and_hash:
+            fields_to_set[f"{path}.{index}"] = element
+            fields_to_set[f"{hashes_path}.{index}"] = element_id_and_hash
+    return fields_to_set
+
+
+def create_update(
+    document: Dict[str, Any], document_hashes: Dict[str, Any], stored_hashes: Optional[Dict[str, Any]]
+) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Returns the update operators changing the stored document (described by its hashes) into the given one:
+    $set of the changed fields and elements, $unset of the removed fields - along with their hashes. Returns None, if nothing changed.
+    Without the stored hashes, the whole document is set.
+    """
+    if not stored_hashes:
+        return {"$set": document | {HASHES_FIELD_NAME: document_hashes}}
+
+    fields_to_set = {}
+    for key, value_hash in document_hashes.items():
+        stored_value_hash = stored_hashes.get(key)
+        if stored_value_hash == value_hash:
+            continue
+
+        path = key.replace(HASHES_KEY_SEPARATOR, ".")
+        hashes_path = f"{HASHES_FIELD_NAME}.{key}"
+        value = get_value_at_hashes_key(document, key)
+        if isinstance(value_hash, list) and isinstance(stored_value_hash, list):
+            fields_to_set |= create_elements_list_update(path, hashes_path, value, value_hash, stored_value_hash)
+        else:
+            fields_to_set[path] = value
+            fields_to_set[hashes_path] = value_hash
+
+    removed_keys = stored_hashes.keys() - document_hashes.keys()
+    fields_to_unset = {key.replace(HASHES_KEY_SEPARATOR, "."): "" for key in removed_keys}
+    fields_to_unset |= {f"{HASHES_FIELD_NAME}.{key}": "" for key in removed_keys}
+    if not fields_to_set and not fields_to_unset:
+        return None
+
+    update = {}
+    if fields_to_set:
+        update["$set"] = fields_to_set
+    if fields_to_unset:
+        update["$unset"] = fields_to_unset
+    return update
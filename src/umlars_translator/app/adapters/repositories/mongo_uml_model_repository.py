@@ -1,26 +1,124 @@
-from typing import Optional
+from typing import Iterable, List, Optional, Tuple
 
-from pymongo import MongoClient
-from pymongo.results import UpdateResult
+from pymongo import MongoClient, UpdateOne
+from pymongo.results import UpdateResult, BulkWriteResult
 
 from umlars_translator.app.dtos.uml_model import UmlModel
+from umlars_translator.app.dtos.model_sources import UmlModelSourcesDTO
 from umlars_translator.app.adapters.repositories.uml_model_repository import UmlModelRepository
+from umlars_translator.app.adapters.repositories.document_diff import HASHES_FIELD_NAME, REVISION_FIELD_NAME, compute_document_hashes, create_update
+
+
+DIAGRAMS_LISTS_NAMES = ("class_diagrams", "sequence_diagrams")
+# Provenance of the model's elements, stored along the model
+SOURCES_FIELD_NAME = "_sources"
+INTERNAL_FIELDS_PROJECTION = {HASHES_FIELD_NAME: 0, REVISION_FIELD_NAME: 0, SOURCES_FIELD_NAME: 0}
 
 
 class MongoDBUmlModelRepository(UmlModelRepository):
+    """
+    Saves only the changes of the models. Hashes of the model's fields and elements are stored along it - the new version
+    is compared with them (without reading the stored model) and only the changed fields and elements are set.
+    The revision of the stored model guards the partial update - if it was changed in the meantime, the whole model is set.
+    """
     def __init__(self, db_client: MongoClient, dbname: str, collection_name: str):
         self._client = db_client
         self._db = self._client[dbname]
         self._collection = self._db[collection_name]
 
     async def get(self, model_id: str) -> Optional[UmlModel]:
-        db_model = await self._collection.find_one({"_id": str(model_id)})
+        db_model = await self._collection.find_one({"_id": str(model_id)}, INTERNAL_FIELDS_PROJECTION)
         return UmlModel.from_mongo(db_model) if db_model else None
-            
-    async def save(self, uml_model: UmlModel) -> UpdateResult:
-        result = await self._collection.update_one(
-            {"_id": str(uml_model.id)},
-            {"$set": uml_model.model_dump()},
-            upsert=True
-        )
+
+    async def get_with_revision(self, model_id: str) -> Optional[Tuple[UmlModel, Optional[int]]]:
+        db_model = await self._collection.find_one({"_id": str(model_id)}, {HASHES_FIELD_NAME: 0, SOURCES_FIELD_NAME: 0})
+        if not db_model:
+            return None
+        revision = db_model.pop(REVISION_FIELD_NAME, None)
+        return UmlModel.from_mongo(db_model), revision
+
+    async def get_raw(self, model_id: str, fields: Optional[List[str]] = None) -> Optional[dict]:
+        # Only the requested fields are read and sent by the database
+        projection = {field: 1 for field in fields} if fields else INTERNAL_FIELDS_PROJECTION
+        db_model = await self._collection.find_one({"_id": str(model_id)}, projection)
+        if db_model is None:
+            return None
+        db_model["id"] = db_model.pop("_id")
+        return db_model
+
+    async def get_raw_with_sources(self, model_id: str) -> Optional[Tuple[dict, Optional[UmlModelSourcesDTO]]]:
+        db_model = await self._collection.find_one({"_id": str(model_id)}, {HASHES_FIELD_NAME: 0, REVISION_FIELD_NAME: 0})
+        if db_model is None:
+            return None
+        db_model["id"] = db_model.pop("_id")
+        model_sources = db_model.pop(SOURCES_FIELD_NAME, None)
+        return db_model, UmlModelSourcesDTO(**model_sources) if model_sources is not None else None
+
+    async def get_diagram_raw(self, model_id: str, diagram_id: str) -> Optional[dict]:
+        diagrams_lists = [{"$ifNull": [f"$diagrams.{diagrams_list_name}", []]} for diagrams_list_name in DIAGRAMS_LISTS_NAMES]
+        pipeline = [
+            {"$match": {"_id": str(model_id)}},
+            {"$project": {"_id": 0, "diagram": {"$arrayElemAt": [
+                {"$filter": {"input": {"$concatArrays": diagrams_lists}, "cond": {"$eq": ["$$this.id", diagram_id]}}}, 0
+            ]}}},
+        ]
+        results = await self._collection.aggregate(pipeline).to_list(length=1)
+        return results[0].get("diagram") if results else None
+
+    async def save(self, uml_model: UmlModel, model_sources: Optional[UmlModelSourcesDTO] = None) -> UpdateResult:
+        model_id = str(uml_model.id)
+        stored_model_state = await self._collection.find_one({"_id": model_id}, {HASHES_FIELD_NAME: 1, REVISION_FIELD_NAME: 1})
+        update_arguments = self._create_update_arguments(uml_model, stored_model_state, model_sources)
+        if update_arguments is None:
+            return None
+
+        result = await self._collection.update_one(**update_arguments)
+        if result.matched_count == 0 and result.upserted_id is None:
+            # Model was changed since its hashes were read
+            result = await self._collection.update_one(**self._create_update_arguments(uml_model, model_sources=model_sources))
         return result
+
+    async def save_many(self, uml_models: Iterable[UmlModel]) -> Optional[BulkWriteResult]:
+        """
+        Saves the changes of all the models in one bulk write.
+        """
+        uml_models = list(uml_models)
+        if not uml_models:
+            return None
+
+        models_ids = [str(uml_model.id) for uml_model in uml_models]
+        stored_models_states = {
+            stored_model_state["_id"]: stored_model_state
+            async for stored_model_state in self._collection.find({"_id": {"$in": models_ids}}, {HASHES_FIELD_NAME: 1, REVISION_FIELD_NAME: 1})
+        }
+        update_operations = [
+            UpdateOne(**update_arguments)
+            for uml_model, model_id in zip(uml_models, models_ids)
+            if (update_arguments := self._create_update_arguments(uml_model, stored_models_states.get(model_id))) is not None
+        ]
+        if not update_operations:
+            return None
+
+        result = await self._collection.bulk_write(update_operations, ordered=False)
+        if result.matched_count + result.upserted_count < len(update_operations):
+            # Some of the models were changed since their hashes were read - it isn't known which, so all of them are set as a whole
+            result = await self._collection.bulk_write([UpdateOne(**self._create_update_arguments(uml_model)) for uml_model in uml_models], ordered=False)
+        return result
+
+    def _create_update_arguments(
+        self, uml_model: UmlModel, stored_model_state: Optional[dict] = None, model_sources: Optional[UmlModelSourcesDTO] = None
+    ) -> Optional[dict]:
+        document = uml_model.model_dump()
+        if model_sources is not None:
+            document[SOURCES_FIELD_NAME] = model_sources.model_dump()
+        document_hashes = compute_document_hashes(document)
+        stored_hashes = stored_model_state.get(HASHES_FIELD_NAME) if stored_model_state else None
+        update = create_update(document, document_hashes, stored_hashes)
+        if update is None:
+            return None
+
+        update["$inc"] = {REVISION_FIELD_NAME: 1}
+        if not stored_hashes:
+            return {"filter": {"_id": str(uml_model.id)}, "update": update, "upsert": True}
+        # Applied only to the version the diff was computed against
+        return {"filter": {"_id": str(uml_model.id), REVISION_FIELD_NAME: stored_model_state.get(REVISION_FIELD_NAME)}, "update": update, "upsert": False}
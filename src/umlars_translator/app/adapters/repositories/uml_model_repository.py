@@ -1,6 +1,47 @@
+from typing import Dict, Iterable, Optional, List, Tuple
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+import hashlib
 
 from umlars_translator.app.dtos.uml_model import UmlModel
+from umlars_translator.app.dtos.model_sources import UmlModelSourcesDTO
+from umlars_translator.core.serialization.compression import CompressionMethod, iter_compressed
+from umlars_translator.core.serialization.umlars_model.json_serializer import iter_dto_json_fragments
+
+
+@dataclass
+class SerializedUmlModel:
+    """
+    JSON of the model, as returned by the API - along with its compressed versions, created when they are requested.
+    """
+    model_id: str
+    revision: Optional[int]
+    body: bytes
+    content_hash: str
+    encoded_bodies: Dict[CompressionMethod, bytes] = field(default_factory=dict)
+
+    @classmethod
+    def from_model(cls, uml_model: UmlModel, revision: Optional[int] = None) -> "SerializedUmlModel":
+        body = b"".join(iter_dto_json_fragments(uml_model))
+        return cls(str(uml_model.id), revision, body, hashlib.blake2b(body, digest_size=16).hexdigest())
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(encoded_body) for encoded_body in self.encoded_bodies.values())
+
+    def get_body(self, content_encoding: Optional[CompressionMethod] = None) -> bytes:
+        if content_encoding is None or content_encoding == CompressionMethod.NONE:
+            return self.body
+        encoded_body = self.encoded_bodies.get(content_encoding)
+        if encoded_body is None:
+            encoded_body = self.encoded_bodies[content_encoding] = b"".join(iter_compressed([self.body], content_encoding))
+        return encoded_body
+
+    def get_etag(self, content_encoding: Optional[CompressionMethod] = None) -> str:
+        # Strong ETag - compressed representation differs in bytes from the uncompressed one, so it is tagged differently
+        if content_encoding is None or content_encoding == CompressionMethod.NONE:
+            return f'"{self.content_hash}"'
+        return f'"{self.content_hash}-{CompressionMethod(content_encoding).value}"'
 
 
 class UmlModelRepository(ABC):
@@ -9,5 +50,52 @@ class UmlModelRepository(ABC):
         ...
 
     @abstractmethod
-    async def save(self, uml_model: UmlModel) -> UmlModel:
+    async def save(self, uml_model: UmlModel, model_sources: Optional[UmlModelSourcesDTO] = None) -> UmlModel:
+        """
+        Saves the model, along with the provenance of its elements, if given - the model saved without it will be translated as a whole.
+        """
+        ...
+
+    @abstractmethod
+    async def get_raw(self, model_id: str, fields: Optional[List[str]] = None) -> Optional[dict]:
+        """
+        Returns the stored data of the model, as is - limited to the given fields (dotted paths), if any.
+        """
         ...
+
+    @abstractmethod
+    async def get_diagram_raw(self, model_id: str, diagram_id: str) -> Optional[dict]:
+        """
+        Returns the stored data of the model's diagram, as is. None, if the model or the diagram doesn't exist.
+        """
+        ...
+
+    async def get_raw_with_sources(self, model_id: str) -> Optional[Tuple[dict, Optional[UmlModelSourcesDTO]]]:
+        """
+        Returns the stored data of the model, along with the provenance of its elements - None, if it wasn't saved with the model.
+        """
+        model_data = await self.get_raw(model_id)
+        return (model_data, None) if model_data is not None else None
+
+    async def save_many(self, uml_models: Iterable[UmlModel]) -> None:
+        for uml_model in uml_models:
+            await self.save(uml_model)
+
+    async def get_with_revision(self, model_id: str) -> Optional[Tuple[UmlModel, Optional[int]]]:
+        """
+        Returns the model along with the revision of its stored version - None, if the repository doesn't track the revisions.
+        """
+        uml_model = await self.get(model_id)
+        return (uml_model, None) if uml_model is not None else None
+
+    async def get_serialized(self, model_id: str, content_encoding: Optional[CompressionMethod] = None) -> Optional[SerializedUmlModel]:
+        """
+        Returns JSON of the model, compressed with the given method too. None, if the model doesn't exist.
+        """
+        model_with_revision = await self.get_with_revision(model_id)
+        if model_with_revision is None:
+            return None
+
+        serialized_model = SerializedUmlModel.from_model(*model_with_revision)
+        serialized_model.get_body(content_encoding)
+        return serialized_model
@@ -9,8 +9,50 @@ MONGO_INITDB_ROOT_PASSWORD = os.getenv('MONGO_INITDB_ROOT_PASSWORD')
 MONGO_HOST = os.getenv('MONGO_HOST', "127.0.0.1")
 MONGO_PORT = int(os.getenv('MONGO_PORT', 27017))
 MONGO_INITDB_DATABASE = os.getenv('MONGO_INITDB_DATABASE')
+# Network compression of the data exchanged with the database, comma separated list of: zstd, zlib, snappy
+DB_COMPRESSORS = os.getenv("MONGO_COMPRESSORS", "zlib")
 DB_CONN_STR = f"mongodb://{(MONGO_INITDB_ROOT_USERNAME)}:{(MONGO_INITDB_ROOT_PASSWORD)}@{(MONGO_HOST)}:{(MONGO_PORT)}/{(MONGO_INITDB_DATABASE)}?authSource=admin"
 
+# TRANSLATION
+# Cache the translations of the source files (see core translation cache settings for the limits of its tiers)
+TRANSLATION_CACHE_ENABLED = os.getenv("TRANSLATION_CACHE_ENABLED", "false").lower() in ("1", "true", "yes")
+# Limits of the translation of each source file (in seconds and bytes) - files exceeding them are reported as failed.
+# Memory is measured per process, so its limit applies only with TRANSLATION_EXECUTOR_TYPE=process (ignored for the translations run in threads)
+TRANSLATION_FILE_TIME_LIMIT = float(os.getenv("TRANSLATION_FILE_TIME_LIMIT")) if os.getenv("TRANSLATION_FILE_TIME_LIMIT") else None
+TRANSLATION_FILE_MEMORY_LIMIT = int(os.getenv("TRANSLATION_FILE_MEMORY_LIMIT")) if os.getenv("TRANSLATION_FILE_MEMORY_LIMIT") else None
+# Translate again only the edited and new files of the updated models - contributions of the other files are taken from the saved model
+TRANSLATION_INCREMENTAL_ENABLED = os.getenv("TRANSLATION_INCREMENTAL_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# TRANSLATION API
+# Models translated synchronously by POST /uml-models - bigger uploads (in bytes) are rejected with 413
+TRANSLATION_API_MAX_UPLOAD_SIZE = int(os.getenv("TRANSLATION_API_MAX_UPLOAD_SIZE", 32 * 1024 * 1024))
+# Translations requested through the API at once - the other requests are rejected with 503 before their upload is read
+TRANSLATION_API_MAX_CONCURRENCY = int(os.getenv("TRANSLATION_API_MAX_CONCURRENCY", 4))
+# Seconds after which the rejected request may be retried (sent in the Retry-After header)
+TRANSLATION_API_RETRY_AFTER = int(os.getenv("TRANSLATION_API_RETRY_AFTER", 5))
+
+# TRANSLATION JOBS
+# Models translated in the background by POST /translation-jobs - bigger uploads (in bytes) are rejected with 413
+TRANSLATION_JOBS_MAX_UPLOAD_SIZE = int(os.getenv("TRANSLATION_JOBS_MAX_UPLOAD_SIZE", 256 * 1024 * 1024))
+# Jobs translated at once (in their own thread pool), and how many of them may be heavy (batch) jobs - the rest of the workers
+# is kept for the interactive jobs, so the heavy workers have to be fewer than all the workers
+TRANSLATION_JOBS_MAX_WORKERS = int(os.getenv("TRANSLATION_JOBS_MAX_WORKERS", 4))
+TRANSLATION_JOBS_MAX_HEAVY_WORKERS = int(os.getenv("TRANSLATION_JOBS_MAX_HEAVY_WORKERS", 2))
+# Jobs waiting for a worker - the new jobs are rejected with 503 above this number
+TRANSLATION_JOBS_MAX_QUEUED = int(os.getenv("TRANSLATION_JOBS_MAX_QUEUED", 100))
+# Uploads bigger than this number of bytes are scheduled as heavy jobs, unless the priority is given by the client
+TRANSLATION_JOBS_HEAVY_JOB_MIN_SIZE = int(os.getenv("TRANSLATION_JOBS_HEAVY_JOB_MIN_SIZE", 4 * 1024 * 1024))
+# Seconds for which the finished jobs can be polled - they are forgotten afterwards (the translated model stays saved)
+TRANSLATION_JOBS_RESULT_TTL = int(os.getenv("TRANSLATION_JOBS_RESULT_TTL", 3600))
+
+# MODEL CACHE
+# Models returned by the API are cached in memory as JSON - dropped when the model is saved by the service
+UML_MODEL_CACHE_ENABLED = os.getenv("UML_MODEL_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+UML_MODEL_CACHE_MAX_ENTRIES = int(os.getenv("UML_MODEL_CACHE_MAX_ENTRIES", 256))
+UML_MODEL_CACHE_MAX_BYTES = int(os.getenv("UML_MODEL_CACHE_MAX_BYTES", 128 * 1024 * 1024))
+# Seconds after which the cached model is read again - limits staleness of the models saved by the other instances of the service
+UML_MODEL_CACHE_TTL = float(os.getenv("UML_MODEL_CACHE_TTL", 60))
+
 # LOGGER
 APP_LOGGER_NAME = "APP_LOGGER"
 LOG_LEVEL = os.getenv("APP_LOG_LEVEL", "WARNING")
@@ -30,3 +72,7 @@ API_VERSION = "v1"
 REPOSITORY_API_URL = f"http://{REPOSITORY_SERVICE_HOST}:{REPOSITORY_SERVICE_PORT}/api/{API_VERSION}"
 REPOSITORY_SERVICE_USER = os.getenv("REPOSITORY_SERVICE_USER", "admin")
 REPOSITORY_SERVICE_PASSWORD = os.getenv("REPOSITORY_SERVICE_PASSWORD", "admin")
+# Source files of the models fetched from the repository, bigger than this number of characters, are spooled to the temporary files
+REPOSITORY_PAYLOAD_SPOOL_MIN_SIZE = int(os.getenv("REPOSITORY_PAYLOAD_SPOOL_MIN_SIZE", 1024 * 1024))
+# Directory of the spooled files - system temporary directory, if not set
+REPOSITORY_PAYLOAD_SPOOL_DIR = os.getenv("REPOSITORY_PAYLOAD_SPOOL_DIR")
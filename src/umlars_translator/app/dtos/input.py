@@ -1,22 +1,56 @@
-from typing import Optional, List
+from typing import Any, AsyncIterable, Dict, Optional, List
+import codecs
+import os
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, model_validator
 
 from umlars_translator.config import SupportedFormat
 from umlars_translator.core.deserialization.data_source import DataSource
+from umlars_translator.app.utils.json_stream import JsonStreamParser, TextSpool
+from umlars_translator.app.utils.multipart_stream import BytesSpool, MultipartStreamParser, parse_header_parameters
+from umlars_translator.app.exceptions import PayloadTooLargeError
+from umlars_translator.app import config
+
+
+SOURCE_FILES_PREFIX = "source_files.item"
+SOURCE_FILE_DATA_PREFIX = f"{SOURCE_FILES_PREFIX}.data"
+# Fields of the multipart form, other than the uploaded files, describing the model
+MULTIPART_MODEL_FIELDS = ("id", "format")
 
 
 class UmlFileDTO(BaseModel):
     id: str | int
     filename: str
-    data: str
+    # Uploaded files are kept as they were received (bytes), so their encoding is detected from the data
+    data: Optional[str | bytes] = None
     format: Optional[SupportedFormat] = None
+    # Temporary file with the data, used instead of the data kept in memory
+    data_file_path: Optional[str] = None
+    # Encoding of the temporary file - None for the uploaded bytes
+    data_file_encoding: Optional[str] = "utf-8"
 
     model_config = ConfigDict(from_attributes=True)
 
+    @model_validator(mode="after")
+    def check_data_is_given(self) -> "UmlFileDTO":
+        if self.data is None and self.data_file_path is None:
+            raise ValueError(f"Data of the file {self.filename} is missing")
+        return self
+
     def to_data_source(self) -> DataSource:
+        if self.data_file_path is not None:
+            return DataSource(file_path=self.data_file_path, format=self.format, encoding=self.data_file_encoding)
         return DataSource(self.data, format=self.format)
 
+    def release(self) -> None:
+        """
+        Frees the data of the file - it won't be translated anymore.
+        """
+        if self.data_file_path is not None and os.path.exists(self.data_file_path):
+            os.remove(self.data_file_path)
+        self.data_file_path = None
+        self.data = ""
+
 
 class UmlModelDTO(BaseModel):
     id: str | int
@@ -24,3 +58,129 @@ class UmlModelDTO(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @classmethod
+    async def from_json_stream(
+        cls, chunks: AsyncIterable[bytes], spool_min_size: Optional[int] = None, spool_dir: Optional[str] = None
+    ) -> "UmlModelDTO":
+        """
+        Reads the model from the JSON document received in chunks, without holding the whole document in memory.
+        Data of each source file is read in parts - data bigger than spool_min_size characters is written to the temporary file,
+        so the memory used doesn't grow with the number and size of the files.
+        """
+        spool_min_size = spool_min_size or config.REPOSITORY_PAYLOAD_SPOOL_MIN_SIZE
+        spool_dir = spool_dir or config.REPOSITORY_PAYLOAD_SPOOL_DIR
+        parser = JsonStreamParser(streamed_prefixes=[SOURCE_FILE_DATA_PREFIX])
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        model_fields: Dict[str, Any] = {}
+        source_files: List[UmlFileDTO] = []
+        source_file_fields: Dict[str, Any] = {}
+        data_spool: Optional[TextSpool] = None
+
+        def handle_event(prefix: str, event: str, value: Any) -> None:
+            nonlocal source_file_fields, data_spool
+            if prefix == SOURCE_FILES_PREFIX:
+                if event == "start_map":
+                    source_file_fields = {}
+                elif event == "end_map":
+                    source_files.append(UmlFileDTO(**source_file_fields))
+                    source_file_fields = {}
+            elif prefix == SOURCE_FILE_DATA_PREFIX and event in ("string_part", "end_string"):
+                if data_spool is None:
+                    data_spool = TextSpool(spool_min_size, spool_dir)
+                if event == "string_part":
+                    data_spool.write(value)
+                else:
+                    source_file_fields["data"] = data_spool.close()
+                    source_file_fields["data_file_path"] = data_spool.file_path
+                    data_spool = None
+            elif prefix.startswith(f"{SOURCE_FILES_PREFIX}.") and prefix.count(".") == 2 and event in ("string", "number", "null", "boolean"):
+                source_file_fields[prefix.rsplit(".", 1)[1]] = value
+            elif "." not in prefix and prefix and event in ("string", "number", "null", "boolean"):
+                model_fields[prefix] = value
+
+        try:
+            async for chunk in chunks:
+                for event in parser.feed(decoder.decode(chunk)):
+                    handle_event(*event)
+            for event in parser.feed(decoder.decode(b"", final=True)) + parser.close():
+                handle_event(*event)
+            return cls(**model_fields, source_files=source_files)
+        except BaseException:
+            if data_spool is not None:
+                data_spool.discard()
+            # Spooled data of the file, which wasn't created
+            if source_file_fields.get("data_file_path") is not None and os.path.exists(source_file_fields["data_file_path"]):
+                os.remove(source_file_fields["data_file_path"])
+            for source_file in source_files:
+                source_file.release()
+            raise
+
+    @classmethod
+    async def from_multipart_stream(
+        cls,
+        chunks: AsyncIterable[bytes],
+        boundary: bytes,
+        default_id: str | int,
+        max_size: Optional[int] = None,
+        spool_min_size: Optional[int] = None,
+        spool_dir: Optional[str] = None,
+    ) -> "UmlModelDTO":
+        """
+        Reads the model from the multipart/form-data body received in chunks - each uploaded file is one source file of the model.
+        Files are spooled like the data read by from_json_stream, but not decoded - their encoding is detected during the translation. Optional form fields: id of the model (default_id is used otherwise)
+        and format of all the files (detected for each file otherwise).
+        Raises PayloadTooLargeError, as soon as the body exceeds max_size bytes.
+        """
+        spool_min_size = spool_min_size or config.REPOSITORY_PAYLOAD_SPOOL_MIN_SIZE
+        spool_dir = spool_dir or config.REPOSITORY_PAYLOAD_SPOOL_DIR
+        parser = MultipartStreamParser(boundary)
+        model_fields: Dict[str, Any] = {"id": default_id}
+        files_fields: List[Dict[str, Any]] = []
+        part_name: Optional[str] = None
+        field_value = bytearray()
+        data_spool: Optional[BytesSpool] = None
+        body_size = 0
+
+        def handle_event(event: str, value: Any) -> None:
+            nonlocal part_name, data_spool
+            if event == "part_start":
+                _, disposition_parameters = parse_header_parameters(value.get("content-disposition", ""))
+                part_name = disposition_parameters.get("name")
+                if "filename" in disposition_parameters:
+                    files_fields.append({"id": len(files_fields), "filename": disposition_parameters["filename"], "data_file_encoding": None})
+                    data_spool = BytesSpool(spool_min_size, spool_dir)
+            elif event == "part_data":
+                if data_spool is not None:
+                    data_spool.write(value)
+                elif part_name in MULTIPART_MODEL_FIELDS:
+                    field_value.extend(value)
+            elif data_spool is not None:
+                files_fields[-1]["data"] = data_spool.close()
+                files_fields[-1]["data_file_path"] = data_spool.file_path
+                data_spool = None
+            else:
+                if part_name in MULTIPART_MODEL_FIELDS and field_value:
+                    model_fields[part_name] = field_value.decode("utf-8")
+                field_value.clear()
+
+        try:
+            async for chunk in chunks:
+                body_size += len(chunk)
+                if max_size is not None and body_size > max_size:
+                    raise PayloadTooLargeError(f"Uploaded data exceeds the limit of {max_size} bytes")
+                for event in parser.feed(chunk):
+                    handle_event(*event)
+            parser.close()
+            files_format = model_fields.pop("format", None)
+            return cls(**model_fields, source_files=[UmlFileDTO(**file_fields, format=files_format) for file_fields in files_fields])
+        except BaseException:
+            if data_spool is not None:
+                data_spool.discard()
+            for file_fields in files_fields:
+                if file_fields.get("data_file_path") is not None and os.path.exists(file_fields["data_file_path"]):
+                    os.remove(file_fields["data_file_path"])
+            raise
+
+    def release(self) -> None:
+        for source_file in self.source_files:
+            source_file.release()
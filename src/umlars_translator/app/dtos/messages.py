@@ -26,6 +26,18 @@ class ModelToTranslateMessage(QueueMessage):
     ids_of_new_submitted_files: Optional[List[Union[int, str]]] = None
     ids_of_deleted_files: Optional[List[Union[int, str]]] = None
 
+    def coalesce(self, newer_message: "ModelToTranslateMessage") -> "ModelToTranslateMessage":
+        """
+        Returns the message replacing this one and the newer one, sent for the same model - changes of the files described by both
+        of them are joined. When either of them doesn't describe the changes, the whole model is translated.
+        """
+        changes_lists_names = ("ids_of_edited_files", "ids_of_new_submitted_files", "ids_of_deleted_files")
+        if all(getattr(self, name) is None for name in changes_lists_names) or all(getattr(newer_message, name) is None for name in changes_lists_names):
+            return newer_message.model_copy(update=dict.fromkeys(changes_lists_names))
+        return newer_message.model_copy(update={
+            name: list(dict.fromkeys([*(getattr(self, name) or []), *(getattr(newer_message, name) or [])])) for name in changes_lists_names
+        })
+
 
 class TranslatedFileMessage(QueueMessage):
     id: str | int
@@ -34,3 +46,9 @@ class TranslatedFileMessage(QueueMessage):
     process_id: Optional[str] = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class TranslatedFilesMessage(QueueMessage):
+    """States of many files translated in one process, sent together instead of the TranslatedFileMessage per file."""
+    process_id: Optional[str] = None
+    files_states: List[TranslatedFileMessage]
@@ -0,0 +1,33 @@
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+from pydantic import BaseModel, Field
+
+if TYPE_CHECKING:
+    from umlars_translator.core.translation_context import SourceContribution
+
+
+class UmlFileContributionDTO(BaseModel):
+    """Part of the translated model coming from the single source file."""
+    file_id: str
+    elements_ids: List[str] = Field(default_factory=list)
+    name: Optional[str] = None
+    metadata: dict = Field(default_factory=dict)
+    failed: bool = False
+
+
+class UmlModelSourcesDTO(BaseModel):
+    """
+    Provenance of the translated model - IDs of the top-level elements and diagrams added by each of its source files, in their order.
+    Stored along the model, so only the changed files have to be translated again.
+    """
+    files: List[UmlFileContributionDTO] = Field(default_factory=list)
+
+    @classmethod
+    def from_contributions(cls, contributions: Dict[str, "SourceContribution"], failed_files_ids: Iterable[str] = ()) -> "UmlModelSourcesDTO":
+        failed_files_ids = {str(file_id) for file_id in failed_files_ids}
+        return cls(files=[
+            UmlFileContributionDTO(
+                file_id=file_id, elements_ids=contribution.elements_ids, name=contribution.name, metadata=contribution.metadata, failed=file_id in failed_files_ids,
+            )
+            for file_id, contribution in contributions.items()
+        ])
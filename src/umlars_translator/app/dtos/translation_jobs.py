@@ -0,0 +1,73 @@
+from typing import TYPE_CHECKING, Dict, Optional
+from datetime import datetime, timezone
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+from umlars_translator.app.dtos.messages import ProcessStatusEnum
+
+if TYPE_CHECKING:
+    from umlars_translator.app.dtos.input import UmlModelDTO
+    from umlars_translator.app.services.translation_jobs import TranslationJob
+
+
+class TranslationJobPriority(str, Enum):
+    """Interactive jobs are taken before the batch ones, which are the heavy jobs limited to a part of the workers."""
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
+
+
+class TranslationJobProgressDTO(BaseModel):
+    files_total: int = 0
+    files_done: int = 0
+    current_file: Optional[str] = None
+    elements_built: int = 0
+    current_pipe: Optional[str] = None
+
+
+class FailedFileDTO(BaseModel):
+    filename: str
+    error_message: str
+
+
+class TranslationJobDTO(BaseModel):
+    """State of the translation job, polled by the client until the job is finished."""
+    id: str
+    model_id: str
+    priority: TranslationJobPriority
+    state: ProcessStatusEnum
+    progress: TranslationJobProgressDTO
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    # Failed files by their IDs - names of the uploaded files may repeat
+    failed_files: Dict[str, FailedFileDTO] = Field(default_factory=dict)
+    error_message: Optional[str] = None
+
+    @classmethod
+    def from_job(cls, job: "TranslationJob") -> "TranslationJobDTO":
+        return cls(
+            id=job.id,
+            model_id=job.model_id,
+            priority=job.priority,
+            state=job.status,
+            progress=TranslationJobProgressDTO(**job.progress.to_dict()),
+            created_at=to_datetime(job.created_at),
+            started_at=to_datetime(job.started_at),
+            finished_at=to_datetime(job.finished_at),
+            failed_files=job.failed_files,
+            error_message=job.error_message,
+        )
+
+
+def get_failed_files(uml_model: "UmlModelDTO", files_errors_messages: Dict[str, str]) -> Dict[str, FailedFileDTO]:
+    """Returns the failed files of the model by their IDs, with their names and error messages."""
+    return {
+        str(uml_file.id): FailedFileDTO(filename=uml_file.filename, error_message=files_errors_messages[uml_file.id])
+        for uml_file in uml_model.source_files
+        if uml_file.id in files_errors_messages
+    }
+
+
+def to_datetime(timestamp: Optional[float]) -> Optional[datetime]:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc) if timestamp is not None else None
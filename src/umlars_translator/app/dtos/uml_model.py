@@ -1,7 +1,7 @@
 import uuid
 from typing import List, Optional, Union, Type, Dict, Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_serializer, model_validator
+from pydantic import BaseModel, ConfigDict, Field, SerializationInfo, SerializerFunctionWrapHandler, field_serializer, model_validator
 
 from umlars_translator.core.model.constants import (
     UmlVisibilityEnum,
@@ -29,6 +29,20 @@ def serialize_field_to_id_reference(
     )
 
 
+# Serialization context of the models read back by the UMJ deserialization strategy (e.g. the cached translations).
+# Ends of the aggregations and compositions are dumped in full, instead of the id references the backend receives.
+FULL_ASSOCIATION_ENDS_CONTEXT = {"full_association_ends": True}
+
+
+def serialize_association_end(
+    end: Optional[Union["UmlAssociationEnd", "UmlIdReference"]], handler: SerializerFunctionWrapHandler, info: SerializationInfo
+) -> Optional[dict]:
+    if info.context and info.context.get("full_association_ends"):
+        return handler(end)
+
+    return serialize_field_to_id_reference(end)
+
+
 class UmlIdReference(BaseModel):
     idref: str
 
@@ -232,13 +246,17 @@ class UmlDirectedAssociation(UmlNamedElement):
     source: Optional[Union["UmlAssociationEnd", "UmlIdReference"]] = None
     target: Optional[Union["UmlAssociationEnd", "UmlIdReference"]] = None
 
-    @field_serializer("source")
-    def source_to_json(source: Optional[Union["UmlAssociationEnd", "UmlIdReference"]]) -> dict:
-        return serialize_field_to_id_reference(source)
+    @field_serializer("source", mode="wrap")
+    def source_to_json(
+        source: Optional[Union["UmlAssociationEnd", "UmlIdReference"]], handler: SerializerFunctionWrapHandler, info: SerializationInfo
+    ) -> dict:
+        return serialize_association_end(source, handler, info)
 
-    @field_serializer("target")
-    def target_to_json(target: Optional[Union["UmlAssociationEnd", "UmlIdReference"]]) -> dict:
-        return serialize_field_to_id_reference(target)
+    @field_serializer("target", mode="wrap")
+    def target_to_json(
+        target: Optional[Union["UmlAssociationEnd", "UmlIdReference"]], handler: SerializerFunctionWrapHandler, info: SerializationInfo
+    ) -> dict:
+        return serialize_association_end(target, handler, info)
 
 
 class UmlAggregation(UmlDirectedAssociation):
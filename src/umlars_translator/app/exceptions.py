@@ -23,3 +23,11 @@ class ExternalServiceOperationError(Exception):
 
 class InputDataError(Exception):
     """Input data error."""
+
+
+class PayloadTooLargeError(InputDataError):
+    """Input data exceeding the allowed size."""
+
+
+class TranslationJobsQueueFullError(Exception):
+    """Too many translation jobs waiting error."""
@@ -1,21 +1,39 @@
-from typing import Optional
+from typing import AsyncIterator, Dict, Optional, List, Tuple
 import os
+import re
+import json
+import uuid
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
 from kink import di, inject
 import uvicorn
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, Header, Request
 from fastapi.exceptions import HTTPException
+from fastapi.responses import StreamingResponse, Response
 from motor.motor_asyncio import AsyncIOMotorClient
 from pydantic import ValidationError
+from pydantic_core import to_json
 
 from umlars_translator.app.adapters.repositories.uml_model_repository import UmlModelRepository
 from umlars_translator.app.adapters.repositories.mongo_uml_model_repository import MongoDBUmlModelRepository
+from umlars_translator.app.adapters.repositories.cached_uml_model_repository import CachedUmlModelRepository, UmlModelCache
 from umlars_translator.app.dtos.uml_model import UmlModel
-from umlars_translator.app.adapters.message_brokers.rabbitmq_message_consumer import RabbitMQConsumer
+from umlars_translator.app.dtos.input import UmlModelDTO
+from umlars_translator.app.dtos.messages import ProcessStatusEnum
+from umlars_translator.app.dtos.translation_jobs import FailedFileDTO, TranslationJobDTO, TranslationJobPriority, get_failed_files
+from umlars_translator.app.adapters.message_brokers.rabbitmq_message_consumer import RabbitMQConsumer, translate_model_in_worker, get_translation_memory_limit
+from umlars_translator.app.adapters.message_brokers.rabbitmq_message_producer import close_shared_producers
 from umlars_translator.app import config
-from umlars_translator.app.exceptions import ServiceConnectionError, QueueUnavailableError
+from umlars_translator.app.exceptions import ServiceConnectionError, QueueUnavailableError, PayloadTooLargeError, TranslationJobsQueueFullError
+from umlars_translator.app.services.translation_jobs import TranslationJobScheduler
+from umlars_translator.app.utils.functions import negotiate_content_encoding, is_etag_matched
+from umlars_translator.app.utils.multipart_stream import MultipartStreamError, get_multipart_boundary
+from umlars_translator.core.serialization.compression import iter_compressed
+from umlars_translator.core.serialization.umlars_model.json_serializer import iter_dto_json_fragments
+from umlars_translator.core.translation_executor import TranslationExecutor
+from umlars_translator.core.translation_cache import TranslationCache
 from umlars_translator.logger import add_file_handler
 
 
@@ -39,7 +57,7 @@ di["app_logger"] = lambda _: create_app_logger()
 def get_db_client(app_logger: logging.Logger) -> AsyncIOMotorClient:
     try:
         connection_str = config.DB_CONN_STR
-        return AsyncIOMotorClient(connection_str)
+        return AsyncIOMotorClient(connection_str, compressors=config.DB_COMPRESSORS or None)
     except Exception as e:
         app_logger.error(f"Failed to connect to the database: {e}")
         raise HTTPException(status_code=500, detail="Failed to connect to the database")        
@@ -50,11 +68,22 @@ di[AsyncIOMotorClient] = lambda _: get_db_client()
 
 @inject
 def get_uml_model_repository(db_client: AsyncIOMotorClient) -> UmlModelRepository:
-    return MongoDBUmlModelRepository(db_client, config.DB_NAME, config.DB_COLLECTION_NAME)
+    model_repository = MongoDBUmlModelRepository(db_client, config.DB_NAME, config.DB_COLLECTION_NAME)
+    if config.UML_MODEL_CACHE_ENABLED:
+        # Shared by the API and the consumer, so the models saved after the translation are dropped from the cache
+        return CachedUmlModelRepository(model_repository, UmlModelCache())
+    return model_repository
 
 
 di[UmlModelRepository] = lambda _: get_uml_model_repository()
 
+# Jobs are kept in memory, so the same scheduler has to serve all the requests
+di[TranslationJobScheduler] = lambda _: TranslationJobScheduler()
+
+if config.TRANSLATION_CACHE_ENABLED:
+    # Shared by all the translators created by the service
+    di[TranslationCache] = lambda _: TranslationCache()
+
 
 async def start_consuming_messages() -> None:
     try:
@@ -85,30 +114,234 @@ async def lifespan_event_handler(app: FastAPI, logger: logging.Logger):
             logger.error(error_message)
             raise ServiceConnectionError(error_message) from ex
         yield
+        await di[TranslationJobScheduler].close()
+        await close_shared_producers()
+        await di["repository_api_connector"].close()
+        di[TranslationExecutor].shutdown(wait=False, cancel_futures=True)
     except ServiceConnectionError as ex:
         raise ServiceConnectionError("Error occured before the application startup") from ex
 
 
 app = FastAPI(lifespan=lifespan_event_handler)
 
+# Dotted path of the field of the stored model - operators ($) and internal fields (_) can't be requested
+MODEL_FIELD_PATH_PATTERN = re.compile(r"[A-Za-z][A-Za-z0-9_]*(\.[A-Za-z0-9][A-Za-z0-9_]*)*")
 
-@app.get("/uml-models/{model_id}")
-async def get_uml_model(model_id: str, model_repo: UmlModelRepository = Depends(lambda: di[UmlModelRepository]), app_logger: logging.Logger = Depends(lambda: di[logging.Logger])):
+
+def parse_model_fields(fields: str) -> List[str]:
+    """
+    Parses comma separated paths of the model's fields (e.g. "name,elements.classes"), rejecting paths outside of the model.
+    """
+    fields_paths = [field_path.strip() for field_path in fields.split(",") if field_path.strip()]
+    for field_path in fields_paths:
+        if not MODEL_FIELD_PATH_PATTERN.fullmatch(field_path) or field_path.split(".")[0] not in UmlModel.model_fields:
+            raise HTTPException(status_code=400, detail=f"Invalid field: {field_path}")
+    # Paths inside the other requested fields would collide with them in the projection
+    return [
+        field_path for field_path in dict.fromkeys(fields_paths)
+        if not any(field_path.startswith(f"{other_field_path}.") for other_field_path in fields_paths)
+    ]
+
+
+def create_raw_json_response(data: dict, accept_encoding: Optional[str]) -> Response:
+    """
+    Returns the data read from the database as JSON - without validating it against the model.
+    """
+    response_body = to_json(data, fallback=str)
+    content_encoding = negotiate_content_encoding(accept_encoding)
+    if content_encoding is None:
+        return Response(response_body, media_type="application/json")
+
+    return StreamingResponse(
+        iter_compressed([response_body], content_encoding),
+        media_type="application/json",
+        headers={"Content-Encoding": content_encoding.value, "Vary": "Accept-Encoding"},
+    )
+
+
+async def create_serialized_model_response(
+    model_id: str, model_repo: UmlModelRepository, accept_encoding: Optional[str], if_none_match: Optional[str], app_logger: logging.Logger
+) -> Response:
+    content_encoding = negotiate_content_encoding(accept_encoding)
     try:
-        model = await model_repo.get(model_id)
+        serialized_model = await model_repo.get_serialized(model_id, content_encoding)
     except ValidationError as e:
         app_logger.error(f"Failed to validate the model from database: {e}")
         raise HTTPException(status_code=422, detail=f"Invalid model data. Error: {e}")
-    if model is None:
+    if serialized_model is None:
         raise HTTPException(status_code=404, detail=f"Model with ID: {model_id} not found")
-    return model
+
+    # Clients polling the model revalidate it with the ETag - unchanged model isn't sent again
+    etag = serialized_model.get_etag(content_encoding)
+    headers = {"ETag": etag, "Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+    if is_etag_matched(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    if content_encoding is not None:
+        headers["Content-Encoding"] = content_encoding.value
+    return Response(serialized_model.get_body(content_encoding), media_type="application/json", headers=headers)
+
+
+@app.get("/uml-models/{model_id}")
+async def get_uml_model(model_id: str, fields: Optional[str] = None, accept_encoding: Optional[str] = Header(None), if_none_match: Optional[str] = Header(None), model_repo: UmlModelRepository = Depends(lambda: di[UmlModelRepository]), app_logger: logging.Logger = Depends(lambda: di[logging.Logger])):
+    if fields is not None:
+        # Partial read - only the requested fields are read from the database and returned as stored
+        model_data = await model_repo.get_raw(model_id, parse_model_fields(fields))
+        if model_data is None:
+            raise HTTPException(status_code=404, detail=f"Model with ID: {model_id} not found")
+        return create_raw_json_response(model_data, accept_encoding)
+
+    return await create_serialized_model_response(model_id, model_repo, accept_encoding, if_none_match, app_logger)
+
+
+@app.get("/uml-models/{model_id}/diagrams/{diagram_id}")
+async def get_uml_model_diagram(model_id: str, diagram_id: str, accept_encoding: Optional[str] = Header(None), model_repo: UmlModelRepository = Depends(lambda: di[UmlModelRepository])):
+    diagram_data = await model_repo.get_diagram_raw(model_id, diagram_id)
+    if diagram_data is None:
+        raise HTTPException(status_code=404, detail=f"Diagram with ID: {diagram_id} not found in the model with ID: {model_id}")
+    return create_raw_json_response(diagram_data, accept_encoding)
+
+
+def check_upload_headers(request: Request, max_upload_size: int) -> None:
+    """
+    Rejects the upload of the source files before its body is read - if it isn't multipart/form-data or its declared size exceeds the limit.
+    """
+    if get_multipart_boundary(request.headers.get("content-type")) is None:
+        raise HTTPException(status_code=415, detail="Source files have to be uploaded as multipart/form-data")
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > max_upload_size:
+        raise HTTPException(status_code=413, detail=f"Uploaded data exceeds the limit of {max_upload_size} bytes")
+
+
+async def read_uploaded_model(request: Request, max_upload_size: int, app_logger: logging.Logger) -> Tuple[UmlModelDTO, int]:
+    """
+    Reads the model from the source files uploaded as multipart/form-data. Returns the model and the size of the upload in bytes.
+    Body is read as it arrives - the uploaded files are spooled to the temporary files instead of being kept in memory.
+    """
+    upload_size = 0
+
+    async def count_uploaded_bytes(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        nonlocal upload_size
+        async for chunk in chunks:
+            upload_size += len(chunk)
+            yield chunk
+
+    try:
+        uml_model = await UmlModelDTO.from_multipart_stream(
+            count_uploaded_bytes(request.stream()), get_multipart_boundary(request.headers.get("content-type")),
+            default_id=str(uuid.uuid4()), max_size=max_upload_size,
+        )
+    except PayloadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except (MultipartStreamError, UnicodeDecodeError, ValidationError) as e:
+        app_logger.error(f"Failed to read the uploaded files: {e}")
+        raise HTTPException(status_code=400, detail=f"Invalid upload. Error: {e}")
+    return uml_model, upload_size
+
+
+def dump_failed_files(failed_files: Dict[str, FailedFileDTO]) -> Dict[str, dict]:
+    return {file_id: failed_file.model_dump() for file_id, failed_file in failed_files.items()}
+
+
+def get_failed_files_header(failed_files: Dict[str, FailedFileDTO]) -> str:
+    """Lists the names of the failed files - the same name is listed for each file uploaded with it."""
+    return json.dumps([failed_file.filename for failed_file in failed_files.values()])
+
+
+# Translations requested through the API at once - the excess requests are rejected, instead of waiting with their uploads spooled
+translation_requests_slots = asyncio.Semaphore(config.TRANSLATION_API_MAX_CONCURRENCY)
 
 
 @app.post("/uml-models")
-async def translate_uml_model(uml_model: UmlModel, model_repo: UmlModelRepository = Depends(lambda: di[UmlModelRepository]), app_logger: logging.Logger = Depends(lambda: di[logging.Logger])):
-    # TODO: translate
-    await model_repo.save(uml_model)
-    return {"status": "success"}
+async def translate_uml_model(request: Request, accept_encoding: Optional[str] = Header(None), model_repo: UmlModelRepository = Depends(lambda: di[UmlModelRepository]), translation_executor: TranslationExecutor = Depends(lambda: di[TranslationExecutor]), app_logger: logging.Logger = Depends(lambda: di[logging.Logger])):
+    """
+    Translates the source files uploaded as multipart/form-data into one model, without the message queue.
+    The model is saved and returned in the UMJ format - files which failed are listed in the X-Failed-Files header.
+    """
+    check_upload_headers(request, config.TRANSLATION_API_MAX_UPLOAD_SIZE)
+    if translation_requests_slots.locked():
+        raise HTTPException(status_code=503, detail="Too many translations in progress", headers={"Retry-After": str(config.TRANSLATION_API_RETRY_AFTER)})
+
+    async with translation_requests_slots:
+        uml_model, _ = await read_uploaded_model(request, config.TRANSLATION_API_MAX_UPLOAD_SIZE, app_logger)
+        try:
+            if not uml_model.source_files:
+                raise HTTPException(status_code=400, detail="No source files were uploaded")
+            translated_model, files_errors_messages, model_sources = await translation_executor.run(
+                translate_model_in_worker, uml_model, config.TRANSLATION_FILE_TIME_LIMIT, get_translation_memory_limit(translation_executor)
+            )
+        finally:
+            uml_model.release()
+
+    failed_files = get_failed_files(uml_model, files_errors_messages)
+    if len(failed_files) == len(uml_model.source_files):
+        raise HTTPException(status_code=422, detail=dump_failed_files(failed_files))
+
+    await model_repo.save(translated_model, model_sources)
+    headers = {"Location": f"/uml-models/{translated_model.id}", "Vary": "Accept-Encoding"}
+    if failed_files:
+        headers["X-Failed-Files"] = get_failed_files_header(failed_files)
+    response_fragments = iter_dto_json_fragments(translated_model)
+    content_encoding = negotiate_content_encoding(accept_encoding)
+    if content_encoding is not None:
+        headers["Content-Encoding"] = content_encoding.value
+        response_fragments = iter_compressed(response_fragments, content_encoding)
+    return StreamingResponse(response_fragments, media_type="application/json", headers=headers)
+
+
+@app.post("/translation-jobs", status_code=202)
+async def create_translation_job(request: Request, priority: Optional[TranslationJobPriority] = None, job_scheduler: TranslationJobScheduler = Depends(lambda: di[TranslationJobScheduler]), app_logger: logging.Logger = Depends(lambda: di[logging.Logger])):
+    """
+    Queues the translation of the source files uploaded as multipart/form-data and returns its job, to be polled for the progress.
+    Without the priority given, uploads bigger than TRANSLATION_JOBS_HEAVY_JOB_MIN_SIZE are translated as the batch jobs.
+    """
+    check_upload_headers(request, config.TRANSLATION_JOBS_MAX_UPLOAD_SIZE)
+    # Checked also before the upload is read, so it isn't spooled in vain
+    if job_scheduler.is_queue_full:
+        raise HTTPException(status_code=503, detail="Too many translation jobs waiting", headers={"Retry-After": str(config.TRANSLATION_API_RETRY_AFTER)})
+
+    uml_model, upload_size = await read_uploaded_model(request, config.TRANSLATION_JOBS_MAX_UPLOAD_SIZE, app_logger)
+    if not uml_model.source_files:
+        uml_model.release()
+        raise HTTPException(status_code=400, detail="No source files were uploaded")
+    if priority is None:
+        priority = TranslationJobPriority.BATCH if upload_size >= config.TRANSLATION_JOBS_HEAVY_JOB_MIN_SIZE else TranslationJobPriority.INTERACTIVE
+
+    try:
+        job = job_scheduler.submit(uml_model, priority)
+    except TranslationJobsQueueFullError as e:
+        uml_model.release()
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(config.TRANSLATION_API_RETRY_AFTER)})
+    return Response(
+        TranslationJobDTO.from_job(job).model_dump_json(), status_code=202, media_type="application/json", headers={"Location": f"/translation-jobs/{job.id}"}
+    )
+
+
+@app.get("/translation-jobs/{job_id}")
+async def get_translation_job(job_id: str, job_scheduler: TranslationJobScheduler = Depends(lambda: di[TranslationJobScheduler])) -> TranslationJobDTO:
+    job = job_scheduler.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Translation job with ID: {job_id} not found")
+    return TranslationJobDTO.from_job(job)
+
+
+@app.get("/translation-jobs/{job_id}/result")
+async def get_translation_job_result(job_id: str, accept_encoding: Optional[str] = Header(None), if_none_match: Optional[str] = Header(None), job_scheduler: TranslationJobScheduler = Depends(lambda: di[TranslationJobScheduler]), model_repo: UmlModelRepository = Depends(lambda: di[UmlModelRepository]), app_logger: logging.Logger = Depends(lambda: di[logging.Logger])):
+    """
+    Returns the model translated by the job, as saved - files which failed are listed in the X-Failed-Files header.
+    """
+    job = job_scheduler.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Translation job with ID: {job_id} not found")
+    if not job.is_finished:
+        raise HTTPException(status_code=409, detail=f"Translation job with ID: {job_id} is not finished", headers={"Retry-After": str(config.TRANSLATION_API_RETRY_AFTER)})
+    if job.status == ProcessStatusEnum.FAILED:
+        raise HTTPException(status_code=422, detail={"error_message": job.error_message, "failed_files": dump_failed_files(job.failed_files)})
+
+    response = await create_serialized_model_response(job.model_id, model_repo, accept_encoding, if_none_match, app_logger)
+    if job.failed_files:
+        response.headers["X-Failed-Files"] = get_failed_files_header(job.failed_files)
+    return response
 
 
 @inject
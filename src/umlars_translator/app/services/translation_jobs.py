@@ -0,0 +1,203 @@
+from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+import time
+import uuid
+
+from kink import inject
+
+from umlars_translator.app import config
+from umlars_translator.app.dtos.input import UmlModelDTO
+from umlars_translator.app.dtos.messages import ProcessStatusEnum
+from umlars_translator.app.dtos.translation_jobs import FailedFileDTO, TranslationJobPriority, get_failed_files
+from umlars_translator.app.exceptions import TranslationJobsQueueFullError
+from umlars_translator.app.adapters.repositories.uml_model_repository import UmlModelRepository
+from umlars_translator.app.adapters.message_brokers.rabbitmq_message_consumer import ModelTranslationResult, translate_model_in_worker
+from umlars_translator.core.deserialization.translation_progress import TranslationProgress
+from umlars_translator.core.translation_executor import TranslationExecutor, ExecutorType
+
+
+FINISHED_JOB_STATUSES = (ProcessStatusEnum.FINISHED, ProcessStatusEnum.PARTIAL_SUCCESS, ProcessStatusEnum.FAILED)
+# Order in which the waiting jobs are taken by the workers
+PRIORITIES_RANKS = {TranslationJobPriority.INTERACTIVE: 0, TranslationJobPriority.BATCH: 1}
+
+
+@dataclass
+class TranslationJob:
+    """Translation of the uploaded model, run in the background. Its progress is updated by the thread translating it."""
+    uml_model: UmlModelDTO
+    priority: TranslationJobPriority = TranslationJobPriority.INTERACTIVE
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    status: ProcessStatusEnum = ProcessStatusEnum.QUEUED
+    progress: TranslationProgress = field(default_factory=TranslationProgress)
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    # Failed files by their IDs - names of the uploaded files may repeat
+    failed_files: Dict[str, FailedFileDTO] = field(default_factory=dict)
+    error_message: Optional[str] = None
+    # Set when the job is cancelled - its translation stops at the next checkpoint
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+
+    def __post_init__(self) -> None:
+        self.progress.files_total = len(self.uml_model.source_files)
+
+    @property
+    def model_id(self) -> str:
+        return str(self.uml_model.id)
+
+    @property
+    def is_heavy(self) -> bool:
+        return self.priority == TranslationJobPriority.BATCH
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in FINISHED_JOB_STATUSES
+
+
+def translate_job_in_thread(job: TranslationJob) -> ModelTranslationResult:
+    """
+    Translates the model of the job, reporting its progress. The translation stops at its next checkpoint after the job's cancel_event is set.
+    Jobs are translated in threads, so the memory limit doesn't apply to them (see get_translation_memory_limit).
+    """
+    return translate_model_in_worker(job.uml_model, config.TRANSLATION_FILE_TIME_LIMIT, None, job.progress, job.cancel_event)
+
+
+@inject
+class TranslationJobScheduler:
+    """
+    Runs the translation jobs in the background, on a bounded number of workers. Waiting jobs are taken by their priority,
+    in the order of submission. Heavy jobs can take only max_heavy_workers of the workers, so the interactive jobs
+    don't wait for them, even if many heavy jobs are submitted. Jobs are translated in the threads of their own translation executor
+    (sized to max_workers), so they don't compete for the slots of the message consumer and POST /uml-models.
+    Unlike the worker processes, the threads share the progress of the translation with the event loop, so it can be polled.
+    Translated models are saved to the repository, finished jobs are kept for polling for result_ttl seconds.
+    """
+    def __init__(
+        self,
+        uml_model_repository: UmlModelRepository,
+        translation_executor: Optional[TranslationExecutor] = None,
+        app_logger: Optional[logging.Logger] = None,
+        max_workers: Optional[int] = None,
+        max_heavy_workers: Optional[int] = None,
+        max_queued_jobs: Optional[int] = None,
+        result_ttl: Optional[float] = None,
+    ) -> None:
+        self._logger = (app_logger or logging.getLogger(config.APP_LOGGER_NAME)).getChild(self.__class__.__name__)
+        self._uml_model_repository = uml_model_repository
+        self._max_workers = max_workers or config.TRANSLATION_JOBS_MAX_WORKERS
+        self._max_heavy_workers = max_heavy_workers or config.TRANSLATION_JOBS_MAX_HEAVY_WORKERS
+        if not 1 <= self._max_heavy_workers < self._max_workers:
+            raise ValueError(
+                f"Heavy jobs have to be allowed to take at least one, but not all of the workers (max_workers={self._max_workers}, "
+                f"max_heavy_workers={self._max_heavy_workers}) - otherwise they would block the interactive jobs"
+            )
+        self._owns_translation_executor = translation_executor is None
+        self._translation_executor = translation_executor or TranslationExecutor(
+            executor_type=ExecutorType.THREAD, max_workers=self._max_workers, max_concurrency=self._max_workers
+        )
+        self._max_queued_jobs = max_queued_jobs or config.TRANSLATION_JOBS_MAX_QUEUED
+        self._result_ttl = result_ttl if result_ttl is not None else config.TRANSLATION_JOBS_RESULT_TTL
+        self._jobs: Dict[str, TranslationJob] = {}
+        self._waiting_jobs: List[Tuple[int, int, TranslationJob]] = []
+        self._submission_counter = itertools.count()
+        self._running_tasks: Set[asyncio.Task] = set()
+        self._running_heavy_jobs_count = 0
+
+    @property
+    def is_queue_full(self) -> bool:
+        return len(self._waiting_jobs) >= self._max_queued_jobs
+
+    def submit(self, uml_model: UmlModelDTO, priority: TranslationJobPriority = TranslationJobPriority.INTERACTIVE) -> TranslationJob:
+        """
+        Queues the translation of the model and returns its job. The scheduler takes over the model - its spooled files are released
+        after the translation. Raises TranslationJobsQueueFullError if too many jobs are waiting and ValueError if the model has no source files.
+        """
+        if not uml_model.source_files:
+            raise ValueError(f"Model {uml_model.id} has no source files to translate")
+        self._remove_expired_jobs()
+        if self.is_queue_full:
+            raise TranslationJobsQueueFullError(f"Translation jobs queue is full ({self._max_queued_jobs} jobs waiting)")
+
+        job = TranslationJob(uml_model=uml_model, priority=priority)
+        self._jobs[job.id] = job
+        heapq.heappush(self._waiting_jobs, (PRIORITIES_RANKS[priority], next(self._submission_counter), job))
+        self._logger.info(f"Translation job {job.id} of model {job.model_id} was queued with {priority.value} priority")
+        self._start_waiting_jobs()
+        return job
+
+    def get(self, job_id: str) -> Optional[TranslationJob]:
+        self._remove_expired_jobs()
+        return self._jobs.get(job_id)
+
+    async def close(self) -> None:
+        """
+        Cancels the running jobs and forgets the waiting ones. Files of all the jobs are released -
+        those of the running jobs once their translations stop.
+        """
+        while self._waiting_jobs:
+            _, _, job = heapq.heappop(self._waiting_jobs)
+            job.uml_model.release()
+        for task in self._running_tasks:
+            task.cancel()
+        await asyncio.gather(*self._running_tasks, return_exceptions=True)
+        self._jobs.clear()
+        if self._owns_translation_executor:
+            self._translation_executor.shutdown()
+
+    def _start_waiting_jobs(self) -> None:
+        while self._waiting_jobs and len(self._running_tasks) < self._max_workers:
+            _, _, job = self._waiting_jobs[0]
+            # Interactive jobs are taken first, so the heavy job on top means that only the heavy jobs are waiting
+            if job.is_heavy and self._running_heavy_jobs_count >= self._max_heavy_workers:
+                return
+            heapq.heappop(self._waiting_jobs)
+            if job.is_heavy:
+                self._running_heavy_jobs_count += 1
+            task = asyncio.create_task(self._run_job(job))
+            self._running_tasks.add(task)
+            task.add_done_callback(lambda finished_task, job=job: self._finish_job(finished_task, job))
+
+    def _finish_job(self, task: asyncio.Task, job: TranslationJob) -> None:
+        self._running_tasks.discard(task)
+        if job.is_heavy:
+            self._running_heavy_jobs_count -= 1
+        self._start_waiting_jobs()
+
+    async def _run_job(self, job: TranslationJob) -> None:
+        job.status = ProcessStatusEnum.RUNNING
+        job.started_at = time.time()
+        self._logger.info(f"Translation job {job.id} of model {job.model_id} was started")
+        try:
+            # When the job is cancelled, the translation is awaited until it stops, so its files are released after that.
+            translated_model, files_errors_messages, model_sources = await self._translation_executor.run_in_thread(translate_job_in_thread, job, cancel_event=job.cancel_event)
+            job.failed_files = get_failed_files(job.uml_model, files_errors_messages)
+            if len(job.failed_files) == len(job.uml_model.source_files):
+                job.error_message = "None of the source files was translated"
+                job.status = ProcessStatusEnum.FAILED
+            else:
+                await self._uml_model_repository.save(translated_model, model_sources)
+                job.status = ProcessStatusEnum.PARTIAL_SUCCESS if job.failed_files else ProcessStatusEnum.FINISHED
+        except asyncio.CancelledError:
+            job.error_message = "Translation job was cancelled"
+            job.status = ProcessStatusEnum.FAILED
+            raise
+        except Exception as ex:
+            job.error_message = f"Failed to translate model: {ex}"
+            job.status = ProcessStatusEnum.FAILED
+        finally:
+            job.finished_at = time.time()
+            job.uml_model.release()
+            self._logger.info(f"Translation job {job.id} of model {job.model_id} was finished with state {job.status.name}")
+            if job.error_message is not None:
+                self._logger.error(f"Translation job {job.id} failed: {job.error_message}")
+
+    def _remove_expired_jobs(self) -> None:
+        expiration_time = time.time() - self._result_ttl
+        expired_jobs_ids = [job_id for job_id, job in self._jobs.items() if job.is_finished and job.finished_at < expiration_time]
+        for job_id in expired_jobs_ids:
+            del self._jobs[job_id]
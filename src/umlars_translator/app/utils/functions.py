@@ -1,8 +1,14 @@
-from typing import Callable, Type
+from typing import Callable, Optional, Type
 import asyncio
 from functools import wraps
 
 from umlars_translator.app.exceptions import NotYetAvailableError, ServiceConnectionError
+from umlars_translator.core.serialization.compression import CompressionMethod
+
+
+HTTP_CONTENT_ENCODINGS = {
+    "gzip": CompressionMethod.GZIP,
+}
 
 
 def retry_async(reconnect_attempts: int = 5, sleep_seconds_between_recconnects: int = 5, exception_class_raised_when_all_attempts_failed: Type["Exception"] = ServiceConnectionError) -> None:
@@ -20,3 +26,41 @@ def retry_async(reconnect_attempts: int = 5, sleep_seconds_between_recconnects:
 
         return inner
     return wrapper
+
+
+def negotiate_content_encoding(accept_encoding: Optional[str]) -> Optional[CompressionMethod]:
+    """Returns compression method accepted by the client, based on the Accept-Encoding header, or None if the response should not be compressed."""
+    if not accept_encoding:
+        return None
+
+    accepted_encodings = {}
+    for coding in accept_encoding.split(","):
+        name, *parameters = [part.strip() for part in coding.split(";")]
+        quality = 1.0
+        for parameter in parameters:
+            key, _, value = parameter.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted_encodings[name.lower()] = quality
+
+    for name, compression in HTTP_CONTENT_ENCODINGS.items():
+        quality = accepted_encodings.get(name, accepted_encodings.get("*", 0.0))
+        if quality > 0:
+            return compression
+
+    return None
+
+
+def is_etag_matched(if_none_match: Optional[str], etag: str) -> bool:
+    """Checks the If-None-Match header against the ETag of the current representation - weak comparison is used, as required for this header."""
+    if not if_none_match:
+        return False
+
+    for requested_etag in if_none_match.split(","):
+        requested_etag = requested_etag.strip()
+        if requested_etag == "*" or requested_etag.removeprefix("W/") == etag:
+            return True
+    return False
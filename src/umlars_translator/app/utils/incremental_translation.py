@@ -0,0 +1,100 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from umlars_translator.app.dtos.model_sources import UmlModelSourcesDTO, UmlFileContributionDTO
+
+
+# Parts of the serialized model holding the lists of its top-level elements and diagrams
+MODEL_SECTIONS_GROUPS = ("elements", "diagrams")
+
+
+def iter_top_level_elements(model_data: Dict[str, Any]) -> Iterator[Tuple[str, str, dict]]:
+    """
+    Yields (group, section, element) of each top-level element and diagram of the serialized model.
+    """
+    for group_name in MODEL_SECTIONS_GROUPS:
+        for section_name, section in (model_data.get(group_name) or {}).items():
+            for element in section:
+                yield group_name, section_name, element
+
+
+def get_files_to_translate(
+    source_files_ids: Iterable[str],
+    model_data: Optional[Dict[str, Any]],
+    model_sources: Optional[UmlModelSourcesDTO],
+    ids_of_edited_files: Optional[Iterable[str]] = None,
+    ids_of_new_submitted_files: Optional[Iterable[str]] = None,
+) -> Optional[List[str]]:
+    """
+    Returns IDs of the source files, which have to be translated again to update the stored model - edited and new ones,
+    along with the files missing in the model's sources or failed before. Contributions of the other files are taken from the stored model.
+    Returns None, if the whole model has to be translated - it wasn't stored with its sources or some of its elements are missing in them.
+    """
+    if model_data is None or model_sources is None:
+        return None
+
+    attributed_elements_ids = {element_id for file in model_sources.files for element_id in file.elements_ids}
+    if any(element["id"] not in attributed_elements_ids for _, _, element in iter_top_level_elements(model_data)):
+        return None
+
+    source_files_ids = [str(file_id) for file_id in source_files_ids]
+    changed_files_ids = {str(file_id) for file_id in (ids_of_edited_files or [])} | {str(file_id) for file_id in (ids_of_new_submitted_files or [])}
+    stored_files = {file.file_id: file for file in model_sources.files}
+    files_to_translate_ids = []
+    for file_id in source_files_ids:
+        stored_file = stored_files.get(file_id)
+        if file_id in changed_files_ids or stored_file is None or stored_file.failed:
+            files_to_translate_ids.append(file_id)
+
+    if len(files_to_translate_ids) == len(source_files_ids):
+        return None
+    return files_to_translate_ids
+
+
+def merge_translated_files(
+    source_files_ids: Iterable[str],
+    model_data: Dict[str, Any],
+    model_sources: UmlModelSourcesDTO,
+    translated_model_data: Dict[str, Any],
+    translated_model_sources: UmlModelSourcesDTO,
+) -> Tuple[Dict[str, Any], UmlModelSourcesDTO]:
+    """
+    Builds the model from the contributions of the source files, in their order - the translated files' ones are taken from the
+    translated model, the others from the stored model. Contributions of the files no longer in the sources (deleted) are dropped.
+    Elements reference each other by IDs, so references to the elements of the files translated again are linked by the new elements.
+    The result is the same as the translation of all the files - model's name and metadata are the last ones set by any file.
+    """
+    stored_elements = {element["id"]: (group_name, section_name, element) for group_name, section_name, element in iter_top_level_elements(model_data)}
+    translated_elements = {
+        element["id"]: (group_name, section_name, element) for group_name, section_name, element in iter_top_level_elements(translated_model_data)
+    }
+
+    merged_model_data = {key: value for key, value in (model_data | translated_model_data).items() if key not in MODEL_SECTIONS_GROUPS}
+    merged_model_data["name"] = None
+    merged_model_data["metadata"] = {}
+    for group_name in MODEL_SECTIONS_GROUPS:
+        sections_names = dict.fromkeys([*(model_data.get(group_name) or {}), *(translated_model_data.get(group_name) or {})])
+        merged_model_data[group_name] = {section_name: [] for section_name in sections_names}
+
+    stored_files = {file.file_id: file for file in model_sources.files}
+    translated_files = {file.file_id: file for file in translated_model_sources.files}
+    files_contributions: List[UmlFileContributionDTO] = []
+    for file_id in source_files_ids:
+        file_id = str(file_id)
+        file_contribution = translated_files.get(file_id)
+        elements = translated_elements
+        if file_contribution is None:
+            file_contribution, elements = stored_files.get(file_id), stored_elements
+        if file_contribution is None:
+            continue
+
+        files_contributions.append(file_contribution)
+        for element_id in file_contribution.elements_ids:
+            if element_id in elements:
+                group_name, section_name, element = elements[element_id]
+                merged_model_data[group_name][section_name].append(element)
+        if file_contribution.name is not None:
+            merged_model_data["name"] = file_contribution.name
+        if file_contribution.metadata:
+            merged_model_data["metadata"] = file_contribution.metadata
+
+    return merged_model_data, UmlModelSourcesDTO(files=files_contributions)
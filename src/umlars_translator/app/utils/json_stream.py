@@ -0,0 +1,294 @@
+from typing import Any, Iterable, List, Optional, Tuple
+import os
+import re
+import tempfile
+
+
+JSON_WHITESPACE = " \t\n\r"
+JSON_SCALAR_DELIMITERS = JSON_WHITESPACE + ",]}"
+JSON_LITERALS = {"true": ("boolean", True), "false": ("boolean", False), "null": ("null", None)}
+JSON_ESCAPED_CHARACTERS = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+JSON_STRING_SPECIAL_CHARACTER_PATTERN = re.compile(r'["\\]')
+JSON_NUMBER_PATTERN = re.compile(r"-?(0|[1-9][0-9]*)(\.[0-9]+)?([eE][+-]?[0-9]+)?")
+ARRAY_ITEM_PREFIX = "item"
+
+# Expected next token
+EXPECT_VALUE = "value"
+EXPECT_VALUE_OR_ARRAY_END = "value_or_array_end"
+EXPECT_KEY = "key"
+EXPECT_KEY_OR_MAP_END = "key_or_map_end"
+EXPECT_COLON = "colon"
+EXPECT_COMMA_OR_END = "comma_or_end"
+EXPECT_NOTHING = "nothing"
+
+JsonEvent = Tuple[str, str, Any]
+
+
+class JsonStreamError(ValueError):
+    pass
+
+
+class JsonStreamParser:
+    """
+    Incremental JSON parser - it is fed with the text in chunks and returns the parsing events, as soon as they are complete,
+    so the document is never held in memory as a whole.
+    Events are (prefix, event, value) tuples. The prefix is the path to the value - keys of the objects and "item" for the elements
+    of the arrays, joined with dots (e.g. "source_files.item.data"). Events: start_map, map_key, end_map, start_array, end_array,
+    string, number, boolean and null. Strings at the streamed prefixes are returned in parts, as they arrive - string_part events
+    ended by end_string - so even a single, huge value doesn't have to be kept in memory.
+    """
+    def __init__(self, streamed_prefixes: Iterable[str] = ()) -> None:
+        self._streamed_prefixes = frozenset(streamed_prefixes)
+        self._buffer = ""
+        self._path: List[Optional[str]] = []
+        self._containers: List[str] = []
+        self._expected = EXPECT_VALUE
+        self._string_parts: Optional[List[str]] = None
+        self._is_string_key = False
+        self._is_string_streamed = False
+        self._scalar_token: Optional[str] = None
+
+    @property
+    def prefix(self) -> str:
+        return ".".join(self._path)
+
+    def feed(self, text: str) -> List[JsonEvent]:
+        events = []
+        text = self._buffer + text
+        position = 0
+        text_length = len(text)
+        while position < text_length:
+            if self._string_parts is not None:
+                position = self._read_string(text, position, events)
+                if self._string_parts is not None:
+                    break
+                continue
+
+            if self._scalar_token is not None:
+                position = self._read_scalar(text, position, events)
+                if self._scalar_token is not None:
+                    break
+                continue
+
+            character = text[position]
+            if character in JSON_WHITESPACE:
+                position += 1
+                continue
+
+            self._read_structural_character(character, events)
+            position += 1
+
+        self._buffer = text[position:]
+        return events
+
+    def close(self) -> List[JsonEvent]:
+        """
+        Ends the parsing, returning the remaining events. Raises JsonStreamError, if the document is incomplete.
+        """
+        events = []
+        if self._scalar_token is not None:
+            self._complete_scalar(events)
+        if self._buffer.strip() or self._string_parts is not None or self._expected != EXPECT_NOTHING:
+            raise JsonStreamError("Unexpected end of the JSON document")
+        return events
+
+    def _read_structural_character(self, character: str, events: List[JsonEvent]) -> None:
+        expected = self._expected
+        if expected in (EXPECT_VALUE, EXPECT_VALUE_OR_ARRAY_END):
+            if character == "]" and expected == EXPECT_VALUE_OR_ARRAY_END:
+                self._end_container("array", events)
+            elif character == "{":
+                events.append((self.prefix, "start_map", None))
+                self._containers.append("map")
+                self._path.append(None)
+                self._expected = EXPECT_KEY_OR_MAP_END
+            elif character == "[":
+                events.append((self.prefix, "start_array", None))
+                self._containers.append("array")
+                self._path.append(ARRAY_ITEM_PREFIX)
+                self._expected = EXPECT_VALUE_OR_ARRAY_END
+            elif character == '"':
+                self._start_string(is_key=False, events=events)
+            elif character == "-" or character.isdigit() or character in "tfn":
+                self._scalar_token = character
+            else:
+                raise JsonStreamError(f"Unexpected character {character!r} at {self.prefix!r}")
+        elif expected in (EXPECT_KEY, EXPECT_KEY_OR_MAP_END):
+            if character == '"':
+                self._start_string(is_key=True, events=events)
+            elif character == "}" and expected == EXPECT_KEY_OR_MAP_END:
+                self._end_container("map", events)
+            else:
+                raise JsonStreamError(f"Expected key at {self.prefix!r}, found {character!r}")
+        elif expected == EXPECT_COLON:
+            if character != ":":
+                raise JsonStreamError(f"Expected colon at {self.prefix!r}, found {character!r}")
+            self._expected = EXPECT_VALUE
+        elif expected == EXPECT_COMMA_OR_END:
+            container = self._containers[-1]
+            if character == ",":
+                self._expected = EXPECT_KEY if container == "map" else EXPECT_VALUE
+            elif character == "}" and container == "map":
+                self._end_container("map", events)
+            elif character == "]" and container == "array":
+                self._end_container("array", events)
+            else:
+                raise JsonStreamError(f"Unexpected character {character!r} at {self.prefix!r}")
+        else:
+            raise JsonStreamError(f"Unexpected character {character!r} after the end of the JSON document")
+
+    def _end_container(self, container: str, events: List[JsonEvent]) -> None:
+        self._containers.pop()
+        self._path.pop()
+        events.append((self.prefix, f"end_{container}", None))
+        self._complete_value()
+
+    def _complete_value(self) -> None:
+        self._expected = EXPECT_COMMA_OR_END if self._containers else EXPECT_NOTHING
+
+    def _start_string(self, is_key: bool, events: List[JsonEvent]) -> None:
+        self._string_parts = []
+        self._is_string_key = is_key
+        self._is_string_streamed = not is_key and self.prefix in self._streamed_prefixes
+
+    def _read_string(self, text: str, position: int, events: List[JsonEvent]) -> int:
+        text_length = len(text)
+        while position < text_length:
+            special_character = JSON_STRING_SPECIAL_CHARACTER_PATTERN.search(text, position)
+            if special_character is None:
+                self._add_string_part(text[position:], events)
+                return text_length
+
+            special_character_position = special_character.start()
+            if special_character_position > position:
+                self._add_string_part(text[position:special_character_position], events)
+
+            if text[special_character_position] == '"':
+                self._complete_string(events)
+                return special_character_position + 1
+
+            unescaped_text, escape_sequence_length = self._read_escape_sequence(text, special_character_position)
+            if unescaped_text is None:
+                # Escape sequence split between the chunks - the rest of it is read with the next one
+                return special_character_position
+            self._add_string_part(unescaped_text, events)
+            position = special_character_position + escape_sequence_length
+        return position
+
+    def _read_escape_sequence(self, text: str, position: int) -> Tuple[Optional[str], int]:
+        available_length = len(text) - position
+        if available_length < 2:
+            return None, 0
+
+        escaped_character = text[position + 1]
+        if escaped_character in JSON_ESCAPED_CHARACTERS:
+            return JSON_ESCAPED_CHARACTERS[escaped_character], 2
+        if escaped_character != "u":
+            raise JsonStreamError(f"Invalid escape sequence in the string at {self.prefix!r}")
+        if available_length < 6:
+            return None, 0
+
+        code_point = self._parse_code_point(text[position + 2:position + 6])
+        if 0xD800 <= code_point <= 0xDBFF:
+            # High surrogate - joined with the low one, if it follows
+            if available_length < 8:
+                return None, 0
+            if text[position + 6:position + 8] == "\\u":
+                if available_length < 12:
+                    return None, 0
+                low_code_point = self._parse_code_point(text[position + 8:position + 12])
+                if 0xDC00 <= low_code_point <= 0xDFFF:
+                    return chr(0x10000 + ((code_point - 0xD800) << 10) + (low_code_point - 0xDC00)), 12
+        return chr(code_point), 6
+
+    def _parse_code_point(self, hex_digits: str) -> int:
+        try:
+            return int(hex_digits, 16)
+        except ValueError as ex:
+            raise JsonStreamError(f"Invalid unicode escape sequence in the string at {self.prefix!r}") from ex
+
+    def _add_string_part(self, part: str, events: List[JsonEvent]) -> None:
+        if self._is_string_streamed:
+            events.append((self.prefix, "string_part", part))
+        else:
+            self._string_parts.append(part)
+
+    def _complete_string(self, events: List[JsonEvent]) -> None:
+        string_parts, self._string_parts = self._string_parts, None
+        if self._is_string_key:
+            events.append((".".join(self._path[:-1]), "map_key", "".join(string_parts)))
+            self._path[-1] = "".join(string_parts)
+            self._expected = EXPECT_COLON
+            return
+
+        if self._is_string_streamed:
+            events.append((self.prefix, "end_string", None))
+        else:
+            events.append((self.prefix, "string", "".join(string_parts)))
+        self._complete_value()
+
+    def _read_scalar(self, text: str, position: int, events: List[JsonEvent]) -> int:
+        text_length = len(text)
+        token_end = position
+        while token_end < text_length and text[token_end] not in JSON_SCALAR_DELIMITERS:
+            token_end += 1
+        self._scalar_token += text[position:token_end]
+        if token_end < text_length:
+            self._complete_scalar(events)
+        return token_end
+
+    def _complete_scalar(self, events: List[JsonEvent]) -> None:
+        token, self._scalar_token = self._scalar_token, None
+        if token in JSON_LITERALS:
+            event, value = JSON_LITERALS[token]
+        elif JSON_NUMBER_PATTERN.fullmatch(token):
+            event, value = "number", float(token) if any(character in token for character in ".eE") else int(token)
+        else:
+            raise JsonStreamError(f"Invalid value {token!r} at {self.prefix!r}")
+        events.append((self.prefix, event, value))
+        self._complete_value()
+
+
+class TextSpool:
+    """
+    Text written in parts - kept in memory, until it reaches max_memory_size characters,
+    then moved to the temporary file (encoded in UTF-8), so big texts don't occupy the memory.
+    """
+    def __init__(self, max_memory_size: int, spool_dir: Optional[str] = None) -> None:
+        self._max_memory_size = max_memory_size
+        self._spool_dir = spool_dir
+        self._parts: List[str] = []
+        self._memory_size = 0
+        self._file = None
+        self.file_path: Optional[str] = None
+
+    def write(self, part: str) -> None:
+        if self._file is not None:
+            self._file.write(part)
+            return
+
+        self._parts.append(part)
+        self._memory_size += len(part)
+        if self._memory_size >= self._max_memory_size:
+            self._file = tempfile.NamedTemporaryFile(
+                mode="w", encoding="utf-8", errors="surrogatepass", suffix=".spool", dir=self._spool_dir, delete=False
+            )
+            self.file_path = self._file.name
+            self._file.writelines(self._parts)
+            self._parts = []
+
+    def close(self) -> Optional[str]:
+        """
+        Ends writing. Returns the text, if it is kept in memory, otherwise None - the text is in the file at file_path.
+        """
+        if self._file is None:
+            return "".join(self._parts)
+        self._file.close()
+        return None
+
+    def discard(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        if self.file_path is not None and os.path.exists(self.file_path):
+            os.remove(self.file_path)
+        self._parts = []
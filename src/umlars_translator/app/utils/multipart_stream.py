@@ -0,0 +1,182 @@
+from typing import Any, Dict, List, Optional, Tuple
+import os
+import tempfile
+
+
+CRLF = b"\r\n"
+HEADERS_END = b"\r\n\r\n"
+BOUNDARY_MARK = b"--"
+# Headers of the part longer than this number of bytes are rejected - they are kept in memory until complete
+MAX_PART_HEADERS_SIZE = 16 * 1024
+
+# Part of the body being read
+READ_PREAMBLE = "preamble"
+READ_HEADERS = "headers"
+READ_DATA = "data"
+READ_EPILOGUE = "epilogue"
+
+MultipartEvent = Tuple[str, Any]
+
+
+class MultipartStreamError(ValueError):
+    pass
+
+
+def parse_header_parameters(value: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Splits the header value into its main value and parameters, e.g. 'form-data; name="file"' into ("form-data", {"name": "file"}).
+    """
+    main_value, *parameters = value.split(";")
+    parsed_parameters = {}
+    for parameter in parameters:
+        key, _, parameter_value = parameter.strip().partition("=")
+        parameter_value = parameter_value.strip()
+        if len(parameter_value) >= 2 and parameter_value[0] == parameter_value[-1] == '"':
+            parameter_value = parameter_value[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+        parsed_parameters[key.strip().lower()] = parameter_value
+    return main_value.strip().lower(), parsed_parameters
+
+
+def get_multipart_boundary(content_type: Optional[str]) -> Optional[bytes]:
+    """
+    Returns the boundary of the multipart/form-data body, or None if the content type is different.
+    """
+    if not content_type:
+        return None
+    media_type, parameters = parse_header_parameters(content_type)
+    if media_type != "multipart/form-data" or not parameters.get("boundary"):
+        return None
+    return parameters["boundary"].encode("latin-1")
+
+
+class MultipartStreamParser:
+    """
+    Incremental parser of the multipart body - it is fed with the body in chunks and returns the parsing events, as soon as they are complete,
+    so the uploaded files are never held in memory as a whole.
+    Events are (event, value) tuples: part_start with the part's headers (lowercase names), part_data with the next bytes of the part's content
+    and part_end. The data of each part is returned as it arrives - only the bytes which could start the boundary are held back.
+    """
+    def __init__(self, boundary: bytes) -> None:
+        self._delimiter = CRLF + BOUNDARY_MARK + boundary
+        # Body may start with the boundary, without the preceding line break
+        self._buffer = bytearray(CRLF)
+        self._state = READ_PREAMBLE
+
+    @property
+    def is_complete(self) -> bool:
+        return self._state == READ_EPILOGUE
+
+    def feed(self, chunk: bytes) -> List[MultipartEvent]:
+        events: List[MultipartEvent] = []
+        if self._state == READ_EPILOGUE:
+            return events
+
+        self._buffer += chunk
+        while self._state != READ_EPILOGUE:
+            is_read = self._read_headers(events) if self._state == READ_HEADERS else self._read_until_delimiter(events)
+            if not is_read:
+                return events
+        self._buffer.clear()
+        return events
+
+    def close(self) -> List[MultipartEvent]:
+        if self._state != READ_EPILOGUE:
+            raise MultipartStreamError("Multipart body ended before its closing boundary")
+        return []
+
+    def _read_headers(self, events: List[MultipartEvent]) -> bool:
+        headers_end_position = self._buffer.find(HEADERS_END)
+        if headers_end_position == -1:
+            if len(self._buffer) > MAX_PART_HEADERS_SIZE:
+                raise MultipartStreamError("Headers of the multipart body part are too long")
+            return False
+        if headers_end_position > MAX_PART_HEADERS_SIZE:
+            raise MultipartStreamError("Headers of the multipart body part are too long")
+
+        headers = {}
+        for line in bytes(self._buffer[:headers_end_position]).split(CRLF):
+            if not line:
+                continue
+            name, separator, value = line.decode("utf-8", errors="replace").partition(":")
+            if not separator:
+                raise MultipartStreamError(f"Invalid header of the multipart body part: {line[:100]!r}")
+            headers[name.strip().lower()] = value.strip()
+        del self._buffer[:headers_end_position + len(HEADERS_END)]
+        events.append(("part_start", headers))
+        self._state = READ_DATA
+        return True
+
+    def _read_until_delimiter(self, events: List[MultipartEvent]) -> bool:
+        """
+        Reads the part's data (or the preamble, which is skipped) up to the boundary, along with the line ending the boundary.
+        """
+        delimiter_position = self._buffer.find(self._delimiter)
+        data_end_position = delimiter_position if delimiter_position != -1 else len(self._buffer) - len(self._delimiter) + 1
+        if data_end_position > 0:
+            # Only the bytes which could start the boundary are held back
+            if self._state == READ_DATA:
+                events.append(("part_data", bytes(self._buffer[:data_end_position])))
+            del self._buffer[:data_end_position]
+        if delimiter_position == -1:
+            return False
+
+        delimiter_end_position = len(self._delimiter)
+        if self._buffer[delimiter_end_position:delimiter_end_position + len(BOUNDARY_MARK)] == BOUNDARY_MARK:
+            next_state = READ_EPILOGUE
+        else:
+            line_end_position = self._buffer.find(CRLF, delimiter_end_position)
+            if line_end_position == -1:
+                # Padding after the boundary can't be longer than the usual line
+                if len(self._buffer) > MAX_PART_HEADERS_SIZE:
+                    raise MultipartStreamError("Boundary of the multipart body isn't followed by the line break")
+                return False
+            if self._buffer[delimiter_end_position:line_end_position].strip(b" \t"):
+                raise MultipartStreamError("Boundary of the multipart body is followed by unexpected characters")
+            del self._buffer[:line_end_position + len(CRLF)]
+            next_state = READ_HEADERS
+
+        if self._state == READ_DATA:
+            events.append(("part_end", None))
+        self._state = next_state
+        return True
+
+
+class BytesSpool:
+    """
+    Binary counterpart of the TextSpool - data is kept in memory, until it reaches max_memory_size bytes,
+    then moved to the temporary file as it is, so its encoding can still be detected from the data.
+    """
+    def __init__(self, max_memory_size: int, spool_dir: Optional[str] = None) -> None:
+        self._max_memory_size = max_memory_size
+        self._spool_dir = spool_dir
+        self._buffer = bytearray()
+        self._file = None
+        self.file_path: Optional[str] = None
+
+    def write(self, part: bytes) -> None:
+        if self._file is not None:
+            self._file.write(part)
+            return
+
+        self._buffer.extend(part)
+        if len(self._buffer) >= self._max_memory_size:
+            self._file = tempfile.NamedTemporaryFile(mode="wb", suffix=".spool", dir=self._spool_dir, delete=False)
+            self.file_path = self._file.name
+            self._file.write(self._buffer)
+            self._buffer = bytearray()
+
+    def close(self) -> Optional[bytes]:
+        """
+        Ends writing. Returns the data, if it is kept in memory, otherwise None - the data is in the file at file_path.
+        """
+        if self._file is None:
+            return bytes(self._buffer)
+        self._file.close()
+        return None
+
+    def discard(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        if self.file_path is not None and os.path.exists(self.file_path):
+            os.remove(self.file_path)
+        self._buffer = bytearray()
@@ -7,8 +7,9 @@ from kink import inject
 
 from umlars_translator.config import SupportedFormat
 from umlars_translator.core.translator import ModelTranslator
+from umlars_translator.core.serialization.umlars_model.parallel_json_serializer import ParallelUmlToPydanticSerializer
+from umlars_translator.core.serialization.compression import CompressionMethod, open_output_sink, get_compressed_file_name
 from umlars_translator.core.utils.functions import get_enum_members_values
-from umlars_translator.app.main import run_app
 
 
 @inject
@@ -42,6 +43,20 @@ class CLIManager:
             "--join", action="store_true", help="Join all files data into one model"
         )
 
+        self._parser.add_argument(
+            "--serialization-workers",
+            type=int,
+            default=None,
+            help="Serialize large models in parallel, using given number of worker processes",
+        )
+
+        self._parser.add_argument(
+            "--compression",
+            default=CompressionMethod.NONE.value,
+            choices=get_enum_members_values(CompressionMethod),
+            help="Compress the output files on the fly",
+        )
+
     def _parse_args(self) -> argparse.Namespace:
         return self._parser.parse_args()
 
@@ -50,17 +65,33 @@ class CLIManager:
         if args.run_server:
             self._run_server()
         elif args.file_names:
-            self._translate_files(args.file_names, args.from_format, args.join)
+            self._translate_files(args.file_names, args.from_format, args.join, args.serialization_workers, args.compression)
         else:
             self._parser.print_help()
 
     def _run_server(self) -> None:
         self._logger.info("Running REST API server...")
+        # Imported here, so translating files doesn't require loading the web and messaging stack
+        from umlars_translator.app.main import run_app
+
         run_app()
 
-    def _translate_files(self, file_names, from_format, join_into_one_model) -> None:
+    def _translate_files(self, file_names, from_format, join_into_one_model, serialization_workers=None, compression=CompressionMethod.NONE) -> None:
         self._logger.info(f"Translating files {file_names} from format {from_format}...")
-        translator = ModelTranslator()
+        if serialization_workers is not None:
+            serializer = ParallelUmlToPydanticSerializer(max_workers=serialization_workers)
+            translator = ModelTranslator(serializer=serializer)
+        else:
+            serializer = None
+            translator = ModelTranslator()
+        try:
+            self._translate_files_with(translator, file_names, from_format, join_into_one_model, compression)
+        finally:
+            if serializer is not None:
+                # Workers are shared by all the translated files
+                serializer.shutdown()
+
+    def _translate_files_with(self, translator: ModelTranslator, file_names, from_format, join_into_one_model, compression: CompressionMethod) -> None:
         current_working_directory = os.getcwd()
         output_directory = os.path.join(current_working_directory, "output")
         if not os.path.exists(output_directory):
@@ -71,25 +102,23 @@ class CLIManager:
             for file_name in file_names:
                 file_base_name = os.path.basename(file_name)
                 self._logger.info(f"Translating file {file_base_name}...")
-                translated_data = translator.translate(file_name=file_name, from_format=from_format, clear_model_afterwards=False)
-            
-            output_file_name = f"{file_base_name}_merged_translated.umj"
+                translated_model = translator.deserialize(file_name=file_name, from_format=from_format, clear_builder_afterwards=False)
+
+            output_file_name = get_compressed_file_name(f"{file_base_name}_merged_translated.umj", compression)
             output_location = os.path.join(output_directory, output_file_name)
+            with open_output_sink(output_location, compression) as output_file:
+                translator.serialize_to_stream(output_file, translated_model)
             self._logger.info(f"Files translated to {output_location}")
-            with open(output_location, "w") as output_file:
-                output_file.write(translated_data)
-        
-        else:        
+
+        else:
             for file_name in file_names:
                 file_base_name = os.path.basename(file_name)
                 self._logger.info(f"Translating file {file_base_name}...")
-                
-                output_file_name = f"{file_base_name}_translated.umj"
+
+                output_file_name = get_compressed_file_name(f"{file_base_name}_translated.umj", compression)
                 output_location = os.path.join(output_directory, output_file_name)
-                translated_data = translator.translate(file_name=file_name, from_format=from_format, clear_model_afterwards=True)
-                with open(output_location, "w") as output_file:
-                    output_file.write(translated_data)
+                translated_model = translator.deserialize(file_name=file_name, from_format=from_format, clear_builder_afterwards=True)
+                with open_output_sink(output_location, compression) as output_file:
+                    translator.serialize_to_stream(output_file, translated_model)
 
                 self._logger.info(f"File {file_name} translated to {output_location}")
-
-            
@@ -11,6 +11,7 @@ class SupportedFormat(Enum):
     UML_PAPYRUS = "uml_papyrus"
     NOTATION_PAPYRUS = "notation_papyrus"
     MDJ_STARTUML = "mdj_staruml"
+    UMJ = "umj"
     UNKNOWN = "unknown"
 
 
@@ -9,3 +9,38 @@ LOGGER_BASE_NAME = SYSTEM_NAME
 
 LOG_LEVEL = os.getenv("CORE_LOG_LEVEL", "WARNING")
 LOG_FILE = os.getenv("CORE_LOG_FILE", "logs/umlars-core.log")
+
+
+"""
+Asynchronous translation settings
+"""
+# "thread" or "process" - type of the pool, in which the translation is run by the asynchronous API
+TRANSLATION_EXECUTOR_TYPE = os.getenv("TRANSLATION_EXECUTOR_TYPE", "thread")
+TRANSLATION_EXECUTOR_MAX_WORKERS = int(os.getenv("TRANSLATION_EXECUTOR_MAX_WORKERS", os.cpu_count() or 1))
+TRANSLATION_MAX_CONCURRENCY = int(os.getenv("TRANSLATION_MAX_CONCURRENCY", TRANSLATION_EXECUTOR_MAX_WORKERS))
+
+
+"""
+Batch translation settings
+"""
+# Number of jobs submitted ahead per worker by ModelTranslator.translate_many - bounds the number of models kept in memory
+TRANSLATE_MANY_PENDING_JOBS_PER_WORKER = int(os.getenv("TRANSLATE_MANY_PENDING_JOBS_PER_WORKER", 2))
+
+
+"""
+Translation cache settings
+"""
+TRANSLATION_CACHE_MEMORY_MAX_ENTRIES = int(os.getenv("TRANSLATION_CACHE_MEMORY_MAX_ENTRIES", 256))
+TRANSLATION_CACHE_MEMORY_MAX_BYTES = int(os.getenv("TRANSLATION_CACHE_MEMORY_MAX_BYTES", 64 * 1024 * 1024))
+# On-disk tier is used only if the directory is set
+TRANSLATION_CACHE_DISK_DIRECTORY = os.getenv("TRANSLATION_CACHE_DISK_DIRECTORY")
+TRANSLATION_CACHE_DISK_MAX_BYTES = int(os.getenv("TRANSLATION_CACHE_DISK_MAX_BYTES", 1024 * 1024 * 1024))
+# Changing the salt invalidates all the cached translations, e.g. after the change of the configuration affecting the output
+TRANSLATION_CACHE_KEY_SALT = os.getenv("TRANSLATION_CACHE_KEY_SALT", "")
+
+
+"""
+Translation budget settings
+"""
+# Memory usage is read every N-th budget check, as it is much more expensive than checking the time
+TRANSLATION_BUDGET_MEMORY_CHECK_INTERVAL = int(os.getenv("TRANSLATION_BUDGET_MEMORY_CHECK_INTERVAL", 1000))
@@ -0,0 +1,32 @@
+from typing import Optional, Any
+import json
+
+from umlars_translator.core.deserialization.abstract.pipeline_deserialization.pipeline_deserialization_strategy import (
+    PipelineDeserializationStrategy,
+)
+from umlars_translator.core.deserialization.data_source import DataSource
+from umlars_translator.core.deserialization.abstract.pipeline_deserialization.pipeline import (
+    ModelProcessingPipe,
+)
+from umlars_translator.core.deserialization.exceptions import InvalidFormatException
+
+
+class JSONDeserializationStrategy(PipelineDeserializationStrategy):
+    def __init__(
+        self,
+        pipe: Optional[ModelProcessingPipe] = None,
+        format_detection_pipe: Optional[ModelProcessingPipe] = None,
+        **kwargs,
+    ) -> None:
+        self._pipe = pipe
+        self._format_detection_pipe = format_detection_pipe
+        self._parsed_data = None
+        super().__init__(**kwargs)
+
+    def _parse_format_data(self, data_source: DataSource) -> Any:
+        try:
+            return json.loads(data_source.retrieved_data)
+        except json.JSONDecodeError as ex:
+            error_message = f"Error parsing JSON data from {data_source}: {ex}"
+            self._logger.error(error_message)
+            raise InvalidFormatException(error_message)
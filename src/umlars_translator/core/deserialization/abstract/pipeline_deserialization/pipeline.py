@@ -154,6 +154,9 @@ class ModelProcessingPipe(ABC):
         # It is a generator so iteration through it can be done only once and has to be done exactly ones to make the operations execute.
         # TODO: this should be optimized not to iterate through all successors for each data batch IF some way of grouping successors is possible.
         for data_batch in batches_of_data_processed_by_parent:
+            if self.model_builder is not None:
+                self.model_builder.check_translation_budget()
+                self.model_builder.report_processing_pipe(self.__class__.__name__)
             for successor in self._successors:
                 successor.process_if_possible(data_batch=data_batch)
 
@@ -1,21 +1,58 @@
 from typing import Any
-import io
 from xml.etree import ElementTree as ET
+from xml.parsers.expat import errors as expat_errors
 
 from umlars_translator.core.deserialization.data_source import DataSource
 
 
+# Errors of the parser fed with the data in other encoding than the declared one
+ENCODING_PARSE_ERRORS_CODES = {
+    expat_errors.codes[expat_errors.XML_ERROR_UNKNOWN_ENCODING],
+    expat_errors.codes[expat_errors.XML_ERROR_INCORRECT_ENCODING],
+    expat_errors.codes[expat_errors.XML_ERROR_INVALID_TOKEN],
+}
+
+
+class NamespacesCollectingTreeBuilder(ET.TreeBuilder):
+    """
+    Tree builder collecting the namespaces declared in the document, so they are known without parsing it again.
+    """
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.namespaces: dict[str, str] = {}
+
+    def start_ns(self, prefix: str, uri: str) -> None:
+        self.namespaces[prefix] = uri
+
+
+def parse_element_tree(source: DataSource) -> tuple[ET.ElementTree, dict[str, str]]:
+    """
+    Parses the data source in one pass, returning the element tree and the namespaces declared in it.
+    The raw buffer is fed to the parser directly - it handles the encoding declared in the XML prolog itself.
+    If the data doesn't match the declared encoding, it is parsed again as the text decoded by the data source.
+    """
+    raw_data = source.retrieved_raw_data
+    if isinstance(raw_data, str):
+        return _parse_element_tree(raw_data)
+
+    try:
+        return _parse_element_tree(raw_data)
+    except LookupError:
+        return _parse_element_tree(source.retrieved_data)
+    except ET.ParseError as ex:
+        if ex.code not in ENCODING_PARSE_ERRORS_CODES:
+            raise
+        return _parse_element_tree(source.retrieved_data)
+
+
+def _parse_element_tree(data: Any) -> tuple[ET.ElementTree, dict[str, str]]:
+    tree_builder = NamespacesCollectingTreeBuilder()
+    parser = ET.XMLParser(target=tree_builder)
+    parser.feed(data)
+    root = parser.close()
+    return ET.ElementTree(root), tree_builder.namespaces
+
+
 def retrieve_namespaces(source: DataSource) -> dict[str, str]:
-        namespaces = {}
-        xml_file_like_data_reference = (
-            source.file_path
-            if source.file_path is not None
-            else io.StringIO(source.retrieved_data)
-        )
-
-        for event, elem in ET.iterparse(
-            xml_file_like_data_reference, events=("start-ns",)
-        ):
-            prefix, uri = elem
-            namespaces[prefix] = uri
-        return namespaces
+    _, namespaces = parse_element_tree(source)
+    return namespaces
@@ -10,7 +10,7 @@ from umlars_translator.core.deserialization.abstract.pipeline_deserialization.pi
 )
 from umlars_translator.core.deserialization.exceptions import InvalidFormatException
 from umlars_translator.core.configuration.config_namespace import ParsedConfigNamespace
-from umlars_translator.core.deserialization.abstract.xml.utils import retrieve_namespaces
+from umlars_translator.core.deserialization.abstract.xml.utils import retrieve_namespaces, parse_element_tree
 
 
 class XmlDeserializationStrategy(PipelineDeserializationStrategy):
@@ -22,19 +22,17 @@ class XmlDeserializationStrategy(PipelineDeserializationStrategy):
         TODO: To improve - now it has the side effect of parsing the config - too much responsibility and not obvoius what the function does.
         """
         try:
-            self._parse_config(data_source)
-            return self._get_element_tree(data_source)
+            element_tree, namespaces = parse_element_tree(data_source)
+            self.config.parse(namespaces)
+            return element_tree
         except ET.ParseError as ex:
             error_message = f"Error parsing XML data from {data_source}: {ex}"
             self._logger.warning(error_message)
             raise InvalidFormatException(error_message)
 
     def _get_element_tree(self, source: DataSource) -> ET.ElementTree:
-        return (
-            ET.parse(source.file_path)
-            if source.file_path is not None
-            else ET.ElementTree(ET.fromstring(source.retrieved_data))
-        )
+        element_tree, _ = parse_element_tree(source)
+        return element_tree
 
     def _parse_config(self, source: DataSource) -> ParsedConfigNamespace:
         namespaces = retrieve_namespaces(source)
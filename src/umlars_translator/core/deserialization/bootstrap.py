@@ -1,5 +1,7 @@
 from kink import di
 
+from umlars_translator.core.deserialization import config
+
 from umlars_translator.core.deserialization.factory import (
     DeserializationStrategyFactory,
 )
@@ -11,7 +13,7 @@ def bootstrap_di() -> None:
     factory = DeserializationStrategyFactory()
     di[DeserializationStrategyFactory] = factory
 
-    deserialization_extensions_manager = ExtensionsManager()
+    deserialization_extensions_manager = ExtensionsManager(manifest_path=config.EXTENSIONS_MANIFEST_PATH)
     di[ExtensionsManager] = deserialization_extensions_manager
 
     model_deserializer = ModelDeserializer()
@@ -1,6 +1,26 @@
+import os
+
+
 """
 Extensions settings
 """
 DESERIALIZATION_EXTENSIONS_GROUP_NAME = [
     "umlars_translator.core.deserialization.abstract.base.deserialization_strategy"
 ]
+# Manifest of the deserialization plugins (entry points and formats of their strategies).
+# If set, it is created on the first start and then read instead of scanning the installed distributions metadata,
+# allowing the strategies modules to be imported only when their format is needed.
+EXTENSIONS_MANIFEST_PATH = os.getenv("EXTENSIONS_MANIFEST_PATH")
+
+
+"""
+Data sources settings
+"""
+# Files of at least this size (in bytes) are memory-mapped instead of being read into memory
+DATA_SOURCE_MMAP_MIN_FILE_SIZE = int(os.getenv("DATA_SOURCE_MMAP_MIN_FILE_SIZE", 1024 * 1024))
+# Default size (in bytes) of the chunks, in which the data sources are streamed
+DATA_SOURCE_CHUNK_SIZE = int(os.getenv("DATA_SOURCE_CHUNK_SIZE", 64 * 1024))
+# Encoding of the text data without BOM or encoding declaration
+DATA_SOURCE_DEFAULT_ENCODING = os.getenv("DATA_SOURCE_DEFAULT_ENCODING", "utf-8")
+# Encoding used, when the data without encoding declared is not valid in the default encoding
+DATA_SOURCE_FALLBACK_ENCODING = os.getenv("DATA_SOURCE_FALLBACK_ENCODING", "windows-1252")
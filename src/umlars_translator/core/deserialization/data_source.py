@@ -1,16 +1,79 @@
-from typing import Any, Callable, Optional, Iterable, Dict
+from typing import Any, BinaryIO, Callable, Optional, Iterable, Iterator, Dict
 from functools import cached_property
 from dataclasses import dataclass
+import codecs
+import io
+import mmap
+import os
+import re
+
+from umlars_translator.core.deserialization import config
+
+
+BYTES_ORDER_MARKS_ENCODINGS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+# Start of the XML declaration ("<?") written in the wide encodings without BOM
+XML_DECLARATION_WIDE_ENCODINGS = (
+    (b"<\x00\x00\x00?\x00\x00\x00", "utf-32-le"),
+    (b"\x00\x00\x00<\x00\x00\x00?", "utf-32-be"),
+    (b"<\x00?\x00", "utf-16-le"),
+    (b"\x00<\x00?", "utf-16-be"),
+)
+XML_DECLARATION_ENCODING_PATTERN = re.compile(rb"^<\?xml[^>]*?\sencoding\s*=\s*[\"']([A-Za-z][A-Za-z0-9._-]*)[\"']")
+ENCODING_DETECTION_PREFIX_LENGTH = 256
+
+
+def detect_encoding(data_prefix: bytes) -> Optional[str]:
+    """
+    Detects encoding of the text from its beginning: the BOM or the encoding declared in the XML prolog.
+    Returns None, if the encoding isn't stated in the data or the declared encoding is unknown.
+    """
+    for bytes_order_mark, encoding in BYTES_ORDER_MARKS_ENCODINGS:
+        if data_prefix.startswith(bytes_order_mark):
+            return encoding
+
+    for xml_declaration_start, encoding in XML_DECLARATION_WIDE_ENCODINGS:
+        if data_prefix.startswith(xml_declaration_start):
+            return encoding
+
+    declared_encoding = XML_DECLARATION_ENCODING_PATTERN.match(data_prefix)
+    if declared_encoding is not None:
+        encoding = declared_encoding.group(1).decode("ascii").lower()
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            return None
+        return encoding
+
+    return None
+
+
+def is_stream(data: Any) -> bool:
+    return callable(getattr(data, "read", None))
 
 
 @dataclass
 class DataSource:
+    """
+    Source of the data to deserialize: a file, data given as string or bytes, a callable returning them
+    or a binary stream (e.g. a network response body). Streams can be consumed only once - reading all the data
+    (e.g. through retrieved_buffer) caches it, so it can be read again.
+    Encoding given explicitly overrides the one stated in the data - e.g. for the text re-encoded when it was stored.
+    Used as a context manager, it releases the memory-mapped buffer on exit.
+    """
     def __init__(
-        self, data: Optional[str | Callable] = None, file_path: Optional[str] = None, format: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None, **kwargs
+        self, data: Optional[str | bytes | Callable | BinaryIO] = None, file_path: Optional[str] = None, format: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None,
+        encoding: Optional[str] = None, **kwargs
     ) -> None:
         self._data = data
         self._file_path = file_path
         self._format = format
+        self._encoding = encoding
         self._metadata: Dict[str, Any] = kwargs | (metadata or {})
 
     @cached_property
@@ -18,24 +81,69 @@ class DataSource:
         """
         Returns data stored in the data property.
         If it contains None value or Callable - the data is extracted and then returned.
+        Data given as bytes (or returned as bytes by the callable) or read from the file is decoded
+        using the detected encoding.
         """
-        if isinstance(self._data, Callable):
-            return self._data()
+        if self._is_text_data:
+            return self._text_data
 
         if self._data is None:
             if self._file_path is not None:
-                return self.read_data_from_file()
-        else:
+                return self.decode(self.retrieved_buffer)
+        elif isinstance(self._data, str):
             return self._data
+        else:
+            return self.decode(self.retrieved_buffer)
 
         raise ValueError("Tried to access data that wasn't properly setup")
 
+    @cached_property
+    def retrieved_buffer(self) -> bytes | mmap.mmap:
+        """
+        Returns raw, not decoded data. Big files are memory-mapped instead of being read into memory.
+        The buffer can be consumed directly by the parsers accepting bytes-like objects.
+        """
+        if self._data is None and self._file_path is not None:
+            return self.read_buffer_from_file()
+
+        if is_stream(self._data):
+            with self.open_stream() as stream:
+                return stream.read()
+
+        data = self._called_data if isinstance(self._data, Callable) else self._data
+        if isinstance(data, str):
+            return data.encode("utf-8")
+        if data is None:
+            raise ValueError("Tried to access data that wasn't properly setup")
+        return data
+
+    @property
+    def retrieved_raw_data(self) -> str | bytes | mmap.mmap:
+        """
+        Returns data in the form requiring no conversion: text given as string or the buffer otherwise.
+        Data with the encoding given explicitly is decoded, so the parsers don't use the encoding stated in it.
+        """
+        if self._is_text_data or self._encoding is not None:
+            return self.retrieved_data
+        return self.retrieved_buffer
+
+    @cached_property
+    def encoding(self) -> Optional[str]:
+        """
+        Encoding stated by the BOM or declared in the XML prolog of the data. None, if not stated.
+        """
+        if self._encoding is not None:
+            return self._encoding
+        if self._is_text_data:
+            return None
+        return detect_encoding(bytes(self.retrieved_buffer[:ENCODING_DETECTION_PREFIX_LENGTH]))
+
     @property
     def data(self) -> str:
         return self._data
 
     @data.setter
-    def data(self, data: str | Callable) -> None:
+    def data(self, data: str | bytes | Callable) -> None:
         self._data = data
 
     @property
@@ -49,7 +157,7 @@ class DataSource:
     @property
     def metadata(self) -> Dict[str, Any]:
         return self._metadata
-    
+
     @metadata.setter
     def metadata(self, metadata: Dict[str, Any]) -> None:
         self._metadata = metadata
@@ -57,20 +165,123 @@ class DataSource:
     @property
     def format(self) -> str:
         return self._format
-    
+
     @format.setter
     def format(self, format: str) -> None:
         self._format = format
 
-    @cached_property
+    @property
     def data_by_lines(self) -> Iterable[str]:
-        with open(self._file_path, "r", encoding="utf-8") as file:
-            yield from file.readlines()
+        """
+        Returns new iterator over the decoded lines of the data, read lazily.
+        """
+        with self.open_stream() as stream:
+            encoding = self._detect_stream_encoding(stream)
+            text_stream = io.TextIOWrapper(stream, encoding=encoding or config.DATA_SOURCE_DEFAULT_ENCODING)
+            try:
+                yield from text_stream
+            finally:
+                text_stream.detach()
 
-    def read_data_from_file(self) -> str:
+    def open_stream(self) -> BinaryIO:
+        """
+        Returns new binary file-like object streaming the raw data. Files are opened again each time,
+        so nothing is kept in memory. Stream given as the data is returned as is, if it wasn't read yet.
+        """
+        if self._data is None and self._file_path is not None:
+            return open(self._file_path, "rb")
+
+        if is_stream(self._data) and "retrieved_buffer" not in self.__dict__:
+            if self.__dict__.get("_stream_opened"):
+                raise ValueError("Data stream of the data source was already consumed")
+            self.__dict__["_stream_opened"] = True
+            return self._data
+
+        return io.BytesIO(self.retrieved_buffer)
+
+    def _detect_stream_encoding(self, stream: BinaryIO) -> Optional[str]:
+        if self._encoding is not None:
+            return self._encoding
+        if self._is_text_data:
+            return "utf-8"
+        if "retrieved_buffer" in self.__dict__:
+            return self.encoding
+        if hasattr(stream, "peek"):
+            return detect_encoding(stream.peek(ENCODING_DETECTION_PREFIX_LENGTH)[:ENCODING_DETECTION_PREFIX_LENGTH])
+        if stream.seekable():
+            data_prefix = stream.read(ENCODING_DETECTION_PREFIX_LENGTH)
+            stream.seek(-len(data_prefix), io.SEEK_CUR)
+            return detect_encoding(data_prefix)
+        return None
+
+    @property
+    def is_single_pass(self) -> bool:
+        """Data is a stream which wasn't buffered - it can be read only once."""
+        return is_stream(self._data) and "retrieved_buffer" not in self.__dict__
+
+    @property
+    def _is_text_data(self) -> bool:
+        """Data given as text is buffered encoded in UTF-8, regardless of the encoding it declares."""
+        return isinstance(self._text_data, str)
+
+    @property
+    def _text_data(self) -> Optional[str]:
+        if isinstance(self._data, Callable) and not is_stream(self._data):
+            data = self._called_data
+        else:
+            data = self._data
+        return data if isinstance(data, str) else None
+
+    @cached_property
+    def _called_data(self) -> str | bytes:
+        return self._data()
+
+    def iter_chunks(self, size: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Yields the raw data in chunks of the given size (the last one may be shorter).
+        """
+        chunk_size = size or config.DATA_SOURCE_CHUNK_SIZE
+        with self.open_stream() as stream:
+            yield from iter(lambda: stream.read(chunk_size), b"")
+
+    def decode(self, buffer: bytes | mmap.mmap) -> str:
+        """
+        Decodes the buffer using the stated encoding (or the default one, if not stated). Data which isn't valid
+        in that encoding (e.g. declared as UTF-8, but saved in Windows-1252) is decoded using the fallback encoding.
+        """
         try:
-            with open(self._file_path, "r", encoding="utf-8") as file:
+            return codecs.decode(buffer, self.encoding or config.DATA_SOURCE_DEFAULT_ENCODING)
+        except (LookupError, UnicodeDecodeError):
+            return codecs.decode(buffer, config.DATA_SOURCE_FALLBACK_ENCODING)
+
+    def read_buffer_from_file(self) -> bytes | mmap.mmap:
+        with open(self._file_path, "rb") as file:
+            file_size = os.fstat(file.fileno()).st_size
+            if file_size == 0 or file_size < config.DATA_SOURCE_MMAP_MIN_FILE_SIZE:
                 return file.read()
-        except UnicodeDecodeError:
-            with open(self._file_path, "r", encoding="windows-1252") as file:
-                return file.read()
\ No newline at end of file
+            # The mapping stays valid after the file is closed
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def read_data_from_file(self) -> str:
+        return self.decode(self.read_buffer_from_file())
+
+    def close(self) -> None:
+        """
+        Releases the memory-mapped buffer. It will be mapped again, if needed.
+        """
+        buffer = self.__dict__.pop("retrieved_buffer", None)
+        if isinstance(buffer, mmap.mmap):
+            buffer.close()
+
+    def __enter__(self) -> "DataSource":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Memory-mapped buffer can't be pickled - it is mapped again in the other process
+        state = self.__dict__.copy()
+        if isinstance(state.get("retrieved_buffer"), mmap.mmap):
+            del state["retrieved_buffer"]
+        return state
@@ -1,4 +1,6 @@
-from typing import Optional, Iterator, Dict, Iterator
+import os
+from types import ModuleType
+from typing import Callable, Optional, Iterator, Dict, Iterator
 from logging import Logger
 
 from kink import inject
@@ -8,7 +10,7 @@ from umlars_translator.core.deserialization.exceptions import UnsupportedSourceD
 from umlars_translator.core.deserialization.data_source import DataSource
 from umlars_translator.config import SupportedFormat
 from umlars_translator.core.model.abstract.uml_model import IUmlModel
-from umlars_translator.core.extensions_manager import ExtensionsManager
+from umlars_translator.core.extensions_manager import ExtensionsManager, ExtensionEntry
 from umlars_translator.core.deserialization import config
 from umlars_translator.core.deserialization.factory import (
     DeserializationStrategyFactory,
@@ -18,6 +20,8 @@ from umlars_translator.core.deserialization.abstract.base.deserialization_strate
 )
 from umlars_translator.core.model.abstract.uml_model_builder import IUmlModelBuilder
 from umlars_translator.core.model.umlars_model.uml_model_builder import UmlModelBuilder
+from umlars_translator.core.translation_context import TranslationContext
+from umlars_translator.core.deserialization.translation_budget import TranslationBudget, create_translation_budget
 
 
 @inject
@@ -29,21 +33,27 @@ class ModelDeserializer:
         input_processor: Optional[InputProcessor] = None,
         model_builder: IUmlModelBuilder | None = None,
         core_logger: Optional[Logger] = None,
+        model_builder_factory: Optional[Callable[[], IUmlModelBuilder]] = None,
     ) -> None:
         self._factory = factory
         self._deserialization_extensions_manager = deserialization_extensions_manager
-        self._model_builder = model_builder or UmlModelBuilder()
+        self._default_context = TranslationContext(model_builder or UmlModelBuilder())
+        # Builders of the new contexts are of the same kind as the injected one, unless the factory is given
+        self._model_builder_factory = model_builder_factory or type(self._default_context.model_builder)
         self._input_processor = input_processor or InputProcessor()
         self._logger = core_logger.getChild(self.__class__.__name__)
         self.load_formats_support()
 
     @property
     def model_builder(self) -> IUmlModelBuilder:
-        return self._model_builder
+        return self._default_context.model_builder
 
     @property
     def model(self) -> IUmlModel:
-        return self._model_builder.model
+        return self._default_context.model_builder.model
+
+    def create_context(self) -> TranslationContext:
+        return TranslationContext(self._model_builder_factory())
 
     def load_formats_support(
         self, extensions_group_name: Optional[Iterator[str]] = None
@@ -54,9 +64,39 @@ class ModelDeserializer:
         self._logger.info(
             f"Activating deserialization extensions for group: {extensions_group_name}"
         )
+        manifest_path = self._deserialization_extensions_manager.manifest_path
+        if manifest_path is not None and not os.path.exists(manifest_path):
+            self._logger.info(f"Creating deserialization extensions manifest: {manifest_path}")
+            self._deserialization_extensions_manager.save_manifest(
+                extensions_group_name, self._get_strategy_module_format
+            )
+
         self._deserialization_extensions_manager.activate_extensions(
-            extensions_group_name
+            extensions_group_name, self._register_lazy_strategy
+        )
+
+    def _register_lazy_strategy(self, extension: ExtensionEntry) -> bool:
+        """
+        Extensions with format known from the manifest are imported when their format is first needed.
+        """
+        if extension.key is None:
+            return False
+
+        self._factory.register_lazy_strategy(
+            SupportedFormat(extension.key),
+            lambda: self._deserialization_extensions_manager.load_extension(extension),
         )
+        return True
+
+    def _get_strategy_module_format(self, strategy_module: ModuleType) -> Optional[str]:
+        for module_attribute in vars(strategy_module).values():
+            if (
+                isinstance(module_attribute, type)
+                and issubclass(module_attribute, DeserializationStrategy)
+                and module_attribute.__module__ == strategy_module.__name__
+            ):
+                return module_attribute.get_supported_format().value
+        return None
 
     def deserialize(
         self,
@@ -66,8 +106,14 @@ class ModelDeserializer:
         from_format: Optional[SupportedFormat] = None,
         model_to_extend: Optional[IUmlModel] = None,
         clear_builder_afterwards: bool = True,
+        context: Optional[TranslationContext] = None,
+        time_limit: Optional[float] = None,
+        memory_limit: Optional[int] = None,
     ) -> IUmlModel:
         """
+        The model is built by the builder of the given context - deserializer's default one, if not given.
+        Time (in seconds) and memory (in bytes) limits of the deserialization are checked cooperatively during processing,
+        TranslationBudgetExceededError is raised when any is exceeded. Without them, the budget of the context is used.
         TODO: Support for accepting dictionary assigning from_format to file_name or data_batch.
         """
         self._logger.debug(
@@ -81,41 +127,57 @@ class ModelDeserializer:
             self._logger.info("Multiple inputs accepted.")
 
         self._logger.info("Deserializing data sources")
-        return self.deserialize_data_sources(data_sources, model_to_extend, clear_builder_afterwards)
+        translation_budget = create_translation_budget(time_limit, memory_limit)
+        return self.deserialize_data_sources(data_sources, model_to_extend, clear_builder_afterwards, context, translation_budget)
 
     def deserialize_data_sources(
         self,
         data_sources: Iterator[DataSource],
         model_to_extend: Optional[IUmlModel] = None,
         clear_builder_afterwards: bool = True,
+        context: Optional[TranslationContext] = None,
+        translation_budget: Optional[TranslationBudget] = None,
     ) -> IUmlModel:
+        context = context or self._default_context
+        model_builder = context.model_builder
+        translation_budget = translation_budget or context.translation_budget
         model: IUmlModel = model_to_extend
 
-        for source in data_sources:
-            self._logger.info(
-                f"Choosing deserialization strategy for data source: {source}"
-                f"Registered strategies: {self._factory._registered_strategies}"
-            )
-            try:
-                import_parsing_strategy = self.get_strategy_for_source(source)
-            except UnsupportedSourceDataTypeError as ex:
-                self._logger.error(f"Error while choosing deserialization strategy: {ex}")
-                raise ex
-            self._logger.info(f"Retrieving model from data source: {source}")
-            model = import_parsing_strategy.retrieve_model(source, model, self._model_builder, clear_afterwards=False)
+        previous_translation_budget, previous_translation_progress = model_builder.translation_budget, model_builder.translation_progress
+        model_builder.translation_budget = translation_budget
+        model_builder.translation_progress = context.translation_progress
+        try:
+            for source in data_sources:
+                model_builder.check_translation_budget()
+                self._logger.info(
+                    f"Choosing deserialization strategy for data source: {source}"
+                    f"Registered strategies: {self._factory._registered_strategies}"
+                )
+                # Memory-mapped buffer of the source is released once it is deserialized
+                with source:
+                    try:
+                        import_parsing_strategy = self.get_strategy_for_source(source, model_builder)
+                    except UnsupportedSourceDataTypeError as ex:
+                        self._logger.error(f"Error while choosing deserialization strategy: {ex}")
+                        raise ex
+                    self._logger.info(f"Retrieving model from data source: {source}")
+                    model = import_parsing_strategy.retrieve_model(source, model, model_builder, clear_afterwards=False)
+        finally:
+            model_builder.translation_budget = previous_translation_budget
+            model_builder.translation_progress = previous_translation_progress
 
         if clear_builder_afterwards:
-            self._model_builder.clear()
+            model_builder.clear()
 
         return model
 
     def get_strategy_for_source(
-        self, source: DataSource
+        self, source: DataSource, model_builder: Optional[IUmlModelBuilder] = None
     ) -> DeserializationStrategy:
         return self._factory.get_strategy(
             format_data_source=source,
-            model_builder=self._model_builder,
+            model_builder=model_builder or self._default_context.model_builder,
         )
 
-    def clear(self) -> None:
-        self._model_builder.clear()
+    def clear(self, context: Optional[TranslationContext] = None) -> None:
+        (context or self._default_context).clear()
@@ -25,4 +25,32 @@ class UnableToMapError(Exception):
 class UnsupportedSourceDataTypeError(Exception):
     """
     Raised when the data source type is not supported by any deserialization strategy.
-    """
\ No newline at end of file
+    """
+
+
+class TranslationCancelledError(Exception):
+    """
+    Raised inside the worker, when the awaiting side cancelled the translation, to stop it before the next data source is processed.
+    """
+
+
+class TranslationBudgetExceededError(Exception):
+    """
+    Raised by the cooperative checks during deserialization, when the translation exceeded its time or memory budget.
+    Reason describes the exceeded limit, so it can be reported to the client.
+    """
+    def __init__(self, reason: str) -> None:
+        super().__init__(reason)
+        self.reason = reason
+
+
+class TranslationDeadlineExceededError(TranslationBudgetExceededError):
+    """
+    Raised when the translation didn't finish before its deadline.
+    """
+
+
+class TranslationMemoryBudgetExceededError(TranslationBudgetExceededError):
+    """
+    Raised when memory used by the process grew during the translation above its memory limit.
+    """
@@ -1,4 +1,5 @@
-from typing import Type, Optional, Dict
+import threading
+from typing import Type, Optional, Dict, Callable, Any
 
 from kink import inject
 
@@ -15,10 +16,13 @@ from umlars_translator.core.deserialization.abstract.base.deserialization_strate
 class DeserializationStrategyFactory:
     """
     Factory used to create deserialization strategies.
+    Strategies can be registered lazily - by the loader importing their module, called when their format is first needed.
     """
 
     def __init__(self) -> None:
         self._registered_strategies: Dict[SupportedFormat, DeserializationStrategy] = {}
+        self._lazy_strategies_loaders: Dict[SupportedFormat, Callable[[], Any]] = {}
+        self._lazy_strategies_lock = threading.RLock()
 
     def register_strategy(
         self, strategy_class: Type["DeserializationStrategy"]
@@ -31,6 +35,26 @@ class DeserializationStrategyFactory:
         ] = strategy_class
         return strategy_class
 
+    def register_lazy_strategy(self, supported_format: SupportedFormat, loader: Callable[[], Any]) -> None:
+        """
+        Registers loader, which is expected to register the strategy for the format (e.g. by importing its module).
+        """
+        if supported_format not in self._registered_strategies:
+            self._lazy_strategies_loaders[supported_format] = loader
+
+    def _load_lazy_strategies(self, supported_format: Optional[SupportedFormat] = None) -> None:
+        """
+        Calls the loader of the format - or all the pending loaders, if the format is not given.
+        """
+        with self._lazy_strategies_lock:
+            formats_to_load = (
+                [supported_format] if supported_format is not None else list(self._lazy_strategies_loaders)
+            )
+            for format_to_load in formats_to_load:
+                loader = self._lazy_strategies_loaders.pop(format_to_load, None)
+                if loader is not None:
+                    loader()
+
     def get_strategy(
         self,
         *,
@@ -48,13 +72,17 @@ class DeserializationStrategyFactory:
         ) -> DeserializationStrategy:
             return stategy_class(model_builder=model_builder, **kwargs)
 
-        strategy_class = (
-            self._registered_strategies.get(format_data_source.format) if format_data_source.format is not None else None
-        )
+        strategy_class = None
+        if format_data_source.format is not None:
+            self._load_lazy_strategies(format_data_source.format)
+            strategy_class = self._registered_strategies.get(format_data_source.format)
 
         if strategy_class is not None:
             return create_strategy(strategy_class)
 
+        # Format detection requires every strategy
+        self._load_lazy_strategies()
+
         strategies_instances_for_data = [
             strategy_instance
             for strategy_class in self._registered_strategies.values()
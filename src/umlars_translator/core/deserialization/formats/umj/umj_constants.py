@@ -0,0 +1,111 @@
+from umlars_translator.core.configuration.config_namespace import ConfigNamespace
+
+
+class UmjConfig(ConfigNamespace):
+    """
+    UMJ is the JSON representation of the model produced by the UmlToPydanticSerializer (see docs/umj-json-schema.json).
+    """
+    KEYS: dict[str, str] = {
+        "id": "id",
+        "idref": "idref",
+        "name": "name",
+        "visibility": "visibility",
+        "description": "description",
+        "metadata": "metadata",
+        "elements": "elements",
+        "diagrams": "diagrams",
+        "classes": "classes",
+        "interfaces": "interfaces",
+        "data_types": "data_types",
+        "enumerations": "enumerations",
+        "primitive_types": "primitive_types",
+        "associations": "associations",
+        "generalizations": "generalizations",
+        "dependencies": "dependencies",
+        "realizations": "realizations",
+        "interactions": "interactions",
+        "packages": "packages",
+        "class_diagrams": "class_diagrams",
+        "sequence_diagrams": "sequence_diagrams",
+        "attributes": "attributes",
+        "operations": "operations",
+        "parameters": "parameters",
+        "type": "type",
+        "return_type": "return_type",
+        "direction": "direction",
+        "literals": "literals",
+        "kind": "kind",
+        "is_static": "is_static",
+        "is_ordered": "is_ordered",
+        "is_unique": "is_unique",
+        "is_read_only": "is_read_only",
+        "is_query": "is_query",
+        "is_derived": "is_derived",
+        "is_derived_union": "is_derived_union",
+        "is_abstract": "is_abstract",
+        "exceptions": "exceptions",
+        "end1": "end1",
+        "end2": "end2",
+        "element": "element",
+        "role": "role",
+        "multiplicity": "multiplicity",
+        "navigability": "navigability",
+        "source": "source",
+        "target": "target",
+        "specific": "specific",
+        "general": "general",
+        "client": "client",
+        "supplier": "supplier",
+        "lifelines": "lifelines",
+        "messages": "messages",
+        "fragments": "fragments",
+        "represents": "represents",
+        "covered": "covered",
+        "interaction": "interaction",
+        "operands": "operands",
+        "operator": "operator",
+        "guard": "guard",
+        "send_event": "send_event",
+        "receive_event": "receive_event",
+        "signature": "signature",
+        "sort": "sort",
+        "arguments": "arguments",
+    }
+
+    ELEMENTS_SECTIONS: tuple[str, ...] = (
+        "classes",
+        "interfaces",
+        "data_types",
+        "enumerations",
+        "primitive_types",
+        "associations",
+        "generalizations",
+        "dependencies",
+        "realizations",
+        "interactions",
+        "packages",
+    )
+    """
+    Order matters - packages refer to all the other elements, so they are processed last.
+    """
+
+    DIAGRAMS_SECTIONS: tuple[str, ...] = (
+        "class_diagrams",
+        "sequence_diagrams",
+    )
+
+    CLASS_DIAGRAM_ELEMENTS_SECTIONS: tuple[str, ...] = (
+        "classes",
+        "interfaces",
+        "data_types",
+        "enumerations",
+        "primitive_types",
+        "associations",
+        "generalizations",
+        "dependencies",
+        "realizations",
+    )
+
+    SEQUENCE_DIAGRAM_ELEMENTS_SECTIONS: tuple[str, ...] = (
+        "interactions",
+    )
@@ -0,0 +1,104 @@
+from umlars_translator.core.deserialization.abstract.json.json_deserialization_strategy import (
+    JSONDeserializationStrategy,
+)
+from umlars_translator.core.deserialization.abstract.pipeline_deserialization.pipeline import (
+    ModelProcessingPipe,
+    FormatDetectionPipe,
+)
+from umlars_translator.core.deserialization.formats.umj.umj_format_detection_pipeline import (
+    UmjDetectionPipe,
+)
+from umlars_translator.core.deserialization.formats.umj.umj_model_processing_pipeline import (
+    UmlModelPipe,
+    UmlClassPipe,
+    UmlInterfacePipe,
+    UmlAttributePipe,
+    UmlOperationPipe,
+    UmlOperationParameterPipe,
+    UmlDataTypePipe,
+    UmlEnumerationPipe,
+    UmlPrimitiveTypePipe,
+    UmlAssociationPipe,
+    UmlAssociationEndPipe,
+    UmlAggregationPipe,
+    UmlCompositionPipe,
+    UmlGeneralizationPipe,
+    UmlDependencyPipe,
+    UmlRealizationPipe,
+    UmlInteractionPipe,
+    UmlLifelinePipe,
+    UmlMessagePipe,
+    UmlOccurrenceSpecificationPipe,
+    UmlInteractionUsePipe,
+    UmlCombinedFragmentPipe,
+    UmlInteractionOperandPipe,
+    UmlPackagePipe,
+    UmlClassDiagramPipe,
+    UmlSequenceDiagramPipe,
+)
+from umlars_translator.core.deserialization.factory import (
+    register_deserialization_strategy,
+)
+from umlars_translator.config import SupportedFormat
+from umlars_translator.core.deserialization.formats.umj.umj_constants import (
+    UmjConfig,
+)
+
+
+@register_deserialization_strategy
+class UmjDeserializationStrategy(JSONDeserializationStrategy):
+    """
+    Rehydrates models stored in the UMJ format (output of the translation) back into the core model.
+    """
+    SUPPORTED_FORMAT_NAME = SupportedFormat.UMJ
+    CONFIG_NAMESPACE_CLASS = UmjConfig
+
+    def _build_processing_pipe(self) -> ModelProcessingPipe:
+        # The whole document represents the model
+        uml_model_pipe = UmlModelPipe()
+
+        # Add classifiers processing pipes
+        self._build_classifier_processing_pipe(uml_model_pipe.add_next(UmlClassPipe()))
+        self._build_classifier_processing_pipe(uml_model_pipe.add_next(UmlInterfacePipe()))
+        uml_model_pipe.add_next(UmlDataTypePipe())
+        uml_model_pipe.add_next(UmlEnumerationPipe())
+        uml_model_pipe.add_next(UmlPrimitiveTypePipe())
+
+        # Add relationships processing pipes
+        uml_association_pipe = uml_model_pipe.add_next(UmlAssociationPipe())
+        uml_association_pipe.add_next(UmlAssociationEndPipe())
+        uml_model_pipe.add_next(UmlAggregationPipe()).add_next(UmlAssociationEndPipe())
+        uml_model_pipe.add_next(UmlCompositionPipe()).add_next(UmlAssociationEndPipe())
+        uml_model_pipe.add_next(UmlGeneralizationPipe())
+        uml_model_pipe.add_next(UmlDependencyPipe())
+        uml_model_pipe.add_next(UmlRealizationPipe())
+
+        # Add interaction processing pipes - fragments, including the nested ones, are all passed by the interaction pipe
+        uml_interaction_pipe = uml_model_pipe.add_next(UmlInteractionPipe())
+        uml_interaction_pipe.add_next(UmlLifelinePipe())
+        uml_interaction_pipe.add_next(UmlMessagePipe())
+        uml_interaction_pipe.add_next(UmlOccurrenceSpecificationPipe())
+        uml_interaction_pipe.add_next(UmlInteractionUsePipe())
+        uml_interaction_pipe.add_next(UmlCombinedFragmentPipe())
+        uml_interaction_pipe.add_next(UmlInteractionOperandPipe())
+
+        uml_model_pipe.add_next(UmlPackagePipe())
+
+        # Add diagrams processing pipes
+        uml_model_pipe.add_next(UmlClassDiagramPipe())
+        uml_model_pipe.add_next(UmlSequenceDiagramPipe())
+
+        return uml_model_pipe
+
+    def _build_classifier_processing_pipe(
+        self, parent_pipe: UmlClassPipe | UmlInterfacePipe
+    ) -> UmlClassPipe | UmlInterfacePipe:
+        parent_pipe.add_next(UmlAttributePipe())
+
+        operation_pipe = parent_pipe.add_next(UmlOperationPipe())
+        operation_pipe.add_next(UmlOperationParameterPipe())
+
+        return parent_pipe
+
+    def _build_format_detection_pipe(self) -> FormatDetectionPipe:
+        return UmjDetectionPipe()
@@ -0,0 +1,25 @@
+from typing import Iterator
+
+from umlars_translator.core.deserialization.abstract.json.json_pipeline import (
+    JSONFormatDetectionPipe,
+    DataBatch,
+)
+from umlars_translator.core.deserialization.formats.umj.umj_constants import UmjConfig
+from umlars_translator.core.deserialization.exceptions import InvalidFormatException
+
+
+class UmjFormatDetectionPipe(JSONFormatDetectionPipe):
+    ...
+
+
+class UmjDetectionPipe(UmjFormatDetectionPipe):
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        data = data_batch.data
+        if not isinstance(data, dict):
+            raise InvalidFormatException(f"Expected dict, got {type(data)}")
+
+        for key in (UmjConfig.KEYS["elements"], UmjConfig.KEYS["diagrams"]):
+            if not isinstance(data.get(key), dict):
+                raise InvalidFormatException(f"Expected dict under the key {key}, got {type(data.get(key))}")
+
+        yield from self._create_data_batches([])
@@ -0,0 +1,577 @@
+from enum import Enum
+from typing import Iterator, Iterable, Optional
+
+from umlars_translator.core.deserialization.abstract.pipeline_deserialization.pipeline import DataBatch
+from umlars_translator.core.deserialization.abstract.json.json_pipeline import (
+    JSONModelProcessingPipe,
+    JSONAttributeCondition,
+    AliasToJSONKey,
+)
+from umlars_translator.core.deserialization.formats.umj.umj_constants import UmjConfig
+from umlars_translator.core.deserialization.exceptions import InvalidFormatException, UnableToMapError
+from umlars_translator.core.model.constants import (
+    UmlAssociationTypeEnum,
+    UmlVisibilityEnum,
+    UmlParameterDirectionEnum,
+    UmlMultiplicityEnum,
+    UmlPrimitiveTypeKindEnum,
+    UmlInteractionOperatorEnum,
+    UmlMessageSortEnum,
+    UmlMessageKindEnum,
+)
+
+
+class UmjModelProcessingPipe(JSONModelProcessingPipe):
+    """
+    UMJ elements carry no type markers - their kind is defined by the list they are stored in.
+    The name of that list is passed by the predecessor pipe in the parent context under the "section" key.
+    """
+    ASSOCIATED_SECTION: Optional[str] = None
+    # UMJ allows nulls under these keys (e.g. unspecified visibility) - they are passed on instead of the builder defaults
+    NULLABLE_KEYS: tuple[str, ...] = ("visibility", "navigability")
+
+    def _can_process(self, data_batch: Optional[DataBatch] = None) -> bool:
+        parent_context = data_batch.parent_context or {}
+        if parent_context.get("section") != self.ASSOCIATED_SECTION:
+            return False
+        return super()._can_process(data_batch)
+
+    def _get_values_for_keys(
+        self, data: dict, mandatory_keys: Iterable[str] = (), optional_keys: Iterable[str] = ()
+    ) -> dict:
+        try:
+            mandatory_attributes = AliasToJSONKey.from_kwargs(**{key: UmjConfig.KEYS[key] for key in mandatory_keys})
+            optional_attributes = AliasToJSONKey.from_kwargs(**{key: UmjConfig.KEYS[key] for key in optional_keys})
+        except KeyError as ex:
+            raise ValueError(
+                f"Configuration of the data format was invalid. Error: {str(ex)}"
+            )
+
+        aliases_to_values = self._get_attributes_values_for_aliases(data, mandatory_attributes, optional_attributes)
+        for key in optional_keys:
+            if key in self.NULLABLE_KEYS and UmjConfig.KEYS[key] in data and data[UmjConfig.KEYS[key]] is None:
+                aliases_to_values[key] = None
+
+        return aliases_to_values
+
+    def _get_reference_id(self, data: dict, key: str) -> Optional[str]:
+        reference = data.get(UmjConfig.KEYS[key])
+        if reference is None:
+            return None
+
+        try:
+            return reference[UmjConfig.KEYS["idref"]]
+        except (KeyError, TypeError) as ex:
+            raise InvalidFormatException(f"Expected id reference under the key {key}, got {reference}") from ex
+
+    def _get_references_ids(self, data: dict, key: str) -> list[str]:
+        references = data.get(UmjConfig.KEYS[key]) or []
+
+        try:
+            return [reference[UmjConfig.KEYS["idref"]] for reference in references]
+        except (KeyError, TypeError) as ex:
+            raise InvalidFormatException(f"Expected list of id references under the key {key}, got {references}") from ex
+
+    def _map_to_enum(self, values: dict, key: str, enum_class: type[Enum], raise_when_missing: bool = True) -> None:
+        if values.get(key) is None:
+            return
+
+        try:
+            values[key] = enum_class(values[key])
+        except ValueError as ex:
+            if raise_when_missing:
+                raise UnableToMapError(f"Value {values[key]} is not a valid {enum_class.__name__}.") from ex
+
+    def _get_directed_association_ends(self, data: dict) -> tuple[dict, list[dict]]:
+        """
+        Ends of the aggregations and compositions are stored in full, but id references to them are accepted as well.
+        Returns ids of the referenced ends (by the names of the builder arguments) and the ends stored in full,
+        which are added to the association in the order of their construction.
+        """
+        ends_ids, ends = {}, []
+        for key in ("source", "target"):
+            end = data.get(UmjConfig.KEYS[key])
+            if isinstance(end, dict) and UmjConfig.KEYS["idref"] not in end:
+                ends.append(end)
+            else:
+                ends_ids[f"{key}_id"] = self._get_reference_id(data, key)
+
+        return ends_ids, ends
+
+    def _create_fragments_data_batches(self, fragments: list[dict], interaction_id: Optional[str] = None) -> Iterator[DataBatch]:
+        """
+        Fragments of all kinds are stored in a single list, so the section is determined for each of them separately.
+        Operands of the combined fragments and their nested fragments are flattened here (right after their parent),
+        so that the pipes processing them don't have to form a cycle.
+        Nested fragments belong to the operand only - they are created without the interaction id.
+        """
+        for fragment in fragments:
+            if UmjConfig.KEYS["operator"] in fragment:
+                yield from self._create_data_batches([fragment], section="combined_fragments", interaction_id=interaction_id)
+
+                for operand in fragment.get(UmjConfig.KEYS["operands"], []):
+                    yield from self._create_data_batches([operand], section="operands", parent_id=fragment[UmjConfig.KEYS["id"]])
+                    yield from self._create_fragments_data_batches(operand.get(UmjConfig.KEYS["fragments"], []))
+
+            elif UmjConfig.KEYS["interaction"] in fragment:
+                yield from self._create_data_batches([fragment], section="interaction_uses", interaction_id=interaction_id)
+            else:
+                yield from self._create_data_batches([fragment], section="occurrence_specifications", interaction_id=interaction_id)
+
+
+class UmlModelPipe(UmjModelProcessingPipe):
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        data = data_batch.data
+        if not isinstance(data, dict):
+            raise InvalidFormatException(f"Expected dict, got {type(data)}")
+
+        aliases_to_values = self._get_values_for_keys(data, optional_keys=("id", "name", "visibility"))
+        self._map_to_enum(aliases_to_values, "visibility", UmlVisibilityEnum)
+        self.model_builder.construct_uml_model(**aliases_to_values)
+
+        metadata = data.get(UmjConfig.KEYS["metadata"])
+        if metadata:
+            self.model_builder.construct_metadata(**metadata)
+
+        elements = data.get(UmjConfig.KEYS["elements"], {})
+        for section in UmjConfig.ELEMENTS_SECTIONS:
+            yield from self._create_data_batches(elements.get(UmjConfig.KEYS[section], []), section=section)
+
+        diagrams = data.get(UmjConfig.KEYS["diagrams"], {})
+        for section in UmjConfig.DIAGRAMS_SECTIONS:
+            yield from self._create_data_batches(diagrams.get(UmjConfig.KEYS[section], []), section=section)
+
+
+class UmlClassPipe(UmjModelProcessingPipe):
+    ASSOCIATED_SECTION = "classes"
+
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        data = data_batch.data
+
+        aliases_to_values = self._get_values_for_keys(data, ("id",), ("name", "visibility"))
+        self._map_to_enum(aliases_to_values, "visibility", UmlVisibilityEnum)
+        # Generalizations and interfaces of the class are stored as references - they are bound when the relationships are constructed.
+        self.model_builder.construct_uml_class(**aliases_to_values)
+
+        yield from self._create_data_batches(data.get(UmjConfig.KEYS["attributes"], []), section="attributes", parent_id=aliases_to_values["id"])
+        yield from self._create_data_batches(data.get(UmjConfig.KEYS["operations"], []), section="operations", parent_id=aliases_to_values["id"])
+
+
+class UmlInterfacePipe(UmjModelProcessingPipe):
+    ASSOCIATED_SECTION = "interfaces"
+
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        data = data_batch.data
+
+        aliases_to_values = self._get_values_for_keys(data, ("id",), ("name", "visibility"))
+        self._map_to_enum(aliases_to_values, "visibility", UmlVisibilityEnum)
+        self.model_builder.construct_uml_interface(**aliases_to_values)
+
+        yield from self._create_data_batches(data.get(UmjConfig.KEYS["attributes"], []), section="attributes", parent_id=aliases_to_values["id"])
+        yield from self._create_data_batches(data.get(UmjConfig.KEYS["operations"], []), section="operations", parent_id=aliases_to_values["id"])
+
+
+class UmlAttributePipe(UmjModelProcessingPipe):
+    ASSOCIATED_SECTION = "attributes"
+
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        data = data_batch.data
+
+        aliases_to_values = self._get_values_for_keys(
+            data,
+            ("id",),
+            (
+                "name", "visibility", "is_static", "is_ordered", "is_unique", "is_read_only", "is_query", "is_derived",
+                "is_derived_union",
+            ),
+        )
+        self._map_to_enum(aliases_to_values, "visibility", UmlVisibilityEnum)
+        self.model_builder.construct_uml_attribute(
+            classifier_id=data_batch.parent_context["parent_id"],
+            type_id=self._get_reference_id(data, "type"),
+            **aliases_to_values,
+        )
+
+        yield from self._create_data_batches([])
+
+
+class UmlOperationPipe(UmjModelProcessingPipe):
+    ASSOCIATED_SECTION = "operations"
+
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        data = data_batch.data
+
+        aliases_to_values = self._get_values_for_keys(
+            data,
+            ("id",),
+            (
+                "name", "visibility", "is_static", "is_ordered", "is_unique", "is_query", "is_derived", "is_derived_union",
+                "is_abstract", "exceptions",
+            ),
+        )
+        self._map_to_enum(aliases_to_values, "visibility", UmlVisibilityEnum)
+        self.model_builder.construct_uml_operation(
+            classifier_id=data_batch.parent_context["parent_id"],
+            return_type_id=self._get_reference_id(data, "return_type"),
+            **aliases_to_values,
+        )
+
+        yield from self._create_data_batches(data.get(UmjConfig.KEYS["parameters"], []), section="parameters", parent_id=aliases_to_values["id"])
+
+
+class UmlOperationParameterPipe(UmjModelProcessingPipe):
+    ASSOCIATED_SECTION = "parameters"
+
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        data = data_batch.data
+
+        aliases_to_values = self._get_values_for_keys(data, ("id",), ("name", "direction"))
+        self._map_to_enum(aliases_to_values, "direction", UmlParameterDirectionEnum)
+        self.model_builder.construct_uml_parameter(
+            operation_id=data_batch.parent_context["parent_id"],
+            type_id=self._get_reference_id(data, "type"),
+            **aliases_to_values,
+        )
+
+        yield from self._create_data_batches([])
+
+
+class UmlDataTypePipe(UmjModelProcessingPipe):
+    ASSOCIATED_SECTION = "data_types"
+
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        aliases_to_values = self._get_values_for_keys(data_batch.data, ("id",), ("name", "visibility"))
+        self._map_to_enum(aliases_to_values, "visibility", UmlVisibilityEnum)
+        self.model_builder.construct_uml_data_type(**aliases_to_values)
+
+        yield from self._create_data_batches([])
+
+
+class UmlEnumerationPipe(UmjModelProcessingPipe):
+    ASSOCIATED_SECTION = "enumerations"
+
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        aliases_to_values = self._get_values_for_keys(data_batch.data, ("id",), ("name", "visibility", "literals"))
+        self._map_to_enum(aliases_to_values, "visibility", UmlVisibilityEnum)
+        self.model_builder.construct_uml_enumeration(**aliases_to_values)
+
+        yield from self._create_data_batches([])
+
+
+class UmlPrimitiveTypePipe(UmjModelProcessingPipe):
+    ASSOCIATED_SECTION = "primitive_types"
+
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        aliases_to_values = self._get_values_for_keys(data_batch.data, ("id", "kind"), ("name",))
+        # Kind of the primitive type is allowed to be any string
+        self._map_to_enum(aliases_to_values, "kind", UmlPrimitiveTypeKindEnum, raise_when_missing=False)
+        self.model_builder.construct_uml_primitive_type(**aliases_to_values)
+
+        yield from self._create_data_batches([])
+
+
+class UmlAssociationPipe(UmjModelProcessingPipe):
+    ASSOCIATED_SECTION = "associations"
+    ATTRIBUTE_CONDITIONS = [
+        JSONAttributeCondition(attribute_name=UmjConfig.KEYS["type"], expected_value=UmlAssociationTypeEnum.ASSOCIATION.value),
+    ]
+
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        data = data_batch.data
+
+        aliases_to_values = self._get_values_for_keys(data, ("id",), ("name",))
+        self.model_builder.construct_uml_association(**aliases_to_values)
+
+        # Ends are added to the association in the order of their construction
+        association_ends = [data.get(UmjConfig.KEYS["end1"]), data.get(UmjConfig.KEYS["end2"])]
+        yield from self._create_data_batches(
+            [end for end in association_ends if end is not None], section="association_ends", parent_id=aliases_to_values["id"]
+        )
+
+
+class UmlAssociationEndPipe(UmjModelProcessingPipe):
+    ASSOCIATED_SECTION = "association_ends"
+
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        data = data_batch.data
+
+        aliases_to_values = self._get_values_for_keys(data, ("id",), ("name", "visibility", "role", "multiplicity", "navigability"))
+        self._map_to_enum(aliases_to_values, "visibility", UmlVisibilityEnum)
+        self._map_to_enum(aliases_to_values, "multiplicity", UmlMultiplicityEnum)
+        self.model_builder.construct_uml_association_end(
+            association_id=data_batch.parent_context["parent_id"],
+            type_id=self._get_reference_id(data, "element"),
+            **aliases_to_values,
+        )
+
+        yield from self._create_data_batches([])
+
+
+class UmlAggregationPipe(UmjModelProcessingPipe):
+    ASSOCIATED_SECTION = "associations"
+    ATTRIBUTE_CONDITIONS = [
+        JSONAttributeCondition(attribute_name=UmjConfig.KEYS["type"], expected_value=UmlAssociationTypeEnum.AGGREGATION.value),
+    ]
+
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        data = data_batch.data
+
+        aliases_to_values = self._get_values_for_keys(data, ("id",), ("name", "visibility"))
+        self._map_to_enum(aliases_to_values, "visibility", UmlVisibilityEnum)
+        ends_ids, ends = self._get_directed_association_ends(data)
+        self.model_builder.construct_uml_aggregation(**ends_ids, **aliases_to_values)
+
+        yield from self._create_data_batches(ends, section="association_ends", parent_id=aliases_to_values["id"])
+
+
+class UmlCompositionPipe(UmjModelProcessingPipe):
+    ASSOCIATED_SECTION = "associations"
+    ATTRIBUTE_CONDITIONS = [
+        JSONAttributeCondition(attribute_name=UmjConfig.KEYS["type"], expected_value=UmlAssociationTypeEnum.COMPOSITION.value),
+    ]
+
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        data = data_batch.data
+
+        aliases_to_values = self._get_values_for_keys(data, ("id",), ("name", "visibility"))
+        self._map_to_enum(aliases_to_values, "visibility", UmlVisibilityEnum)
+        ends_ids, ends = self._get_directed_association_ends(data)
+        self.model_builder.construct_uml_composition(**ends_ids, **aliases_to_values)
+
+        yield from self._create_data_batches(ends, section="association_ends", parent_id=aliases_to_values["id"])
+
+
+class UmlGeneralizationPipe(UmjModelProcessingPipe):
+    ASSOCIATED_SECTION = "generalizations"
+
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        data = data_batch.data
+
+        aliases_to_values = self._get_values_for_keys(data, ("id",))
+        self.model_builder.construct_uml_generalization(
+            specific_id=self._get_reference_id(data, "specific"),
+            general_id=self._get_reference_id(data, "general"),
+            **aliases_to_values,
+        )
+
+        yield from self._create_data_batches([])
+
+
+class UmlDependencyPipe(UmjModelProcessingPipe):
+    ASSOCIATED_SECTION = "dependencies"
+
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        data = data_batch.data
+
+        aliases_to_values = self._get_values_for_keys(data, ("id",))
+        self.model_builder.construct_uml_dependency(
+            client_id=self._get_reference_id(data, "client"),
+            supplier_id=self._get_reference_id(data, "supplier"),
+            **aliases_to_values,
+        )
+
+        yield from self._create_data_batches([])
+
+
+class UmlRealizationPipe(UmjModelProcessingPipe):
+    ASSOCIATED_SECTION = "realizations"
+
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        data = data_batch.data
+
+        aliases_to_values = self._get_values_for_keys(data, ("id",))
+        self.model_builder.construct_uml_realization(
+            client_id=self._get_reference_id(data, "client"),
+            supplier_id=self._get_reference_id(data, "supplier"),
+            **aliases_to_values,
+        )
+
+        yield from self._create_data_batches([])
+
+
+class UmlInteractionPipe(UmjModelProcessingPipe):
+    ASSOCIATED_SECTION = "interactions"
+
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        data = data_batch.data
+
+        aliases_to_values = self._get_values_for_keys(data, ("id",), ("name",))
+        self.model_builder.construct_uml_interaction(**aliases_to_values)
+
+        interaction_id = aliases_to_values["id"]
+        yield from self._create_data_batches(data.get(UmjConfig.KEYS["lifelines"], []), section="lifelines", parent_id=interaction_id)
+        yield from self._create_fragments_data_batches(data.get(UmjConfig.KEYS["fragments"], []), interaction_id=interaction_id)
+        yield from self._create_data_batches(data.get(UmjConfig.KEYS["messages"], []), section="messages", parent_id=interaction_id)
+
+
+class UmlLifelinePipe(UmjModelProcessingPipe):
+    ASSOCIATED_SECTION = "lifelines"
+
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        data = data_batch.data
+
+        aliases_to_values = self._get_values_for_keys(data, ("id",), ("name",))
+        self.model_builder.construct_uml_lifeline(
+            represents_id=self._get_reference_id(data, "represents"),
+            interaction_id=data_batch.parent_context["parent_id"],
+            **aliases_to_values,
+        )
+
+        yield from self._create_data_batches([])
+
+
+class UmlMessagePipe(UmjModelProcessingPipe):
+    ASSOCIATED_SECTION = "messages"
+
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        data = data_batch.data
+
+        aliases_to_values = self._get_values_for_keys(data, ("id",), ("name", "sort", "kind", "arguments"))
+        self._map_to_enum(aliases_to_values, "sort", UmlMessageSortEnum)
+        self._map_to_enum(aliases_to_values, "kind", UmlMessageKindEnum)
+        if "sort" in aliases_to_values:
+            aliases_to_values["message_sort"] = aliases_to_values.pop("sort")
+
+        # Occurrence specifications are stored as fragments of the interaction - they must not be recreated for the message.
+        self.model_builder.construct_uml_message(
+            send_event_id=self._get_reference_id(data, "send_event"),
+            receive_event_id=self._get_reference_id(data, "receive_event"),
+            signature_id=self._get_reference_id(data, "signature"),
+            create_new_occurences=False,
+            interaction_id=data_batch.parent_context["parent_id"],
+            **aliases_to_values,
+        )
+
+        yield from self._create_data_batches([])
+
+
+class UmlOccurrenceSpecificationPipe(UmjModelProcessingPipe):
+    ASSOCIATED_SECTION = "occurrence_specifications"
+
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        data = data_batch.data
+
+        aliases_to_values = self._get_values_for_keys(data, ("id",))
+        self.model_builder.construct_uml_occurrence_specification(
+            covered_id=self._get_reference_id(data, "covered"),
+            interaction_id=data_batch.parent_context["interaction_id"],
+            **aliases_to_values,
+        )
+
+        yield from self._create_data_batches([])
+
+
+class UmlInteractionUsePipe(UmjModelProcessingPipe):
+    ASSOCIATED_SECTION = "interaction_uses"
+
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        data = data_batch.data
+
+        aliases_to_values = self._get_values_for_keys(data, ("id",), ("name",))
+        self.model_builder.construct_uml_interaction_use(
+            covered_ids=self._get_references_ids(data, "covered"),
+            referred_interaction_id=self._get_reference_id(data, "interaction"),
+            parent_interaction_id=data_batch.parent_context["interaction_id"],
+            **aliases_to_values,
+        )
+
+        yield from self._create_data_batches([])
+
+
+class UmlCombinedFragmentPipe(UmjModelProcessingPipe):
+    ASSOCIATED_SECTION = "combined_fragments"
+
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        data = data_batch.data
+
+        aliases_to_values = self._get_values_for_keys(data, ("id", "operator"), ("name",))
+        self._map_to_enum(aliases_to_values, "operator", UmlInteractionOperatorEnum)
+        self.model_builder.construct_uml_combined_fragment(
+            covered_ids=self._get_references_ids(data, "covered"),
+            interaction_id=data_batch.parent_context["interaction_id"],
+            **aliases_to_values,
+        )
+
+        yield from self._create_data_batches([])
+
+
+class UmlInteractionOperandPipe(UmjModelProcessingPipe):
+    ASSOCIATED_SECTION = "operands"
+
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        data = data_batch.data
+
+        aliases_to_values = self._get_values_for_keys(data, ("id",), ("guard",))
+        # Nested fragments are constructed afterwards - they are bound to the operand when the model is built.
+        self.model_builder.construct_uml_operand(
+            fragment_ids=[fragment[UmjConfig.KEYS["id"]] for fragment in data.get(UmjConfig.KEYS["fragments"], [])],
+            combined_fragment_id=data_batch.parent_context["parent_id"],
+            **aliases_to_values,
+        )
+
+        yield from self._create_data_batches([])
+
+
+class UmlPackagePipe(UmjModelProcessingPipe):
+    ASSOCIATED_SECTION = "packages"
+
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        data = data_batch.data
+
+        aliases_to_values = self._get_values_for_keys(data, ("id",), ("name", "visibility"))
+        self._map_to_enum(aliases_to_values, "visibility", UmlVisibilityEnum)
+        self.model_builder.construct_uml_package(**aliases_to_values)
+
+        package_id = aliases_to_values["id"]
+        package_elements = data.get(UmjConfig.KEYS["elements"], {})
+        for section, add_to_package in (
+            ("classes", self.model_builder.add_class_to_package),
+            ("interfaces", self.model_builder.add_interface_to_package),
+            ("data_types", self.model_builder.add_data_type_to_package),
+            ("enumerations", self.model_builder.add_enumeration_to_package),
+            ("primitive_types", self.model_builder.add_primitive_type_to_package),
+            ("associations", self.model_builder.add_association_to_package),
+            ("generalizations", self.model_builder.add_generalization_to_package),
+            ("dependencies", self.model_builder.add_dependency_to_package),
+            ("realizations", self.model_builder.add_realization_to_package),
+            ("interactions", self.model_builder.add_interaction_to_package),
+            ("packages", self.model_builder.add_package_to_package),
+        ):
+            for element_id in self._get_references_ids(package_elements, section):
+                add_to_package(element_id, package_id)
+
+        yield from self._create_data_batches([])
+
+
+class UmlClassDiagramPipe(UmjModelProcessingPipe):
+    ASSOCIATED_SECTION = "class_diagrams"
+
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        data = data_batch.data
+
+        aliases_to_values = self._get_values_for_keys(data, ("id",), ("name", "description"))
+        self.model_builder.construct_class_diagram(**aliases_to_values)
+
+        diagram_elements = data.get(UmjConfig.KEYS["elements"], {})
+        for section in UmjConfig.CLASS_DIAGRAM_ELEMENTS_SECTIONS:
+            for element_id in self._get_references_ids(diagram_elements, section):
+                self.model_builder.bind_element_to_diagram(element_id=element_id, diagram_id=aliases_to_values["id"])
+
+        yield from self._create_data_batches([])
+
+
+class UmlSequenceDiagramPipe(UmjModelProcessingPipe):
+    ASSOCIATED_SECTION = "sequence_diagrams"
+
+    def _process(self, data_batch: DataBatch) -> Iterator[DataBatch]:
+        data = data_batch.data
+
+        aliases_to_values = self._get_values_for_keys(data, ("id",), ("name", "description"))
+        self.model_builder.construct_sequence_diagram(**aliases_to_values)
+
+        diagram_elements = data.get(UmjConfig.KEYS["elements"], {})
+        for section in UmjConfig.SEQUENCE_DIAGRAM_ELEMENTS_SECTIONS:
+            for element_id in self._get_references_ids(diagram_elements, section):
+                self.model_builder.bind_element_to_diagram(element_id=element_id, diagram_id=aliases_to_values["id"])
+
+        yield from self._create_data_batches([])
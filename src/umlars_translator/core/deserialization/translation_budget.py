@@ -0,0 +1,87 @@
+from typing import Optional
+from functools import cache
+import logging
+import threading
+import time
+
+from umlars_translator.core import config
+from umlars_translator.core.deserialization.exceptions import (
+    TranslationCancelledError,
+    TranslationDeadlineExceededError,
+    TranslationMemoryBudgetExceededError,
+)
+from umlars_translator.core.utils.functions import get_process_memory_usage
+
+
+@cache
+def warn_memory_usage_not_measurable() -> None:
+    """Warns once per process - the limit is set for each translation."""
+    logging.getLogger(config.LOGGER_BASE_NAME).getChild(TranslationBudget.__name__).warning(
+        "Translation memory limit is ignored - memory usage of the process can't be measured on this system"
+    )
+
+
+class TranslationBudget:
+    """
+    Limits of a single translation - time it may take and memory it may allocate.
+    The translation is stopped cooperatively: the pipes and the builder call check() while processing the data,
+    which raises the exception describing the exceeded limit.
+
+    Memory is measured as the growth of the process' resident memory since the budget was created,
+    so it is precise only for the translations run one at a time in the process (e.g. in worker processes).
+    """
+    def __init__(
+        self,
+        time_limit: Optional[float] = None,
+        memory_limit: Optional[int] = None,
+        cancel_event: Optional[threading.Event] = None,
+        memory_check_interval: int = config.TRANSLATION_BUDGET_MEMORY_CHECK_INTERVAL,
+    ) -> None:
+        self._time_limit = time_limit
+        self._deadline = time.monotonic() + time_limit if time_limit is not None else None
+        self._memory_limit = memory_limit
+        self._initial_memory_usage = get_process_memory_usage() if memory_limit is not None else None
+        if memory_limit is not None and self._initial_memory_usage is None:
+            warn_memory_usage_not_measurable()
+        self._cancel_event = cancel_event
+        self._memory_check_interval = max(memory_check_interval, 1)
+        self._checks_count = 0
+
+    @property
+    def remaining_time(self) -> Optional[float]:
+        return self._deadline - time.monotonic() if self._deadline is not None else None
+
+    def check(self) -> None:
+        if self._cancel_event is not None and self._cancel_event.is_set():
+            raise TranslationCancelledError("Translation was cancelled")
+
+        if self._deadline is not None and time.monotonic() > self._deadline:
+            raise TranslationDeadlineExceededError(f"Translation exceeded its time limit of {self._time_limit} s")
+
+        if self._initial_memory_usage is not None:
+            self._checks_count += 1
+            if self._checks_count % self._memory_check_interval == 0:
+                self.check_memory()
+
+    def check_memory(self) -> None:
+        if self._initial_memory_usage is None:
+            return
+
+        memory_usage = get_process_memory_usage()
+        if memory_usage is None:
+            return
+
+        allocated_memory = memory_usage - self._initial_memory_usage
+        if allocated_memory > self._memory_limit:
+            raise TranslationMemoryBudgetExceededError(
+                f"Translation exceeded its memory limit of {self._memory_limit} B (allocated {allocated_memory} B)"
+            )
+
+
+def create_translation_budget(
+    time_limit: Optional[float] = None, memory_limit: Optional[int] = None, cancel_event: Optional[threading.Event] = None
+) -> Optional[TranslationBudget]:
+    """Returns None, if no limit is set - so the unlimited translations don't pay for the checks."""
+    if time_limit is None and memory_limit is None and cancel_event is None:
+        return None
+    return TranslationBudget(time_limit, memory_limit, cancel_event)
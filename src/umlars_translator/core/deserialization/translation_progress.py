@@ -0,0 +1,43 @@
+from typing import Any, Dict, Optional
+import time
+
+
+class TranslationProgress:
+    """
+    Progress of a single translation, updated at the same checkpoints as the TranslationBudget - the builder counts the built elements
+    and the pipelines report the one processing the data. It is written only by the thread running the translation,
+    so the other threads can read it at any time, without locking.
+    """
+    def __init__(self, files_total: int = 0) -> None:
+        self.files_total = files_total
+        self.files_done = 0
+        self.current_file: Optional[str] = None
+        self.elements_built = 0
+        self.current_pipe: Optional[str] = None
+        self.updated_at = time.time()
+
+    def start_file(self, file_name: str) -> None:
+        self.current_file = file_name
+        self.current_pipe = None
+        self.updated_at = time.time()
+
+    def finish_file(self) -> None:
+        self.files_done += 1
+        self.current_file = None
+        self.current_pipe = None
+        self.updated_at = time.time()
+
+    def add_built_element(self) -> None:
+        self.elements_built += 1
+
+    def enter_pipe(self, pipe_name: str) -> None:
+        self.current_pipe = pipe_name
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "files_total": self.files_total,
+            "files_done": self.files_done,
+            "current_file": self.current_file,
+            "elements_built": self.elements_built,
+            "current_pipe": self.current_pipe,
+        }
@@ -1,59 +1,174 @@
+import importlib
 import importlib.metadata
+import json
+import os
+import threading
 from logging import Logger
-from typing import Iterator, Optional
+from typing import Any, Callable, ClassVar, Iterable, Iterator, NamedTuple, Optional
 
 from kink import inject
 
+from umlars_translator.core.utils.functions import get_translator_version
+
+
+class ExtensionEntry(NamedTuple):
+    """
+    Entry point of a plugin, which can be stored in the manifest.
+    Key is an optional value describing the plugin (e.g. format supported by the deserialization strategy),
+    known without importing its module.
+    """
+    group: str
+    name: str
+    value: str
+    key: Optional[str] = None
+
+    def load(self) -> Any:
+        module_name, _, attributes_path = self.value.partition(":")
+        loaded_object = importlib.import_module(module_name.strip())
+        for attribute_name in filter(None, attributes_path.strip().split(".")):
+            loaded_object = getattr(loaded_object, attribute_name)
+        return loaded_object
+
 
 @inject
 class ExtensionsManager:
     """
     Class used to manage extensions of the application. It allows to load plugins from directories and filter them by categories.
     Manages application extensions (plugins) via Python entry points.
+
+    Entry points are resolved once per process and the loaded plugins are shared by all the instances,
+    so creating next managers (and the deserializers using them) is cheap.
     """
+    _entries_by_group: ClassVar[dict[str, list[ExtensionEntry]]] = {}
+    _loaded_extensions: ClassVar[dict[ExtensionEntry, Any]] = {}
+    _registry_lock: ClassVar[threading.RLock] = threading.RLock()
 
     def __init__(
         self,
         extensions_modules_groups_names: Optional[Iterator[str]] = None,
+        manifest_path: Optional[str] = None,
         core_logger: Optional[Logger] = None,
     ) -> None:
         self._logger = core_logger.getChild(self.__class__.__name__)
         self._extensions_modules_groups_names = extensions_modules_groups_names
+        self._manifest_path = manifest_path
+
+    @property
+    def manifest_path(self) -> Optional[str]:
+        return self._manifest_path
 
     def activate_extensions(
-        self, extensions_modules_groups_names: Optional[Iterator[str]] = None
+        self,
+        extensions_modules_groups_names: Optional[Iterator[str]] = None,
+        defer_loading: Optional[Callable[[ExtensionEntry], bool]] = None,
     ) -> None:
+        """
+        Loads the plugins of the given groups. If defer_loading is given, it is called for each plugin first -
+        when it returns True, the plugin isn't imported now (the callee takes the responsibility of loading it when needed).
+        """
         if extensions_modules_groups_names is None:
             if self._extensions_modules_groups_names is None:
                 self._logger.error("No extensions modules groups names provided.")
                 raise ValueError("No extensions modules groups names provided.")
             extensions_modules_groups_names = self._extensions_modules_groups_names
 
-        all_entry_points = importlib.metadata.entry_points()
-        self._logger.info(f"Entry points loaded: {len(all_entry_points)}")
-
         for group in extensions_modules_groups_names:
             self._logger.info(f"Loading plugins for group: {group}")
+            extensions = self.get_extensions(group)
 
-            # Correct: filter entry points for the specific group
-            matching_eps = all_entry_points.select(group=group)
-
-            if not matching_eps:
+            if not extensions:
                 self._logger.warning(f"No plugins found for group: {group}")
                 continue
 
-            self._logger.info(f"Found {len(matching_eps)} plugins for group: {group}")
-
-            for entry_point in matching_eps:
-                self._logger.info(f"Loading plugin: {entry_point.name}")
-                try:
-                    plugin_class = entry_point.load()
-                    self._logger.info(f"Loaded plugin: {plugin_class.__name__}")
-                except ModuleNotFoundError as ex:
-                    msg = (
-                        f"Plugin '{entry_point.name}' could not be loaded. "
-                        f"Check your [tool.poetry.plugins] section in pyproject.toml.\n"
-                        f"Error: {ex}"
-                    )
-                    self._logger.error(msg)
-                    raise ModuleNotFoundError(msg) from ex
+            self._logger.info(f"Found {len(extensions)} plugins for group: {group}")
+
+            for extension in extensions:
+                if defer_loading is not None and defer_loading(extension):
+                    self._logger.debug(f"Loading of plugin {extension.name} deferred")
+                    continue
+                self.load_extension(extension)
+
+    def get_extensions(self, group: str) -> list[ExtensionEntry]:
+        with self._registry_lock:
+            if group not in self._entries_by_group:
+                self._entries_by_group.update(self._read_manifest())
+            if group not in self._entries_by_group:
+                self._entries_by_group[group] = self._resolve_entry_points(group)
+            return self._entries_by_group[group]
+
+    def load_extension(self, extension: ExtensionEntry) -> Any:
+        with self._registry_lock:
+            if extension in self._loaded_extensions:
+                return self._loaded_extensions[extension]
+
+            self._logger.info(f"Loading plugin: {extension.name}")
+            try:
+                plugin = extension.load()
+            except ModuleNotFoundError as ex:
+                msg = (
+                    f"Plugin '{extension.name}' could not be loaded. "
+                    f"Check your [tool.poetry.plugins] section in pyproject.toml.\n"
+                    f"Error: {ex}"
+                )
+                self._logger.error(msg)
+                raise ModuleNotFoundError(msg) from ex
+
+            self._logger.info(f"Loaded plugin: {getattr(plugin, '__name__', extension.name)}")
+            self._loaded_extensions[extension] = plugin
+            return plugin
+
+    def save_manifest(
+        self, extensions_modules_groups_names: Iterable[str], get_extension_key: Optional[Callable[[Any], Optional[str]]] = None
+    ) -> None:
+        """
+        Stores the entry points of the groups in the manifest file. If get_extension_key is given,
+        each plugin is loaded and the key computed for it is stored too, so the next processes can defer its loading.
+        """
+        if self._manifest_path is None:
+            raise ValueError("No manifest path provided.")
+
+        groups = {}
+        for group in extensions_modules_groups_names:
+            extensions = self.get_extensions(group)
+            if get_extension_key is not None:
+                extensions = [extension._replace(key=get_extension_key(self.load_extension(extension))) for extension in extensions]
+            groups[group] = [extension._asdict() for extension in extensions]
+
+        manifest_directory = os.path.dirname(self._manifest_path)
+        if manifest_directory:
+            os.makedirs(manifest_directory, exist_ok=True)
+        temporary_manifest_path = f"{self._manifest_path}.{os.getpid()}.tmp"
+        with open(temporary_manifest_path, "w") as manifest_file:
+            json.dump({"version": get_translator_version(), "groups": groups}, manifest_file, indent=2)
+        os.replace(temporary_manifest_path, self._manifest_path)
+        self._logger.info(f"Extensions manifest saved to {self._manifest_path}")
+
+    @classmethod
+    def clear_registry(cls) -> None:
+        """Forgets the resolved entry points, e.g. after installing new plugins. Already imported modules stay imported."""
+        with cls._registry_lock:
+            cls._entries_by_group.clear()
+            cls._loaded_extensions.clear()
+
+    def _read_manifest(self) -> dict[str, list[ExtensionEntry]]:
+        if self._manifest_path is None or not os.path.exists(self._manifest_path):
+            return {}
+
+        try:
+            with open(self._manifest_path) as manifest_file:
+                manifest = json.load(manifest_file)
+            if manifest.get("version") != get_translator_version():
+                self._logger.info("Extensions manifest was created by another version and is ignored")
+                return {}
+            return {
+                group: [ExtensionEntry(**extension) for extension in extensions]
+                for group, extensions in manifest["groups"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError) as ex:
+            self._logger.warning(f"Unable to read extensions manifest {self._manifest_path}: {ex}")
+            return {}
+
+    def _resolve_entry_points(self, group: str) -> list[ExtensionEntry]:
+        entry_points = importlib.metadata.entry_points(group=group)
+        self._logger.info(f"Entry points resolved for group {group}: {len(entry_points)}")
+        return [ExtensionEntry(group, entry_point.name, entry_point.value) for entry_point in entry_points]
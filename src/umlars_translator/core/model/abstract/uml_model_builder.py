@@ -1,11 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Optional, Union, List
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union, List
 from functools import wraps
 from logging import Logger
 import logging
 
 from kink import inject
 
+if TYPE_CHECKING:
+    from umlars_translator.core.deserialization.translation_budget import TranslationBudget
+    from umlars_translator.core.deserialization.translation_progress import TranslationProgress
+
 from umlars_translator.core.model.abstract.uml_model import IUmlModel
 from umlars_translator.core.model.constants import UmlVisibilityEnum, UmlMultiplicityEnum, UmlPrimitiveTypeKindEnum, UmlParameterDirectionEnum, UmlInteractionOperatorEnum, UmlMessageSortEnum, UmlMessageKindEnum
 
@@ -33,6 +37,8 @@ class IUmlModelBuilder(ABC):
     """
     _logger: Logger
     _model: IUmlModel
+    _translation_budget: Optional["TranslationBudget"] = None
+    _translation_progress: Optional["TranslationProgress"] = None
 
     @property
     def model(self) -> IUmlModel:
@@ -42,6 +48,36 @@ class IUmlModelBuilder(ABC):
     def model(self, new_model: IUmlModel) -> None:
         self._model = new_model
 
+    @property
+    def translation_budget(self) -> Optional["TranslationBudget"]:
+        return self._translation_budget
+
+    @translation_budget.setter
+    def translation_budget(self, new_translation_budget: Optional["TranslationBudget"]) -> None:
+        self._translation_budget = new_translation_budget
+
+    @property
+    def translation_progress(self) -> Optional["TranslationProgress"]:
+        return self._translation_progress
+
+    @translation_progress.setter
+    def translation_progress(self, new_translation_progress: Optional["TranslationProgress"]) -> None:
+        self._translation_progress = new_translation_progress
+
+    def report_processing_pipe(self, pipe_name: str) -> None:
+        """
+        Reports the pipe processing the data to the progress of the translation run by the builder.
+        """
+        if self._translation_progress is not None:
+            self._translation_progress.enter_pipe(pipe_name)
+
+    def check_translation_budget(self) -> None:
+        """
+        Cooperative checkpoint of the translation - raises, if the budget of the translation run by the builder was exceeded.
+        """
+        if self._translation_budget is not None:
+            self._translation_budget.check()
+
     @abstractmethod
     def build(self) -> IUmlModel:
         ...
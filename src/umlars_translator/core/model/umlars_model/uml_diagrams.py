@@ -54,10 +54,10 @@ class UmlClassDiagramElements(IUmlClassDiagramElements):
             self.primitive_types.append(element)
         elif isinstance(element, UmlGeneralization):
             self.generalizations.append(element)
-        elif isinstance(element, UmlDependency):
-            self.dependencies.append(element)
         elif isinstance(element, UmlRealization):
             self.realizations.append(element)
+        elif isinstance(element, UmlDependency):
+            self.dependencies.append(element)
         elif isinstance(element, UmlEnumeration):
             self.enumerations.append(element)
         elif isinstance(element, UmlDataType):
@@ -522,6 +522,14 @@ class UmlDirectedAssociation(UmlAssociationBase, IUmlDirectedAssociation):
         if self.builder:
             self.builder.register_if_not_present(new_target)
 
+    def add_end(self, end: IUmlAssociationEnd):
+        if not self.source:
+            self.source = end
+        elif not self.target:
+            self.target = end
+        else:
+            raise ValueError("Both ends are already set")
+
     @property
     def end1(self) -> IUmlAssociationEnd:
         return self.source
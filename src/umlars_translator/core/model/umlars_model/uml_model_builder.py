@@ -38,14 +38,23 @@ class UmlModelBuilder(DalayedIdToInstanceMapper, IUmlModelBuilder):
         self._model = UmlModel(builder=self)
         super().clear()
 
+    def register_if_not_present(self, element: Any, *args, **kwargs) -> None:
+        # Each element built goes through here, so it is the checkpoint of the translation budget and progress
+        self.check_translation_budget()
+        if self._translation_progress is not None:
+            self._translation_progress.add_built_element()
+        super().register_if_not_present(element, *args, **kwargs)
+
     def add_element(self, element: Any) -> 'IUmlModelBuilder':
         self.register_if_not_present(element)
         return self
 
-    def construct_uml_model(self, name: Optional[str] = None, visibility: Optional[UmlVisibilityEnum] = UmlVisibilityEnum.PUBLIC, *args, **kwargs) -> "IUmlModelBuilder":
+    def construct_uml_model(self, name: Optional[str] = None, visibility: Optional[UmlVisibilityEnum] = UmlVisibilityEnum.PUBLIC, id: Optional[str] = None, *args, **kwargs) -> "IUmlModelBuilder":
         self._logger.debug(f"Method called: construct_uml_model({args}, {kwargs})")
         self._model.name = name
         self._model.visibility = visibility
+        if id is not None:
+            self._model.id = id
         return self
 
     def bind_element_to_diagram(self, element: Optional[UmlElement] = None, element_id: Optional[str] = None, diagram: Optional[UmlDiagram] = None, diagram_id: Optional[str] = None,  *args, **kwargs) -> "IUmlModelBuilder":
@@ -143,14 +152,16 @@ class UmlModelBuilder(DalayedIdToInstanceMapper, IUmlModelBuilder):
         self.add_element(attribute)
         return self
 
-    def construct_uml_operation(self, classifier_id: str, id: Optional[str] = None, name: Optional[str] = None, visibility: Optional[UmlVisibilityEnum] = UmlVisibilityEnum.PUBLIC, return_type_id: Optional[str] = None, type_metadata: Optional[dict[str, Any]] = None, **kwargs) -> "IUmlModelBuilder":
+    def construct_uml_operation(self, classifier_id: str, id: Optional[str] = None, name: Optional[str] = None, visibility: Optional[UmlVisibilityEnum] = UmlVisibilityEnum.PUBLIC, return_type_id: Optional[str] = None, type_metadata: Optional[dict[str, Any]] = None, is_static: Optional[bool] = None, is_ordered: Optional[bool] = None, is_unique: Optional[bool] = None, is_query: Optional[bool] = None, is_derived: Optional[bool] = None, is_derived_union: Optional[bool] = None, is_abstract: bool = False, exceptions: Optional[List[str]] = None, **kwargs) -> "IUmlModelBuilder":
         if return_type_id is None:
             return_type_id = type_metadata.get('referenced_type_id') if type_metadata is not None else None
         self._logger.debug(f"Method called: construct_uml_operation({kwargs})")
         uml_class = self.get_instance_by_id(classifier_id)
         return_type = self.get_instance_by_id(return_type_id)
         operation = UmlOperation(
-            id=id, name=name, visibility=visibility, return_type=return_type, model=self._model, builder=self
+            id=id, name=name, visibility=visibility, return_type=return_type, is_static=is_static, is_ordered=is_ordered,
+            is_unique=is_unique, is_query=is_query, is_derived=is_derived, is_derived_union=is_derived_union,
+            is_abstract=is_abstract if is_abstract is not None else False, exceptions=exceptions, model=self._model, builder=self
         )
 
         self.add_element(operation)
@@ -215,7 +226,48 @@ class UmlModelBuilder(DalayedIdToInstanceMapper, IUmlModelBuilder):
         enumeration = self.get_instance_by_id(enumeration_id)
         package = self.get_instance_by_id(package_id)
         package.add_enumeration(enumeration)
-        return self    
+        return self
+
+    def add_primitive_type_to_package(self, primitive_type_id: str, package_id: str) -> "IUmlModelBuilder":
+        primitive_type = self.get_instance_by_id(primitive_type_id)
+        package = self.get_instance_by_id(package_id)
+        package.add_primitive_type(primitive_type)
+        return self
+
+    def add_generalization_to_package(self, generalization_id: str, package_id: str) -> "IUmlModelBuilder":
+        generalization = self.get_instance_by_id(generalization_id)
+        package = self.get_instance_by_id(package_id)
+        package.add_generalization(generalization)
+        return self
+
+    def add_dependency_to_package(self, dependency_id: str, package_id: str) -> "IUmlModelBuilder":
+        dependency = self.get_instance_by_id(dependency_id)
+        package = self.get_instance_by_id(package_id)
+        package.add_dependency(dependency)
+        return self
+
+    def add_realization_to_package(self, realization_id: str, package_id: str) -> "IUmlModelBuilder":
+        realization = self.get_instance_by_id(realization_id)
+        package = self.get_instance_by_id(package_id)
+        package.add_realization(realization)
+        return self
+
+    def add_interaction_to_package(self, interaction_id: str, package_id: str) -> "IUmlModelBuilder":
+        interaction = self.get_instance_by_id(interaction_id)
+        package = self.get_instance_by_id(package_id)
+        package.add_interaction(interaction)
+        return self
+
+    def add_package_to_package(self, nested_package_id: str, package_id: str) -> "IUmlModelBuilder":
+        nested_package = self.get_instance_by_id(nested_package_id)
+        package = self.get_instance_by_id(package_id)
+
+        # Nested package may be constructed after its parent
+        if nested_package is None:
+            self.register_dalayed_call_for_id(nested_package_id, package.add_package)
+        else:
+            package.add_package(nested_package)
+        return self
 
     def construct_uml_lifeline(self, id: Optional[str] = None, name: Optional[str] = None, represents_id: Optional[str] = None, interaction_id: Optional[str] = None, *args, **kwargs) -> "IUmlModelBuilder":
         self._logger.debug(f"Method called: construct_uml_lifeline({args}, {kwargs})")
@@ -310,12 +362,12 @@ class UmlModelBuilder(DalayedIdToInstanceMapper, IUmlModelBuilder):
         return self
 
     # Relationships with Delayed Assignments
-    def construct_uml_dependency(self, client_id: str, supplier_id: str, *args, **kwargs) -> "IUmlModelBuilder":
+    def construct_uml_dependency(self, client_id: str, supplier_id: str, id: Optional[str] = None, *args, **kwargs) -> "IUmlModelBuilder":
         self._logger.debug(f"Method called: construct_uml_dependency({args}, {kwargs})")
         client = self.get_instance_by_id(client_id)
         supplier = self.get_instance_by_id(supplier_id)
         
-        dependency = UmlDependency(client=client, supplier=supplier, model=self._model, builder=self)
+        dependency = UmlDependency(id=id, client=client, supplier=supplier, model=self._model, builder=self)
         self.add_element(dependency)
         self.model.elements.dependencies.append(dependency)
 
@@ -327,12 +379,12 @@ class UmlModelBuilder(DalayedIdToInstanceMapper, IUmlModelBuilder):
 
         return self
 
-    def construct_uml_realization(self, client_id: str, supplier_id: str, *args, **kwargs) -> "IUmlModelBuilder":
+    def construct_uml_realization(self, client_id: str, supplier_id: str, id: Optional[str] = None, *args, **kwargs) -> "IUmlModelBuilder":
         self._logger.debug(f"Method called: construct_uml_realization({args}, {kwargs})")
         client = self.get_instance_by_id(client_id)
         supplier = self.get_instance_by_id(supplier_id)
         
-        realization = UmlRealization(client=client, supplier=supplier, model=self._model, builder=self)
+        realization = UmlRealization(id=id, client=client, supplier=supplier, model=self._model, builder=self)
         self.add_element(realization)
         self.model.elements.realizations.append(realization)
 
@@ -352,12 +404,12 @@ class UmlModelBuilder(DalayedIdToInstanceMapper, IUmlModelBuilder):
 
         return self
 
-    def construct_uml_generalization(self, specific_id: str, general_id: str, *args, **kwargs) -> "IUmlModelBuilder":
+    def construct_uml_generalization(self, specific_id: str, general_id: str, id: Optional[str] = None, *args, **kwargs) -> "IUmlModelBuilder":
         self._logger.debug(f"Method called: construct_uml_generalization({args}, {kwargs})")
         specific = self.get_instance_by_id(specific_id)
         general = self.get_instance_by_id(general_id)
         
-        generalization = UmlGeneralization(specific=specific, general=general, model=self._model, builder=self)
+        generalization = UmlGeneralization(id=id, specific=specific, general=general, model=self._model, builder=self)
         self.add_element(generalization)
         self.model.elements.generalizations.append(generalization)
 
@@ -378,12 +430,12 @@ class UmlModelBuilder(DalayedIdToInstanceMapper, IUmlModelBuilder):
 
         return self
 
-    def construct_uml_aggregation(self, id: Optional[str] = None, source_id: str = None, target_id: str = None, *args, **kwargs) -> "IUmlModelBuilder":
+    def construct_uml_aggregation(self, id: Optional[str] = None, source_id: str = None, target_id: str = None, name: Optional[str] = None, visibility: Optional[UmlVisibilityEnum] = UmlVisibilityEnum.PUBLIC, *args, **kwargs) -> "IUmlModelBuilder":
         self._logger.debug(f"Method called: construct_uml_aggregation({args}, {kwargs})")
         source = self.get_instance_by_id(source_id)
         target = self.get_instance_by_id(target_id)
         
-        aggregation = UmlAggregation(id=id, source=source, target=target, model=self._model, builder=self)
+        aggregation = UmlAggregation(id=id, name=name, visibility=visibility, source=source, target=target, model=self._model, builder=self)
         self.add_element(aggregation)
         self.model.elements.associations.append(aggregation)
 
@@ -395,12 +447,12 @@ class UmlModelBuilder(DalayedIdToInstanceMapper, IUmlModelBuilder):
 
         return self
 
-    def construct_uml_composition(self, id: Optional[str] = None, source_id: str = None, target_id: str = None, *args, **kwargs) -> "IUmlModelBuilder":
+    def construct_uml_composition(self, id: Optional[str] = None, source_id: str = None, target_id: str = None, name: Optional[str] = None, visibility: Optional[UmlVisibilityEnum] = UmlVisibilityEnum.PUBLIC, *args, **kwargs) -> "IUmlModelBuilder":
         self._logger.debug(f"Method called: construct_uml_composition({args}, {kwargs})")
         source = self.get_instance_by_id(source_id)
         target = self.get_instance_by_id(target_id)
         
-        composition = UmlComposition(id=id, source=source, target=target, model=self._model, builder=self)
+        composition = UmlComposition(id=id, name=name, visibility=visibility, source=source, target=target, model=self._model, builder=self)
         self.add_element(composition)
         self.model.elements.associations.append(composition)
 
@@ -412,7 +464,7 @@ class UmlModelBuilder(DalayedIdToInstanceMapper, IUmlModelBuilder):
 
         return self
 
-    def construct_uml_message(self, id: Optional[str] = None, name: Optional[str] = None, send_event_id: Optional[str] = None, receive_event_id: Optional[str] = None, source_lifeline_id: Optional[str] = None, target_lifeline_id: Optional[str] = None, message_sort: Optional[UmlMessageSortEnum] = UmlMessageSortEnum.SYNCH_CALL, kind: Optional[UmlMessageKindEnum] = UmlMessageKindEnum.UNKNOWN, signature_id: Optional[str] = None, create_new_occurences: bool = True, interaction_id: Optional[str] = None, *args, **kwargs) -> "IUmlModelBuilder":
+    def construct_uml_message(self, id: Optional[str] = None, name: Optional[str] = None, send_event_id: Optional[str] = None, receive_event_id: Optional[str] = None, source_lifeline_id: Optional[str] = None, target_lifeline_id: Optional[str] = None, message_sort: Optional[UmlMessageSortEnum] = UmlMessageSortEnum.SYNCH_CALL, kind: Optional[UmlMessageKindEnum] = UmlMessageKindEnum.UNKNOWN, signature_id: Optional[str] = None, create_new_occurences: bool = True, interaction_id: Optional[str] = None, arguments: Optional[List[str]] = None, *args, **kwargs) -> "IUmlModelBuilder":
         self._logger.debug(f"Method called: construct_uml_message({args}, {kwargs})")
         interaction = self.get_instance_by_id(interaction_id)
 
@@ -426,7 +478,7 @@ class UmlModelBuilder(DalayedIdToInstanceMapper, IUmlModelBuilder):
         signature = self.get_instance_by_id(signature_id)
 
         message = UmlMessage(
-            id=id, name=name, send_event=send_event, receive_event=receive_event, sort=message_sort, kind=kind, signature=signature,
+            id=id, name=name, send_event=send_event, receive_event=receive_event, sort=message_sort, kind=kind, signature=signature, arguments=arguments,
             model=self._model, builder=self
         )
         self.add_message(message)
@@ -489,7 +541,7 @@ class UmlModelBuilder(DalayedIdToInstanceMapper, IUmlModelBuilder):
         self._logger.debug(f"Method called: construct_uml_interaction_use({args}, {kwargs})")
         covered = [self.get_instance_by_id(covered_id) for covered_id in (covered_ids or [])]
         referred_interaction = self.get_instance_by_id(referred_interaction_id)
-        interaction_use = UmlInteractionUse(id=id, covered=covered, interaction=referred_interaction, model=self._model, builder=self)
+        interaction_use = UmlInteractionUse(id=id, name=name, covered=[lifeline for lifeline in covered if lifeline is not None], interaction=referred_interaction, model=self._model, builder=self)
         parent_interaction = self.get_instance_by_id(parent_interaction_id)
 
         self.add_element(interaction_use)
@@ -511,12 +563,16 @@ class UmlModelBuilder(DalayedIdToInstanceMapper, IUmlModelBuilder):
 
         return self
 
-    def construct_uml_combined_fragment(self, id: Optional[str] = None, operand_ids: Optional[List[str]] = None, operator: Optional[str] = None, covered_ids: Optional[List[str]] = None, interaction_id: Optional[str] = None, *args, **kwargs) -> "IUmlModelBuilder":
+    def construct_uml_combined_fragment(self, id: Optional[str] = None, operand_ids: Optional[List[str]] = None, operator: Optional[str] = None, covered_ids: Optional[List[str]] = None, interaction_id: Optional[str] = None, name: Optional[str] = None, *args, **kwargs) -> "IUmlModelBuilder":
         self._logger.debug(f"Method called: construct_uml_combined_fragment({args}, {kwargs})")
         operands = [self.get_instance_by_id(operand_id) for operand_id in (operand_ids or [])]
         covered = [self.get_instance_by_id(covered_id) for covered_id in (covered_ids or [])]
         interaction = self.get_instance_by_id(interaction_id)
-        combined_fragment = UmlCombinedFragment(id=id, operands=operands, covered=covered, operator=operator, model=self._model, builder=self)
+        # Not yet constructed operands and lifelines are appended by the delayed calls below
+        combined_fragment = UmlCombinedFragment(
+            id=id, name=name, operands=[operand for operand in operands if operand is not None],
+            covered=[lifeline for lifeline in covered if lifeline is not None], operator=operator, model=self._model, builder=self
+        )
         self.add_element(combined_fragment)
 
         if interaction is not None:
@@ -542,7 +598,7 @@ class UmlModelBuilder(DalayedIdToInstanceMapper, IUmlModelBuilder):
         fragments = [self.get_instance_by_id(fragment_id) for fragment_id in (fragment_ids or [])]
         combined_fragment = self.get_instance_by_id(combined_fragment_id)
 
-        operand = UmlOperand(id=id, guard=guard, fragments=fragments, model=self._model, builder=self)
+        operand = UmlOperand(id=id, guard=guard, fragments=[fragment for fragment in fragments if fragment is not None], model=self._model, builder=self)
         self.add_element(operand)
         
         if combined_fragment is not None:
@@ -584,12 +640,12 @@ class UmlModelBuilder(DalayedIdToInstanceMapper, IUmlModelBuilder):
         return self
 
     # Relationships
-    def construct_uml_aggregation(self, id: Optional[str] = None, source_id: str = None, target_id: str = None, *args, **kwargs) -> "IUmlModelBuilder":
+    def construct_uml_aggregation(self, id: Optional[str] = None, source_id: str = None, target_id: str = None, name: Optional[str] = None, visibility: Optional[UmlVisibilityEnum] = UmlVisibilityEnum.PUBLIC, *args, **kwargs) -> "IUmlModelBuilder":
         self._logger.debug(f"Method called: construct_uml_aggregation({args}, {kwargs})")
         source = self.get_instance_by_id(source_id)
         target = self.get_instance_by_id(target_id)
         
-        aggregation = UmlAggregation(id=id, source=source, target=target, model=self._model, builder=self)
+        aggregation = UmlAggregation(id=id, name=name, visibility=visibility, source=source, target=target, model=self._model, builder=self)
         self.add_element(aggregation)
         self.model.elements.associations.append(aggregation)
 
@@ -601,12 +657,12 @@ class UmlModelBuilder(DalayedIdToInstanceMapper, IUmlModelBuilder):
 
         return self
 
-    def construct_uml_composition(self, id: Optional[str] = None, source_id: str = None, target_id: str = None, *args, **kwargs) -> "IUmlModelBuilder":
+    def construct_uml_composition(self, id: Optional[str] = None, source_id: str = None, target_id: str = None, name: Optional[str] = None, visibility: Optional[UmlVisibilityEnum] = UmlVisibilityEnum.PUBLIC, *args, **kwargs) -> "IUmlModelBuilder":
         self._logger.debug(f"Method called: construct_uml_composition({args}, {kwargs})")
         source = self.get_instance_by_id(source_id)
         target = self.get_instance_by_id(target_id)
         
-        composition = UmlComposition(id=id, source=source, target=target, model=self._model, builder=self)
+        composition = UmlComposition(id=id, name=name, visibility=visibility, source=source, target=target, model=self._model, builder=self)
         self.add_element(composition)
         self.model.elements.associations.append(composition)
 
@@ -655,15 +711,15 @@ class UmlModelBuilder(DalayedIdToInstanceMapper, IUmlModelBuilder):
         self.model.diagrams.sequence_diagrams.append(sequence_diagram)
         return self
 
-    def construct_sequence_diagram(self, id: Optional[str] = None, name: Optional[str] = None, *args, **kwargs) -> "IUmlModelBuilder":
+    def construct_sequence_diagram(self, id: Optional[str] = None, name: Optional[str] = None, description: Optional[str] = None, *args, **kwargs) -> "IUmlModelBuilder":
         self._logger.debug(f"Method called: construct_sequence_diagram({args}, {kwargs})")
-        diagram = UmlSequenceDiagram(id=id, name=name, model=self._model, builder=self)
+        diagram = UmlSequenceDiagram(id=id, name=name, description=description, model=self._model, builder=self)
         self.add_sequence_diagram(diagram)
         return self
 
-    def construct_class_diagram(self, id: Optional[str] = None, name: Optional[str] = None, *args, **kwargs) -> "IUmlModelBuilder":
+    def construct_class_diagram(self, id: Optional[str] = None, name: Optional[str] = None, description: Optional[str] = None, *args, **kwargs) -> "IUmlModelBuilder":
         self._logger.debug(f"Method called: construct_class_diagram({args}, {kwargs})")
-        diagram = UmlClassDiagram(id=id, name=name, model=self._model, builder=self)
+        diagram = UmlClassDiagram(id=id, name=name, description=description, model=self._model, builder=self)
         self.add_class_diagram(diagram)
         return self
 
@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from typing import BinaryIO
 
 from umlars_translator.core.utils.visitor import IModelVisitor
 from umlars_translator.core.model.abstract.uml_model import IUmlModel
@@ -8,3 +9,7 @@ class UmlSerializer(IModelVisitor):
     @abstractmethod
     def serialize(self, model: IUmlModel, to_string: bool) -> str:
         pass
+
+    def serialize_to_stream(self, model: IUmlModel, stream: BinaryIO) -> None:
+        """Writes serialized model to the binary stream. Serializers able to produce the output in fragments should override it."""
+        stream.write(self.serialize(model, to_string=True).encode())
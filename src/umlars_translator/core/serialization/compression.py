@@ -0,0 +1,59 @@
+from typing import BinaryIO, Iterable, Iterator
+from enum import Enum
+import gzip
+import lzma
+import zlib
+
+from umlars_translator.core.serialization import config
+
+
+class CompressionMethod(str, Enum):
+    NONE = "none"
+    GZIP = "gzip"
+    LZMA = "lzma"
+
+
+COMPRESSED_FILES_EXTENSIONS = {
+    CompressionMethod.NONE: "",
+    CompressionMethod.GZIP: ".gz",
+    CompressionMethod.LZMA: ".xz",
+}
+
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def get_compressed_file_name(file_name: str, compression: CompressionMethod = CompressionMethod.NONE) -> str:
+    return file_name + COMPRESSED_FILES_EXTENSIONS[CompressionMethod(compression)]
+
+
+def open_output_sink(file_path: str, compression: CompressionMethod = CompressionMethod.NONE) -> BinaryIO:
+    """
+    Opens binary file, to which the data written is compressed on the fly.
+    Only the compressor's internal buffer is kept in memory - the output can be written to the sink in fragments.
+    """
+    compression = CompressionMethod(compression)
+    if compression == CompressionMethod.GZIP:
+        return gzip.open(file_path, "wb", compresslevel=config.GZIP_COMPRESSION_LEVEL)
+    elif compression == CompressionMethod.LZMA:
+        return lzma.open(file_path, "wb", preset=config.LZMA_COMPRESSION_PRESET)
+
+    return open(file_path, "wb")
+
+
+def iter_compressed(fragments: Iterable[bytes], compression: CompressionMethod = CompressionMethod.GZIP) -> Iterator[bytes]:
+    """Compresses the fragments as they are produced, e.g. to be sent in a streamed response."""
+    compression = CompressionMethod(compression)
+    if compression == CompressionMethod.NONE:
+        yield from fragments
+        return
+
+    if compression == CompressionMethod.GZIP:
+        compressor = zlib.compressobj(config.GZIP_COMPRESSION_LEVEL, zlib.DEFLATED, GZIP_WBITS)
+    else:
+        compressor = lzma.LZMACompressor(preset=config.LZMA_COMPRESSION_PRESET)
+
+    for fragment in fragments:
+        compressed_fragment = compressor.compress(fragment)
+        if compressed_fragment:
+            yield compressed_fragment
+    yield compressor.flush()
@@ -0,0 +1,24 @@
+import os
+
+
+"""
+Parallel serialization settings
+"""
+PARALLEL_SERIALIZATION_MAX_WORKERS = int(os.getenv("PARALLEL_SERIALIZATION_MAX_WORKERS", os.cpu_count() or 1))
+PARALLEL_SERIALIZATION_CHUNK_SIZE = int(os.getenv("PARALLEL_SERIALIZATION_CHUNK_SIZE", 500))
+# Smaller models (counted in the top-level elements and diagrams) are serialized sequentially - the walk over the model
+# and sending it to the workers costs more than the work spread over them (see the benchmark in test_parallel_json_serializer.py)
+PARALLEL_SERIALIZATION_MIN_ITEMS = int(os.getenv("PARALLEL_SERIALIZATION_MIN_ITEMS", 5000))
+
+
+"""
+Streaming serialization settings
+"""
+STREAMING_SERIALIZATION_CHUNK_SIZE = int(os.getenv("STREAMING_SERIALIZATION_CHUNK_SIZE", 100))
+
+
+"""
+Output compression settings
+"""
+GZIP_COMPRESSION_LEVEL = int(os.getenv("GZIP_COMPRESSION_LEVEL", 6))
+LZMA_COMPRESSION_PRESET = int(os.getenv("LZMA_COMPRESSION_PRESET", 6))
@@ -1,6 +1,9 @@
-from typing import Union, Optional
+from typing import BinaryIO, Iterator, Union, Optional
+from functools import lru_cache
 
 from kink import inject
+from pydantic import TypeAdapter
+from pydantic_core import to_json
 
 from umlars_translator.core.model.abstract.uml_elements import IUmlClassifier
 from umlars_translator.core.serialization.abstract.serializer import UmlSerializer
@@ -34,10 +37,49 @@ from umlars_translator.core.model.umlars_model.uml_elements import (
     UmlPackage,
 )
 from umlars_translator.core.model.umlars_model.uml_model import UmlModel
+from umlars_translator.core.serialization import config
 
 import umlars_translator.app.dtos.uml_model as pydantic_uml
 
 
+SECTIONS_CONTAINERS_FIELDS = ("elements", "diagrams")
+
+
+@lru_cache(maxsize=None)
+def get_field_type_adapter(owner_name: str, field_name: str) -> TypeAdapter:
+    owner_class = getattr(pydantic_uml, owner_name)
+    return TypeAdapter(owner_class.model_fields[field_name].annotation)
+
+
+def iter_dto_json_fragments(dto: pydantic_uml.BaseModel, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+    """
+    Yields the same JSON as dto.model_dump_json(), in fragments.
+    Lists of the sections containers (model elements and diagrams) are dumped in chunks of given size,
+    so the JSON text of the whole document never has to be held in memory at once. Only the text is streamed -
+    the DTO tree is already built in full.
+    """
+    chunk_size = chunk_size or config.STREAMING_SERIALIZATION_CHUNK_SIZE
+    owner_name = dto.__class__.__name__
+
+    yield b"{"
+    for index, field_name in enumerate(dto.__class__.model_fields):
+        yield (b"," if index else b"") + to_json(field_name) + b":"
+        value = getattr(dto, field_name)
+
+        if field_name in SECTIONS_CONTAINERS_FIELDS and isinstance(value, pydantic_uml.BaseModel):
+            yield from iter_dto_json_fragments(value, chunk_size)
+        elif isinstance(value, list):
+            adapter = get_field_type_adapter(owner_name, field_name)
+            yield b"["
+            for start in range(0, len(value), chunk_size):
+                # Each chunk is dumped as a complete JSON array - only its content is spliced into the list.
+                yield (b"," if start else b"") + adapter.dump_json(value[start:start + chunk_size])[1:-1]
+            yield b"]"
+        else:
+            yield get_field_type_adapter(owner_name, field_name).dump_json(value)
+    yield b"}"
+
+
 @inject(alias=UmlSerializer)
 class UmlToPydanticSerializer(UmlSerializer):
     def serialize(self, model: UmlModel, to_string: bool = True) -> str:
@@ -48,8 +90,20 @@ class UmlToPydanticSerializer(UmlSerializer):
         
         return pydantic_model.model_dump_json()
 
+    def iter_json_fragments(self, model: UmlModel) -> Iterator[bytes]:
+        return iter_dto_json_fragments(self.serialize(model, to_string=False))
+
+    def serialize_to_stream(self, model: UmlModel, stream: BinaryIO) -> None:
+        for fragment in self.iter_json_fragments(model):
+            stream.write(fragment)
+
+    def _build_dto(self, dto_class: type[pydantic_uml.BaseModel], **fields) -> pydantic_uml.BaseModel:
+        """Single point where every visited element is turned into its DTO - subclasses can override it to change the produced representation."""
+        return dto_class(**fields)
+
     def visit_uml_model(self, model: UmlModel) -> pydantic_uml.UmlModel:
-        return pydantic_uml.UmlModel(
+        return self._build_dto(
+            pydantic_uml.UmlModel,
             id=model.id,
             name=model.name,
             elements=self.visit_uml_model_elements(model.elements),
@@ -58,7 +112,8 @@ class UmlToPydanticSerializer(UmlSerializer):
         )
 
     def visit_uml_model_elements(self, elements: UmlModelElements) -> pydantic_uml.UmlModelElements:
-        return pydantic_uml.UmlModelElements(
+        return self._build_dto(
+            pydantic_uml.UmlModelElements,
             classes=[self.visit_uml_class(cls) for cls in elements.classes],
             interfaces=[self.visit_uml_interface(interface) for interface in elements.interfaces],
             data_types=[self.visit_uml_data_type(data_type) for data_type in elements.data_types],
@@ -73,7 +128,8 @@ class UmlToPydanticSerializer(UmlSerializer):
         )
 
     def visit_uml_class(self, uml_class: UmlClass) -> pydantic_uml.UmlClass:
-        return pydantic_uml.UmlClass(
+        return self._build_dto(
+            pydantic_uml.UmlClass,
             id=uml_class.id,
             name=uml_class.name,
             visibility=uml_class.visibility,
@@ -84,7 +140,8 @@ class UmlToPydanticSerializer(UmlSerializer):
         )
 
     def visit_uml_interface(self, uml_interface: UmlInterface) -> pydantic_uml.UmlInterface:
-        return pydantic_uml.UmlInterface(
+        return self._build_dto(
+            pydantic_uml.UmlInterface,
             id=uml_interface.id,
             name=uml_interface.name,
             visibility=uml_interface.visibility,
@@ -93,7 +150,8 @@ class UmlToPydanticSerializer(UmlSerializer):
         )
 
     def visit_uml_attribute(self, attribute: UmlAttribute) -> pydantic_uml.UmlAttribute:
-        return pydantic_uml.UmlAttribute(
+        return self._build_dto(
+            pydantic_uml.UmlAttribute,
             id=attribute.id,
             name=attribute.name,
             visibility=attribute.visibility,
@@ -108,7 +166,8 @@ class UmlToPydanticSerializer(UmlSerializer):
         )
 
     def visit_uml_operation(self, operation: UmlOperation) -> pydantic_uml.UmlOperation:
-        return pydantic_uml.UmlOperation(
+        return self._build_dto(
+            pydantic_uml.UmlOperation,
             id=operation.id,
             name=operation.name,
             visibility=operation.visibility,
@@ -125,7 +184,8 @@ class UmlToPydanticSerializer(UmlSerializer):
         )
 
     def visit_uml_parameter(self, parameter: UmlParameter) -> pydantic_uml.UmlParameter:
-        return pydantic_uml.UmlParameter(
+        return self._build_dto(
+            pydantic_uml.UmlParameter,
             id=parameter.id,
             name=parameter.name,
             visibility=parameter.visibility,
@@ -136,7 +196,8 @@ class UmlToPydanticSerializer(UmlSerializer):
     def visit_uml_aggregation(
         self, element: UmlAggregation
     ) -> pydantic_uml.UmlAggregation:
-        return pydantic_uml.UmlAggregation(
+        return self._build_dto(
+            pydantic_uml.UmlAggregation,
             id=element.id,
             name=element.name,
             visibility=element.visibility,
@@ -149,7 +210,8 @@ class UmlToPydanticSerializer(UmlSerializer):
     def visit_uml_composition(
         self, element: UmlComposition
     ) -> pydantic_uml.UmlComposition:
-        return pydantic_uml.UmlComposition(
+        return self._build_dto(
+            pydantic_uml.UmlComposition,
             id=element.id,
             name=element.name,
             visibility=element.visibility,
@@ -165,7 +227,8 @@ class UmlToPydanticSerializer(UmlSerializer):
         elif isinstance(association, UmlComposition):
             return self.visit_uml_composition(association)
         elif isinstance(association, UmlAssociation):
-            return pydantic_uml.UmlAssociation(
+            return self._build_dto(
+                pydantic_uml.UmlAssociation,
                 id=association.id,
                 name=association.name,
                 visibility=association.visibility,
@@ -181,8 +244,11 @@ class UmlToPydanticSerializer(UmlSerializer):
         if association_end is None:
             return None
         
-        return pydantic_uml.UmlAssociationEnd(
+        return self._build_dto(
+            pydantic_uml.UmlAssociationEnd,
             id=association_end.id,
+            name=association_end.name,
+            visibility=association_end.visibility,
             multiplicity=association_end.multiplicity,
             element=self.visit_element_or_reference(association_end.element),
             role=association_end.role,
@@ -190,28 +256,32 @@ class UmlToPydanticSerializer(UmlSerializer):
         )
 
     def visit_uml_dependency(self, dependency: UmlDependency) -> pydantic_uml.UmlDependency:
-        return pydantic_uml.UmlDependency(
+        return self._build_dto(
+            pydantic_uml.UmlDependency,
             id=dependency.id,
             supplier=self.visit_element_or_reference(dependency.supplier),
             client=self.visit_element_or_reference(dependency.client),
         )
 
     def visit_uml_realization(self, realization: UmlRealization) -> pydantic_uml.UmlRealization:
-        return pydantic_uml.UmlRealization(
+        return self._build_dto(
+            pydantic_uml.UmlRealization,
             id=realization.id,
             supplier=self.visit_element_or_reference(realization.supplier),
             client=self.visit_element_or_reference(realization.client),
         )
 
     def visit_uml_generalization(self, generalization: UmlGeneralization) -> pydantic_uml.UmlGeneralization:
-        return pydantic_uml.UmlGeneralization(
+        return self._build_dto(
+            pydantic_uml.UmlGeneralization,
             id=generalization.id,
             specific=self.visit_element_or_reference(generalization.specific),
             general=self.visit_element_or_reference(generalization.general),
         )
 
     def visit_uml_primitive_type(self, primitive_type: UmlPrimitiveType) -> pydantic_uml.UmlPrimitiveType:
-        return pydantic_uml.UmlPrimitiveType(
+        return self._build_dto(
+            pydantic_uml.UmlPrimitiveType,
             id=primitive_type.id,
             name=primitive_type.name,
             visibility=primitive_type.visibility,
@@ -219,14 +289,16 @@ class UmlToPydanticSerializer(UmlSerializer):
         )
 
     def visit_uml_data_type(self, data_type: UmlDataType) -> pydantic_uml.UmlDataType:
-        return pydantic_uml.UmlDataType(
+        return self._build_dto(
+            pydantic_uml.UmlDataType,
             id=data_type.id,
             name=data_type.name,
             visibility=data_type.visibility,
         )
 
     def visit_uml_enumeration(self, enumeration: UmlEnumeration) -> pydantic_uml.UmlEnumeration:
-        return pydantic_uml.UmlEnumeration(
+        return self._build_dto(
+            pydantic_uml.UmlEnumeration,
             id=enumeration.id,
             name=enumeration.name,
             visibility=enumeration.visibility,
@@ -234,7 +306,8 @@ class UmlToPydanticSerializer(UmlSerializer):
         )
 
     def visit_uml_message(self, message: UmlMessage) -> pydantic_uml.UmlMessage:
-        return pydantic_uml.UmlMessage(
+        return self._build_dto(
+            pydantic_uml.UmlMessage,
             id=message.id,
             name=message.name,
             visibility=message.visibility,
@@ -247,7 +320,8 @@ class UmlToPydanticSerializer(UmlSerializer):
         )
 
     def visit_uml_interaction(self, interaction: UmlInteraction) -> pydantic_uml.UmlInteraction:
-        return pydantic_uml.UmlInteraction(
+        return self._build_dto(
+            pydantic_uml.UmlInteraction,
             id=interaction.id,
             name=interaction.name,
             visibility=interaction.visibility,
@@ -257,7 +331,8 @@ class UmlToPydanticSerializer(UmlSerializer):
         )
 
     def visit_uml_lifeline(self, lifeline: UmlLifeline) -> pydantic_uml.UmlLifeline:
-        return pydantic_uml.UmlLifeline(
+        return self._build_dto(
+            pydantic_uml.UmlLifeline,
             id=lifeline.id,
             name=lifeline.name,
             visibility=lifeline.visibility,
@@ -267,7 +342,8 @@ class UmlToPydanticSerializer(UmlSerializer):
     def visit_uml_occurrence_specification(
         self, occurrence_spec: UmlOccurrenceSpecification
     ) -> pydantic_uml.UmlOccurrenceSpecification:
-        return pydantic_uml.UmlOccurrenceSpecification(
+        return self._build_dto(
+            pydantic_uml.UmlOccurrenceSpecification,
             id=occurrence_spec.id,
             covered=self.visit_element_or_reference(occurrence_spec.covered),
         )
@@ -275,7 +351,8 @@ class UmlToPydanticSerializer(UmlSerializer):
     def visit_uml_combined_fragment(
         self, combined_fragment: UmlCombinedFragment
     ) -> pydantic_uml.UmlCombinedFragment:
-        return pydantic_uml.UmlCombinedFragment(
+        return self._build_dto(
+            pydantic_uml.UmlCombinedFragment,
             id=combined_fragment.id,
             name=combined_fragment.name,
             visibility=combined_fragment.visibility,
@@ -288,7 +365,8 @@ class UmlToPydanticSerializer(UmlSerializer):
         )
 
     def visit_uml_operand(self, operand: UmlOperand) -> pydantic_uml.UmlOperand:
-        return pydantic_uml.UmlOperand(
+        return self._build_dto(
+            pydantic_uml.UmlOperand,
             id=operand.id,
             guard=operand.guard,
             fragments=[
@@ -297,7 +375,8 @@ class UmlToPydanticSerializer(UmlSerializer):
         )
 
     def visit_uml_interaction_use(self, interaction_use: UmlInteractionUse) -> pydantic_uml.UmlInteractionUse:
-        return pydantic_uml.UmlInteractionUse(
+        return self._build_dto(
+            pydantic_uml.UmlInteractionUse,
             id=interaction_use.id,
             name=interaction_use.name,
             visibility=interaction_use.visibility,
@@ -309,7 +388,8 @@ class UmlToPydanticSerializer(UmlSerializer):
         )
 
     def visit_uml_package(self, uml_package: UmlPackage) -> pydantic_uml.UmlPackage:
-        return pydantic_uml.UmlPackage(
+        return self._build_dto(
+            pydantic_uml.UmlPackage,
             id=uml_package.id,
             name=uml_package.name,
             visibility=uml_package.visibility,
@@ -318,7 +398,8 @@ class UmlToPydanticSerializer(UmlSerializer):
 
 
     def visit_uml_package_elements(self, elements: UmlModelElements) -> pydantic_uml.UmlPackageElements:
-        return pydantic_uml.UmlPackageElements(
+        return self._build_dto(
+            pydantic_uml.UmlPackageElements,
             classes=[self.visit_element_or_reference(cls) for cls in elements.classes],
             interfaces=[self.visit_element_or_reference(interface) for interface in elements.interfaces],
             data_types=[self.visit_element_or_reference(data_type) for data_type in elements.data_types],
@@ -335,20 +416,22 @@ class UmlToPydanticSerializer(UmlSerializer):
 
     def visit_element_or_reference(self, element: Optional[UmlElement] = None) -> Union[pydantic_uml.UmlElement, pydantic_uml.UmlIdReference]:
         if isinstance(element, UmlElement):
-            return pydantic_uml.UmlIdReference(idref=element.id)
+            return self._build_dto(pydantic_uml.UmlIdReference, idref=element.id)
         elif element is None:
             return None
         else:
             raise ValueError("Unsupported element type")
 
     def visit_uml_diagrams(self, diagrams: UmlDiagrams) -> pydantic_uml.UmlDiagrams:
-        return pydantic_uml.UmlDiagrams(
+        return self._build_dto(
+            pydantic_uml.UmlDiagrams,
             class_diagrams=[self.visit_uml_class_diagram(diag) for diag in diagrams.class_diagrams],
             sequence_diagrams=[self.visit_uml_sequence_diagram(diag) for diag in diagrams.sequence_diagrams],
         )
 
     def visit_uml_class_diagram(self, class_diagram: UmlClassDiagram) -> pydantic_uml.UmlClassDiagram:
-        return pydantic_uml.UmlClassDiagram(
+        return self._build_dto(
+            pydantic_uml.UmlClassDiagram,
             id=class_diagram.id,
             name=class_diagram.name,
             description=class_diagram.description,
@@ -358,7 +441,8 @@ class UmlToPydanticSerializer(UmlSerializer):
     def visit_uml_class_diagram_elements(
         self, elements: UmlClassDiagramElements
     ) -> pydantic_uml.UmlClassDiagramElements:
-        return pydantic_uml.UmlClassDiagramElements(
+        return self._build_dto(
+            pydantic_uml.UmlClassDiagramElements,
             classes=[self.visit_element_or_reference(cls) for cls in elements.classes],
             interfaces=[self.visit_element_or_reference(interface) for interface in elements.interfaces],
             data_types=[self.visit_element_or_reference(data_type) for data_type in elements.data_types],
@@ -371,7 +455,8 @@ class UmlToPydanticSerializer(UmlSerializer):
         )
 
     def visit_uml_sequence_diagram(self, sequence_diagram: UmlSequenceDiagram) -> pydantic_uml.UmlSequenceDiagram:
-        return pydantic_uml.UmlSequenceDiagram(
+        return self._build_dto(
+            pydantic_uml.UmlSequenceDiagram,
             id=sequence_diagram.id,
             name=sequence_diagram.name,
             description=sequence_diagram.description,
@@ -381,7 +466,8 @@ class UmlToPydanticSerializer(UmlSerializer):
     def visit_uml_sequence_diagram_elements(
         self, elements: UmlSequenceDiagramElements
     ) -> pydantic_uml.UmlSequenceDiagramElements:
-        return pydantic_uml.UmlSequenceDiagramElements(
+        return self._build_dto(
+            pydantic_uml.UmlSequenceDiagramElements,
             interactions=[self.visit_element_or_reference(interaction) for interaction in elements.interactions],
         )
 
@@ -0,0 +1,191 @@
+from typing import Iterator, Optional, Sequence
+from collections import OrderedDict
+import gzip
+import hashlib
+import os
+import threading
+
+from umlars_translator.core import config
+from umlars_translator.core.deserialization.data_source import DataSource
+from umlars_translator.core.serialization.compression import CompressionMethod, get_compressed_file_name
+from umlars_translator.core.serialization import config as serialization_config
+from umlars_translator.core.utils.functions import get_translator_version
+from umlars_translator.config import SupportedFormat
+
+
+class MemoryCacheTier:
+    """LRU cache of serialized translations, limited by both the number of entries and their total size."""
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None) -> None:
+        self._max_entries = max_entries if max_entries is not None else config.TRANSLATION_CACHE_MEMORY_MAX_ENTRIES
+        self._max_bytes = max_bytes if max_bytes is not None else config.TRANSLATION_CACHE_MEMORY_MAX_BYTES
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        value_size = len(value)
+        if value_size > self._max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._size -= len(self._entries.pop(key))
+            self._entries[key] = value
+            self._size += value_size
+
+            while len(self._entries) > self._max_entries or self._size > self._max_bytes:
+                _, evicted_value = self._entries.popitem(last=False)
+                self._size -= len(evicted_value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+class DiskCacheTier:
+    """
+    Directory of gzip compressed translations, limited by the total size of the files.
+    Reading an entry updates its modification time - the least recently used files are evicted first.
+    """
+    FILE_NAME_SUFFIX = get_compressed_file_name(".umj", CompressionMethod.GZIP)
+
+    def __init__(self, directory: str, max_bytes: Optional[int] = None) -> None:
+        self._directory = directory
+        self._max_bytes = max_bytes if max_bytes is not None else config.TRANSLATION_CACHE_DISK_MAX_BYTES
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._size = sum(os.path.getsize(file_path) for file_path in self._iter_files_paths())
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def get(self, key: str) -> Optional[str]:
+        file_path = self._get_file_path(key)
+        try:
+            with gzip.open(file_path, "rb") as cache_file:
+                value = cache_file.read().decode()
+            os.utime(file_path)
+            return value
+        except (FileNotFoundError, OSError, EOFError):
+            return None
+
+    def put(self, key: str, value: str) -> None:
+        file_path = self._get_file_path(key)
+        temporary_file_path = f"{file_path}.{threading.get_ident()}.tmp"
+        with open(temporary_file_path, "wb") as cache_file:
+            cache_file.write(gzip.compress(value.encode(), compresslevel=serialization_config.GZIP_COMPRESSION_LEVEL, mtime=0))
+
+        file_size = os.path.getsize(temporary_file_path)
+        if file_size > self._max_bytes:
+            os.remove(temporary_file_path)
+            return
+
+        with self._lock:
+            if os.path.exists(file_path):
+                self._size -= os.path.getsize(file_path)
+            # Replacing is atomic, so the concurrent readers never see partially written entry.
+            os.replace(temporary_file_path, file_path)
+            self._size += file_size
+            if self._size > self._max_bytes:
+                self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            for file_path in self._iter_files_paths():
+                os.remove(file_path)
+            self._size = 0
+
+    def _evict(self) -> None:
+        files_paths = sorted(self._iter_files_paths(), key=os.path.getmtime)
+        for file_path in files_paths:
+            if self._size <= self._max_bytes:
+                break
+            self._size -= os.path.getsize(file_path)
+            os.remove(file_path)
+
+    def _iter_files_paths(self) -> Iterator[str]:
+        for file_name in os.listdir(self._directory):
+            if file_name.endswith(self.FILE_NAME_SUFFIX):
+                yield os.path.join(self._directory, file_name)
+
+    def _get_file_path(self, key: str) -> str:
+        return os.path.join(self._directory, key + self.FILE_NAME_SUFFIX)
+
+
+class TranslationCache:
+    """
+    Two-tier cache of the translations of the sources, in their serialized (UMJ) form.
+    Entries are keyed by the hash of the sources data, their formats, translator version and configuration salt,
+    so the cached translation is reused only for exactly the same input translated by the same translator.
+    Sources translated together share one entry, instead of an entry per file - they can refer to each other
+    (e.g. Papyrus model and its notation), so the translation of one of them depends on the others.
+    """
+    def __init__(
+        self,
+        memory_tier: Optional[MemoryCacheTier] = None,
+        disk_tier: Optional[DiskCacheTier] = None,
+        translator_version: Optional[str] = None,
+    ) -> None:
+        self._memory_tier = memory_tier or MemoryCacheTier()
+        if disk_tier is None and config.TRANSLATION_CACHE_DISK_DIRECTORY:
+            disk_tier = DiskCacheTier(config.TRANSLATION_CACHE_DISK_DIRECTORY)
+        self._disk_tier = disk_tier
+        self._translator_version = translator_version or get_translator_version()
+
+    def make_key(self, data_sources: Sequence[DataSource], format: Optional[SupportedFormat] = None) -> str:
+        """
+        Sources are translated together, so the key covers all of them, in their order.
+        Their data is hashed in chunks, so the spooled and memory-mapped files aren't read into memory.
+        """
+        key_hash = hashlib.sha256()
+        for key_part in (self._translator_version, config.TRANSLATION_CACHE_KEY_SALT):
+            key_hash.update(key_part.encode())
+            key_hash.update(b"\0")
+        for data_source in data_sources:
+            source_format = format or data_source.format
+            key_hash.update(f"{getattr(source_format, 'value', source_format)}\0".encode())
+            key_hash.update(self._hash_data(data_source))
+        return key_hash.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._memory_tier.get(key)
+        if value is None and self._disk_tier is not None:
+            value = self._disk_tier.get(key)
+            if value is not None:
+                self._memory_tier.put(key, value)
+        return value
+
+    def put(self, key: str, value: str) -> None:
+        self._memory_tier.put(key, value)
+        if self._disk_tier is not None:
+            self._disk_tier.put(key, value)
+
+    def clear(self) -> None:
+        self._memory_tier.clear()
+        if self._disk_tier is not None:
+            self._disk_tier.clear()
+
+    @staticmethod
+    def _hash_data(data_source: DataSource) -> bytes:
+        # Stream read only once is buffered, so it can still be parsed after it was hashed
+        chunks = [data_source.retrieved_buffer] if data_source.is_single_pass else data_source.iter_chunks()
+        data_hash = hashlib.sha256()
+        for chunk in chunks:
+            data_hash.update(chunk)
+        return data_hash.digest()
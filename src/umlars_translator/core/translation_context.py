@@ -0,0 +1,117 @@
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+
+from umlars_translator.core.model.abstract.uml_model import IUmlModel
+from umlars_translator.core.model.abstract.uml_model_builder import IUmlModelBuilder
+from umlars_translator.core.model.umlars_model.uml_model_builder import UmlModelBuilder
+from umlars_translator.core.deserialization.translation_budget import TranslationBudget
+from umlars_translator.core.deserialization.translation_progress import TranslationProgress
+
+
+# Lists of the model holding its top-level elements and diagrams - the other elements are nested in them
+MODEL_ELEMENTS_SECTIONS = (
+    "classes", "interfaces", "data_types", "enumerations", "primitive_types", "associations",
+    "generalizations", "dependencies", "realizations", "interactions", "packages",
+)
+MODEL_DIAGRAMS_SECTIONS = ("class_diagrams", "sequence_diagrams")
+
+
+@dataclass
+class SourceContribution:
+    """
+    Part of the model added by the translation of a single source - IDs of its top-level elements and diagrams
+    (their nested elements come from the same source) and the model's fields it set.
+    """
+    elements_ids: List[str] = field(default_factory=list)
+    name: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+def iter_model_sections(model: IUmlModel) -> Iterator[Tuple[str, list]]:
+    for section_name in MODEL_ELEMENTS_SECTIONS:
+        yield f"elements.{section_name}", getattr(model.elements, section_name)
+    for section_name in MODEL_DIAGRAMS_SECTIONS:
+        yield f"diagrams.{section_name}", getattr(model.diagrams, section_name)
+
+
+def get_contributed_model_part(model: IUmlModel, contribution: SourceContribution) -> SimpleNamespace:
+    """
+    Returns the part of the model added by the contribution, as a standalone model - it has only the attributes read by the serializers.
+    """
+    elements_ids = set(contribution.elements_ids)
+
+    def get_contributed_elements(section: list) -> list:
+        return [element for element in section if element.id in elements_ids]
+
+    return SimpleNamespace(
+        id=model.id,
+        name=contribution.name,
+        metadata=contribution.metadata,
+        elements=SimpleNamespace(**{name: get_contributed_elements(getattr(model.elements, name)) for name in MODEL_ELEMENTS_SECTIONS}),
+        diagrams=SimpleNamespace(**{name: get_contributed_elements(getattr(model.diagrams, name)) for name in MODEL_DIAGRAMS_SECTIONS}),
+    )
+
+
+class TranslationContext:
+    """
+    Mutable state of a single translation - the builder and the model it creates.
+    Translators and deserializers keep only the parts shared between the translations (strategies registry, configuration),
+    so one instance can serve many concurrent translations, each with its own context.
+    """
+    def __init__(
+        self,
+        model_builder: Optional[IUmlModelBuilder] = None,
+        model: Optional[IUmlModel] = None,
+        translation_budget: Optional[TranslationBudget] = None,
+        translation_progress: Optional[TranslationProgress] = None,
+    ) -> None:
+        self._model_builder = model_builder or UmlModelBuilder()
+        self.model = model or self._model_builder.model
+        # Limits checked while the data is deserialized in this context
+        self.translation_budget = translation_budget
+        # Progress reported while the data is deserialized in this context
+        self.translation_progress = translation_progress
+        # Provenance of the model's parts, recorded with record_source
+        self.sources_contributions: Dict[str, SourceContribution] = {}
+
+    @property
+    def model_builder(self) -> IUmlModelBuilder:
+        return self._model_builder
+
+    @contextmanager
+    def record_source(self, source_id: str) -> Iterator[SourceContribution]:
+        """
+        Records the part of the model added while the source is translated in this context - also when its translation fails,
+        as the elements it added before the failure stay in the model.
+        """
+        with self.track_contribution() as contribution:
+            self.sources_contributions[source_id] = contribution
+            yield contribution
+
+    @contextmanager
+    def track_contribution(self, model: Optional[IUmlModel] = None) -> Iterator[SourceContribution]:
+        """
+        Tracks the part of the model (of the context, by default) added inside the block, without recording it as a source.
+        The contribution is complete once the block is left.
+        """
+        model = model or self.model
+        sections_lengths = {section_path: len(section) for section_path, section in iter_model_sections(model)}
+        previous_name, previous_metadata = model.name, model.metadata
+        model.name, model.metadata = None, {}
+        contribution = SourceContribution()
+        try:
+            yield contribution
+        finally:
+            for section_path, section in iter_model_sections(model):
+                contribution.elements_ids.extend(element.id for element in section[sections_lengths.get(section_path, 0):])
+            contribution.name, contribution.metadata = model.name, model.metadata
+            # Fields not set by the source keep their previous values
+            model.name = contribution.name if contribution.name is not None else previous_name
+            model.metadata = contribution.metadata or previous_metadata
+
+    def clear(self) -> None:
+        self._model_builder.clear()
+        self.model = self._model_builder.model
+        self.sources_contributions = {}
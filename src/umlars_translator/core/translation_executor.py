@@ -0,0 +1,165 @@
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import Enum
+from functools import partial
+from logging import Logger
+from weakref import WeakKeyDictionary
+import asyncio
+import threading
+
+from kink import inject
+
+from umlars_translator.core import config
+from umlars_translator.core.deserialization.exceptions import TranslationCancelledError
+
+
+T = TypeVar("T")
+
+
+class ExecutorType(str, Enum):
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+def iter_until_cancelled(items: Optional[Iterable[T]], cancel_event: threading.Event) -> Optional[Iterator[T]]:
+    """Checks the cancellation flag before each item is handed over to the worker."""
+    if items is None:
+        return None
+
+    def checked_items() -> Iterator[T]:
+        for item in items:
+            if cancel_event.is_set():
+                raise TranslationCancelledError("Translation was cancelled")
+            yield item
+
+    return checked_items()
+
+
+@inject
+class TranslationExecutor:
+    """
+    Runs the CPU-bound translation work outside of the event loop.
+    The number of translations running at once is limited by a semaphore, so the excess requests wait without occupying the pool.
+    Work that has to share the state with the calling process (e.g. model kept by the translator) is always run in threads,
+    picklable functions are run in the pool of the configured type.
+    """
+    def __init__(
+        self,
+        executor_type: Optional[ExecutorType] = None,
+        max_workers: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        core_logger: Optional[Logger] = None,
+    ) -> None:
+        self._executor_type = ExecutorType(executor_type or config.TRANSLATION_EXECUTOR_TYPE)
+        self._max_workers = max_workers or config.TRANSLATION_EXECUTOR_MAX_WORKERS
+        self._max_concurrency = max_concurrency or config.TRANSLATION_MAX_CONCURRENCY
+        self._executor = executor
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._semaphores: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._logger = core_logger.getChild(self.__class__.__name__)
+
+    @property
+    def executor_type(self) -> ExecutorType:
+        return self._executor_type
+
+    @property
+    def uses_processes(self) -> bool:
+        if self._executor is not None:
+            return isinstance(self._executor, ProcessPoolExecutor)
+        return self._executor_type == ExecutorType.PROCESS
+
+    async def run(self, function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Runs the function in the configured pool. In case of the process pool, the function and its arguments have to be picklable."""
+        return await self._run_in_executor(self._get_executor(), function, *args, **kwargs)
+
+    async def run_in_thread(
+        self, function: Callable[..., T], *args: Any, cancel_event: Optional[threading.Event] = None, **kwargs: Any
+    ) -> T:
+        """
+        Runs the function in the thread pool. Work already running in a thread cannot be interrupted -
+        on cancellation the cancel_event is set, so the function can stop at its next checkpoint.
+        The cancellation is propagated once it stops, so the caller can safely release what the function uses.
+        """
+        return await self._run_in_executor(self._get_thread_pool(), function, *args, cancel_event=cancel_event, **kwargs)
+
+    async def _run_in_executor(
+        self, executor: Executor, function: Callable[..., T], *args: Any, cancel_event: Optional[threading.Event] = None, **kwargs: Any
+    ) -> T:
+        loop = asyncio.get_running_loop()
+        semaphore = self._get_semaphore(loop)
+        await semaphore.acquire()
+        try:
+            work = executor.submit(partial(function, *args, **kwargs))
+        except BaseException:
+            semaphore.release()
+            raise
+        # The slot is taken until the work is done - cancelled work already running in the pool keeps running till its checkpoint.
+        work.add_done_callback(lambda _: self._release_semaphore(loop, semaphore))
+
+        # Cancelling the asyncio future also cancels the work not yet started in the pool.
+        future = asyncio.wrap_future(work, loop=loop)
+        try:
+            return await future
+        except asyncio.CancelledError:
+            self._logger.info(f"Translation task {function} was cancelled")
+            if cancel_event is not None:
+                cancel_event.set()
+                await self._wait_until_done(work, loop)
+            raise
+
+    @staticmethod
+    async def _wait_until_done(work: Future, loop: asyncio.AbstractEventLoop) -> None:
+        """Waits for the cancelled work to stop at its checkpoint - repeated cancellations don't stop the waiting."""
+        stopped = asyncio.wrap_future(work, loop=loop)
+        while not stopped.done():
+            try:
+                await asyncio.shield(stopped)
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    @staticmethod
+    def _release_semaphore(loop: asyncio.AbstractEventLoop, semaphore: asyncio.Semaphore) -> None:
+        """Called by the thread completing the work - the semaphore has to be released in the loop it belongs to."""
+        if loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(semaphore.release)
+        except RuntimeError:
+            # The loop was closed in the meantime - the semaphore is not used anymore
+            pass
+
+    def _get_semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self._max_concurrency)
+        return semaphore
+
+    def _get_executor(self) -> Executor:
+        if self._executor is not None:
+            return self._executor
+        if self._executor_type == ExecutorType.THREAD:
+            return self._get_thread_pool()
+
+        with self._lock:
+            if self._process_pool is None:
+                self._logger.info(f"Starting translation process pool with {self._max_workers} workers")
+                self._process_pool = ProcessPoolExecutor(max_workers=self._max_workers)
+            return self._process_pool
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="translation")
+            return self._thread_pool
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        """Shuts down the pools created by the executor. Executor passed from the outside is left to its owner."""
+        with self._lock:
+            for pool in (self._process_pool, self._thread_pool):
+                if pool is not None:
+                    pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+            self._process_pool = None
+            self._thread_pool = None
@@ -1,14 +1,56 @@
-from typing import Optional, Iterable
+from typing import Any, BinaryIO, Optional, Iterable, Iterator, NamedTuple
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from contextlib import nullcontext
 from logging import Logger
+import threading
 
 from kink import inject
 
 from umlars_translator.core.deserialization.deserializer import ModelDeserializer
+from umlars_translator.core.deserialization.exceptions import TranslationCancelledError
 from umlars_translator.core.serialization.umlars_model.json_serializer import UmlToPydanticSerializer
 from umlars_translator.core.serialization.abstract.serializer import UmlSerializer
 from umlars_translator.config import SupportedFormat
 from umlars_translator.core.deserialization.data_source import DataSource
 from umlars_translator.core.model.abstract.uml_model import IUmlModel
+from umlars_translator.core.translation_executor import TranslationExecutor, iter_until_cancelled
+from umlars_translator.core.translation_cache import TranslationCache
+from umlars_translator.core.deserialization.input_processor import InputProcessor
+from umlars_translator.core.translation_context import TranslationContext, get_contributed_model_part
+from umlars_translator.core.deserialization.translation_budget import TranslationBudget, create_translation_budget
+from umlars_translator.core import config
+from umlars_translator.app.dtos.uml_model import FULL_ASSOCIATION_ENDS_CONTEXT
+
+
+class TranslationJob(NamedTuple):
+    """Single model to be translated by ModelTranslator.translate_many."""
+    id: str
+    sources: Iterable[DataSource]
+    format: Optional[SupportedFormat] = None
+
+
+_worker_translator: Optional["ModelTranslator"] = None
+
+
+def get_worker_translator() -> "ModelTranslator":
+    """
+    Translator shared by the translations run in the worker process. It is created once,
+    so the loaded strategies are reused - each translation gets only its own context.
+    """
+    global _worker_translator
+    if _worker_translator is None:
+        _worker_translator = ModelTranslator()
+    return _worker_translator
+
+
+def translate_in_worker(translation_kwargs: dict[str, Any]) -> Any:
+    """Entry point of the translation worker processes."""
+    translator = get_worker_translator()
+    return translator.translate(**translation_kwargs, context=translator.create_context())
+
+
+def translate_job_in_worker(job: TranslationJob, to_string: bool = True) -> Any:
+    return get_worker_translator().translate_job(job, to_string=to_string)
 
 
 @inject
@@ -18,11 +60,25 @@ class ModelTranslator:
         model_deseializer: Optional[ModelDeserializer] = None,
         core_logger: Optional[Logger] = None,
         model_to_extend: Optional[IUmlModel] = None,
+        serializer: Optional[UmlSerializer] = None,
+        translation_executor: Optional[TranslationExecutor] = None,
+        translation_cache: Optional[TranslationCache] = None,
     ) -> None:
         self._model_deserializer = model_deseializer
+        self._serializer = serializer
+        self._translation_executor = translation_executor
+        self._translation_cache = translation_cache
         self._logger = core_logger.getChild(self.__class__.__name__)
         self._logger.info("ModelTranslator initialized")
-        self._model = model_to_extend or model_deseializer.model
+        # Used when no context is passed - keeps the previous behaviour of the translator extending its own model.
+        self._context = TranslationContext(model_deseializer.model_builder, model_to_extend or model_deseializer.model)
+
+    def create_context(self, model_to_extend: Optional[IUmlModel] = None) -> TranslationContext:
+        """Creates the state of a new translation. Translations using different contexts can run concurrently."""
+        context = self._model_deserializer.create_context()
+        if model_to_extend is not None:
+            context.model = model_to_extend
+        return context
 
     def translate(
         self,
@@ -36,9 +92,13 @@ class ModelTranslator:
         clear_model_afterwards: bool = False,
         model_id: Optional[str] = None,
         to_string: bool = True,
+        context: Optional[TranslationContext] = None,
+        time_limit: Optional[float] = None,
+        memory_limit: Optional[int] = None,
     ) -> str | Iterable[str]:
         deserialized_model: IUmlModel = self.deserialize(
-            data, file_name, file_paths, data_batches, data_sources, from_format, model_to_extend, clear_builder_afterwards=clear_model_afterwards, model_id=model_id
+            data, file_name, file_paths, data_batches, data_sources, from_format, model_to_extend, clear_builder_afterwards=clear_model_afterwards, model_id=model_id, context=context,
+            time_limit=time_limit, memory_limit=memory_limit,
         )
         # TODO: serializer should accept many implementations of IUmlModel
         serialized_model = self.serialize(deserialized_model, to_string=to_string)
@@ -55,42 +115,282 @@ class ModelTranslator:
         model_to_extend: Optional[IUmlModel] = None,
         model_id: Optional[str] = None,
         clear_builder_afterwards: bool = False,
+        context: Optional[TranslationContext] = None,
+        time_limit: Optional[float] = None,
+        memory_limit: Optional[int] = None,
     ) -> IUmlModel:
+        """
+        Time (in seconds) and memory (in bytes) limits are checked cooperatively during the deserialization -
+        TranslationBudgetExceededError is raised when any is exceeded. Without them, the budget of the context is used.
+        """
         self._logger.info("Deserializing model")
 
-        model_to_extend = model_to_extend or self._model
+        context = context or self._context
+        translation_budget = create_translation_budget(time_limit, memory_limit)
+        if translation_budget is None:
+            return self._deserialize(data, file_name, file_paths, data_batches, data_sources, from_format, model_to_extend, model_id, clear_builder_afterwards, context)
+
+        previous_translation_budget = context.translation_budget
+        context.translation_budget = translation_budget
+        try:
+            return self._deserialize(data, file_name, file_paths, data_batches, data_sources, from_format, model_to_extend, model_id, clear_builder_afterwards, context)
+        finally:
+            context.translation_budget = previous_translation_budget
+
+    def _deserialize(
+        self,
+        data: Optional[str],
+        file_name: Optional[str],
+        file_paths: Optional[Iterable[str]],
+        data_batches: Optional[Iterable[str]],
+        data_sources: Optional[Iterable[DataSource]],
+        from_format: Optional[SupportedFormat],
+        model_to_extend: Optional[IUmlModel],
+        model_id: Optional[str],
+        clear_builder_afterwards: bool,
+        context: TranslationContext,
+    ) -> IUmlModel:
+        model_to_extend = model_to_extend or context.model
     
         if model_id is not None:
             self._logger.info(f"Model ID will be set to {model_id}")
             model_to_extend.id = model_id
 
-        if data is not None:
-            deserialized_model = self._model_deserializer.deserialize(data_batches=[data], from_format=from_format, model_to_extend=model_to_extend, clear_builder_afterwards=True)
+        if self._translation_cache is not None:
+            if data is not None:
+                data_batches = [data]
+            elif file_name is not None:
+                file_paths = [file_name]
+            if not data_sources:
+                data_sources = InputProcessor().accept_multiple_inputs(data_batches, file_paths, format_for_all=from_format)
+            deserialized_model = self._deserialize_cached(data_sources, from_format, model_to_extend, context)
+
+        elif data is not None:
+            deserialized_model = self._model_deserializer.deserialize(data_batches=[data], from_format=from_format, model_to_extend=model_to_extend, clear_builder_afterwards=True, context=context)
 
         elif file_name is not None:
-            deserialized_model = self._model_deserializer.deserialize(file_paths=[file_name], from_format=from_format, model_to_extend=model_to_extend, clear_builder_afterwards=True)
+            deserialized_model = self._model_deserializer.deserialize(file_paths=[file_name], from_format=from_format, model_to_extend=model_to_extend, clear_builder_afterwards=True, context=context)
 
         else:
-            deserialized_model = self._model_deserializer.deserialize(file_paths, data_batches, data_sources, from_format=from_format, model_to_extend=model_to_extend, clear_builder_afterwards=True)
+            deserialized_model = self._model_deserializer.deserialize(file_paths, data_batches, data_sources, from_format=from_format, model_to_extend=model_to_extend, clear_builder_afterwards=True, context=context)
 
+        if model_id is not None:
+            # ID of the model read from the source is replaced too
+            deserialized_model.id = model_id
         self._logger.info("Model deserialized")
 
         if clear_builder_afterwards:
-            self.clear()
+            self.clear(context)
         else:
-            self._model = deserialized_model
+            context.model = deserialized_model
+
+        return deserialized_model
+
+    def _deserialize_cached(
+        self, data_sources: Iterable[DataSource], from_format: Optional[SupportedFormat], model_to_extend: IUmlModel, context: TranslationContext
+    ) -> IUmlModel:
+        """
+        All the sources are translated at once, because they can refer to each other (e.g. Papyrus model and its notation).
+        Their cached translation (in UMJ format) is merged into the extended model without parsing them. Otherwise they are translated
+        straight into the extended model and only the part they added is serialized into the cache.
+        """
+        data_sources = list(data_sources)
+        cache_key = self._translation_cache.make_key(data_sources, from_format)
+        cached_translation = self._translation_cache.get(cache_key)
+        if cached_translation is not None:
+            self._logger.info(f"Translation of data sources {data_sources} found in cache")
+            return self._model_deserializer.deserialize(
+                data_sources=[DataSource(cached_translation, format=SupportedFormat.UMJ)], model_to_extend=model_to_extend, clear_builder_afterwards=True, context=context
+            )
 
+        previous_model_id = model_to_extend.id
+        with context.track_contribution(model_to_extend) as contribution:
+            deserialized_model = self._model_deserializer.deserialize(
+                data_sources=data_sources, from_format=from_format, model_to_extend=model_to_extend, clear_builder_afterwards=True, context=context
+            )
+        # ID of the extended model is left out - merged translation keeps it, unless the sources set their own.
+        excluded_fields = {"id"} if deserialized_model.id == previous_model_id else None
+        # The cached form doesn't depend on the serializer configured for the translator.
+        model_part = UmlToPydanticSerializer().visit_uml_model(get_contributed_model_part(deserialized_model, contribution))
+        self._translation_cache.put(cache_key, model_part.model_dump_json(exclude=excluded_fields, context=FULL_ASSOCIATION_ENDS_CONTEXT))
         return deserialized_model
 
-    @inject
-    def serialize(self, model: Optional[IUmlModel] = None, serializer: Optional[UmlSerializer] = None, to_string: bool = True) -> str:
-        model = model or self._model
+    def serialize(
+        self, model: Optional[IUmlModel] = None, serializer: Optional[UmlSerializer] = None, to_string: bool = True, context: Optional[TranslationContext] = None
+    ) -> str:
+        model = model or (context or self._context).model
+        serializer = serializer or self._serializer
         self._logger.info("Serializing model")
         serialized_model = serializer.serialize(model, to_string=to_string)
         self._logger.info("Model serialized")
         return serialized_model
+
+    def serialize_to_stream(
+        self, stream: BinaryIO, model: Optional[IUmlModel] = None, serializer: Optional[UmlSerializer] = None, context: Optional[TranslationContext] = None
+    ) -> None:
+        model = model or (context or self._context).model
+        serializer = serializer or self._serializer
+        self._logger.info("Serializing model to stream")
+        serializer.serialize_to_stream(model, stream)
+        self._logger.info("Model serialized")
     
-    def clear(self) -> None:
-        self._model = None
-        self._model_deserializer.clear()
+    async def adeserialize(
+        self,
+        data: Optional[str] = None,
+        file_name: Optional[str] = None,
+        file_paths: Optional[Iterable[str]] = None,
+        data_batches: Optional[Iterable[str]] = None,
+        data_sources: Optional[Iterable[DataSource]] = None,
+        from_format: Optional[SupportedFormat] = None,
+        model_to_extend: Optional[IUmlModel] = None,
+        model_id: Optional[str] = None,
+        clear_builder_afterwards: bool = False,
+        context: Optional[TranslationContext] = None,
+        time_limit: Optional[float] = None,
+        memory_limit: Optional[int] = None,
+    ) -> IUmlModel:
+        """
+        Runs deserialize in the executor's thread pool - the model is built in the context, so it cannot leave the process.
+        When cancelled, the deserialization stops at its next checkpoint and the context is cleared.
+        The time limit includes the time spent waiting for the free worker.
+        """
+        cancel_event = threading.Event()
+        context = context or self._context
+        previous_translation_budget = context.translation_budget
+        context.translation_budget = TranslationBudget(time_limit, memory_limit, cancel_event)
+        try:
+            return await self._translation_executor.run_in_thread(
+                self._deserialize_until_cancelled,
+                cancel_event,
+                context,
+                data,
+                file_name,
+                iter_until_cancelled(file_paths, cancel_event),
+                iter_until_cancelled(data_batches, cancel_event),
+                iter_until_cancelled(data_sources, cancel_event),
+                from_format,
+                model_to_extend,
+                model_id,
+                clear_builder_afterwards,
+                cancel_event=cancel_event,
+            )
+        finally:
+            context.translation_budget = previous_translation_budget
+
+    async def aserialize(
+        self, model: Optional[IUmlModel] = None, serializer: Optional[UmlSerializer] = None, to_string: bool = True, context: Optional[TranslationContext] = None
+    ) -> str:
+        return await self._translation_executor.run_in_thread(self.serialize, model, serializer, to_string, context)
+
+    async def atranslate(
+        self,
+        data: Optional[str] = None,
+        file_name: Optional[str] = None,
+        file_paths: Optional[Iterable[str]] = None,
+        data_batches: Optional[Iterable[str]] = None,
+        data_sources: Optional[Iterable[DataSource]] = None,
+        from_format: Optional[SupportedFormat] = None,
+        model_to_extend: Optional[IUmlModel] = None,
+        clear_model_afterwards: bool = False,
+        model_id: Optional[str] = None,
+        to_string: bool = True,
+        context: Optional[TranslationContext] = None,
+        time_limit: Optional[float] = None,
+        memory_limit: Optional[int] = None,
+    ) -> str | Iterable[str]:
+        """
+        Asynchronous counterpart of translate. With the process pool configured, independent translations
+        (not extending any model or context) are run in a worker process, using the default serializer.
+        """
+        if self._translation_executor.uses_processes and model_to_extend is None and context is None:
+            translation_kwargs = dict(
+                data=data,
+                file_name=file_name,
+                file_paths=list(file_paths) if file_paths is not None else None,
+                data_batches=list(data_batches) if data_batches is not None else None,
+                data_sources=list(data_sources) if data_sources is not None else None,
+                from_format=from_format,
+                model_id=model_id,
+                to_string=to_string,
+                time_limit=time_limit,
+                memory_limit=memory_limit,
+            )
+            return await self._translation_executor.run(translate_in_worker, translation_kwargs)
+
+        deserialized_model = await self.adeserialize(
+            data, file_name, file_paths, data_batches, data_sources, from_format, model_to_extend, model_id=model_id, clear_builder_afterwards=clear_model_afterwards, context=context,
+            time_limit=time_limit, memory_limit=memory_limit,
+        )
+        return await self.aserialize(deserialized_model, to_string=to_string)
+
+    def translate_job(self, job: TranslationJob, to_string: bool = True) -> Any:
+        """Translates the job into a new model, built in its own context."""
+        job = TranslationJob(*job)
+        return self.translate(
+            data_sources=job.sources, from_format=job.format, model_id=job.id, to_string=to_string, context=self.create_context()
+        )
+
+    def translate_many(
+        self,
+        jobs: Iterable[TranslationJob | tuple],
+        to_string: bool = True,
+        max_workers: int = 1,
+        max_pending_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> Iterator[tuple[str, Any]]:
+        """
+        Translates many independent models, yielding (job id, result) pairs in the order of completion.
+        If the translation fails, the raised exception is yielded as the result instead.
+
+        With max_workers > 1 (or an executor given) the jobs are run by the workers, each reusing its warm translator.
+        Jobs are pulled from the iterable lazily - at most max_pending_jobs of them are submitted at once,
+        so only a bounded number of models (and their results) is kept in memory.
+        """
+        if executor is None and max_workers <= 1:
+            for job in jobs:
+                job = TranslationJob(*job)
+                try:
+                    yield job.id, self.translate_job(job, to_string=to_string)
+                except Exception as ex:
+                    self._logger.error(f"Failed to translate model {job.id}: {ex}")
+                    yield job.id, ex
+            return
+
+        max_pending_jobs = max_pending_jobs or max_workers * config.TRANSLATE_MANY_PENDING_JOBS_PER_WORKER
+        pending_jobs: dict[Future, str] = {}
+        jobs_iterator = iter(jobs)
+        executor_context = nullcontext(executor) if executor is not None else ProcessPoolExecutor(max_workers=max_workers)
+
+        with executor_context as executor:
+            while True:
+                for job in jobs_iterator:
+                    job = TranslationJob(job[0], list(job[1]), *job[2:])
+                    pending_jobs[executor.submit(translate_job_in_worker, job, to_string)] = job.id
+                    if len(pending_jobs) >= max_pending_jobs:
+                        break
+
+                if not pending_jobs:
+                    return
+
+                done_jobs, _ = wait(pending_jobs, return_when=FIRST_COMPLETED)
+                for future in done_jobs:
+                    job_id = pending_jobs.pop(future)
+                    if future.exception() is not None:
+                        self._logger.error(f"Failed to translate model {job_id}: {future.exception()}")
+                        yield job_id, future.exception()
+                    else:
+                        yield job_id, future.result()
+
+    def _deserialize_until_cancelled(
+        self, cancel_event: threading.Event, context: Optional[TranslationContext], *deserialize_args: Any
+    ) -> IUmlModel:
+        try:
+            return self.deserialize(*deserialize_args, context=context)
+        except TranslationCancelledError:
+            self._logger.info("Deserialization was cancelled, clearing the context")
+            self.clear(context)
+            raise
+
+    def clear(self, context: Optional[TranslationContext] = None) -> None:
+        self._model_deserializer.clear(context or self._context)
         self._logger.info("Model cleared")
@@ -1,6 +1,38 @@
-from typing import Iterator, Any
+from typing import Iterator, Any, Optional
 from enum import Enum
+import importlib.metadata
+import os
+
+try:
+    import resource
+except ImportError:
+    resource = None
 
 
 def get_enum_members_values(cls: type[Enum] | Enum) -> Iterator[Any]:
     return list(map(lambda member: member.value, cls.__members__.values()))
+
+
+def get_translator_version() -> str:
+    try:
+        return importlib.metadata.version("umlars_translator")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def get_process_memory_usage() -> Optional[int]:
+    """
+    Returns resident memory of the current process in bytes. Where it is not available (non Linux systems),
+    peak resident memory is returned instead or None, if none of them can be read.
+    """
+    try:
+        with open("/proc/self/statm") as statm_file:
+            return int(statm_file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+
+    if resource is None:
+        return None
+    max_resident_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in kilobytes on Linux and in bytes on macOS
+    return max_resident_memory if os.uname().sysname == "Darwin" else max_resident_memory * 1024
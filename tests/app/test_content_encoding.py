@@ -0,0 +1,22 @@
+import pytest
+
+from umlars_translator.app.utils.functions import negotiate_content_encoding
+from umlars_translator.core.serialization.compression import CompressionMethod
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected_encoding",
+    [
+        (None, None),
+        ("", None),
+        ("identity", None),
+        ("gzip", CompressionMethod.GZIP),
+        ("deflate, gzip;q=0.8, br", CompressionMethod.GZIP),
+        ("GZIP", CompressionMethod.GZIP),
+        ("gzip;q=0", None),
+        ("*", CompressionMethod.GZIP),
+        ("*;q=0.5, gzip;q=0", None),
+    ],
+)
+def test_negotiate_content_encoding(accept_encoding, expected_encoding):
+    assert negotiate_content_encoding(accept_encoding) == expected_encoding
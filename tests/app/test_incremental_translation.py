@@ -0,0 +1,172 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from umlars_translator.app.adapters.message_brokers.rabbitmq_message_producer import RabbitMQProducer
+from umlars_translator.app.adapters.message_brokers.rabbitmq_message_consumer import RabbitMQConsumer
+from umlars_translator.app.adapters.apis.rest_api_connector import RestApiConnector
+from umlars_translator.app.adapters.repositories.uml_model_repository import UmlModelRepository
+from umlars_translator.app.dtos.messages import ModelToTranslateMessage, ProcessStatusEnum
+from umlars_translator.app.dtos.input import UmlModelDTO, UmlFileDTO
+from umlars_translator.app.dtos.model_sources import UmlModelSourcesDTO, UmlFileContributionDTO
+from umlars_translator.app.utils.incremental_translation import get_files_to_translate
+from umlars_translator.core.translator import ModelTranslator
+from umlars_translator.core.translation_executor import TranslationExecutor
+
+
+SOURCE_FILES_PATHS = {
+    "basic": "tests/core/deserializer/formats/ea_xmi/test_data/ea_xmi_class_basic.xml",
+    "staruml": "tests/core/deserializer/formats/staruml_mdj/test_data/staruml-car-model-with-sequence.mdj",
+    "car": "tests/core/deserializer/formats/ea_xmi/test_data/ea_xmi_car-model-xmi-21.xml",
+}
+
+
+def create_uml_model_dto(files_ids):
+    source_files = []
+    for file_id in files_ids:
+        with open(SOURCE_FILES_PATHS[file_id]) as source_file:
+            source_files.append(UmlFileDTO(id=file_id, filename=SOURCE_FILES_PATHS[file_id].rsplit("/", 1)[-1], data=source_file.read()))
+    return UmlModelDTO(id="model", source_files=source_files)
+
+
+def get_sections_elements_ids(model_data):
+    return {(group_name, section_name): [element["id"] for element in element_list] for group_name in ("elements", "diagrams") for section_name, element_list in model_data[group_name].items()}
+
+
+def create_message(files_ids, **changes):
+    return ModelToTranslateMessage(id="model", ids_of_source_files=files_ids, **changes)
+
+
+@pytest.fixture
+def stored_models():
+    return {}
+
+
+@pytest.fixture
+def uml_model_repository(stored_models):
+    uml_model_repository = AsyncMock(spec=UmlModelRepository)
+
+    async def save(uml_model, model_sources=None):
+        stored_models[str(uml_model.id)] = (uml_model.model_dump(), model_sources)
+
+    async def get_raw_with_sources(model_id):
+        return stored_models.get(model_id)
+
+    uml_model_repository.save.side_effect = save
+    uml_model_repository.get_raw_with_sources.side_effect = get_raw_with_sources
+    return uml_model_repository
+
+
+@pytest.fixture
+def model_translator():
+    return ModelTranslator()
+
+
+@pytest.fixture
+def message_producer():
+    return AsyncMock(spec=RabbitMQProducer)
+
+
+@pytest.fixture
+def consumer(uml_model_repository, model_translator, message_producer):
+    translation_executor = AsyncMock(spec=TranslationExecutor)
+    translation_executor.uses_processes = False
+    return RabbitMQConsumer(
+        queue_name="test_queue",
+        rabbitmq_host="localhost",
+        repository_api_connector=AsyncMock(spec=RestApiConnector),
+        uml_model_repository=uml_model_repository,
+        messaging_logger=MagicMock(),
+        model_translator=model_translator,
+        message_producer=message_producer,
+        translation_executor=translation_executor,
+        processing_slots=1,
+    )
+
+
+async def translate(consumer, files_ids, model_to_translate_message=None):
+    await consumer.process_message(create_uml_model_dto(files_ids), process_id="process", model_to_translate_message=model_to_translate_message)
+
+
+@pytest.mark.asyncio
+async def test_when_files_edited_and_added_then_only_they_are_translated_and_model_equals_full_translation(consumer, model_translator, stored_models):
+    # Given
+    await translate(consumer, ["basic", "car", "staruml"])
+    fully_translated_model, fully_translated_model_sources = stored_models.pop("model")
+    await translate(consumer, ["basic", "staruml"])
+
+    # When
+    with patch.object(model_translator, "adeserialize", wraps=model_translator.adeserialize) as adeserialize:
+        await translate(consumer, ["basic", "car", "staruml"], create_message(
+            ["basic", "car", "staruml"], ids_of_edited_files=["staruml"], ids_of_new_submitted_files=["car"]
+        ))
+
+    # Then
+    assert adeserialize.await_count == 2
+    incrementally_translated_model, incrementally_translated_model_sources = stored_models["model"]
+    # Some of the nested elements get random IDs on each translation
+    assert get_sections_elements_ids(incrementally_translated_model) == get_sections_elements_ids(fully_translated_model)
+    assert incrementally_translated_model["elements"]["classes"] == fully_translated_model["elements"]["classes"]
+    assert incrementally_translated_model_sources == fully_translated_model_sources
+
+
+@pytest.mark.asyncio
+async def test_when_file_deleted_then_its_elements_are_removed_without_translation(consumer, model_translator, stored_models, message_producer):
+    # Given
+    await translate(consumer, ["basic"])
+    expected_model, _ = stored_models.pop("model")
+    await translate(consumer, ["basic", "staruml"])
+
+    # When
+    with patch.object(model_translator, "adeserialize", wraps=model_translator.adeserialize) as adeserialize:
+        await translate(consumer, ["basic"], create_message(["basic"], ids_of_deleted_files=["staruml"]))
+
+    # Then
+    adeserialize.assert_not_awaited()
+    translated_model, model_sources = stored_models["model"]
+    assert translated_model == expected_model
+    assert [file.file_id for file in model_sources.files] == ["basic"]
+    sent_states = {message["id"]: message["state"] for message in message_producer.send_messages.call_args.args[0]}
+    assert sent_states == {"basic": ProcessStatusEnum.FINISHED}
+
+
+@pytest.mark.asyncio
+async def test_when_model_saved_without_sources_then_it_is_translated_as_whole(consumer, model_translator, stored_models):
+    # Given
+    await translate(consumer, ["basic", "staruml"])
+    stored_models["model"] = (stored_models["model"][0], None)
+
+    # When
+    with patch.object(model_translator, "adeserialize", wraps=model_translator.adeserialize) as adeserialize:
+        await translate(consumer, ["basic", "staruml"], create_message(["basic", "staruml"], ids_of_edited_files=["staruml"]))
+
+    # Then
+    assert adeserialize.await_count == 2
+    assert stored_models["model"][1] is not None
+
+
+def test_when_file_failed_before_then_it_is_translated_again():
+    # Given
+    model_data = {"id": "model", "elements": {"classes": [{"id": "class"}]}, "diagrams": {}}
+    model_sources = UmlModelSourcesDTO(files=[
+        UmlFileContributionDTO(file_id="valid", elements_ids=["class"]),
+        UmlFileContributionDTO(file_id="invalid", failed=True),
+        UmlFileContributionDTO(file_id="edited"),
+    ])
+
+    # When
+    files_to_translate_ids = get_files_to_translate(["valid", "invalid", "edited", "new"], model_data, model_sources, ids_of_edited_files=["edited"])
+
+    # Then
+    assert files_to_translate_ids == ["invalid", "edited", "new"]
+
+
+def test_when_stored_element_has_no_source_then_whole_model_is_translated():
+    # Given
+    model_data = {"id": "model", "elements": {"classes": [{"id": "class"}, {"id": "unknown"}]}, "diagrams": {}}
+    model_sources = UmlModelSourcesDTO(files=[UmlFileContributionDTO(file_id="valid", elements_ids=["class"])])
+
+    # When
+    files_to_translate_ids = get_files_to_translate(["valid", "edited"], model_data, model_sources, ids_of_edited_files=["edited"])
+
+    # Then
+    assert files_to_translate_ids is None
@@ -0,0 +1,127 @@
+import json
+import os
+
+import pytest
+
+from umlars_translator.app.utils.json_stream import JsonStreamParser, JsonStreamError
+from umlars_translator.app.dtos.input import UmlModelDTO
+from umlars_translator.config import SupportedFormat
+
+
+JSON_DOCUMENT = {
+    "id": 12,
+    "name": "Car \"model\" \\ Łódź \U0001F697\n",
+    "values": [1, -2.5, 3e2, True, False, None, [], {}],
+    "source_files": [{"id": "first", "filename": "first.xml", "data": "<xmi>é\U0001F697</xmi>" * 3, "format": None}],
+}
+
+
+def rebuild_document(events):
+    """Builds the document back from the parsing events."""
+    stack, key, root = [], None, None
+
+    def add_value(value):
+        nonlocal root
+        if not stack:
+            root = value
+        elif isinstance(stack[-1], list):
+            stack[-1].append(value)
+        else:
+            stack[-1][key] = value
+
+    for _, event, value in events:
+        if event == "map_key":
+            key = value
+        elif event in ("start_map", "start_array"):
+            container = {} if event == "start_map" else []
+            add_value(container)
+            stack.append(container)
+        elif event in ("end_map", "end_array"):
+            stack.pop()
+        else:
+            add_value(value)
+    return root
+
+
+def parse_in_chunks(text, chunk_size, streamed_prefixes=()):
+    parser = JsonStreamParser(streamed_prefixes)
+    events = []
+    for chunk_start in range(0, len(text), chunk_size):
+        events.extend(parser.feed(text[chunk_start:chunk_start + chunk_size]))
+    return events + parser.close()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 7, 1000])
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+def test_when_document_parsed_in_chunks_then_events_describe_it(chunk_size, ensure_ascii):
+    # Given
+    text = json.dumps(JSON_DOCUMENT, ensure_ascii=ensure_ascii, indent=1)
+
+    # When
+    events = parse_in_chunks(text, chunk_size)
+
+    # Then
+    assert rebuild_document(events) == JSON_DOCUMENT
+    assert ("source_files.item", "map_key", "filename") in events
+    assert ("source_files.item.filename", "string", "first.xml") in events
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+def test_when_string_prefix_streamed_then_string_is_returned_in_parts(chunk_size):
+    # When
+    events = parse_in_chunks(json.dumps(JSON_DOCUMENT), chunk_size, streamed_prefixes=["source_files.item.data"])
+
+    # Then
+    data_events = [(event, value) for prefix, event, value in events if prefix == "source_files.item.data"]
+    assert data_events[-1] == ("end_string", None)
+    assert "".join(value for _, value in data_events[:-1]) == JSON_DOCUMENT["source_files"][0]["data"]
+    if chunk_size == 1:
+        assert len(data_events) > 2
+
+
+@pytest.mark.parametrize("text", ['{"id": 1', '{"id" 1}', '[1,]', '{"id": tru}', '"unterminated', '[1] 2'])
+def test_when_document_is_invalid_then_error_is_raised(text):
+    with pytest.raises(JsonStreamError):
+        parse_in_chunks(text, 2)
+
+
+async def iter_chunks(data, chunk_size):
+    for chunk_start in range(0, len(data), chunk_size):
+        yield data[chunk_start:chunk_start + chunk_size]
+
+
+@pytest.mark.asyncio
+async def test_when_model_read_from_stream_then_big_files_are_spooled_to_temporary_files(tmp_path):
+    # Given
+    small_file_data = '<?xml version="1.0" encoding="windows-1250"?><name>Łódź</name>'
+    big_file_data = small_file_data + " " * 100
+    response_body = json.dumps({"id": "model", "source_files": [
+        {"id": "small", "filename": "small.xml", "data": small_file_data},
+        {"id": "big", "filename": "big.xml", "data": big_file_data, "format": "xmi_ea"},
+    ]}).encode()
+
+    # When
+    uml_model = await UmlModelDTO.from_json_stream(iter_chunks(response_body, 7), spool_min_size=100, spool_dir=str(tmp_path))
+
+    # Then
+    small_file, big_file = uml_model.source_files
+    assert (small_file.data, small_file.data_file_path) == (small_file_data, None)
+    assert big_file.data is None and os.path.dirname(big_file.data_file_path) == str(tmp_path)
+    assert big_file.to_data_source().retrieved_data == big_file_data
+    assert big_file.format == SupportedFormat.XMI_EA
+
+    uml_model.release()
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.asyncio
+async def test_when_model_stream_is_invalid_then_spooled_files_are_removed(tmp_path):
+    # Given
+    response_body = json.dumps({"id": "model", "source_files": [{"id": "big", "filename": "big.xml", "data": " " * 200}]}).encode()[:-5]
+
+    # When
+    with pytest.raises(JsonStreamError):
+        await UmlModelDTO.from_json_stream(iter_chunks(response_body, 16), spool_min_size=100, spool_dir=str(tmp_path))
+
+    # Then
+    assert os.listdir(tmp_path) == []
@@ -1,5 +1,7 @@
-import pytest
+import asyncio
 import json
+
+import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from aio_pika import IncomingMessage
@@ -7,11 +9,26 @@ from pydantic import ValidationError
 
 from umlars_translator.app.exceptions import QueueUnavailableError, InputDataError
 from umlars_translator.app.adapters.message_brokers.rabbitmq_message_producer import RabbitMQProducer
-from umlars_translator.app.dtos.messages import ModelToTranslateMessage
+from umlars_translator.app.dtos.messages import ModelToTranslateMessage, ProcessStatusEnum
+from umlars_translator.app.dtos.input import UmlModelDTO, UmlFileDTO
 from umlars_translator.app.adapters.apis.rest_api_connector import RestApiConnector
 from umlars_translator.app.adapters.repositories.uml_model_repository import UmlModelRepository
 from umlars_translator.core.translator import ModelTranslator
-from umlars_translator.app.adapters.message_brokers.rabbitmq_message_consumer import RabbitMQConsumer
+from umlars_translator.core.translation_executor import TranslationExecutor
+from umlars_translator.core.deserialization.exceptions import TranslationDeadlineExceededError
+from umlars_translator.app.adapters.message_brokers.rabbitmq_message_consumer import RabbitMQConsumer, ModelTranslationResult, translate_model_in_worker
+from umlars_translator.app.adapters.message_brokers import config as messaging_config
+from umlars_translator.app import config as app_config
+
+
+EA_CAR_MODEL_FILE_PATH = "tests/core/deserializer/formats/ea_xmi/test_data/ea_car_model_xmi21-with-sequence.xml"
+
+
+def create_delivered_message(model_id, files_ids=("file",), **changes):
+    message = MagicMock()
+    message.body = json.dumps({"id": model_id, "ids_of_source_files": list(files_ids), **changes}).encode()
+    message.ack = AsyncMock()
+    return message
 
 
 @pytest.fixture
@@ -20,8 +37,11 @@ def mock_dependencies():
     uml_model_repository = AsyncMock(spec=UmlModelRepository)
     message_producer = AsyncMock(spec=RabbitMQProducer)
     model_translator = AsyncMock(spec=ModelTranslator)
+    translation_executor = AsyncMock(spec=TranslationExecutor)
+    translation_executor.uses_processes = False
     logger = MagicMock()
     return {
+        'translation_executor': translation_executor,
         'repository_api_connector': repository_api_connector,
         'uml_model_repository': uml_model_repository,
         'message_producer': message_producer,
@@ -38,7 +58,9 @@ def rabbitmq_consumer(mock_dependencies):
         uml_model_repository=mock_dependencies['uml_model_repository'],
         messaging_logger=mock_dependencies['logger'],
         model_translator=mock_dependencies['model_translator'],
-        message_producer=mock_dependencies['message_producer']
+        message_producer=mock_dependencies['message_producer'],
+        translation_executor=mock_dependencies['translation_executor'],
+        processing_slots=2,
     )
 
 
@@ -49,3 +71,189 @@ async def test_connect_channel(rabbitmq_consumer):
         mock_connect_robust.assert_called_once()
         assert rabbitmq_consumer._channel is not None
         assert rabbitmq_consumer._queue is not None
+
+
+@pytest.mark.asyncio
+async def test_when_file_translation_exceeds_budget_then_file_is_reported_as_failed_with_reason(rabbitmq_consumer, mock_dependencies):
+    # Given
+    uml_model = UmlModelDTO(id="model", source_files=[UmlFileDTO(id="file", filename="huge.xml", data="<xmi/>")])
+    mock_dependencies['model_translator'].adeserialize.side_effect = TranslationDeadlineExceededError("Translation exceeded its time limit of 5 s")
+
+    # When
+    await rabbitmq_consumer.process_message(uml_model, process_id="process")
+
+    # Then
+    [sent_message] = mock_dependencies['message_producer'].send_messages.call_args.args[0]
+    assert sent_message["state"] == ProcessStatusEnum.FAILED
+    assert sent_message["message"] == "Translation of file huge.xml was aborted: Translation exceeded its time limit of 5 s"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("uses_processes, expected_memory_limit", [(True, 1024), (False, None)])
+async def test_memory_limit_is_applied_only_to_translations_in_worker_processes(mock_dependencies, uses_processes, expected_memory_limit):
+    # Given
+    uml_model = UmlModelDTO(id="model", source_files=[UmlFileDTO(id="file", filename="car.xml", data="<xmi/>")])
+    mock_dependencies['translation_executor'].uses_processes = uses_processes
+    mock_dependencies['translation_executor'].run.return_value = ModelTranslationResult(MagicMock(), {}, MagicMock())
+    with patch.object(app_config, "TRANSLATION_FILE_MEMORY_LIMIT", 1024):
+        rabbitmq_consumer = RabbitMQConsumer(
+            queue_name='test_queue',
+            rabbitmq_host='localhost',
+            repository_api_connector=mock_dependencies['repository_api_connector'],
+            uml_model_repository=mock_dependencies['uml_model_repository'],
+            messaging_logger=mock_dependencies['logger'],
+            model_translator=mock_dependencies['model_translator'],
+            message_producer=mock_dependencies['message_producer'],
+            translation_executor=mock_dependencies['translation_executor'],
+            processing_slots=2,
+        )
+
+        # When
+        await rabbitmq_consumer.process_message(uml_model, process_id="process")
+
+    # Then
+    if uses_processes:
+        assert mock_dependencies['translation_executor'].run.call_args.args[3] == expected_memory_limit
+    else:
+        assert mock_dependencies['model_translator'].adeserialize.call_args.kwargs["memory_limit"] == expected_memory_limit
+
+
+def test_prefetch_count_is_bounded_by_processing_slots(rabbitmq_consumer):
+    assert rabbitmq_consumer.prefetch_count == 2 * messaging_config.MESSAGE_BROKER_CONSUMER_PREFETCH_PER_SLOT
+
+
+@pytest.mark.asyncio
+async def test_when_messages_delivered_then_at_most_processing_slots_are_processed_concurrently(rabbitmq_consumer):
+    # Given
+    processed_concurrently = 0
+    max_processed_concurrently = 0
+
+    async def translate_delivered_model(message, model_to_translate_message, process_id):
+        nonlocal processed_concurrently, max_processed_concurrently
+        processed_concurrently += 1
+        max_processed_concurrently = max(max_processed_concurrently, processed_concurrently)
+        await asyncio.sleep(0.01)
+        processed_concurrently -= 1
+
+    # When
+    with patch.object(rabbitmq_consumer, '_translate_delivered_model', new=translate_delivered_model):
+        await asyncio.gather(*(rabbitmq_consumer._callback(create_delivered_message(f"model_{index}")) for index in range(5)))
+
+    # Then
+    assert max_processed_concurrently == 2
+
+
+@pytest.mark.asyncio
+async def test_when_translated_in_worker_process_then_statuses_are_sent_and_model_is_saved(rabbitmq_consumer, mock_dependencies):
+    # Given
+    uml_model = UmlModelDTO(id="model", source_files=[
+        UmlFileDTO(id="valid", filename="valid.xml", data="<xmi/>"),
+        UmlFileDTO(id="invalid", filename="invalid.xml", data="<xmi/>"),
+    ])
+    translated_model = MagicMock()
+    model_sources = MagicMock()
+    mock_dependencies['translation_executor'].uses_processes = True
+    mock_dependencies['translation_executor'].run.return_value = ModelTranslationResult(
+        translated_model, {"invalid": "Failed to deserialize file invalid.xml"}, model_sources
+    )
+
+    # When
+    await rabbitmq_consumer.process_message(uml_model, process_id="process")
+
+    # Then
+    mock_dependencies['translation_executor'].run.assert_awaited_once_with(translate_model_in_worker, uml_model, None, None)
+    mock_dependencies['uml_model_repository'].save.assert_awaited_once_with(translated_model, model_sources)
+    mock_dependencies['message_producer'].send_messages.assert_awaited_once()
+    sent_states = {message["id"]: message["state"] for message in mock_dependencies['message_producer'].send_messages.call_args.args[0]}
+    assert sent_states == {"valid": ProcessStatusEnum.FINISHED, "invalid": ProcessStatusEnum.FAILED}
+
+
+def test_when_model_translated_in_worker_then_failed_files_are_skipped():
+    # Given
+    with open(EA_CAR_MODEL_FILE_PATH) as model_file:
+        uml_model = UmlModelDTO(id="model", source_files=[
+            UmlFileDTO(id="valid", filename="car.xml", data=model_file.read()),
+            UmlFileDTO(id="invalid", filename="invalid.xml", data="not a model"),
+        ])
+
+    # When
+    translated_model, files_errors_messages, model_sources = translate_model_in_worker(uml_model)
+
+    # Then
+    assert translated_model.id == "model"
+    assert translated_model.elements.classes
+    assert list(files_errors_messages) == ["invalid"]
+    assert [(file.file_id, file.failed) for file in model_sources.files] == [("valid", False), ("invalid", True)]
+    assert {element.id for element in translated_model.elements.classes} <= set(model_sources.files[0].elements_ids)
+
+
+@pytest.mark.asyncio
+async def test_when_model_translated_before_statuses_flush_then_running_states_are_coalesced_with_final_ones(rabbitmq_consumer, mock_dependencies):
+    # Given
+    message = MagicMock()
+    message.body = json.dumps({"id": "model", "ids_of_source_files": ["file"]}).encode()
+    message.ack = AsyncMock()
+    response_body = json.dumps({"id": "model", "source_files": [{"id": "file", "filename": "car.xml", "data": "<xmi/>"}]}).encode()
+
+    async def iter_response_body_chunks(url):
+        yield response_body[:20]
+        yield response_body[20:]
+
+    mock_dependencies['repository_api_connector'].iter_data_chunks = iter_response_body_chunks
+
+    # When
+    await rabbitmq_consumer._process_delivery(message)
+
+    # Then
+    message.ack.assert_awaited_once()
+    mock_dependencies['message_producer'].send_messages.assert_awaited_once()
+    [sent_message] = mock_dependencies['message_producer'].send_messages.call_args.args[0]
+    assert (sent_message["id"], sent_message["state"]) == ("file", ProcessStatusEnum.FINISHED)
+
+
+@pytest.mark.asyncio
+async def test_when_messages_of_model_delivered_during_its_translation_then_only_latest_is_translated_once(rabbitmq_consumer):
+    # Given
+    translation_started = asyncio.Event()
+    finish_translation = asyncio.Event()
+    translated_messages = []
+
+    async def translate_delivered_model(message, model_to_translate_message, process_id):
+        translated_messages.append(model_to_translate_message)
+        translation_started.set()
+        await finish_translation.wait()
+
+    first_message = create_delivered_message("model", ["a"], ids_of_new_submitted_files=["a"])
+    replaced_message = create_delivered_message("model", ["a", "b"], ids_of_new_submitted_files=["b"])
+    latest_message = create_delivered_message("model", ["a", "b"], ids_of_edited_files=["a"])
+
+    # When
+    with patch.object(rabbitmq_consumer, '_translate_delivered_model', new=translate_delivered_model):
+        first_delivery = asyncio.create_task(rabbitmq_consumer._callback(first_message))
+        await translation_started.wait()
+        replaced_delivery = asyncio.create_task(rabbitmq_consumer._callback(replaced_message))
+        latest_delivery = asyncio.create_task(rabbitmq_consumer._callback(latest_message))
+        await replaced_delivery
+        finish_translation.set()
+        await asyncio.gather(first_delivery, latest_delivery)
+
+    # Then
+    replaced_message.ack.assert_awaited_once()
+    assert len(translated_messages) == 2
+    assert translated_messages[1].ids_of_source_files == ["a", "b"]
+    assert translated_messages[1].ids_of_new_submitted_files == ["b"]
+    assert translated_messages[1].ids_of_edited_files == ["a"]
+    assert not rabbitmq_consumer._translations_coordinator.is_translated("model")
+
+
+def test_when_message_without_changes_coalesced_then_whole_model_is_translated():
+    # Given
+    full_translation_message = ModelToTranslateMessage(id="model", ids_of_source_files=["a"])
+    update_message = ModelToTranslateMessage(id="model", ids_of_source_files=["a", "b"], ids_of_new_submitted_files=["b"])
+
+    # When
+    coalesced_message = full_translation_message.coalesce(update_message)
+
+    # Then
+    assert coalesced_message.ids_of_source_files == ["a", "b"]
+    assert coalesced_message.ids_of_new_submitted_files is None
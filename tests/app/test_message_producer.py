@@ -0,0 +1,142 @@
+import asyncio
+import logging
+import time
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from umlars_translator.app.adapters.message_brokers.rabbitmq_message_producer import RabbitMQProducer, send_translated_models_messages
+from umlars_translator.app.dtos.messages import ProcessStatusEnum
+
+
+# Simulated network round trip to the broker
+BROKER_ROUND_TRIP_TIME = 0.002
+MESSAGES_COUNT = 200
+
+logger = logging.getLogger(__name__)
+
+
+class FakeBroker:
+    """
+    Counts the broker operations and delays each of them by the round trip.
+    The connection handshake takes a few round trips, the confirms of the concurrently published messages come together.
+    """
+    def __init__(self):
+        self.connections_count = 0
+        self.channels_count = 0
+        self.declared_queues = []
+        self.published_messages = []
+
+    async def connect_robust(self, **kwargs):
+        await asyncio.sleep(3 * BROKER_ROUND_TRIP_TIME)
+        self.connections_count += 1
+        return FakeConnection(self)
+
+
+class FakeConnection:
+    def __init__(self, broker):
+        self._broker = broker
+        self.is_closed = False
+
+    async def channel(self, publisher_confirms=True):
+        assert publisher_confirms
+        await asyncio.sleep(BROKER_ROUND_TRIP_TIME)
+        self._broker.channels_count += 1
+        return FakeChannel(self._broker)
+
+    async def close(self):
+        self.is_closed = True
+
+
+class FakeChannel:
+    def __init__(self, broker):
+        self._broker = broker
+        self.is_closed = False
+        self.default_exchange = MagicMock()
+        self.default_exchange.publish = self._publish
+
+    async def declare_queue(self, queue_name, durable=True):
+        await asyncio.sleep(BROKER_ROUND_TRIP_TIME)
+        self._broker.declared_queues.append(queue_name)
+
+    async def _publish(self, message, routing_key):
+        await asyncio.sleep(BROKER_ROUND_TRIP_TIME)
+        self._broker.published_messages.append((routing_key, message.body))
+
+    async def close(self):
+        self.is_closed = True
+
+
+@pytest.fixture
+def broker():
+    broker = FakeBroker()
+    with patch("aio_pika.connect_robust", new=broker.connect_robust):
+        yield broker
+
+
+@pytest.fixture
+def producer():
+    return RabbitMQProducer(queue_name="translated_models", rabbitmq_host="localhost", messaging_logger=MagicMock(), channel_pool_size=2)
+
+
+def create_messages(count):
+    return [{"id": str(message_number), "process_id": "process", "state": ProcessStatusEnum.RUNNING} for message_number in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_when_many_messages_sent_then_connection_is_established_and_queue_declared_once(broker, producer):
+    # When
+    await asyncio.gather(*(producer.send_message(message) for message in create_messages(10)))
+
+    # Then
+    assert broker.connections_count == 1
+    assert broker.channels_count <= 2
+    assert broker.declared_queues == ["translated_models"]
+    assert len(broker.published_messages) == 10
+
+
+@pytest.mark.asyncio
+async def test_when_messages_sent_in_batch_then_they_are_published_through_one_channel(broker, producer):
+    # When
+    await send_translated_models_messages(create_messages(5), producer)
+
+    # Then
+    assert broker.channels_count == 1
+    assert [routing_key for routing_key, _ in broker.published_messages] == ["translated_models"] * 5
+
+
+@pytest.mark.asyncio
+async def test_when_producer_closed_then_it_connects_again_on_next_send(broker, producer):
+    # Given
+    await producer.send_message(create_messages(1)[0])
+
+    # When
+    await producer.close()
+    await producer.send_message(create_messages(1)[0])
+
+    # Then
+    assert broker.connections_count == 2
+    assert broker.declared_queues == ["translated_models"] * 2
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_publishing_throughput(broker, producer):
+    messages = create_messages(MESSAGES_COUNT)
+
+    # Connection per message - as each message was sent before the producer was shared
+    start_time = time.perf_counter()
+    for message in messages[:MESSAGES_COUNT // 10]:
+        await producer.send_message(message)
+        await producer.close()
+    connection_per_message_throughput = (MESSAGES_COUNT // 10) / (time.perf_counter() - start_time)
+
+    # Shared connection, batched confirms
+    start_time = time.perf_counter()
+    await producer.send_messages(messages)
+    shared_connection_throughput = MESSAGES_COUNT / (time.perf_counter() - start_time)
+    await producer.close()
+
+    logger.info(f"Connection per message: {connection_per_message_throughput:.0f} messages/s")
+    logger.info(f"Shared connection with batched confirms: {shared_connection_throughput:.0f} messages/s")
+    assert shared_connection_throughput > connection_per_message_throughput
@@ -0,0 +1,113 @@
+import gzip
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from kink import di
+from fastapi.testclient import TestClient
+
+from umlars_translator.app.main import app, get_uml_model_repository
+from umlars_translator.app.adapters.repositories.uml_model_repository import UmlModelRepository
+from umlars_translator.app.adapters.repositories.mongo_uml_model_repository import MongoDBUmlModelRepository
+
+
+CLASSES_DATA = [{"id": "class", "name": "Car", "visibility": "public", "attributes": []}]
+DIAGRAM_DATA = {"id": "diagram", "name": "Main", "elements": {"classes": [{"idref": "class"}]}}
+
+
+@pytest.fixture
+def model_repository():
+    model_repository = AsyncMock(spec=UmlModelRepository)
+    di[UmlModelRepository] = model_repository
+    yield model_repository
+    di[UmlModelRepository] = lambda _: get_uml_model_repository()
+
+
+@pytest.fixture
+def api_client():
+    return TestClient(app)
+
+
+def test_when_fields_requested_then_only_they_are_read_and_returned_as_stored(api_client, model_repository):
+    # Given
+    model_repository.get_raw.return_value = {"id": "model", "elements": {"classes": CLASSES_DATA}}
+
+    # When
+    response = api_client.get("/uml-models/model", params={"fields": "elements.classes,elements.classes.attributes"})
+
+    # Then
+    assert response.status_code == 200
+    assert response.json() == {"id": "model", "elements": {"classes": CLASSES_DATA}}
+    model_repository.get_raw.assert_awaited_once_with("model", ["elements.classes"])
+    model_repository.get.assert_not_awaited()
+
+
+@pytest.mark.parametrize("fields", ["_hashes", "elements.$", "unknown", "elements..classes"])
+def test_when_invalid_fields_requested_then_400_is_returned(api_client, model_repository, fields):
+    response = api_client.get("/uml-models/model", params={"fields": fields})
+
+    assert response.status_code == 400
+    model_repository.get_raw.assert_not_awaited()
+
+
+def test_when_diagram_requested_then_it_is_returned_compressed(api_client, model_repository):
+    # Given
+    model_repository.get_diagram_raw.return_value = DIAGRAM_DATA
+
+    # When
+    response = api_client.get("/uml-models/model/diagrams/diagram", headers={"Accept-Encoding": "gzip"})
+
+    # Then
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.json() == DIAGRAM_DATA
+    model_repository.get_diagram_raw.assert_awaited_once_with("model", "diagram")
+
+
+def test_when_diagram_does_not_exist_then_404_is_returned(api_client, model_repository):
+    model_repository.get_diagram_raw.return_value = None
+
+    assert api_client.get("/uml-models/model/diagrams/missing").status_code == 404
+
+
+@pytest.fixture
+def collection():
+    collection = MagicMock()
+    collection.find_one = AsyncMock()
+    return collection
+
+
+@pytest.fixture
+def mongo_model_repository(collection):
+    db_client = MagicMock()
+    db_client.__getitem__.return_value.__getitem__.return_value = collection
+    return MongoDBUmlModelRepository(db_client, "test_db", "test_collection")
+
+
+@pytest.mark.asyncio
+async def test_when_raw_fields_read_then_projection_is_used(mongo_model_repository, collection):
+    # Given
+    collection.find_one.return_value = {"_id": "model", "name": "Model"}
+
+    # When
+    model_data = await mongo_model_repository.get_raw("model", ["name"])
+
+    # Then
+    collection.find_one.assert_awaited_once_with({"_id": "model"}, {"name": 1})
+    assert model_data == {"id": "model", "name": "Model"}
+
+
+@pytest.mark.asyncio
+async def test_when_raw_diagram_read_then_it_is_filtered_by_database(mongo_model_repository, collection):
+    # Given
+    collection.aggregate.return_value.to_list = AsyncMock(return_value=[{"diagram": DIAGRAM_DATA}])
+
+    # When
+    diagram_data = await mongo_model_repository.get_diagram_raw("model", "diagram")
+
+    # Then
+    pipeline = collection.aggregate.call_args.args[0]
+    assert pipeline[0] == {"$match": {"_id": "model"}}
+    assert "$filter" in json.dumps(pipeline)
+    assert diagram_data == DIAGRAM_DATA
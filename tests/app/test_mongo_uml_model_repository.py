@@ -0,0 +1,158 @@
+import copy
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from pymongo import UpdateOne
+
+from umlars_translator.app.dtos.uml_model import UmlModel, UmlModelElements, UmlDiagrams, UmlClass
+from umlars_translator.app.adapters.repositories.mongo_uml_model_repository import MongoDBUmlModelRepository
+from umlars_translator.app.adapters.repositories.document_diff import HASHES_FIELD_NAME, compute_document_hashes, create_update
+
+
+def create_uml_model(classes_names, model_id="model", name="Model"):
+    # Classes renamed keep their ids - e.g. "B2" is the renamed "B"
+    classes = [UmlClass(id=f"class_{class_name[0]}", name=class_name) for class_name in classes_names]
+    return UmlModel(id=model_id, name=name, elements=UmlModelElements(classes=classes), diagrams=UmlDiagrams())
+
+
+def apply_update(document, update):
+    """Applies $set and $unset operators with the dotted paths, as the database does."""
+    document = copy.deepcopy(document)
+    for path, value in update.get("$set", {}).items():
+        *parents_names, field_name = path.split(".")
+        parent = document
+        for parent_name in parents_names:
+            parent = parent[int(parent_name)] if isinstance(parent, list) else parent[parent_name]
+        if isinstance(parent, list):
+            index = int(field_name)
+            parent.extend([None] * (index + 1 - len(parent)))
+            parent[index] = value
+        else:
+            parent[field_name] = value
+    for path in update.get("$unset", {}):
+        *parents_names, field_name = path.split(".")
+        parent = document
+        for parent_name in parents_names:
+            parent = parent[parent_name]
+        parent.pop(field_name, None)
+    return document
+
+
+def get_stored_document(uml_model):
+    document = uml_model.model_dump()
+    return document | {HASHES_FIELD_NAME: compute_document_hashes(document)}
+
+
+@pytest.mark.parametrize("new_classes_names, expected_set_paths", [
+    (["A", "B", "C"], set()),
+    (["A", "B2", "C"], {"elements.classes.1"}),
+    (["A", "B", "C", "D", "E"], {"elements.classes.3", "elements.classes.4"}),
+    (["A", "C"], {"elements.classes"}),
+    (["C", "B", "A"], {"elements.classes"}),
+])
+def test_when_model_changed_then_update_sets_only_changed_elements(new_classes_names, expected_set_paths):
+    # Given
+    stored_document = get_stored_document(create_uml_model(["A", "B", "C"]))
+    new_document = create_uml_model(new_classes_names).model_dump()
+
+    # When
+    update = create_update(new_document, compute_document_hashes(new_document), stored_document[HASHES_FIELD_NAME])
+
+    # Then
+    if not expected_set_paths:
+        assert update is None
+        return
+    assert {path for path in update["$set"] if not path.startswith(HASHES_FIELD_NAME)} == expected_set_paths
+    assert apply_update(stored_document, update) == new_document | {HASHES_FIELD_NAME: compute_document_hashes(new_document)}
+
+
+def test_when_field_removed_then_it_is_unset():
+    # Given
+    stored_document = get_stored_document(create_uml_model(["A"]))
+    new_document = create_uml_model(["A"]).model_dump()
+    del new_document["metadata"]
+
+    # When
+    update = create_update(new_document, compute_document_hashes(new_document), stored_document[HASHES_FIELD_NAME])
+
+    # Then
+    assert update == {"$unset": {"metadata": "", f"{HASHES_FIELD_NAME}.metadata": ""}}
+
+
+@pytest.fixture
+def collection():
+    collection = MagicMock()
+    collection.find_one = AsyncMock(return_value=None)
+    collection.update_one = AsyncMock(return_value=MagicMock(matched_count=1, upserted_id=None))
+    collection.bulk_write = AsyncMock(return_value=MagicMock(matched_count=2, upserted_count=0))
+    return collection
+
+
+@pytest.fixture
+def model_repository(collection):
+    db_client = MagicMock()
+    db_client.__getitem__.return_value.__getitem__.return_value = collection
+    return MongoDBUmlModelRepository(db_client, "test_db", "test_collection")
+
+
+@pytest.mark.asyncio
+async def test_when_model_not_stored_then_whole_model_is_upserted(model_repository, collection):
+    # When
+    await model_repository.save(create_uml_model(["A"]))
+
+    # Then
+    update_arguments = collection.update_one.call_args.kwargs
+    assert update_arguments["filter"] == {"_id": "model"}
+    assert update_arguments["upsert"]
+    assert update_arguments["update"]["$set"]["elements"]["classes"][0]["name"] == "A"
+
+
+@pytest.mark.asyncio
+async def test_when_stored_model_changed_then_update_is_guarded_by_revision(model_repository, collection):
+    # Given
+    collection.find_one.return_value = {"_id": "model", HASHES_FIELD_NAME: get_stored_document(create_uml_model(["A", "B"]))[HASHES_FIELD_NAME], "_revision": 3}
+
+    # When
+    await model_repository.save(create_uml_model(["A", "B2"]))
+
+    # Then
+    update_arguments = collection.update_one.call_args.kwargs
+    assert update_arguments["filter"] == {"_id": "model", "_revision": 3}
+    assert update_arguments["update"]["$set"].keys() == {"elements.classes.1", f"{HASHES_FIELD_NAME}.elements/classes.1"}
+    assert update_arguments["update"]["$inc"] == {"_revision": 1}
+
+
+@pytest.mark.asyncio
+async def test_when_stored_model_changed_concurrently_then_whole_model_is_set(model_repository, collection):
+    # Given
+    collection.find_one.return_value = {"_id": "model", HASHES_FIELD_NAME: get_stored_document(create_uml_model(["A"]))[HASHES_FIELD_NAME], "_revision": 3}
+    collection.update_one.side_effect = [MagicMock(matched_count=0, upserted_id=None), MagicMock(matched_count=1, upserted_id=None)]
+
+    # When
+    await model_repository.save(create_uml_model(["B"]))
+
+    # Then
+    assert collection.update_one.await_count == 2
+    assert collection.update_one.call_args.kwargs["filter"] == {"_id": "model"}
+    assert "elements" in collection.update_one.call_args.kwargs["update"]["$set"]
+
+
+@pytest.mark.asyncio
+async def test_when_many_models_saved_then_they_are_written_in_bulk(model_repository, collection):
+    # Given
+    stored_model = create_uml_model(["A"], model_id="stored")
+
+    async def find(*args):
+        yield {"_id": "stored", HASHES_FIELD_NAME: get_stored_document(stored_model)[HASHES_FIELD_NAME], "_revision": 1}
+
+    collection.find = find
+
+    # When
+    await model_repository.save_many([create_uml_model(["A"], model_id="new"), create_uml_model(["A", "B"], model_id="stored")])
+
+    # Then
+    update_operations = collection.bulk_write.call_args.args[0]
+    assert all(isinstance(update_operation, UpdateOne) for update_operation in update_operations)
+    assert [update_operation._filter for update_operation in update_operations] == [{"_id": "new"}, {"_id": "stored", "_revision": 1}]
+    collection.update_one.assert_not_awaited()
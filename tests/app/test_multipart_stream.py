@@ -0,0 +1,103 @@
+import os
+
+import pytest
+
+from umlars_translator.app.utils.multipart_stream import MultipartStreamParser, MultipartStreamError, get_multipart_boundary
+from umlars_translator.app.dtos.input import UmlModelDTO
+from umlars_translator.app.exceptions import PayloadTooLargeError
+from umlars_translator.config import SupportedFormat
+
+
+BOUNDARY = b"boundary42"
+FILE_DATA = "<xmi>é\U0001F697\r\n--boundary4</xmi>" * 3
+MULTIPART_BODY = (
+    b"preamble\r\n"
+    b"--boundary42\r\n"
+    b'Content-Disposition: form-data; name="id"\r\n\r\n'
+    b"model\r\n"
+    b"--boundary42\r\n"
+    b'Content-Disposition: form-data; name="format"\r\n\r\n'
+    b"xmi_ea\r\n"
+    b"--boundary42\r\n"
+    b'Content-Disposition: form-data; name="files"; filename="car.xml"\r\n'
+    b"Content-Type: application/xml\r\n\r\n"
+    + FILE_DATA.encode() +
+    b"\r\n--boundary42--\r\n"
+    b"epilogue"
+)
+
+
+async def iter_chunks(data, chunk_size):
+    for start in range(0, len(data), chunk_size):
+        yield data[start:start + chunk_size]
+
+
+def parse(body, chunk_size):
+    parser = MultipartStreamParser(BOUNDARY)
+    events = []
+    for start in range(0, len(body), chunk_size):
+        for event, value in parser.feed(body[start:start + chunk_size]):
+            if event == "part_data" and events[-1][0] == "part_data":
+                events[-1] = (event, events[-1][1] + value)
+            else:
+                events.append((event, value))
+    parser.close()
+    return events
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 13, len(MULTIPART_BODY)])
+def test_when_body_fed_in_chunks_then_parts_are_parsed(chunk_size):
+    # When
+    events = parse(MULTIPART_BODY, chunk_size)
+
+    # Then
+    assert [event for event, _ in events] == ["part_start", "part_data", "part_end"] * 3
+    assert events[0][1] == {"content-disposition": 'form-data; name="id"'}
+    assert events[1][1] == b"model"
+    assert events[6][1]["content-type"] == "application/xml"
+    assert events[7][1] == FILE_DATA.encode()
+
+
+def test_when_body_ends_before_closing_boundary_then_error_is_raised():
+    parser = MultipartStreamParser(BOUNDARY)
+    parser.feed(MULTIPART_BODY[:-30])
+
+    with pytest.raises(MultipartStreamError):
+        parser.close()
+
+
+@pytest.mark.parametrize("content_type, expected_boundary", [
+    ('multipart/form-data; boundary="boundary42"', b"boundary42"),
+    ("multipart/form-data; charset=utf-8; boundary=boundary42", b"boundary42"),
+    ("application/json", None),
+    (None, None),
+])
+def test_get_multipart_boundary(content_type, expected_boundary):
+    assert get_multipart_boundary(content_type) == expected_boundary
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("spool_min_size", [1, 10 * 1024 * 1024])
+async def test_when_model_read_from_multipart_stream_then_files_are_spooled(spool_min_size, tmp_path):
+    # When
+    uml_model = await UmlModelDTO.from_multipart_stream(
+        iter_chunks(MULTIPART_BODY, 7), BOUNDARY, default_id="default", spool_min_size=spool_min_size, spool_dir=str(tmp_path)
+    )
+
+    # Then
+    [source_file] = uml_model.source_files
+    assert uml_model.id == "model"
+    assert (source_file.filename, source_file.format) == ("car.xml", SupportedFormat.XMI_EA)
+    assert source_file.to_data_source().retrieved_data == FILE_DATA
+    uml_model.release()
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.asyncio
+async def test_when_body_exceeds_max_size_then_spooled_files_are_removed(tmp_path):
+    with pytest.raises(PayloadTooLargeError):
+        await UmlModelDTO.from_multipart_stream(
+            iter_chunks(MULTIPART_BODY, 7), BOUNDARY, default_id="default", max_size=len(MULTIPART_BODY) - 20, spool_min_size=1, spool_dir=str(tmp_path)
+        )
+
+    assert os.listdir(tmp_path) == []
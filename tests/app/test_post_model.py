@@ -1,19 +1,145 @@
-# # test_when_body_contains_id_and_name_then_return_200_status_code
-# # test_when_body_contains_unassigned_id_and_name_then_return_assigned_id
-# # test_when_body_contains_assigned_id_and_name_then_return_updated_model
-# from fastapi.testclient import TestClient
+import gzip
+import json
 
+import pytest
+from unittest.mock import AsyncMock, patch
 
-# def test_when_body_contains_id_and_name_then_return_200_status_code(client: TestClient) -> None:
-#     # Given
-#     body = {
-#         "id": "1",
-#         "name": "test"
-#     }
+from kink import di
+from fastapi.testclient import TestClient
 
-#     # When
-#     response = client.post("/uml-models", json=body)
+from umlars_translator.app import config
+from umlars_translator.app.main import app, get_uml_model_repository
+from umlars_translator.app.adapters.repositories.uml_model_repository import UmlModelRepository
 
-#     # Then
-#     assert response.status_code == 200
-#     assert response.json() == body
\ No newline at end of file
+
+EA_CAR_MODEL_FILE_PATH = "tests/core/deserializer/formats/ea_xmi/test_data/ea_xmi_car-model-xmi-21.xml"
+STARUML_CAR_MODEL_FILE_PATH = "tests/core/deserializer/formats/staruml_mdj/test_data/staruml-car-model-with-sequence.mdj"
+
+
+@pytest.fixture
+def model_repository():
+    return AsyncMock(spec=UmlModelRepository)
+
+
+@pytest.fixture
+def api_client(model_repository):
+    di[UmlModelRepository] = model_repository
+    yield TestClient(app)
+    di[UmlModelRepository] = lambda _: get_uml_model_repository()
+
+
+def read_file(file_path):
+    with open(file_path, "rb") as source_file:
+        return source_file.read()
+
+
+def test_when_files_uploaded_then_translated_model_is_saved_and_returned(api_client, model_repository):
+    # Given
+    files = [
+        ("files", ("car.xml", read_file(EA_CAR_MODEL_FILE_PATH), "application/xml")),
+        ("files", ("car.mdj", read_file(STARUML_CAR_MODEL_FILE_PATH), "application/json")),
+    ]
+
+    # When
+    response = api_client.post("/uml-models", data={"id": "model"}, files=files, headers={"Accept-Encoding": "gzip"})
+
+    # Then
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Location"] == "/uml-models/model"
+    assert "X-Failed-Files" not in response.headers
+    translated_model, model_sources = model_repository.save.await_args.args
+    assert response.json() == translated_model.model_dump(mode="json")
+    assert response.json()["id"] == "model"
+    assert [file.file_id for file in model_sources.files] == ["0", "1"]
+
+
+def test_when_file_in_other_encoding_than_utf_8_uploaded_then_encoding_declared_in_it_is_used(api_client):
+    # Given
+    model_data = read_file(EA_CAR_MODEL_FILE_PATH).replace(b'name="Driver"', 'name="Conducteur pressé"'.encode("windows-1252"))
+    files = [("files", ("car.xml", model_data, "application/xml"))]
+
+    # When
+    response = api_client.post("/uml-models", files=files)
+
+    # Then
+    assert response.status_code == 200
+    assert "X-Failed-Files" not in response.headers
+    assert "Conducteur pressé" in [uml_class["name"] for uml_class in response.json()["elements"]["classes"]]
+
+
+def test_when_some_files_failed_then_they_are_listed_in_header(api_client):
+    # Given
+    files = [
+        ("files", ("car.xml", read_file(EA_CAR_MODEL_FILE_PATH), "application/xml")),
+        ("files", ("invalid.xml", b"not a model", "application/xml")),
+    ]
+
+    # When
+    response = api_client.post("/uml-models", files=files)
+
+    # Then
+    assert response.status_code == 200
+    assert json.loads(response.headers["X-Failed-Files"]) == ["invalid.xml"]
+    assert response.json()["elements"]["classes"]
+
+
+def test_when_all_files_failed_then_422_is_returned(api_client, model_repository):
+    # When
+    response = api_client.post("/uml-models", files=[("files", ("invalid.xml", b"not a model", "application/xml"))])
+
+    # Then
+    assert response.status_code == 422
+    assert [failed_file["filename"] for failed_file in response.json()["detail"].values()] == ["invalid.xml"]
+    model_repository.save.assert_not_awaited()
+
+
+def test_when_files_with_same_name_failed_then_each_of_them_is_reported(api_client, model_repository):
+    # Given
+    files = [
+        ("files", ("model.xml", read_file(EA_CAR_MODEL_FILE_PATH), "application/xml")),
+        ("files", ("model.xml", b"not a model", "application/xml")),
+        ("files", ("model.xml", b"not a model either", "application/xml")),
+    ]
+
+    # When
+    response = api_client.post("/uml-models", files=files)
+
+    # Then
+    assert response.status_code == 200
+    assert json.loads(response.headers["X-Failed-Files"]) == ["model.xml", "model.xml"]
+    model_repository.save.assert_awaited_once()
+
+
+def test_when_upload_exceeds_limit_then_413_is_returned(api_client, model_repository):
+    # Given
+    files = [("files", ("car.xml", read_file(EA_CAR_MODEL_FILE_PATH), "application/xml"))]
+
+    # When
+    with patch.object(config, "TRANSLATION_API_MAX_UPLOAD_SIZE", 1024):
+        response = api_client.post("/uml-models", files=files)
+
+    # Then
+    assert response.status_code == 413
+    model_repository.save.assert_not_awaited()
+
+
+def test_when_all_translation_slots_are_taken_then_503_is_returned(api_client):
+    # Given
+    files = [("files", ("car.xml", read_file(EA_CAR_MODEL_FILE_PATH), "application/xml"))]
+
+    # When
+    with patch("umlars_translator.app.main.translation_requests_slots.locked", return_value=True):
+        response = api_client.post("/uml-models", files=files)
+
+    # Then
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == str(config.TRANSLATION_API_RETRY_AFTER)
+
+
+def test_when_body_is_not_multipart_then_415_is_returned(api_client):
+    # When
+    response = api_client.post("/uml-models", json={"id": "model", "name": "Model"})
+
+    # Then
+    assert response.status_code == 415
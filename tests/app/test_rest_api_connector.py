@@ -0,0 +1,125 @@
+import asyncio
+import gzip
+import json
+import logging
+import time
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from unittest.mock import MagicMock
+
+from umlars_translator.app.adapters.apis.rest_api_connector import RestApiConnector
+from umlars_translator.app.adapters.apis.api_connector import ServiceConnectionData
+from umlars_translator.app.exceptions import ExternalServiceOperationError
+
+
+MODELS_COUNT = 100
+MODEL_PAYLOAD = {"id": "model", "source_files": [{"id": str(file_number), "filename": f"model_{file_number}.xml", "data": "<xmi:XMI/>" * 50} for file_number in range(10)]}
+
+logger = logging.getLogger(__name__)
+
+
+class RepositoryServiceStandIn:
+    """
+    Local stand-in of the repository service. Records the connections the requests came through and the requests headers.
+    """
+    def __init__(self):
+        self.connections = set()
+        self.requests_headers = []
+        self.app = web.Application()
+        self.app.router.add_get("/models/{model_id}", self.get_model)
+
+    async def get_model(self, request):
+        self.connections.add(id(request.transport))
+        self.requests_headers.append(request.headers)
+        if request.match_info["model_id"] == "missing":
+            return web.Response(status=404)
+
+        body = json.dumps(MODEL_PAYLOAD | {"id": request.match_info["model_id"], "query": dict(request.query)}).encode()
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            return web.Response(body=gzip.compress(body), content_type="application/json", headers={"Content-Encoding": "gzip"})
+        return web.Response(body=body, content_type="application/json")
+
+
+@pytest_asyncio.fixture
+async def repository_service():
+    repository_service = RepositoryServiceStandIn()
+    server = TestServer(repository_service.app)
+    # Access log would drown the throughput reported by the benchmark
+    await server.start_server(access_log=None)
+    repository_service.url = str(server.make_url("/models"))
+    yield repository_service
+    await server.close()
+
+
+@pytest_asyncio.fixture
+async def api_connector(repository_service):
+    api_connector = RestApiConnector(repository_service.url, ServiceConnectionData(jwt="token"), MagicMock(), max_concurrent_requests=5)
+    yield api_connector
+    await api_connector.close()
+
+
+def get_models_urls(repository_service, count):
+    return [f"{repository_service.url}/{model_number}" for model_number in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_when_data_fetched_then_compressed_response_is_decoded(repository_service, api_connector):
+    # When
+    response_body = await api_connector.get_data(f"{repository_service.url}/model")
+
+    # Then
+    assert response_body["id"] == "model"
+    assert response_body["query"] == {"format": "json"}
+    assert "gzip" in repository_service.requests_headers[0]["Accept-Encoding"]
+    assert repository_service.requests_headers[0]["Authorization"] == "Bearer token"
+
+
+@pytest.mark.asyncio
+async def test_when_many_data_fetched_then_connections_are_reused(repository_service, api_connector):
+    # When
+    responses_bodies = await api_connector.get_many_data(get_models_urls(repository_service, 20))
+
+    # Then
+    assert [response_body["id"] for response_body in responses_bodies] == [str(model_number) for model_number in range(20)]
+    assert len(repository_service.connections) <= 5
+
+
+@pytest.mark.asyncio
+async def test_when_fetching_many_data_fails_then_errors_are_returned_in_place_of_results(repository_service, api_connector):
+    # When
+    responses_bodies = await api_connector.get_many_data([f"{repository_service.url}/model", f"{repository_service.url}/missing"], return_exceptions=True)
+
+    # Then
+    assert responses_bodies[0]["id"] == "model"
+    assert isinstance(responses_bodies[1], ExternalServiceOperationError)
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_fetching_throughput(repository_service, api_connector):
+    models_urls = get_models_urls(repository_service, MODELS_COUNT)
+
+    # Session per request - as each model was fetched before the session was shared
+    async def get_data_in_new_session(url):
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url, params={"format": "json"}) as response:
+                return await response.json()
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(get_data_in_new_session(url) for url in models_urls))
+    session_per_request_throughput = MODELS_COUNT / (time.perf_counter() - start_time)
+    session_per_request_connections_count = len(repository_service.connections)
+
+    # Shared session
+    repository_service.connections.clear()
+    start_time = time.perf_counter()
+    await api_connector.get_many_data(models_urls)
+    shared_session_throughput = MODELS_COUNT / (time.perf_counter() - start_time)
+
+    logger.info(f"Session per request: {session_per_request_throughput:.0f} requests/s through {session_per_request_connections_count} connections")
+    logger.info(f"Shared session: {shared_session_throughput:.0f} requests/s through {len(repository_service.connections)} connections")
+    assert len(repository_service.connections) < session_per_request_connections_count
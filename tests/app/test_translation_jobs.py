@@ -0,0 +1,286 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from kink import di
+
+from umlars_translator.app.main import app, get_uml_model_repository
+from umlars_translator.app.adapters.repositories.uml_model_repository import UmlModelRepository
+from umlars_translator.app.adapters.message_brokers.rabbitmq_message_consumer import translate_model_in_worker
+from umlars_translator.app.dtos.input import UmlModelDTO, UmlFileDTO
+from umlars_translator.app.dtos.messages import ProcessStatusEnum
+from umlars_translator.app.dtos.translation_jobs import TranslationJobPriority
+from umlars_translator.app.services.translation_jobs import TranslationJobScheduler
+from umlars_translator.core.deserialization.translation_progress import TranslationProgress
+from umlars_translator.core.translation_executor import TranslationExecutor
+from umlars_translator.core.deserialization.exceptions import TranslationCancelledError
+
+
+EA_CAR_MODEL_FILE_PATH = "tests/core/deserializer/formats/ea_xmi/test_data/ea_xmi_car-model-xmi-21.xml"
+STARUML_CAR_MODEL_FILE_PATH = "tests/core/deserializer/formats/staruml_mdj/test_data/staruml-car-model-with-sequence.mdj"
+
+
+def read_file(file_path):
+    with open(file_path, "rb") as source_file:
+        return source_file.read()
+
+
+def create_uml_model_dto(model_id, files_paths=(EA_CAR_MODEL_FILE_PATH,)):
+    source_files = [
+        UmlFileDTO(id=file_index, filename=file_path.rsplit("/", 1)[-1], data=read_file(file_path).decode())
+        for file_index, file_path in enumerate(files_paths)
+    ]
+    return UmlModelDTO(id=model_id, source_files=source_files)
+
+
+class RecordedTranslationProgress(TranslationProgress):
+    def __init__(self) -> None:
+        super().__init__()
+        self.entered_pipes = set()
+
+    def enter_pipe(self, pipe_name: str) -> None:
+        super().enter_pipe(pipe_name)
+        self.entered_pipes.add(pipe_name)
+
+
+def create_job_scheduler(translation_executor, uml_model_repository, max_workers, max_heavy_workers=1):
+    return TranslationJobScheduler(
+        uml_model_repository=uml_model_repository, translation_executor=translation_executor, app_logger=MagicMock(),
+        max_workers=max_workers, max_heavy_workers=max_heavy_workers, max_queued_jobs=10, result_ttl=60,
+    )
+
+
+@pytest.fixture
+def model_repository():
+    stored_models = {}
+    model_repository = AsyncMock(spec=UmlModelRepository)
+
+    async def save(uml_model, model_sources=None):
+        stored_models[str(uml_model.id)] = uml_model
+
+    async def get_serialized(model_id, content_encoding=None):
+        return await UmlModelRepository.get_serialized(model_repository, model_id, content_encoding)
+
+    async def get_with_revision(model_id):
+        return (stored_models[model_id], 1) if model_id in stored_models else None
+
+    model_repository.save.side_effect = save
+    model_repository.get_serialized.side_effect = get_serialized
+    model_repository.get_with_revision.side_effect = get_with_revision
+    return model_repository
+
+
+@pytest.fixture
+def blocked_translation_executor():
+    """Executor whose translations wait until their model's event is set."""
+    translation_executor = AsyncMock(spec=TranslationExecutor)
+    translation_executor.started_models_ids = []
+    translation_executor.release_events = {}
+
+    async def run_in_thread(function, job, *args, **kwargs):
+        translation_executor.started_models_ids.append(job.uml_model.id)
+        await translation_executor.release_events.setdefault(job.uml_model.id, asyncio.Event()).wait()
+        return MagicMock(), {}, None
+
+    translation_executor.run_in_thread.side_effect = run_in_thread
+    return translation_executor
+
+
+@pytest.mark.asyncio
+async def test_when_heavy_jobs_fill_their_workers_then_interactive_job_is_started(blocked_translation_executor, model_repository):
+    # Given
+    job_scheduler = create_job_scheduler(blocked_translation_executor, model_repository, max_workers=2)
+    heavy_jobs = [job_scheduler.submit(create_uml_model_dto(f"heavy-{index}"), TranslationJobPriority.BATCH) for index in range(3)]
+
+    # When
+    interactive_job = job_scheduler.submit(create_uml_model_dto("interactive"), TranslationJobPriority.INTERACTIVE)
+    await asyncio.sleep(0)
+
+    # Then
+    assert blocked_translation_executor.started_models_ids == ["heavy-0", "interactive"]
+    assert [job.status for job in heavy_jobs] == [ProcessStatusEnum.RUNNING, ProcessStatusEnum.QUEUED, ProcessStatusEnum.QUEUED]
+    assert interactive_job.status == ProcessStatusEnum.RUNNING
+
+    # When
+    blocked_translation_executor.release_events["heavy-0"].set()
+    await asyncio.sleep(0.01)
+
+    # Then
+    assert blocked_translation_executor.started_models_ids == ["heavy-0", "interactive", "heavy-1"]
+    assert heavy_jobs[0].status == ProcessStatusEnum.FINISHED
+    await job_scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_when_workers_are_busy_then_interactive_jobs_are_started_before_heavy_ones(blocked_translation_executor, model_repository):
+    # Given
+    job_scheduler = create_job_scheduler(blocked_translation_executor, model_repository, max_workers=2)
+    job_scheduler.submit(create_uml_model_dto("first"), TranslationJobPriority.INTERACTIVE)
+    job_scheduler.submit(create_uml_model_dto("second"), TranslationJobPriority.INTERACTIVE)
+    job_scheduler.submit(create_uml_model_dto("heavy"), TranslationJobPriority.BATCH)
+    job_scheduler.submit(create_uml_model_dto("interactive"), TranslationJobPriority.INTERACTIVE)
+    await asyncio.sleep(0)
+
+    # When
+    blocked_translation_executor.release_events["first"].set()
+    await asyncio.sleep(0.01)
+
+    # Then
+    assert blocked_translation_executor.started_models_ids == ["first", "second", "interactive"]
+    await job_scheduler.close()
+
+
+@pytest.mark.parametrize("max_workers, max_heavy_workers", [(1, 1), (2, 2), (2, 3)])
+def test_when_heavy_jobs_could_take_all_workers_then_scheduler_is_rejected(model_repository, max_workers, max_heavy_workers):
+    with pytest.raises(ValueError, match="not all of the workers"):
+        create_job_scheduler(TranslationExecutor(), model_repository, max_workers=max_workers, max_heavy_workers=max_heavy_workers)
+
+
+def test_when_model_without_files_submitted_then_it_is_rejected(model_repository):
+    # Given
+    job_scheduler = create_job_scheduler(TranslationExecutor(), model_repository, max_workers=2)
+
+    # When
+    with pytest.raises(ValueError, match="no source files"):
+        job_scheduler.submit(UmlModelDTO(id="model", source_files=[]))
+
+    # Then
+    assert job_scheduler.get("model") is None and not job_scheduler.is_queue_full
+
+
+@pytest.mark.asyncio
+async def test_when_scheduler_closed_then_files_of_running_job_are_released_after_its_translation_stops(model_repository):
+    # Given
+    translation_started = threading.Event()
+    data_seen_by_translation = []
+
+    def translate_until_cancelled(uml_model, time_limit=None, memory_limit=None, translation_progress=None, cancel_event=None):
+        translation_started.set()
+        cancel_event.wait(5)
+        time.sleep(0.02)
+        data_seen_by_translation.append(uml_model.source_files[0].data)
+        raise TranslationCancelledError("Translation was cancelled")
+
+    job_scheduler = create_job_scheduler(None, model_repository, max_workers=2)
+    with patch("umlars_translator.app.services.translation_jobs.translate_model_in_worker", new=translate_until_cancelled):
+        translation_job = job_scheduler.submit(create_uml_model_dto("model"), TranslationJobPriority.INTERACTIVE)
+        await asyncio.to_thread(translation_started.wait, 5)
+
+        # When
+        await job_scheduler.close()
+
+    # Then
+    assert data_seen_by_translation and data_seen_by_translation[0]
+    assert translation_job.uml_model.source_files[0].data == ""
+    assert translation_job.status == ProcessStatusEnum.FAILED
+
+
+def test_when_model_translated_then_progress_is_reported():
+    # Given
+    uml_model = create_uml_model_dto("model", [EA_CAR_MODEL_FILE_PATH, STARUML_CAR_MODEL_FILE_PATH])
+    translation_progress = RecordedTranslationProgress()
+    translation_progress.files_total = len(uml_model.source_files)
+
+    # When
+    translation_result = translate_model_in_worker(uml_model, translation_progress=translation_progress)
+
+    # Then
+    assert translation_result.files_errors_messages == {}
+    assert (translation_progress.files_done, translation_progress.current_file) == (2, None)
+    assert translation_progress.elements_built >= sum(len(contribution.elements_ids) for contribution in translation_result.sources.files)
+    assert {"UmlClassPipe", "UmlSequenceDiagramPipe"} <= translation_progress.entered_pipes
+
+
+@pytest_asyncio.fixture
+async def api_client(model_repository):
+    job_scheduler = create_job_scheduler(None, model_repository, max_workers=2)
+    di[UmlModelRepository] = model_repository
+    di[TranslationJobScheduler] = job_scheduler
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as api_client:
+        yield api_client
+    await job_scheduler.close()
+    di[UmlModelRepository] = lambda _: get_uml_model_repository()
+    di[TranslationJobScheduler] = lambda _: TranslationJobScheduler()
+
+
+async def wait_for_job(api_client, job_location):
+    for _ in range(500):
+        response = await api_client.get(job_location)
+        if response.json()["state"] not in (ProcessStatusEnum.QUEUED, ProcessStatusEnum.RUNNING):
+            return response.json()
+        await asyncio.sleep(0.01)
+    raise AssertionError("Translation job wasn't finished")
+
+
+@pytest.mark.asyncio
+async def test_when_job_created_then_its_progress_and_result_can_be_polled(api_client, model_repository):
+    # Given
+    files = [
+        ("files", ("car.xml", read_file(EA_CAR_MODEL_FILE_PATH), "application/xml")),
+        ("files", ("invalid.xml", b"not a model", "application/xml")),
+    ]
+
+    # When
+    response = await api_client.post("/translation-jobs", data={"id": "model"}, files=files)
+
+    # Then
+    assert response.status_code == 202
+    assert response.json()["priority"] == TranslationJobPriority.INTERACTIVE
+    assert response.headers["Location"] == f"/translation-jobs/{response.json()['id']}"
+
+    # When
+    translation_job = await wait_for_job(api_client, response.headers["Location"])
+    result_response = await api_client.get(f"{response.headers['Location']}/result")
+
+    # Then
+    assert translation_job["state"] == ProcessStatusEnum.PARTIAL_SUCCESS
+    assert translation_job["failed_files"]["1"]["filename"] == "invalid.xml"
+    assert list(translation_job["failed_files"]) == ["1"]
+    assert translation_job["progress"]["files_done"] == translation_job["progress"]["files_total"] == 2
+    assert translation_job["progress"]["elements_built"] > 0
+    assert result_response.status_code == 200
+    assert result_response.json()["id"] == "model"
+    assert result_response.json()["elements"]["classes"]
+    assert result_response.headers["X-Failed-Files"] == '["invalid.xml"]'
+
+
+@pytest.mark.asyncio
+async def test_when_job_failed_then_its_result_is_422(api_client, model_repository):
+    # Given
+    response = await api_client.post("/translation-jobs", files=[("files", ("invalid.xml", b"not a model", "application/xml"))], params={"priority": "batch"})
+    await wait_for_job(api_client, response.headers["Location"])
+
+    # When
+    result_response = await api_client.get(f"{response.headers['Location']}/result")
+
+    # Then
+    assert response.json()["priority"] == TranslationJobPriority.BATCH
+    assert result_response.status_code == 422
+    assert [failed_file["filename"] for failed_file in result_response.json()["detail"]["failed_files"].values()] == ["invalid.xml"]
+    model_repository.save.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_when_job_not_found_then_404_is_returned(api_client):
+    # When
+    response = await api_client.get("/translation-jobs/unknown")
+
+    # Then
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_when_no_files_uploaded_then_400_is_returned(api_client, model_repository):
+    # When
+    body = b'--boundary\r\nContent-Disposition: form-data; name="id"\r\n\r\nmodel\r\n--boundary--\r\n'
+    response = await api_client.post("/translation-jobs", content=body, headers={"Content-Type": "multipart/form-data; boundary=boundary"})
+
+    # Then
+    assert response.status_code == 400
+    assert response.json()["detail"] == "No source files were uploaded"
+    model_repository.save.assert_not_awaited()
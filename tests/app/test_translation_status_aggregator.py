@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from umlars_translator.app.adapters.message_brokers.rabbitmq_message_producer import RabbitMQProducer, create_running_translation_message, create_successfull_translation_message
+from umlars_translator.app.adapters.message_brokers.translation_status_aggregator import TranslationStatusAggregator
+from umlars_translator.app.dtos.messages import ProcessStatusEnum, TranslatedFilesMessage
+
+
+@pytest.fixture
+def message_producer():
+    return AsyncMock(spec=RabbitMQProducer)
+
+
+def create_aggregator(message_producer, batch_messages=False, batch_max_size=10, batch_max_delay=10):
+    return TranslationStatusAggregator(
+        "process", message_producer, MagicMock(), batch_messages=batch_messages, batch_max_size=batch_max_size, batch_max_delay=batch_max_delay
+    )
+
+
+def get_sent_messages(message_producer):
+    return [message for call in message_producer.send_messages.call_args_list for message in call.args[0]]
+
+
+@pytest.mark.asyncio
+async def test_when_file_state_changed_before_flush_then_only_latest_state_is_sent(message_producer):
+    # Given
+    status_aggregator = create_aggregator(message_producer)
+
+    # When
+    async with status_aggregator:
+        await status_aggregator.add(create_running_translation_message(file_id="first", process_id="process"))
+        await status_aggregator.add(create_running_translation_message(file_id="second", process_id="process"))
+        await status_aggregator.add(create_successfull_translation_message(file_id="first", process_id="process"))
+
+    # Then
+    message_producer.send_messages.assert_awaited_once()
+    assert [(message["id"], message["state"]) for message in get_sent_messages(message_producer)] == [
+        ("second", ProcessStatusEnum.RUNNING), ("first", ProcessStatusEnum.FINISHED)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_when_batch_max_size_reached_then_states_are_flushed(message_producer):
+    # Given
+    status_aggregator = create_aggregator(message_producer, batch_max_size=2)
+
+    # When
+    await status_aggregator.add_all(create_running_translation_message(file_id=file_id, process_id="process") for file_id in ["first", "second", "third"])
+
+    # Then
+    assert [message["id"] for message in get_sent_messages(message_producer)] == ["first", "second"]
+    assert [file_state.id for file_state in status_aggregator.pending_files_states] == ["third"]
+    await status_aggregator.close()
+
+
+@pytest.mark.asyncio
+async def test_when_batch_max_delay_passed_then_states_are_flushed(message_producer):
+    # Given
+    status_aggregator = create_aggregator(message_producer, batch_max_delay=0.01)
+
+    # When
+    await status_aggregator.add(create_running_translation_message(file_id="first", process_id="process"))
+    await asyncio.sleep(0.05)
+
+    # Then
+    assert [message["id"] for message in get_sent_messages(message_producer)] == ["first"]
+    assert status_aggregator.pending_files_states == []
+
+
+@pytest.mark.asyncio
+async def test_when_batching_enabled_then_files_states_are_sent_in_messages_of_max_size(message_producer):
+    # Given
+    status_aggregator = create_aggregator(message_producer, batch_messages=True, batch_max_size=2)
+
+    # When
+    await status_aggregator.add_all(create_running_translation_message(file_id=file_id, process_id="process") for file_id in ["first", "second", "third"])
+    await status_aggregator.close()
+
+    # Then
+    sent_messages = [TranslatedFilesMessage(**message) for message in get_sent_messages(message_producer)]
+    assert [[file_state.id for file_state in message.files_states] for message in sent_messages] == [["first", "second"], ["third"]]
+    assert all(message.process_id == "process" for message in sent_messages)
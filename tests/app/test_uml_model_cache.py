@@ -0,0 +1,173 @@
+import asyncio
+import gzip
+
+import pytest
+from unittest.mock import AsyncMock
+
+from kink import di
+from fastapi.testclient import TestClient
+
+from umlars_translator.app.main import app, get_uml_model_repository
+from umlars_translator.app.dtos.uml_model import UmlModel, UmlModelElements, UmlDiagrams, UmlClass
+from umlars_translator.app.adapters.repositories.uml_model_repository import UmlModelRepository, SerializedUmlModel
+from umlars_translator.app.adapters.repositories.cached_uml_model_repository import CachedUmlModelRepository, UmlModelCache
+from umlars_translator.app.utils.functions import is_etag_matched
+from umlars_translator.core.serialization.compression import CompressionMethod
+
+
+def create_uml_model(model_id="model", name="Model"):
+    classes = [UmlClass(id=f"class_{index}", name=f"Class{index}") for index in range(10)]
+    return UmlModel(id=model_id, name=name, elements=UmlModelElements(classes=classes), diagrams=UmlDiagrams())
+
+
+@pytest.fixture
+def stored_model_repository():
+    stored_model_repository = AsyncMock(spec=UmlModelRepository)
+    stored_model_repository.get_with_revision.return_value = (create_uml_model(), 1)
+    return stored_model_repository
+
+
+@pytest.fixture
+def model_repository(stored_model_repository):
+    return CachedUmlModelRepository(stored_model_repository, UmlModelCache(max_entries=10, max_bytes=1024 * 1024, ttl=60))
+
+
+@pytest.fixture
+def api_client(model_repository):
+    di[UmlModelRepository] = model_repository
+    yield TestClient(app)
+    di[UmlModelRepository] = lambda _: get_uml_model_repository()
+
+
+@pytest.mark.asyncio
+async def test_when_model_read_again_then_it_is_returned_from_cache(model_repository, stored_model_repository):
+    # When
+    first_serialized_model = await model_repository.get_serialized("model")
+    second_serialized_model = await model_repository.get_serialized("model")
+
+    # Then
+    assert second_serialized_model is first_serialized_model
+    assert first_serialized_model.body == create_uml_model().model_dump_json().encode()
+    stored_model_repository.get_with_revision.assert_awaited_once_with("model")
+
+
+@pytest.mark.asyncio
+async def test_when_model_saved_then_it_is_read_again(model_repository, stored_model_repository):
+    # Given
+    await model_repository.get_serialized("model")
+    changed_model = create_uml_model(name="Changed")
+    stored_model_repository.get_with_revision.return_value = (changed_model, 2)
+
+    # When
+    await model_repository.save(changed_model)
+    serialized_model = await model_repository.get_serialized("model")
+
+    # Then
+    stored_model_repository.save.assert_awaited_once_with(changed_model, None)
+    assert serialized_model.revision == 2
+    assert b'"Changed"' in serialized_model.body
+
+
+@pytest.mark.asyncio
+async def test_when_model_saved_while_being_read_then_read_version_is_not_cached(model_repository, stored_model_repository):
+    # Given
+    read_started = asyncio.Event()
+    save_finished = asyncio.Event()
+
+    async def get_with_revision(model_id):
+        read_started.set()
+        await save_finished.wait()
+        return create_uml_model(), 1
+
+    stored_model_repository.get_with_revision.side_effect = get_with_revision
+
+    async def save():
+        await read_started.wait()
+        await model_repository.save(create_uml_model(name="Changed"))
+        save_finished.set()
+
+    # When
+    await asyncio.gather(model_repository.get_serialized("model"), save())
+
+    # Then
+    assert len(model_repository.cache) == 0
+
+
+def test_when_cache_is_full_then_least_recently_used_models_are_evicted():
+    # Given
+    serialized_models = [SerializedUmlModel.from_model(create_uml_model(model_id=f"model_{index}")) for index in range(3)]
+    cache = UmlModelCache(max_entries=10, max_bytes=2 * serialized_models[0].size + 1, ttl=60)
+    cache.put(serialized_models[0], cache.start_read())
+    cache.put(serialized_models[1], cache.start_read())
+
+    # When
+    cache.get("model_0")
+    cache.put(serialized_models[2], cache.start_read())
+
+    # Then
+    assert cache.get("model_0") is serialized_models[0]
+    assert cache.get("model_1") is None
+    assert cache.get("model_2") is serialized_models[2]
+    assert cache.size == serialized_models[0].size + serialized_models[2].size
+
+
+def test_when_model_requested_with_matching_etag_then_304_is_returned(api_client, stored_model_repository):
+    # Given
+    response = api_client.get("/uml-models/model")
+
+    # When
+    revalidation_response = api_client.get("/uml-models/model", headers={"If-None-Match": response.headers["ETag"]})
+
+    # Then
+    assert response.status_code == 200
+    assert response.json() == create_uml_model().model_dump(mode="json")
+    assert revalidation_response.status_code == 304
+    assert revalidation_response.headers["ETag"] == response.headers["ETag"]
+    assert revalidation_response.content == b""
+    stored_model_repository.get_with_revision.assert_awaited_once()
+
+
+def test_when_model_changed_then_etag_changes(api_client, stored_model_repository, model_repository):
+    # Given
+    etag = api_client.get("/uml-models/model").headers["ETag"]
+    stored_model_repository.get_with_revision.return_value = (create_uml_model(name="Changed"), 2)
+    asyncio.run(model_repository.save(create_uml_model(name="Changed")))
+
+    # When
+    response = api_client.get("/uml-models/model", headers={"If-None-Match": etag})
+
+    # Then
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["name"] == "Changed"
+
+
+def test_when_compressed_model_requested_then_compressed_body_has_own_etag(api_client):
+    # When
+    response = api_client.get("/uml-models/model", headers={"Accept-Encoding": "identity"})
+    compressed_response = api_client.get("/uml-models/model", headers={"Accept-Encoding": "gzip"})
+
+    # Then
+    assert "Content-Encoding" not in response.headers
+    assert compressed_response.headers["Content-Encoding"] == "gzip"
+    assert compressed_response.json() == response.json()
+    assert compressed_response.headers["ETag"] != response.headers["ETag"]
+
+
+@pytest.mark.parametrize("if_none_match, expected_result", [
+    (None, False),
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"other", "abc"', True),
+    ("*", True),
+    ('"abc-gzip"', False),
+])
+def test_is_etag_matched(if_none_match, expected_result):
+    assert is_etag_matched(if_none_match, '"abc"') == expected_result
+
+
+def test_when_compressed_body_requested_then_it_is_gzip_of_json():
+    serialized_model = SerializedUmlModel.from_model(create_uml_model())
+
+    assert gzip.decompress(serialized_model.get_body(CompressionMethod.GZIP)) == serialized_model.body
+    assert serialized_model.get_etag(CompressionMethod.GZIP) == f'"{serialized_model.content_hash}-gzip"'
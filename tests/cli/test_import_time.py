@@ -0,0 +1,53 @@
+import logging
+import subprocess
+import sys
+
+import pytest
+
+
+CLI_MODULE = "umlars_translator.cli.cli_manager"
+# Modules of the REST API service, which aren't needed for translating files
+SERVICE_MODULES = ["umlars_translator.app.main", "fastapi", "uvicorn", "motor", "aio_pika", "aiohttp"]
+
+logger = logging.getLogger(__name__)
+
+
+def measure_import_time(module_name: str) -> dict[str, int]:
+    """
+    Imports the module in a fresh interpreter with `-X importtime`.
+    Returns cumulative import time (in microseconds) of each imported module.
+    """
+    completed_process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imports_times = {}
+    for line in completed_process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_time, imported_module = line.removeprefix("import time:").split("|")
+        imports_times[imported_module.strip()] = int(cumulative_time)
+    return imports_times
+
+
+@pytest.fixture(scope="module")
+def cli_imports_times():
+    return measure_import_time(CLI_MODULE)
+
+
+@pytest.mark.parametrize("service_module", SERVICE_MODULES)
+def test_when_cli_imported_then_service_stack_is_not_imported(cli_imports_times, service_module):
+    assert service_module not in cli_imports_times
+
+
+@pytest.mark.benchmark
+def test_cli_cold_start_import_time(cli_imports_times):
+    cli_import_time = cli_imports_times[CLI_MODULE]
+
+    logger.info(f"{CLI_MODULE} cold start import time: {cli_import_time / 1000:.1f} ms")
+    for module_name, import_time in sorted(cli_imports_times.items(), key=lambda item: item[1], reverse=True)[:10]:
+        logger.info(f"{import_time / 1000:10.1f} ms  {module_name}")
+
+    assert cli_import_time > 0
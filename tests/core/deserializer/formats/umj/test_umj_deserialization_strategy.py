@@ -0,0 +1,217 @@
+import glob
+import json
+
+import pytest
+
+from kink import di
+
+from umlars_translator.core.deserialization.formats.umj.umj_deserialization_strategy import (
+    UmjDeserializationStrategy,
+)
+from umlars_translator.core.deserialization.formats.umj.umj_model_processing_pipeline import UmlModelPipe
+from umlars_translator.core.deserialization.formats.umj.umj_format_detection_pipeline import UmjDetectionPipe
+from umlars_translator.core.deserialization.input_processor import InputProcessor
+from umlars_translator.core.translator import ModelTranslator
+from umlars_translator.core.model.umlars_model.uml_model_builder import UmlModelBuilder
+from umlars_translator.core.model.umlars_model.uml_elements import UmlCombinedFragment, UmlOccurrenceSpecification
+from umlars_translator.core.model.constants import UmlVisibilityEnum, UmlInteractionOperatorEnum
+from umlars_translator.config import SupportedFormat
+from umlars_translator.app.dtos.uml_model import FULL_ASSOCIATION_ENDS_CONTEXT
+
+
+EA_CAR_MODEL_FILE_PATH = "tests/core/deserializer/formats/ea_xmi/test_data/ea_car_model_xmi21-with-sequence.xml"
+STARUML_CAR_MODEL_FILE_PATH = "tests/core/deserializer/formats/staruml_mdj/test_data/staruml-car-model-with-sequence.mdj"
+EA_TEST_DATA_DIRECTORY = "tests/core/deserializer/formats/ea_xmi/test_data"
+PAPYRUS_CAR_MODEL_FILES_PATHS = [
+    "tests/core/deserializer/formats/papyrus_xmi/test_data/eclipse-papyrus-car-model-with-sequence.uml",
+    "tests/core/deserializer/formats/papyrus_xmi/test_data/eclipse-papyrus-car-model-with-sequence.notation",
+]
+
+UMJ_MODEL = {
+    "id": "model",
+    "name": "Vehicles",
+    "visibility": "public",
+    "metadata": {"exporter": "umlars"},
+    "elements": {
+        "classes": [
+            {"id": "vehicle", "name": "Vehicle", "visibility": "public", "attributes": [], "operations": []},
+            {
+                "id": "car", "name": "Car", "visibility": "private",
+                "attributes": [{"id": "car-owner", "name": "owner", "type": {"idref": "vehicle"}}],
+                "operations": [{
+                    "id": "car-drive", "name": "drive", "is_abstract": True,
+                    "parameters": [{"id": "car-drive-speed", "name": "speed", "direction": "in"}],
+                }],
+                "generalizations": [{"idref": "car-is-vehicle"}],
+            },
+        ],
+        "associations": [
+            {"id": "car-wheels", "type": "aggregation", "direction": "directed", "source": None, "target": None},
+        ],
+        "generalizations": [
+            {"id": "car-is-vehicle", "specific": {"idref": "car"}, "general": {"idref": "vehicle"}},
+        ],
+        "interactions": [{
+            "id": "driving", "name": "Driving",
+            "lifelines": [{"id": "driver", "name": "driver", "represents": {"idref": "car"}}],
+            "fragments": [
+                {"id": "start", "covered": {"idref": "driver"}},
+                {
+                    "id": "loop", "operator": "loop", "covered": [{"idref": "driver"}],
+                    "operands": [{
+                        "id": "loop-body", "guard": "fuel > 0",
+                        "fragments": [{"id": "accelerate", "covered": {"idref": "driver"}}],
+                    }],
+                },
+            ],
+            "messages": [],
+        }],
+        "packages": [
+            {"id": "root-package", "name": "root", "elements": {"packages": [{"idref": "nested-package"}]}},
+            {"id": "nested-package", "name": "nested", "elements": {"classes": [{"idref": "car"}]}},
+        ],
+    },
+    "diagrams": {
+        "class_diagrams": [{
+            "id": "class-diagram", "name": "Classes", "description": "All classes",
+            "elements": {"classes": [{"idref": "vehicle"}, {"idref": "car"}]},
+        }],
+        "sequence_diagrams": [],
+    },
+}
+
+
+def serialize_to_umj(translator, model):
+    return translator.serialize(model, to_string=False).model_dump_json(context=FULL_ASSOCIATION_ENDS_CONTEXT)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    yield
+    di.clear_cache()
+
+
+@pytest.fixture
+def umj_deserialization_strategy():
+    return UmjDeserializationStrategy(model_builder=UmlModelBuilder())
+
+
+def test_build_processing_pipe(umj_deserialization_strategy):
+    assert isinstance(umj_deserialization_strategy._build_processing_pipe(), UmlModelPipe)
+
+
+def test_build_format_detection_pipe(umj_deserialization_strategy):
+    assert isinstance(umj_deserialization_strategy._build_format_detection_pipe(), UmjDetectionPipe)
+
+
+def test_when_other_json_format_given_then_umj_is_not_detected(umj_deserialization_strategy):
+    data_source = InputProcessor().accept_input(file_path=STARUML_CAR_MODEL_FILE_PATH)
+
+    assert not umj_deserialization_strategy.can_deserialize_format(format_data=data_source)
+
+
+@pytest.mark.parametrize(
+    "files_paths",
+    [
+        *([file_path] for file_path in sorted(glob.glob(f"{EA_TEST_DATA_DIRECTORY}/*.xml"))),
+        [STARUML_CAR_MODEL_FILE_PATH],
+        PAPYRUS_CAR_MODEL_FILES_PATHS,
+    ],
+)
+def test_when_translated_model_deserialized_from_umj_then_serialized_again_to_the_same_umj(files_paths):
+    # Given
+    translator = ModelTranslator()
+    translated_model = translator.deserialize(data_sources=[InputProcessor().accept_input(file_path=file_path) for file_path in files_paths])
+    umj_model = serialize_to_umj(translator, translated_model)
+
+    # When
+    umj_translator = ModelTranslator()
+    rehydrated_model = umj_translator.deserialize(
+        data_sources=[InputProcessor().accept_input(data=umj_model)], from_format=SupportedFormat.UMJ
+    )
+
+    # Then
+    assert json.loads(serialize_to_umj(umj_translator, rehydrated_model)) == json.loads(umj_model)
+
+
+def test_when_umj_model_deserialized_then_elements_are_rebuilt(umj_deserialization_strategy):
+    # Given
+    data_source = InputProcessor().accept_input(data=json.dumps(UMJ_MODEL))
+
+    # When
+    model = umj_deserialization_strategy.retrieve_model(data_source)
+
+    # Then
+    assert (model.id, model.name, model.metadata) == ("model", "Vehicles", {"exporter": "umlars"})
+
+    vehicle, car = model.elements.classes
+    assert car.visibility == UmlVisibilityEnum.PRIVATE
+    assert car.attributes[0].type is vehicle
+    assert car.operations[0].is_abstract
+    assert car.operations[0].parameters[0].name == "speed"
+    assert [generalization.id for generalization in car.generalizations] == ["car-is-vehicle"]
+    assert car.generalizations[0].general is vehicle
+
+    interaction = model.elements.interactions[0]
+    assert interaction.lifelines[0].represents is car
+    start, loop = interaction.fragments
+    assert isinstance(start, UmlOccurrenceSpecification)
+    assert isinstance(loop, UmlCombinedFragment) and loop.operator == UmlInteractionOperatorEnum.LOOP
+    assert loop.operands[0].guard == "fuel > 0"
+    assert [fragment.id for fragment in loop.operands[0].fragments] == ["accelerate"]
+
+    root_package, nested_package = model.elements.packages
+    assert root_package.elements.packages == [nested_package]
+    assert nested_package.elements.classes == [car]
+
+    class_diagram = model.diagrams.class_diagrams[0]
+    assert class_diagram.description == "All classes"
+    assert class_diagram.elements.classes == [vehicle, car]
+
+
+def test_when_umj_model_with_null_visibility_directed_associations_and_messages_arguments_deserialized_then_they_are_serialized_again():
+    # Given
+    wheels_end = {"id": "wheels-end", "name": "wheels", "visibility": None, "multiplicity": "1..*", "element": {"idref": "wheel"}, "role": "part", "navigability": None}
+    umj_model = {
+        "id": "model",
+        "elements": {
+            "classes": [
+                {"id": "car", "name": "Car", "visibility": None},
+                {"id": "wheel", "name": "Wheel", "visibility": "protected"},
+            ],
+            "associations": [{
+                "id": "car-wheels", "name": "has", "visibility": None, "type": "composition", "direction": "directed",
+                "source": {"id": "car-end", "element": {"idref": "car"}}, "target": wheels_end,
+            }],
+            "interactions": [{
+                "id": "driving", "name": "Driving",
+                "lifelines": [{"id": "driver", "represents": {"idref": "car"}}],
+                "fragments": [{"id": "send", "covered": {"idref": "driver"}}, {"id": "receive", "covered": {"idref": "driver"}}],
+                "messages": [{
+                    "id": "turn", "name": "turn", "sort": "asynchCall", "arguments": ["left", "45"],
+                    "send_event": {"idref": "send"}, "receive_event": {"idref": "receive"},
+                }],
+            }],
+        },
+        "diagrams": {},
+    }
+    translator = ModelTranslator()
+
+    # When
+    model = translator.deserialize(data_sources=[InputProcessor().accept_input(data=json.dumps(umj_model))], from_format=SupportedFormat.UMJ)
+    serialized_model = json.loads(serialize_to_umj(translator, model))
+    backend_model = json.loads(translator.serialize(model))
+
+    # Then
+    car, wheel = model.elements.classes
+    assert (car.visibility, wheel.visibility) == (None, UmlVisibilityEnum.PROTECTED)
+
+    composition = serialized_model["elements"]["associations"][0]
+    assert (composition["name"], composition["visibility"]) == ("has", None)
+    assert composition["source"]["id"] == "car-end" and composition["source"]["element"] == {"idref": "car"}
+    assert {key: composition["target"][key] for key in wheels_end} == wheels_end
+    backend_composition = backend_model["elements"]["associations"][0]
+    assert (backend_composition["source"], backend_composition["target"]) == ({"idref": "car-end"}, {"idref": "wheels-end"})
+
+    message = serialized_model["elements"]["interactions"][0]["messages"][0]
+    assert (message["sort"], message["arguments"]) == ("asynchCall", ["left", "45"])
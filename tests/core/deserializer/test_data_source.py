@@ -0,0 +1,214 @@
+import codecs
+import io
+import mmap
+import pickle
+
+import pytest
+
+from umlars_translator.core.deserialization import config
+from umlars_translator.core.deserialization.data_source import DataSource, detect_encoding
+from umlars_translator.core.deserialization.abstract.xml.utils import parse_element_tree
+
+
+XML_DATA = '<?xml version="1.0" encoding="{encoding}"?>\n<xmi:XMI xmlns:xmi="http://schema.omg.org/spec/XMI/2.1"><name>Łódź</name></xmi:XMI>'
+
+
+@pytest.mark.parametrize(
+    "data_prefix, expected_encoding",
+    [
+        (codecs.BOM_UTF8 + b"<?xml version='1.0'?>", "utf-8-sig"),
+        (codecs.BOM_UTF16_LE + "<?xml".encode("utf-16-le"), "utf-16"),
+        ("<?xml".encode("utf-16-be"), "utf-16-be"),
+        (b'<?xml version="1.0" encoding="Windows-1250"?>', "windows-1250"),
+        (b"<?xml version='1.0' encoding='UTF-8' standalone='yes'?>", "utf-8"),
+        (b'<?xml version="1.0" encoding="x-bogus"?>', None),
+        (b'<?xml version="1.0"?><root encoding="latin-1"/>', None),
+        (b'{"encoding": "latin-1"}', None),
+    ],
+)
+def test_detect_encoding(data_prefix, expected_encoding):
+    assert detect_encoding(data_prefix) == expected_encoding
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "windows-1250", "utf-16"])
+def test_when_encoding_declared_then_file_is_decoded_with_it(tmp_path, encoding):
+    # Given
+    xml_data = XML_DATA.format(encoding=encoding)
+    file_path = tmp_path / "model.xml"
+    file_path.write_bytes(xml_data.encode(encoding))
+
+    # When
+    data_source = DataSource(file_path=str(file_path))
+
+    # Then
+    assert data_source.retrieved_data == xml_data
+
+
+def test_when_encoding_not_stated_and_data_is_not_valid_utf8_then_fallback_encoding_is_used():
+    assert DataSource(data="<name>Café</name>".encode("windows-1252")).retrieved_data == "<name>Café</name>"
+
+
+def test_when_declared_encoding_is_unknown_then_data_is_decoded_and_parsed():
+    # Given
+    xml_data = XML_DATA.format(encoding="x-bogus")
+
+    # When
+    data_source = DataSource(data=xml_data.encode("utf-8"))
+    tree, _ = parse_element_tree(DataSource(data=xml_data.encode("utf-8")))
+
+    # Then
+    assert data_source.retrieved_data == xml_data
+    assert tree.getroot().find("name").text == "Łódź"
+
+
+def test_when_data_is_not_valid_in_declared_encoding_then_fallback_encoding_is_used():
+    # Given
+    xml_data = '<?xml version="1.0" encoding="UTF-8"?>\n<name>Café</name>'
+
+    # When
+    data_source = DataSource(data=xml_data.encode("windows-1252"))
+    tree, _ = parse_element_tree(DataSource(data=xml_data.encode("windows-1252")))
+
+    # Then
+    assert data_source.retrieved_data == xml_data
+    assert tree.getroot().text == "Café"
+
+
+def test_when_file_is_big_then_it_is_memory_mapped(tmp_path, monkeypatch):
+    # Given
+    monkeypatch.setattr(config, "DATA_SOURCE_MMAP_MIN_FILE_SIZE", 1)
+    file_path = tmp_path / "model.xml"
+    file_path.write_bytes(XML_DATA.format(encoding="windows-1250").encode("windows-1250"))
+    data_source = DataSource(file_path=str(file_path))
+
+    # When
+    element_tree, namespaces = parse_element_tree(data_source)
+
+    # Then
+    assert isinstance(data_source.retrieved_buffer, mmap.mmap)
+    assert element_tree.getroot().find("name").text == "Łódź"
+    assert namespaces == {"xmi": "http://schema.omg.org/spec/XMI/2.1"}
+
+
+def test_when_data_source_context_exited_then_memory_mapped_buffer_is_released(tmp_path, monkeypatch):
+    # Given
+    monkeypatch.setattr(config, "DATA_SOURCE_MMAP_MIN_FILE_SIZE", 1)
+    file_path = tmp_path / "model.xml"
+    file_path.write_bytes(XML_DATA.format(encoding="utf-8").encode("utf-8"))
+
+    # When
+    with DataSource(file_path=str(file_path)) as data_source:
+        buffer = data_source.retrieved_buffer
+
+    # Then
+    assert buffer.closed
+    assert "retrieved_buffer" not in data_source.__dict__
+
+
+def test_when_callable_returns_bytes_then_they_are_decoded_with_detected_encoding():
+    # Given
+    xml_data = XML_DATA.format(encoding="windows-1250")
+
+    # When
+    data_source = DataSource(data=lambda: xml_data.encode("windows-1250"))
+
+    # Then
+    assert data_source.encoding == "windows-1250"
+    assert data_source.retrieved_data == xml_data
+    assert data_source.retrieved_buffer == xml_data.encode("windows-1250")
+
+
+def test_when_memory_mapped_data_source_pickled_then_buffer_is_mapped_again(tmp_path, monkeypatch):
+    # Given
+    monkeypatch.setattr(config, "DATA_SOURCE_MMAP_MIN_FILE_SIZE", 1)
+    file_path = tmp_path / "model.xml"
+    file_path.write_bytes(XML_DATA.format(encoding="utf-8").encode("utf-8"))
+    data_source = DataSource(file_path=str(file_path))
+    buffer = data_source.retrieved_buffer
+
+    # When
+    unpickled_data_source = pickle.loads(pickle.dumps(data_source))
+
+    # Then
+    assert unpickled_data_source.retrieved_buffer[:] == buffer[:]
+    data_source.close()
+    assert buffer.closed
+
+
+@pytest.fixture
+def xml_file_path(tmp_path):
+    file_path = tmp_path / "model.xml"
+    file_path.write_bytes(XML_DATA.format(encoding="windows-1250").encode("windows-1250"))
+    return str(file_path)
+
+
+@pytest.fixture(params=["file_path", "string", "bytes", "callable", "stream"])
+def data_source_kind(request):
+    return request.param
+
+
+def create_data_source(kind, file_path):
+    with open(file_path, "rb") as file:
+        raw_data = file.read()
+    text_data = raw_data.decode("windows-1250")
+
+    if kind == "file_path":
+        return DataSource(file_path=file_path), raw_data
+    if kind == "string":
+        return DataSource(data=text_data), text_data.encode("utf-8")
+    if kind == "bytes":
+        return DataSource(data=raw_data), raw_data
+    if kind == "callable":
+        return DataSource(data=lambda: text_data), text_data.encode("utf-8")
+    return DataSource(data=io.BytesIO(raw_data)), raw_data
+
+
+def test_when_data_iterated_in_chunks_then_all_raw_data_is_yielded(xml_file_path, data_source_kind):
+    # Given
+    data_source, expected_raw_data = create_data_source(data_source_kind, xml_file_path)
+
+    # When
+    chunks = list(data_source.iter_chunks(size=16))
+
+    # Then
+    assert b"".join(chunks) == expected_raw_data
+    assert all(len(chunk) == 16 for chunk in chunks[:-1])
+
+
+def test_when_lines_iterated_then_they_are_decoded_with_detected_encoding(xml_file_path, data_source_kind):
+    # Given
+    data_source, _ = create_data_source(data_source_kind, xml_file_path)
+
+    # When
+    lines = list(data_source.data_by_lines)
+
+    # Then
+    assert lines[-1].endswith("<name>Łódź</name></xmi:XMI>")
+
+
+def test_when_file_data_source_streamed_then_it_can_be_iterated_again(xml_file_path):
+    data_source = DataSource(file_path=xml_file_path)
+
+    assert list(data_source.data_by_lines) == list(data_source.data_by_lines)
+    assert "retrieved_buffer" not in data_source.__dict__
+
+
+def test_when_stream_data_source_consumed_then_it_cannot_be_streamed_again():
+    # Given
+    data_source = DataSource(data=io.BytesIO(b"<root/>"))
+    list(data_source.iter_chunks())
+
+    # When / Then
+    with pytest.raises(ValueError):
+        data_source.open_stream()
+
+
+def test_when_stream_data_source_buffered_then_it_can_be_streamed_again():
+    # Given
+    data_source = DataSource(data=io.BytesIO(b"<root/>"))
+
+    # When
+    assert data_source.retrieved_data == "<root/>"
+
+    # Then
+    assert b"".join(data_source.iter_chunks()) == b"<root/>"
@@ -0,0 +1,89 @@
+import gzip
+import io
+import lzma
+import zlib
+
+import pytest
+
+from umlars_translator.core.translator import ModelTranslator
+from umlars_translator.core.deserialization.input_processor import InputProcessor
+from umlars_translator.core.serialization.umlars_model.json_serializer import UmlToPydanticSerializer, iter_dto_json_fragments
+from umlars_translator.core.serialization.compression import (
+    CompressionMethod,
+    open_output_sink,
+    iter_compressed,
+    get_compressed_file_name,
+)
+
+
+EA_CAR_MODEL_FILE_PATH = "tests/core/deserializer/formats/ea_xmi/test_data/ea_car_model_xmi21-with-sequence.xml"
+STARUML_CAR_MODEL_FILE_PATH = "tests/core/deserializer/formats/staruml_mdj/test_data/staruml-car-model-with-sequence.mdj"
+
+DECOMPRESSORS = {
+    CompressionMethod.NONE: lambda data: data,
+    CompressionMethod.GZIP: gzip.decompress,
+    CompressionMethod.LZMA: lzma.decompress,
+}
+
+
+@pytest.fixture(params=[EA_CAR_MODEL_FILE_PATH, STARUML_CAR_MODEL_FILE_PATH])
+def translated_model(request):
+    translator = ModelTranslator()
+    return translator.deserialize(data_sources=[InputProcessor().accept_input(file_path=request.param)])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1000])
+def test_when_dto_dumped_in_fragments_then_output_equals_model_dump_json(translated_model, chunk_size):
+    # Given
+    dto = UmlToPydanticSerializer().serialize(translated_model, to_string=False)
+
+    # When
+    result = b"".join(iter_dto_json_fragments(dto, chunk_size=chunk_size))
+
+    # Then
+    assert result.decode() == dto.model_dump_json()
+
+
+@pytest.mark.parametrize("compression", list(CompressionMethod))
+def test_when_model_serialized_to_sink_then_decompressed_file_equals_serialized_model(translated_model, compression, tmp_path):
+    # Given
+    serializer = UmlToPydanticSerializer()
+    output_location = str(tmp_path / get_compressed_file_name("model.umj", compression))
+
+    # When
+    with open_output_sink(output_location, compression) as output_file:
+        serializer.serialize_to_stream(translated_model, output_file)
+
+    # Then
+    with open(output_location, "rb") as output_file:
+        assert DECOMPRESSORS[compression](output_file.read()).decode() == serializer.serialize(translated_model)
+
+
+@pytest.mark.parametrize("compression", list(CompressionMethod))
+def test_when_fragments_compressed_on_the_fly_then_they_decompress_to_original_data(compression):
+    # Given
+    fragments = [f'{{"id": "element-{index}"}},'.encode() for index in range(1000)]
+
+    # When
+    compressed_fragments = list(iter_compressed(iter(fragments), compression))
+
+    # Then
+    assert DECOMPRESSORS[compression](b"".join(compressed_fragments)) == b"".join(fragments)
+
+
+def test_when_gzip_stream_decompressed_incrementally_then_it_is_valid_http_gzip_encoding():
+    # Given
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    fragments = [b"umj" * 100] * 10
+
+    # When
+    result = b"".join(decompressor.decompress(fragment) for fragment in iter_compressed(fragments, CompressionMethod.GZIP))
+
+    # Then
+    assert result == b"".join(fragments) and decompressor.eof
+
+
+def test_compressed_file_name_has_compression_extension():
+    assert get_compressed_file_name("model.umj", CompressionMethod.NONE) == "model.umj"
+    assert get_compressed_file_name("model.umj", CompressionMethod.GZIP) == "model.umj.gz"
+    assert get_compressed_file_name("model.umj", "lzma") == "model.umj.xz"
@@ -0,0 +1,130 @@
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
+import pickle
+import time
+
+import pytest
+
+from umlars_translator.core.translator import ModelTranslator
+from umlars_translator.core.deserialization.input_processor import InputProcessor
+from umlars_translator.core.serialization.umlars_model.json_serializer import UmlToPydanticSerializer
+from umlars_translator.core.model.umlars_model.uml_model_builder import UmlModelBuilder
+from umlars_translator.core.serialization.umlars_model.parallel_json_serializer import (
+    ParallelUmlToPydanticSerializer,
+    UmlToCompactFormSerializer,
+)
+
+
+EA_CAR_MODEL_FILE_PATH = "tests/core/deserializer/formats/ea_xmi/test_data/ea_car_model_xmi21-with-sequence.xml"
+STARUML_CAR_MODEL_FILE_PATH = "tests/core/deserializer/formats/staruml_mdj/test_data/staruml-car-model-with-sequence.mdj"
+BENCHMARK_MODELS_SIZES = (500, 2000, 5000)
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture(params=[EA_CAR_MODEL_FILE_PATH, STARUML_CAR_MODEL_FILE_PATH])
+def translated_model(request):
+    translator = ModelTranslator()
+    return translator.deserialize(data_sources=[InputProcessor().accept_input(file_path=request.param)])
+
+
+def test_when_serialized_in_sections_then_output_equals_sequential_serialization(translated_model):
+    # Given
+    expected_output = UmlToPydanticSerializer().serialize(translated_model)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        serializer = ParallelUmlToPydanticSerializer(chunk_size=1, min_items=0, executor=executor)
+
+        # When
+        result = serializer.serialize(translated_model)
+
+    # Then
+    assert result == expected_output
+
+
+def test_when_serialized_with_process_pool_then_output_equals_sequential_serialization(translated_model):
+    # Given
+    expected_output = UmlToPydanticSerializer().serialize(translated_model)
+    serializer = ParallelUmlToPydanticSerializer(max_workers=2, chunk_size=2, min_items=0)
+
+    # When
+    result = serializer.serialize(translated_model)
+    next_result = serializer.serialize(translated_model)
+
+    # Then
+    assert result == next_result == expected_output
+    serializer.shutdown()
+
+
+def test_compact_form_is_picklable(translated_model):
+    # Given
+    compact_model = UmlToCompactFormSerializer().serialize(translated_model)
+
+    # When
+    unpickled_model = pickle.loads(pickle.dumps(compact_model))
+
+    # Then
+    assert unpickled_model == compact_model
+
+
+def test_when_single_worker_then_falls_back_to_sequential_serialization(translated_model, mocker):
+    # Given
+    serializer = ParallelUmlToPydanticSerializer(max_workers=1)
+    iter_json_fragments = mocker.spy(serializer, "iter_json_fragments")
+
+    # When
+    result = serializer.serialize(translated_model)
+
+    # Then
+    assert result == UmlToPydanticSerializer().serialize(translated_model)
+    iter_json_fragments.assert_not_called()
+
+
+def test_when_model_smaller_than_default_min_items_then_it_is_serialized_sequentially(translated_model, mocker):
+    # Given
+    serializer = ParallelUmlToPydanticSerializer(max_workers=2, chunk_size=1)
+    get_executor = mocker.spy(serializer, "_get_executor")
+
+    # When
+    result = serializer.serialize(translated_model)
+
+    # Then
+    assert result == UmlToPydanticSerializer().serialize(translated_model)
+    get_executor.assert_not_called()
+
+
+def build_model_with_classes(classes_count):
+    builder = UmlModelBuilder()
+    builder.construct_uml_model(id="model", name="Model")
+    for class_index in range(classes_count):
+        builder.construct_uml_class(id=f"class{class_index}", name=f"Class{class_index}")
+        for attribute_index in range(5):
+            builder.construct_uml_attribute(f"class{class_index}", id=f"class{class_index}_attribute{attribute_index}", name=f"attribute{attribute_index}")
+    return builder.build()
+
+
+@pytest.mark.benchmark
+def test_serialization_time_by_model_size():
+    sequential_serializer = UmlToPydanticSerializer()
+    parallel_serializer = ParallelUmlToPydanticSerializer(max_workers=max(os.cpu_count() or 1, 2), chunk_size=250, min_items=0)
+    # Workers are started by the first serialization only
+    parallel_serializer.serialize(build_model_with_classes(500))
+
+    break_even_size = None
+    for classes_count in BENCHMARK_MODELS_SIZES:
+        model = build_model_with_classes(classes_count)
+        start_time = time.perf_counter()
+        expected_output = sequential_serializer.serialize(model)
+        sequential_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        result = parallel_serializer.serialize(model)
+        parallel_time = time.perf_counter() - start_time
+
+        logger.info(f"{classes_count} classes: sequential {sequential_time * 1000:.0f} ms, parallel {parallel_time * 1000:.0f} ms")
+        if break_even_size is None and parallel_time < sequential_time:
+            break_even_size = classes_count
+        assert result == expected_output
+
+    parallel_serializer.shutdown()
+    logger.info(f"Break-even model size on {os.cpu_count()} CPUs: {break_even_size or f'above {BENCHMARK_MODELS_SIZES[-1]}'} classes")
@@ -0,0 +1,106 @@
+import importlib.metadata
+import json
+
+import pytest
+
+from umlars_translator.config import SupportedFormat
+from umlars_translator.core.deserialization import config
+from umlars_translator.core.deserialization.data_source import DataSource
+from umlars_translator.core.deserialization.deserializer import ModelDeserializer
+from umlars_translator.core.deserialization.factory import DeserializationStrategyFactory
+from umlars_translator.core.deserialization.formats.umj.umj_deserialization_strategy import UmjDeserializationStrategy
+from umlars_translator.core.extensions_manager import ExtensionsManager, ExtensionEntry
+from umlars_translator.core.utils.functions import get_translator_version
+
+
+UMJ_STRATEGY_MODULE = "umlars_translator.core.deserialization.formats.umj.umj_deserialization_strategy"
+
+
+@pytest.fixture(autouse=True)
+def clear_registry():
+    ExtensionsManager.clear_registry()
+    yield
+    ExtensionsManager.clear_registry()
+
+
+@pytest.fixture
+def manifest_path(tmp_path):
+    return str(tmp_path / "extensions_manifest.json")
+
+
+def test_when_multiple_managers_created_then_entry_points_are_resolved_once(mocker):
+    # Given
+    entry_points_spy = mocker.spy(importlib.metadata, "entry_points")
+
+    # When
+    for _ in range(3):
+        ExtensionsManager().activate_extensions(config.DESERIALIZATION_EXTENSIONS_GROUP_NAME)
+
+    # Then
+    assert entry_points_spy.call_count == 1
+
+
+def test_when_manifest_saved_then_next_process_does_not_scan_metadata(mocker, manifest_path):
+    # Given
+    ExtensionsManager(manifest_path=manifest_path).save_manifest(config.DESERIALIZATION_EXTENSIONS_GROUP_NAME)
+    ExtensionsManager.clear_registry()
+    entry_points_spy = mocker.spy(importlib.metadata, "entry_points")
+
+    # When
+    extensions = ExtensionsManager(manifest_path=manifest_path).get_extensions(config.DESERIALIZATION_EXTENSIONS_GROUP_NAME[0])
+
+    # Then
+    assert entry_points_spy.call_count == 0
+    assert UMJ_STRATEGY_MODULE in [extension.value for extension in extensions]
+
+
+def test_when_manifest_created_by_other_version_then_it_is_ignored(mocker, manifest_path):
+    # Given
+    group = config.DESERIALIZATION_EXTENSIONS_GROUP_NAME[0]
+    with open(manifest_path, "w") as manifest_file:
+        json.dump({"version": f"{get_translator_version()}-other", "groups": {group: []}}, manifest_file)
+    entry_points_spy = mocker.spy(importlib.metadata, "entry_points")
+
+    # When
+    extensions = ExtensionsManager(manifest_path=manifest_path).get_extensions(group)
+
+    # Then
+    assert entry_points_spy.call_count == 1
+    assert extensions
+
+
+def test_when_manifest_created_by_deserializer_then_it_contains_strategies_formats(manifest_path):
+    # When
+    ModelDeserializer(
+        factory=DeserializationStrategyFactory(),
+        deserialization_extensions_manager=ExtensionsManager(manifest_path=manifest_path),
+    )
+
+    # Then
+    with open(manifest_path) as manifest_file:
+        manifest = json.load(manifest_file)
+    extensions = manifest["groups"][config.DESERIALIZATION_EXTENSIONS_GROUP_NAME[0]]
+    assert {extension["value"]: extension["key"] for extension in extensions}[UMJ_STRATEGY_MODULE] == SupportedFormat.UMJ.value
+
+
+def test_when_extension_key_known_then_its_loading_is_deferred_until_format_is_needed(mocker):
+    # Given
+    manager = ExtensionsManager()
+    umj_entry = ExtensionEntry("group", "umj", UMJ_STRATEGY_MODULE, SupportedFormat.UMJ.value)
+    other_entry = ExtensionEntry("group", "staruml", "not_existing_module", SupportedFormat.MDJ_STARTUML.value)
+    mocker.patch.object(manager, "get_extensions", return_value=[umj_entry, other_entry])
+    factory = DeserializationStrategyFactory()
+    loader = mocker.Mock(side_effect=lambda: factory.register_strategy(UmjDeserializationStrategy))
+    factory.register_lazy_strategy(SupportedFormat.UMJ, loader)
+    not_needed_loader = mocker.Mock()
+    factory.register_lazy_strategy(SupportedFormat.MDJ_STARTUML, not_needed_loader)
+
+    # When
+    manager.activate_extensions(["group"], defer_loading=lambda extension: extension.key is not None)
+    strategy = factory.get_strategy(format_data_source=DataSource(data="{}", format=SupportedFormat.UMJ))
+
+    # Then
+    assert isinstance(strategy, UmjDeserializationStrategy)
+    assert manager._loaded_extensions == {}
+    loader.assert_called_once_with()
+    not_needed_loader.assert_not_called()
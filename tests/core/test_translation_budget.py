@@ -0,0 +1,114 @@
+import threading
+
+import pytest
+
+from umlars_translator.core.deserialization import translation_budget as translation_budget_module
+from umlars_translator.core.deserialization.translation_budget import TranslationBudget
+from umlars_translator.core.translator import ModelTranslator
+from umlars_translator.core.deserialization.input_processor import InputProcessor
+from umlars_translator.core.deserialization.exceptions import (
+    TranslationBudgetExceededError,
+    TranslationCancelledError,
+    TranslationDeadlineExceededError,
+    TranslationMemoryBudgetExceededError,
+)
+
+
+CAR_MODEL_FILE_PATH = "tests/core/deserializer/formats/ea_xmi/test_data/ea_car_model_xmi21-with-sequence.xml"
+
+
+@pytest.fixture
+def ea_xmi_car_data_source():
+    return InputProcessor().accept_input(file_path=CAR_MODEL_FILE_PATH)
+
+
+def test_when_time_limit_exceeded_then_deadline_error_is_raised(mocker):
+    # Given
+    monotonic = mocker.patch("time.monotonic", return_value=100.0)
+    translation_budget = TranslationBudget(time_limit=5)
+    translation_budget.check()
+
+    # When
+    monotonic.return_value = 105.5
+
+    # Then
+    with pytest.raises(TranslationDeadlineExceededError, match="time limit of 5 s"):
+        translation_budget.check()
+
+
+def test_when_memory_limit_exceeded_then_memory_error_is_raised_at_next_memory_check(mocker):
+    # Given
+    memory_usage = mocker.patch.object(translation_budget_module, "get_process_memory_usage", return_value=1000)
+    translation_budget = TranslationBudget(memory_limit=500, memory_check_interval=2)
+
+    # When
+    memory_usage.return_value = 2000
+    translation_budget.check()
+
+    # Then
+    with pytest.raises(TranslationMemoryBudgetExceededError) as exception_info:
+        translation_budget.check()
+    assert "allocated 1000 B" in exception_info.value.reason
+
+
+def test_when_memory_usage_not_measurable_then_warning_is_logged_once(mocker, caplog):
+    # Given
+    mocker.patch.object(translation_budget_module, "get_process_memory_usage", return_value=None)
+    translation_budget_module.warn_memory_usage_not_measurable.cache_clear()
+
+    # When
+    translation_budgets = [TranslationBudget(memory_limit=500, memory_check_interval=1) for _ in range(2)]
+    for translation_budget in translation_budgets:
+        translation_budget.check()
+
+    # Then
+    assert [record.levelname for record in caplog.records if "memory limit is ignored" in record.message] == ["WARNING"]
+
+
+def test_when_cancel_event_set_then_cancelled_error_is_raised():
+    cancel_event = threading.Event()
+    translation_budget = TranslationBudget(cancel_event=cancel_event)
+    translation_budget.check()
+
+    cancel_event.set()
+
+    with pytest.raises(TranslationCancelledError):
+        translation_budget.check()
+
+
+def test_when_translation_exceeds_time_limit_then_it_is_aborted_and_translator_stays_usable(ea_xmi_car_data_source):
+    # Given
+    translator = ModelTranslator()
+    context = translator.create_context()
+
+    # When
+    with pytest.raises(TranslationBudgetExceededError):
+        translator.translate(data_sources=[ea_xmi_car_data_source], context=context, time_limit=-1)
+
+    # Then
+    assert context.translation_budget is None
+    assert context.model_builder.translation_budget is None
+    assert translator.translate(data_sources=[ea_xmi_car_data_source], model_id="car", context=translator.create_context()) == translator.translate(
+        data_sources=[ea_xmi_car_data_source], model_id="car", context=translator.create_context(), time_limit=3600, memory_limit=1024 ** 4
+    )
+
+
+def test_when_deserialized_with_budget_then_it_is_checked_while_model_is_built(ea_xmi_car_data_source, mocker):
+    # Given
+    translator = ModelTranslator()
+    context = translator.create_context()
+    check_spy = mocker.spy(TranslationBudget, "check")
+
+    # When
+    translator.deserialize(data_sources=[ea_xmi_car_data_source], context=context, time_limit=3600)
+
+    # Then
+    assert check_spy.call_count > len(context.model.elements.classes)
+
+
+@pytest.mark.asyncio
+async def test_when_asynchronous_translation_exceeds_time_limit_then_it_is_aborted(ea_xmi_car_data_source):
+    translator = ModelTranslator()
+
+    with pytest.raises(TranslationDeadlineExceededError):
+        await translator.atranslate(data_sources=[ea_xmi_car_data_source], context=translator.create_context(), time_limit=-1)
@@ -0,0 +1,202 @@
+import json
+import os
+
+import pytest
+
+from umlars_translator.core.translator import ModelTranslator
+from umlars_translator.core.translation_cache import TranslationCache, MemoryCacheTier, DiskCacheTier
+from umlars_translator.core.deserialization.input_processor import InputProcessor
+from umlars_translator.core.deserialization.data_source import DataSource
+from umlars_translator.config import SupportedFormat
+
+
+EA_CAR_MODEL_FILE_PATH = "tests/core/deserializer/formats/ea_xmi/test_data/ea_car_model_xmi21-with-sequence.xml"
+STARUML_CAR_MODEL_FILE_PATH = "tests/core/deserializer/formats/staruml_mdj/test_data/staruml-car-model-with-sequence.mdj"
+# Models without sequence diagrams - IDs of their elements don't change between the translations
+EA_MODELS_FILES_PATHS = [
+    "tests/core/deserializer/formats/ea_xmi/test_data/ea_xmi_car-model-xmi-21.xml",
+    "tests/core/deserializer/formats/ea_xmi/test_data/ea_xmi_class_library.xml",
+]
+PAPYRUS_CAR_MODEL_FILES_PATHS = [
+    "tests/core/deserializer/formats/papyrus_xmi/test_data/eclipse-papyrus-car-model-with-sequence.uml",
+    "tests/core/deserializer/formats/papyrus_xmi/test_data/eclipse-papyrus-car-model-with-sequence.notation",
+]
+
+
+@pytest.fixture
+def translation_cache(tmp_path):
+    return TranslationCache(memory_tier=MemoryCacheTier(), disk_tier=DiskCacheTier(str(tmp_path)))
+
+
+def test_when_memory_tier_exceeds_limits_then_least_recently_used_entries_are_evicted():
+    # Given
+    memory_tier = MemoryCacheTier(max_entries=2, max_bytes=10)
+    memory_tier.put("first", "aaa")
+    memory_tier.put("second", "bbb")
+    memory_tier.get("first")
+
+    # When
+    memory_tier.put("third", "ccc")
+    memory_tier.put("fourth", "dddddddd")
+
+    # Then
+    assert [memory_tier.get(key) for key in ("first", "second", "third", "fourth")] == [None, None, None, "dddddddd"]
+    assert memory_tier.size == 8
+
+
+def test_when_disk_tier_exceeds_size_limit_then_least_recently_used_files_are_evicted(tmp_path):
+    # Given
+    disk_tier = DiskCacheTier(str(tmp_path))
+    disk_tier.put("first", "a" * 1000)
+    entry_size = disk_tier.size
+    disk_tier = DiskCacheTier(str(tmp_path), max_bytes=2 * entry_size)
+    disk_tier.put("second", "b" * 1000)
+    os.utime(tmp_path / f"first{DiskCacheTier.FILE_NAME_SUFFIX}", (0, 0))
+
+    # When
+    disk_tier.put("third", "c" * 1000)
+
+    # Then
+    assert [disk_tier.get(key) is not None for key in ("first", "second", "third")] == [False, True, True]
+    assert disk_tier.size == 2 * entry_size
+
+
+def test_cache_key_depends_on_content_format_and_version(translation_cache):
+    # Given
+    data_source = DataSource("<xmi/>")
+
+    # When
+    key = translation_cache.make_key([data_source])
+
+    # Then
+    assert key == translation_cache.make_key([DataSource("<xmi/>")])
+    assert key != translation_cache.make_key([DataSource("<xmi />")])
+    assert key != translation_cache.make_key([data_source], SupportedFormat.XMI_EA)
+    assert key != TranslationCache(translator_version="other").make_key([data_source])
+
+
+def test_cache_key_depends_on_all_sources_and_their_order(translation_cache):
+    # Given
+    first_source, second_source = DataSource("<xmi/>"), DataSource("<notation/>")
+
+    # When
+    key = translation_cache.make_key([first_source, second_source])
+
+    # Then
+    assert key != translation_cache.make_key([first_source])
+    assert key != translation_cache.make_key([second_source, first_source])
+    assert key != translation_cache.make_key([DataSource("<xmi/><notation/>")])
+
+
+def test_when_key_made_then_file_is_hashed_without_buffering_it(translation_cache, tmp_path):
+    # Given
+    file_path = tmp_path / "model.xml"
+    file_path.write_bytes(b"<xmi/>" * 10_000)
+    data_source = DataSource(file_path=str(file_path))
+
+    # When
+    key = translation_cache.make_key([data_source])
+
+    # Then
+    assert "retrieved_buffer" not in data_source.__dict__
+    assert key == translation_cache.make_key([DataSource(b"<xmi/>" * 10_000)])
+
+
+def test_when_entry_only_on_disk_then_it_is_loaded_into_memory(translation_cache, tmp_path):
+    # Given
+    translation_cache.put("key", "translation")
+    translation_cache = TranslationCache(memory_tier=MemoryCacheTier(), disk_tier=DiskCacheTier(str(tmp_path)))
+
+    # When
+    result = translation_cache.get("key")
+
+    # Then
+    assert result == "translation"
+    assert translation_cache._memory_tier.get("key") == "translation"
+
+
+def test_when_translated_with_cache_then_result_equals_translation_without_cache(translation_cache):
+    # Given
+    expected_result = ModelTranslator().translate(file_name=EA_CAR_MODEL_FILE_PATH, model_id="model", clear_model_afterwards=True)
+
+    # When
+    result = ModelTranslator(translation_cache=translation_cache).translate(
+        file_name=EA_CAR_MODEL_FILE_PATH, model_id="model", clear_model_afterwards=True
+    )
+
+    # Then
+    assert json.loads(result) == json.loads(expected_result)
+
+
+@pytest.mark.parametrize("file_path", [EA_CAR_MODEL_FILE_PATH, STARUML_CAR_MODEL_FILE_PATH])
+def test_when_same_content_translated_again_then_source_is_not_parsed(translation_cache, mocker, file_path):
+    # Given
+    translator = ModelTranslator(translation_cache=translation_cache)
+    expected_result = translator.translate(file_name=file_path, model_id="model", clear_model_afterwards=True)
+    deserialization = mocker.spy(translator._model_deserializer, "deserialize")
+
+    # When
+    result = translator.translate(
+        data_sources=[InputProcessor().accept_input(file_path=file_path)], model_id="model", clear_model_afterwards=True
+    )
+
+    # Then
+    deserialization.assert_called_once()
+    assert [data_source.format for data_source in deserialization.call_args.kwargs["data_sources"]] == [SupportedFormat.UMJ]
+    assert result == expected_result
+
+
+def test_when_translation_not_cached_then_sources_are_parsed_once(translation_cache, mocker):
+    # Given
+    translator = ModelTranslator(translation_cache=translation_cache)
+    data_source = InputProcessor().accept_input(file_path=EA_CAR_MODEL_FILE_PATH)
+    deserialization = mocker.spy(translator._model_deserializer, "deserialize")
+
+    # When
+    translator.translate(data_sources=[data_source], model_id="model", clear_model_afterwards=True)
+
+    # Then
+    deserialization.assert_called_once()
+    assert deserialization.call_args.kwargs["data_sources"] == [data_source]
+    assert translation_cache.get(translation_cache.make_key([data_source])) is not None
+
+
+def test_when_model_extended_with_cache_then_result_equals_extension_without_cache(translation_cache):
+    # Given
+    def translate_one_after_another(translator):
+        context = translator.create_context()
+        for file_path in EA_MODELS_FILES_PATHS:
+            translator.deserialize(data_sources=[InputProcessor().accept_input(file_path=file_path)], model_id="model", context=context)
+        return json.loads(translator.serialize(context=context))
+
+    expected_result = translate_one_after_another(ModelTranslator())
+    translator = ModelTranslator(translation_cache=translation_cache)
+
+    # When
+    results = [translate_one_after_another(translator) for _ in range(2)]
+
+    # Then
+    assert results[0] == results[1] == expected_result
+
+
+def test_when_sources_referring_to_each_other_translated_with_cache_then_result_equals_translation_without_cache(translation_cache):
+    # Given
+    expected_result = ModelTranslator().translate(
+        data_sources=[InputProcessor().accept_input(file_path=file_path) for file_path in PAPYRUS_CAR_MODEL_FILES_PATHS], clear_model_afterwards=True
+    )
+    translator = ModelTranslator(translation_cache=translation_cache)
+
+    # When
+    results = [
+        translator.translate(
+            data_sources=[InputProcessor().accept_input(file_path=file_path) for file_path in PAPYRUS_CAR_MODEL_FILES_PATHS], clear_model_afterwards=True
+        )
+        for _ in range(2)
+    ]
+
+    # Then
+    # Papyrus model has no ID of its own - each translation generates one
+    translated_models = [{key: value for key, value in json.loads(result).items() if key != "id"} for result in (*results, expected_result)]
+    assert translated_models[0] == translated_models[1] == translated_models[2]
+    assert translated_models[2]["name"] is not None
+    assert translated_models[2]["diagrams"]["class_diagrams"][0]["elements"]["classes"]
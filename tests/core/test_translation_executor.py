@@ -0,0 +1,110 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from umlars_translator.core.translation_executor import TranslationExecutor, ExecutorType, iter_until_cancelled
+from umlars_translator.core.deserialization.exceptions import TranslationCancelledError
+
+
+@pytest.fixture
+def translation_executor():
+    translation_executor = TranslationExecutor(executor_type=ExecutorType.THREAD, max_workers=4, max_concurrency=2)
+    yield translation_executor
+    translation_executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_when_many_tasks_run_then_concurrency_is_bounded(translation_executor):
+    # Given
+    running_tasks_count, max_running_tasks_count = 0, 0
+    lock = threading.Lock()
+
+    def work() -> None:
+        nonlocal running_tasks_count, max_running_tasks_count
+        with lock:
+            running_tasks_count += 1
+            max_running_tasks_count = max(max_running_tasks_count, running_tasks_count)
+        time.sleep(0.02)
+        with lock:
+            running_tasks_count -= 1
+
+    # When
+    await asyncio.gather(*(translation_executor.run(work) for _ in range(6)))
+
+    # Then
+    assert max_running_tasks_count == 2
+
+
+@pytest.mark.asyncio
+async def test_when_running_task_cancelled_then_cancel_event_is_set_and_work_is_awaited(translation_executor):
+    # Given
+    started, stopped, cancel_event = threading.Event(), threading.Event(), threading.Event()
+
+    def work() -> None:
+        started.set()
+        cancel_event.wait(5)
+        time.sleep(0.02)
+        stopped.set()
+
+    task = asyncio.create_task(translation_executor.run_in_thread(work, cancel_event=cancel_event))
+    await asyncio.to_thread(started.wait, 5)
+
+    # When
+    task.cancel()
+
+    # Then
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert cancel_event.is_set()
+    assert stopped.is_set()
+
+
+@pytest.mark.asyncio
+async def test_when_running_task_cancelled_then_its_slot_is_taken_until_the_work_is_done():
+    # Given
+    translation_executor = TranslationExecutor(executor_type=ExecutorType.THREAD, max_workers=2, max_concurrency=1)
+    started, released = threading.Event(), threading.Event()
+    finished_works = []
+
+    def work(name: str) -> None:
+        started.set()
+        released.wait(5)
+        finished_works.append(name)
+
+    cancelled_task = asyncio.create_task(translation_executor.run_in_thread(work, "cancelled"))
+    await asyncio.to_thread(started.wait, 5)
+    cancelled_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled_task
+
+    # When
+    waiting_task = asyncio.create_task(translation_executor.run(finished_works.append, "waiting"))
+    await asyncio.sleep(0.02)
+
+    # Then
+    assert not waiting_task.done()
+
+    # When
+    released.set()
+    await waiting_task
+
+    # Then
+    assert finished_works == ["cancelled", "waiting"]
+    translation_executor.shutdown()
+
+
+def test_when_cancel_event_set_then_iteration_is_stopped():
+    # Given
+    cancel_event = threading.Event()
+    items = iter_until_cancelled(["first", "second"], cancel_event)
+
+    # When
+    first_item = next(items)
+    cancel_event.set()
+
+    # Then
+    assert first_item == "first"
+    with pytest.raises(TranslationCancelledError):
+        next(items)
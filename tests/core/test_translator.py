@@ -1,7 +1,13 @@
-from pytest import fixture
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+from pytest import fixture, mark
 
 from umlars_translator.core.translator import ModelTranslator
+from umlars_translator.core.translation_executor import TranslationExecutor
 from umlars_translator.core.deserialization.input_processor import InputProcessor
+from umlars_translator.core.deserialization.deserializer import ModelDeserializer
+from umlars_translator.core.model.umlars_model.uml_model_builder import UmlModelBuilder
 
 
 CAR_MODEL_FILE_PATH = "tests/core/deserializer/formats/ea_xmi/test_data/ea_car_model_xmi21-with-sequence.xml"
@@ -24,3 +30,124 @@ def test_when_given_ea_format_deserialization_successful(ea_xmi_car_data_source,
 
     # Then
     assert isinstance(result, str)
+
+
+@mark.asyncio
+async def test_when_translated_asynchronously_then_result_equals_synchronous_translation(ea_xmi_car_data_source) -> None:
+    # Given
+    expected_result = ModelTranslator().translate(data_sources=[ea_xmi_car_data_source], model_id="car-model")
+
+    # When
+    result = await ModelTranslator().atranslate(
+        data_sources=[InputProcessor().accept_input(file_path=CAR_MODEL_FILE_PATH)], model_id="car-model"
+    )
+
+    # Then
+    assert result == expected_result
+
+
+@mark.asyncio
+async def test_when_translated_in_process_pool_then_result_equals_synchronous_translation(ea_xmi_car_data_source) -> None:
+    # Given
+    expected_result = ModelTranslator().translate(data_sources=[ea_xmi_car_data_source], model_id="car-model")
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        translator = ModelTranslator(translation_executor=TranslationExecutor(executor=executor))
+
+        # When
+        result = await translator.atranslate(file_name=CAR_MODEL_FILE_PATH, model_id="car-model")
+
+    # Then
+    assert result == expected_result
+
+
+def test_when_many_models_translated_then_each_job_gets_its_own_model() -> None:
+    # Given
+    jobs = [
+        ("first-model", [InputProcessor().accept_input(file_path=CAR_MODEL_FILE_PATH)], None),
+        ("second-model", [InputProcessor().accept_input(file_path=CAR_MODEL_FILE_PATH)], None),
+    ]
+
+    # When
+    results = dict(ModelTranslator().translate_many(jobs, to_string=False))
+
+    # Then
+    assert [results[model_id].id for model_id in ("first-model", "second-model")] == ["first-model", "second-model"]
+    assert results["first-model"].elements == results["second-model"].elements
+
+
+def test_when_job_fails_then_error_is_yielded_and_next_jobs_are_translated() -> None:
+    # Given
+    jobs = [
+        ("invalid-model", [InputProcessor().accept_input(data="not a model")], None),
+        ("car-model", [InputProcessor().accept_input(file_path=CAR_MODEL_FILE_PATH)], None),
+    ]
+
+    # When
+    results = dict(ModelTranslator().translate_many(jobs))
+
+    # Then
+    assert isinstance(results["invalid-model"], Exception)
+    assert isinstance(results["car-model"], str)
+
+
+def test_when_many_models_translated_in_workers_then_results_equal_sequential_translation() -> None:
+    # Given
+    jobs = [(f"model-{index}", [InputProcessor().accept_input(file_path=CAR_MODEL_FILE_PATH)], None) for index in range(4)]
+    expected_results = dict(ModelTranslator().translate_many(jobs))
+
+    # When
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = dict(ModelTranslator().translate_many(jobs, executor=executor, max_pending_jobs=2))
+
+    # Then
+    assert results == expected_results
+
+
+def test_when_translations_use_separate_contexts_then_their_models_are_independent() -> None:
+    # Given
+    translator = ModelTranslator()
+    first_context, second_context = translator.create_context(), translator.create_context()
+
+    # When
+    first_model = translator.deserialize(file_name=CAR_MODEL_FILE_PATH, model_id="first-model", context=first_context)
+    second_model = translator.deserialize(file_name=CAR_MODEL_FILE_PATH, model_id="second-model", context=second_context)
+
+    # Then
+    assert first_model is not second_model
+    assert (first_context.model.id, second_context.model.id) == ("first-model", "second-model")
+    assert translator.serialize(context=first_context) != translator.serialize(context=second_context)
+
+
+def test_when_context_created_then_its_builder_is_of_the_injected_kind() -> None:
+    # Given
+    class CustomUmlModelBuilder(UmlModelBuilder):
+        pass
+
+    model_builder = CustomUmlModelBuilder()
+    translator = ModelTranslator(model_deseializer=ModelDeserializer(model_builder=model_builder))
+
+    # When
+    context = translator.create_context()
+
+    # Then
+    assert isinstance(context.model_builder, CustomUmlModelBuilder)
+    assert context.model_builder is not model_builder
+    assert translator.deserialize(file_name=CAR_MODEL_FILE_PATH, context=context) is context.model
+
+
+@mark.asyncio
+async def test_when_translations_run_concurrently_in_contexts_then_results_equal_sequential_translation() -> None:
+    # Given
+    translator = ModelTranslator(translation_executor=TranslationExecutor(max_workers=4, max_concurrency=4))
+    model_ids = [f"model-{index}" for index in range(4)]
+    expected_results = [ModelTranslator().translate(file_name=CAR_MODEL_FILE_PATH, model_id=model_id, clear_model_afterwards=True) for model_id in model_ids]
+
+    # When
+    results = await asyncio.gather(*(
+        translator.atranslate(file_name=CAR_MODEL_FILE_PATH, model_id=model_id, context=translator.create_context())
+        for model_id in model_ids
+    ))
+
+    # Then
+    assert results == expected_results